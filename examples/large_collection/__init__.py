@@ -4,11 +4,20 @@ Illustrates the options to use with
 :func:`~sqlalchemy.orm.relationship()` when the list of related
 objects is very large, including:
 
-* "dynamic" relationships which query slices of data as accessed
+* "write only" relationships which never load the full collection; new
+  and removed items are persisted by the unit of work, and the collection
+  is read by executing SELECT statements against it
 * how to use ON DELETE CASCADE in conjunction with
   ``passive_deletes=True`` to greatly improve the performance of
   related collection deletion.
 
+A profiling suite compares adding items to a very large collection
+using the default "select" loader, the "dynamic" loader and the
+"write only" loader; it is run using the command line tool present
+in the :ref:`examples_performance` example::
+
+    $ python -m examples.large_collection.profile_collection --num 10000
+
 .. autosource::
 
 """
@@ -1,16 +1,19 @@
 from sqlalchemy import Column
 from sqlalchemy import create_engine
 from sqlalchemy import ForeignKey
+from sqlalchemy import func
 from sqlalchemy import Integer
 from sqlalchemy import MetaData
+from sqlalchemy import select
 from sqlalchemy import String
 from sqlalchemy import Table
-from sqlalchemy.orm import mapper
+from sqlalchemy.orm import registry
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm import sessionmaker
 
 
 meta = MetaData()
+mapper_registry = registry(metadata=meta)
 
 org_table = Table(
     "organizations",
@@ -43,29 +46,34 @@ class Member:
     def __init__(self, name):
         self.name = name
 
+    def __repr__(self):
+        return "Member(%r)" % self.name
 
-mapper(
+
+mapper_registry.map_imperatively(
     Organization,
     org_table,
     properties={
         "members": relationship(
             Member,
-            # Organization.members will be a Query object - no loading
-            # of the entire collection occurs unless requested
-            lazy="dynamic",
+            # Organization.members will be a WriteOnlyCollection - the
+            # collection is never loaded; it can only be added to, removed
+            # from, or queried using an explicit SELECT statement
+            lazy="write_only",
             # Member objects "belong" to their parent, are deleted when
             # removed from the collection
             cascade="all, delete-orphan",
             # "delete, delete-orphan" cascade does not load in objects on
             # delete, allows ON DELETE CASCADE to handle it.
             # this only works with a database that supports ON DELETE CASCADE -
-            # *not* sqlite or MySQL with MyISAM
+            # *not* sqlite or MySQL with MyISAM.   A "write only" collection
+            # requires this setting in order for its parent to be deleted.
             passive_deletes=True,
         )
     },
 )
 
-mapper(Member, member_table)
+mapper_registry.map_imperatively(Member, member_table)
 
 if __name__ == "__main__":
     engine = create_engine(
@@ -79,30 +87,50 @@ if __name__ == "__main__":
 
     # create org with some members
     org = Organization("org one")
-    org.members.append(Member("member one"))
-    org.members.append(Member("member two"))
-    org.members.append(Member("member three"))
+    org.members.add_all(
+        [Member("member one"), Member("member two"), Member("member three")]
+    )
 
     sess.add(org)
 
     print("-------------------------\nflush one - save org + 3 members\n")
     sess.commit()
 
-    # the 'members' collection is a Query.  it issues
-    # SQL as needed to load subsets of the collection.
+    # the 'members' collection produces a SELECT statement which
+    # is executed as needed to load subsets of the collection.
     print("-------------------------\nload subset of members\n")
-    members = org.members.filter(member_table.c.name.like("%member t%")).all()
+    members = sess.scalars(
+        org.members.select().where(member_table.c.name.like("%member t%"))
+    ).all()
     print(members)
 
-    # new Members can be appended without any
+    # new Members can be added without any
     # SQL being emitted to load the full collection
-    org.members.append(Member("member four"))
-    org.members.append(Member("member five"))
-    org.members.append(Member("member six"))
+    org.members.add(Member("member four"))
+    org.members.add(Member("member five"))
+    org.members.add(Member("member six"))
 
     print("-------------------------\nflush two - save 3 more members\n")
     sess.commit()
 
+    # large numbers of rows may also be INSERTed in terms of the
+    # collection directly, using a single executemany() call and
+    # without constructing any Member objects
+    print("-------------------------\nbulk INSERT of 100 more members\n")
+    sess.execute(
+        org.members.insert(),
+        [{"name": "bulk member %d" % i} for i in range(100)],
+    )
+    sess.commit()
+
+    # the collection may be iterated in batches of rows using yield_per,
+    # rather than being loaded fully into memory
+    print("-------------------------\niterate members in batches\n")
+    for member in sess.scalars(
+        org.members.select().execution_options(yield_per=25)
+    ):
+        pass
+
     # delete the object.   Using ON DELETE CASCADE
     # SQL is only emitted for the head row - the Member rows
     # disappear automatically without the need for additional SQL.
@@ -114,7 +142,7 @@ if __name__ == "__main__":
     sess.commit()
 
     print("-------------------------\nno Member rows should remain:\n")
-    print(sess.query(Member).count())
+    print(sess.scalar(select(func.count()).select_from(member_table)))
     sess.close()
 
     print("------------------------\ndone.  dropping tables.")
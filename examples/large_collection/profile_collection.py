@@ -0,0 +1,126 @@
+"""In this series of tests, we are looking at the time taken to add new
+items to a collection which already contains a large number of rows.
+
+A collection using the default "select" loader is loaded in full the first
+time it's modified on each parent object, so that the time spent grows with
+the size of the collection.  The "dynamic" and "write only" loaders instead
+queue the new items as pending changes that are INSERTed by the next
+flush, without loading the existing contents of the collection.
+
+The suite makes use of the command line tool present in the
+:ref:`examples_performance` example::
+
+    $ python -m examples.large_collection.profile_collection --num 10000
+
+"""
+from sqlalchemy import Column
+from sqlalchemy import create_engine
+from sqlalchemy import ForeignKey
+from sqlalchemy import Integer
+from sqlalchemy import String
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Session
+from ..performance import Profiler
+
+
+Base = declarative_base()
+engine = None
+
+# number of parent objects loaded, each of which has one item added
+# to its collection
+NUM_APPENDS = 25
+
+
+class Parent(Base):
+    __tablename__ = "parent"
+    id = Column(Integer, primary_key=True)
+
+    children = relationship("Child")
+    dynamic_children = relationship(
+        "Child", lazy="dynamic", overlaps="children,write_only_children"
+    )
+    write_only_children = relationship(
+        "Child", lazy="write_only", overlaps="children,dynamic_children"
+    )
+
+
+class Child(Base):
+    __tablename__ = "child"
+    id = Column(Integer, primary_key=True)
+    parent_id = Column(ForeignKey("parent.id"))
+    data = Column(String(255))
+
+
+Profiler.init("profile_collection", num=10000)
+
+
+@Profiler.setup
+def setup_database(dburl, echo, num):
+    global engine
+    engine = create_engine(dburl, echo=echo)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+    with engine.begin() as conn:
+        conn.execute(
+            Parent.__table__.insert(),
+            [{"id": i} for i in range(1, NUM_APPENDS + 1)],
+        )
+        conn.execute(
+            Child.__table__.insert(),
+            [
+                {
+                    "parent_id": (i % NUM_APPENDS) + 1,
+                    "data": "child data %d" % i,
+                }
+                for i in range(num)
+            ],
+        )
+
+
+@Profiler.profile
+def test_select_collection(n):
+    """append to collections using the default "select" loader"""
+
+    with Session(engine) as session:
+        for parent in session.query(Parent):
+            parent.children.append(Child(data="new child"))
+        session.commit()
+
+
+@Profiler.profile
+def test_dynamic_collection(n):
+    """append to collections using the "dynamic" loader"""
+
+    with Session(engine) as session:
+        for parent in session.query(Parent):
+            parent.dynamic_children.append(Child(data="new child"))
+        session.commit()
+
+
+@Profiler.profile
+def test_write_only_collection(n):
+    """add to collections using the "write_only" loader"""
+
+    with Session(engine) as session:
+        for parent in session.query(Parent):
+            parent.write_only_children.add(Child(data="new child"))
+        session.commit()
+
+
+@Profiler.profile
+def test_write_only_bulk_insert(n):
+    """INSERT rows in terms of "write_only" collections"""
+
+    with Session(engine) as session:
+        for parent in session.query(Parent):
+            session.execute(
+                parent.write_only_children.insert(),
+                [{"data": "new child"}],
+            )
+        session.commit()
+
+
+if __name__ == "__main__":
+    Profiler.main()
@@ -141,6 +141,31 @@ def test_core_fetchmany(n):
                 row["id"], row["name"], row["description"]
 
 
+@Profiler.profile
+def test_core_fetchmany_as_columns(n):
+    """Load Core result rows using fetchmany, pivoting them into columns."""
+
+    with engine.connect() as conn:
+        result = conn.execute(Customer.__table__.select().limit(n))
+        columns = [[], [], []]
+        while True:
+            chunk = result.fetchmany(10000)
+            if not chunk:
+                break
+            for column, values in zip(columns, zip(*chunk)):
+                column.extend(values)
+
+
+@Profiler.profile
+def test_core_columns_as_arrays(n):
+    """Load Core result columns using columns_as_arrays()."""
+
+    with engine.connect() as conn:
+        result = conn.execute(Customer.__table__.select().limit(n))
+        columns = result.columns_as_arrays(chunk_size=10000)
+        columns["id"], columns["name"], columns["description"]
+
+
 @Profiler.profile
 def test_dbapi_fetchall_plus_append_objects(n):
     """Load rows using DBAPI fetchall(), generate an object for each row."""
@@ -46,6 +46,7 @@ from .engine import URL as URL
 from .inspection import inspect as inspect
 from .pool import AssertionPool as AssertionPool
 from .pool import AsyncAdaptedQueuePool as AsyncAdaptedQueuePool
+from .pool import AsyncQueuePool as AsyncQueuePool
 from .pool import (
     FallbackAsyncAdaptedQueuePool as FallbackAsyncAdaptedQueuePool,
 )
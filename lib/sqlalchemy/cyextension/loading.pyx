@@ -0,0 +1,133 @@
+cdef class _InstanceFastPath:
+    cdef object fallback
+    cdef object identity_class
+    cdef object primary_key_getter
+    cdef object identity_token
+    cdef object session_identity_map
+    cdef object is_not_primary_key
+    cdef object new_instance
+    cdef object instance_state
+    cdef object instance_dict
+    cdef object session_id
+    cdef object runid
+    cdef object load_options
+    cdef object load_path
+    cdef tuple quick_populators
+    cdef tuple expire_keys
+    cdef tuple new_populators
+    cdef object get_instance
+
+    def __init__(
+        self,
+        object fallback,
+        object identity_class,
+        object primary_key_getter,
+        object identity_token,
+        object session_identity_map,
+        object is_not_primary_key,
+        object new_instance,
+        object instance_state,
+        object instance_dict,
+        object session_id,
+        object runid,
+        object load_options,
+        object load_path,
+        dict populators,
+    ):
+        self.fallback = fallback
+        self.identity_class = identity_class
+        self.primary_key_getter = primary_key_getter
+        self.identity_token = identity_token
+        self.session_identity_map = session_identity_map
+        self.is_not_primary_key = is_not_primary_key
+        self.new_instance = new_instance
+        self.instance_state = instance_state
+        self.instance_dict = instance_dict
+        self.session_id = session_id
+        self.runid = runid
+        self.load_options = load_options
+        self.load_path = load_path
+        self.quick_populators = tuple(populators["quick"])
+        self.expire_keys = tuple(
+            [key for key, set_callable in populators["expire"] if set_callable]
+        )
+        self.new_populators = tuple(populators["new"])
+        self.get_instance = session_identity_map.get
+
+    def __call__(self, object row):
+        cdef tuple data = row._data
+        cdef tuple identitykey
+        cdef dict dict_
+        cdef object instance, state, key, getter, populator
+
+        identitykey = (
+            self.identity_class,
+            self.primary_key_getter(data),
+            self.identity_token,
+        )
+
+        if self.get_instance(identitykey) is not None:
+            return self.fallback(row)
+
+        if self.is_not_primary_key(identitykey[1]):
+            return None
+
+        instance = self.new_instance()
+
+        dict_ = self.instance_dict(instance)
+        state = self.instance_state(instance)
+        state.key = identitykey
+        state.identity_token = self.identity_token
+
+        state.session_id = self.session_id
+        self.session_identity_map._add_unpresent(state, identitykey)
+
+        state.load_options = self.load_options
+        state.load_path = self.load_path
+        state.runid = self.runid
+
+        for key, getter in self.quick_populators:
+            dict_[key] = getter(data)
+        if self.expire_keys:
+            state.expired_attributes.update(self.expire_keys)
+        for key, populator in self.new_populators:
+            populator(state, dict_, row)
+
+        if state.modified:
+            state._commit_all(dict_, self.session_identity_map)
+
+        return instance
+
+
+def _instance_fast_path(
+    fallback,
+    identity_class,
+    primary_key_getter,
+    identity_token,
+    session_identity_map,
+    is_not_primary_key,
+    new_instance,
+    instance_state,
+    instance_dict,
+    session_id,
+    runid,
+    load_options,
+    load_path,
+    populators,
+):
+    return _InstanceFastPath(
+        fallback,
+        identity_class,
+        primary_key_getter,
+        identity_token,
+        session_identity_map,
+        is_not_primary_key,
+        new_instance,
+        instance_state,
+        instance_dict,
+        session_id,
+        runid,
+        load_options,
+        load_path,
+        populators,
+    )
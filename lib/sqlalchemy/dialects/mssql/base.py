@@ -2676,6 +2676,9 @@ def _db_plus_owner_listing(fn):
     return update_wrapper(wrap, fn)
 
 
+# reflection queries are emitted per table, against the database named in a
+# "dbname.owner" schema; the get_multi_*() methods use the default
+# per-table implementation
 def _db_plus_owner(fn):
     def wrap(dialect, connection, tablename, schema=None, **kw):
         dbname, owner = _owner_plus_db(dialect, schema)
@@ -2803,6 +2806,9 @@ class MSDialect(default.DefaultDialect):
     update_returning_multifrom = True
     delete_returning_multifrom = True
 
+    # SQL Server allows at most 2100 parameters per statement
+    max_bind_parameters = 2099
+
     colspecs = {
         sqltypes.DateTime: _MSDateTime,
         sqltypes.Date: _MSDate,
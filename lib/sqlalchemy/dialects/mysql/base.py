@@ -2399,6 +2399,7 @@ class MySQLDialect(default.DefaultDialect):
     supports_sane_rowcount = True
     supports_sane_multi_rowcount = False
     supports_multivalues_insert = True
+    use_insertmanyvalues = True
     insert_null_pk_still_autoincrements = True
 
     supports_comments = True
@@ -3121,6 +3122,10 @@ class MySQLDialect(default.DefaultDialect):
             raise exc.NoSuchTableError(full_name)
         return sql
 
+    # all aspects of a table are parsed from a single SHOW CREATE TABLE
+    # statement, which is cached for the inspection, so the get_multi_*()
+    # methods use the default per-table implementation; information_schema
+    # lacks details which are only present in the DDL
     def _parsed_state_or_create(
         self, connection, table_name, schema=None, **kw
     ):
@@ -1380,6 +1380,7 @@ from ...sql import coercions
 from ...sql import compiler
 from ...sql import elements
 from ...sql import expression
+from ...sql import operators
 from ...sql import roles
 from ...sql import sqltypes
 from ...sql import util as sql_util
@@ -1715,6 +1716,23 @@ class PGCompiler(compiler.SQLCompiler):
                 flags,
             )
 
+    def _array_in_type(self, type_, impl):
+        return _array.ARRAY(type_, dimensions=1)
+
+    def visit_array_in_op_binary(self, binary, operator, array_bind, **kw):
+        # "x = ANY (array)" and "x != ALL (array)" have the same NULL
+        # and empty set semantics as "x IN (...)" and "x NOT IN (...)"
+        if operator is operators.in_op:
+            return "%s = ANY (%s)" % (
+                self.process(binary.left, **kw),
+                self.process(array_bind, **kw),
+            )
+        else:
+            return "(%s != ALL (%s))" % (
+                self.process(binary.left, **kw),
+                self.process(array_bind, **kw),
+            )
+
     def visit_empty_set_expr(self, element_types):
         # cast the empty set to the type we are comparing against.  if
         # we are comparing against the null type, pick an arbitrary
@@ -2804,7 +2822,9 @@ class PGDialect(default.DefaultDialect):
 
     supports_empty_insert = False
     supports_multivalues_insert = True
+    use_insertmanyvalues = True
     supports_identity_columns = True
+    supports_array_in_expansion = True
 
     default_paramstyle = "pyformat"
     ischema_names = ischema_names
@@ -3111,6 +3131,85 @@ class PGDialect(default.DefaultDialect):
         )
         return connection.scalars(query).all()
 
+    # relations whose definitions are reflected, including the indexes
+    # and sequences which belong to tables
+    _fingerprint_relkinds = pg_catalog.RELKINDS_ALL_TABLE_LIKE + (
+        "i",
+        "I",
+        "S",
+    )
+
+    def get_schema_fingerprint(self, connection, schema=None, **kw):
+        # any DDL replaces rows in the system catalogs, which gives the
+        # new row versions the id of the transaction that did so.  the
+        # digest of the row versions which describe the relations and
+        # types of the schema changes whenever one of them is created,
+        # altered or dropped.  the rows are located by namespace and
+        # relation, so that the size of the schema being fingerprinted
+        # rather than of the whole catalog determines the cost
+        if schema is None:
+            namespace = (
+                "nspname = ANY (current_schemas(false)) "
+                "AND nspname != 'pg_catalog'"
+            )
+            params = {}
+        else:
+            namespace = "nspname = :schema"
+            params = {"schema": schema}
+
+        relkinds = ", ".join(
+            "'%s'" % kind for kind in self._fingerprint_relkinds
+        )
+
+        if self.server_version_info >= (10,):
+            sequences = (
+                "UNION ALL SELECT 'pg_sequence:' || seq.xmin::text "
+                "FROM pg_catalog.pg_sequence AS seq "
+                "JOIN rel ON seq.seqrelid = rel.oid "
+            )
+        else:
+            sequences = ""
+
+        query = (
+            "WITH ns AS ("
+            "SELECT oid, xmin FROM pg_catalog.pg_namespace "
+            f"WHERE {namespace}), "
+            "rel AS ("
+            "SELECT cls.oid, cls.xmin FROM pg_catalog.pg_class AS cls "
+            "JOIN ns ON cls.relnamespace = ns.oid "
+            f"WHERE cls.relkind IN ({relkinds})) "
+            "SELECT current_database() || ':' || "
+            "md5(coalesce(string_agg(v, ',' ORDER BY v), '')) FROM ("
+            "SELECT 'pg_namespace:' || ns.xmin::text AS v FROM ns "
+            "UNION ALL SELECT 'pg_class:' || rel.xmin::text FROM rel "
+            "UNION ALL SELECT 'pg_attribute:' || att.xmin::text "
+            "FROM pg_catalog.pg_attribute AS att "
+            "JOIN rel ON att.attrelid = rel.oid "
+            "UNION ALL SELECT 'pg_attrdef:' || def.xmin::text "
+            "FROM pg_catalog.pg_attrdef AS def "
+            "JOIN rel ON def.adrelid = rel.oid "
+            "UNION ALL SELECT 'pg_index:' || ind.xmin::text "
+            "FROM pg_catalog.pg_index AS ind "
+            "JOIN rel ON ind.indrelid = rel.oid "
+            "UNION ALL SELECT 'pg_description:' || dsc.xmin::text "
+            "FROM pg_catalog.pg_description AS dsc "
+            "JOIN rel ON dsc.objoid = rel.oid "
+            "AND dsc.classoid = 'pg_catalog.pg_class'::regclass "
+            "UNION ALL SELECT 'pg_constraint:' || con.xmin::text "
+            "FROM pg_catalog.pg_constraint AS con "
+            "JOIN ns ON con.connamespace = ns.oid "
+            "UNION ALL SELECT 'pg_type:' || typ.xmin::text "
+            "FROM pg_catalog.pg_type AS typ "
+            "JOIN ns ON typ.typnamespace = ns.oid "
+            "UNION ALL SELECT 'pg_enum:' || enm.xmin::text "
+            "FROM pg_catalog.pg_enum AS enm "
+            "JOIN pg_catalog.pg_type AS typ ON enm.enumtypid = typ.oid "
+            "JOIN ns ON typ.typnamespace = ns.oid "
+            f"{sequences}"
+            ") AS catalog"
+        )
+        return connection.execute(sql.text(query), params).scalar()
+
     def _get_relnames_for_relkinds(self, connection, schema, relkinds, scope):
         query = select(pg_catalog.pg_class.c.relname).where(
             self._pg_class_relkind_condition(relkinds)
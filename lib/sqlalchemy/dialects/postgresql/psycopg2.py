@@ -676,6 +676,10 @@ class PGDialect_psycopg2(_PGDialect_common_psycopg):
         if self.executemany_mode & EXECUTEMANY_VALUES:
             self.insert_executemany_returning = True
 
+            # psycopg2's execute_values() helper is used in place of the
+            # generic "insertmanyvalues" feature
+            self.use_insertmanyvalues = False
+
         self.executemany_batch_page_size = executemany_batch_page_size
         self.executemany_values_page_size = executemany_values_page_size
 
@@ -882,7 +882,10 @@ passed to methods such as :meth:`_schema.MetaData.reflect` or
 """  # noqa
 from __future__ import annotations
 
+from collections import defaultdict
 import datetime
+import hashlib
+import json
 import numbers
 import re
 from typing import Optional
@@ -896,6 +899,8 @@ from ... import sql
 from ... import types as sqltypes
 from ... import util
 from ...engine import default
+from ...engine import ObjectKind
+from ...engine import ObjectScope
 from ...engine import processors
 from ...engine import reflection
 from ...engine.reflection import ReflectionDefaults
@@ -903,8 +908,10 @@ from ...sql import coercions
 from ...sql import ColumnElement
 from ...sql import compiler
 from ...sql import elements
+from ...sql import operators
 from ...sql import roles
 from ...sql import schema
+from ...sql.visitors import InternalTraversal
 from ...types import BLOB  # noqa
 from ...types import BOOLEAN  # noqa
 from ...types import CHAR  # noqa
@@ -937,6 +944,30 @@ class _SQliteJson(JSON):
         return process
 
 
+class _JSONArrayParameter(sqltypes.TypeEngine):
+    """Send a list of values as a JSON array string, for use with the
+    ``json_each()`` function when rendering array IN expressions."""
+
+    def __init__(self, item_type):
+        self.item_type = item_type
+
+    def bind_processor(self, dialect):
+        item_proc = self.item_type.dialect_impl(dialect).bind_processor(
+            dialect
+        )
+        json_serializer = dialect._json_serializer or json.dumps
+
+        def process(value):
+            if value is None:
+                return value
+            elif item_proc:
+                return json_serializer([item_proc(elem) for elem in value])
+            else:
+                return json_serializer(list(value))
+
+        return process
+
+
 class _DateTimeMixin:
     _reg = None
     _storage_format = None
@@ -1415,6 +1446,24 @@ class SQLiteCompiler(compiler.SQLCompiler):
             self.process(binary.right, **kw),
         )
 
+    def _array_in_type(self, type_, impl):
+        # binary values can't be represented in JSON
+        if impl._type_affinity is sqltypes._Binary:
+            return None
+        return _JSONArrayParameter(type_)
+
+    def visit_array_in_op_binary(self, binary, operator, array_bind, **kw):
+        if operator is operators.in_op:
+            return "%s IN (SELECT value FROM json_each(%s))" % (
+                self.process(binary.left, **kw),
+                self.process(array_bind, **kw),
+            )
+        else:
+            return "(%s NOT IN (SELECT value FROM json_each(%s)))" % (
+                self.process(binary.left, **kw),
+                self.process(array_bind, **kw),
+            )
+
     def visit_empty_set_op_expr(self, type_, expand_op):
         # slightly old SQLite versions don't seem to be able to handle
         # the empty set impl
@@ -1933,6 +1982,8 @@ class SQLiteDialect(default.DefaultDialect):
     insert_returning = True
     update_returning = True
     delete_returning = True
+    use_insertmanyvalues = True
+    supports_array_in_expansion = True
 
     default_paramstyle = "qmark"
     execution_ctx_cls = SQLiteExecutionContext
@@ -2045,6 +2096,11 @@ class SQLiteDialect(default.DefaultDialect):
                     self.delete_returning
                 ) = self.insert_returning = False
 
+            if self.dbapi.sqlite_version_info < (3, 32, 0):
+                # https://www.sqlite.org/limits.html
+                self.insertmanyvalues_max_parameters = 999
+                self.max_bind_parameters = 999
+
     _isolation_lookup = util.immutabledict(
         {"READ UNCOMMITTED": 1, "SERIALIZABLE": 0}
     )
@@ -2088,6 +2144,25 @@ class SQLiteDialect(default.DefaultDialect):
 
         return [db[1] for db in dl if db[1] != "temp"]
 
+    def get_schema_fingerprint(self, connection, schema=None, **kw):
+        # everything that's reflected is derived from the DDL stored in
+        # sqlite_master, so a digest of its contents identifies the schema.
+        # without a schema, all attached databases are included, as tables
+        # in any of them may be referred to without one
+        quote = self.identifier_preparer.quote_identifier
+        digest = hashlib.sha256()
+        for db in connection.exec_driver_sql("PRAGMA database_list").all():
+            if schema is not None and db[1] != schema:
+                continue
+            digest.update(repr(db[1]).encode("utf-8"))
+            rows = connection.exec_driver_sql(
+                "SELECT type, name, tbl_name, sql "
+                f"FROM {quote(db[1])}.sqlite_master ORDER BY type, name"
+            )
+            for row in rows:
+                digest.update(repr(tuple(row)).encode("utf-8"))
+        return digest.hexdigest()
+
     def _format_schema(self, schema, table_name):
         if schema is not None:
             qschema = self.identifier_preparer.quote_identifier(schema)
@@ -2210,6 +2285,21 @@ class SQLiteDialect(default.DefaultDialect):
         info = self._get_table_pragma(
             connection, pragma, table_name, schema=schema
         )
+        columns = self._columns_from_pragma(
+            info,
+            pragma,
+            lambda: self._get_table_sql(connection, table_name, schema, **kw),
+        )
+        if columns:
+            return columns
+        elif not self.has_table(connection, table_name, schema):
+            raise exc.NoSuchTableError(
+                f"{schema}.{table_name}" if schema else table_name
+            )
+        else:
+            return ReflectionDefaults.columns()
+
+    def _columns_from_pragma(self, info, pragma, get_tablesql):
         columns = []
         tablesql = None
         for row in info:
@@ -2230,9 +2320,7 @@ class SQLiteDialect(default.DefaultDialect):
             persisted = hidden == 3
 
             if tablesql is None and generated:
-                tablesql = self._get_table_sql(
-                    connection, table_name, schema, **kw
-                )
+                tablesql = get_tablesql()
 
             columns.append(
                 self._get_column_info(
@@ -2246,14 +2334,7 @@ class SQLiteDialect(default.DefaultDialect):
                     tablesql,
                 )
             )
-        if columns:
-            return columns
-        elif not self.has_table(connection, table_name, schema):
-            raise exc.NoSuchTableError(
-                f"{schema}.{table_name}" if schema else table_name
-            )
-        else:
-            return ReflectionDefaults.columns()
+        return columns
 
     def _get_column_info(
         self,
@@ -2353,14 +2434,17 @@ class SQLiteDialect(default.DefaultDialect):
 
     @reflection.cache
     def get_pk_constraint(self, connection, table_name, schema=None, **kw):
-        constraint_name = None
         table_data = self._get_table_sql(connection, table_name, schema=schema)
+        cols = self.get_columns(connection, table_name, schema, **kw)
+        return self._pk_constraint_from_columns(table_data, cols)
+
+    def _pk_constraint_from_columns(self, table_data, cols):
+        constraint_name = None
         if table_data:
             PK_PATTERN = r"CONSTRAINT (\w+) PRIMARY KEY"
             result = re.search(PK_PATTERN, table_data, re.I)
             constraint_name = result.group(1) if result else None
 
-        cols = self.get_columns(connection, table_name, schema, **kw)
         # consider only pk columns. This also avoids sorting the cached
         # value returned by get_columns
         cols = [col for col in cols if col.get("primary_key", 0) > 0]
@@ -2379,7 +2463,14 @@ class SQLiteDialect(default.DefaultDialect):
         pragma_fks = self._get_table_pragma(
             connection, "foreign_key_list", table_name, schema=schema
         )
+        table_data = self._get_table_sql(connection, table_name, schema=schema)
+        return self._foreign_keys_from_pragma(
+            connection, table_name, schema, pragma_fks, table_data, **kw
+        )
 
+    def _foreign_keys_from_pragma(
+        self, connection, table_name, schema, pragma_fks, table_data, **kw
+    ):
         fks = {}
 
         for row in pragma_fks:
@@ -2448,8 +2539,6 @@ class SQLiteDialect(default.DefaultDialect):
             for fk in fks.values()
         )
 
-        table_data = self._get_table_sql(connection, table_name, schema=schema)
-
         def parse_fks():
             if table_data is None:
                 # system tables, etc.
@@ -2538,22 +2627,26 @@ class SQLiteDialect(default.DefaultDialect):
         self, connection, table_name, schema=None, **kw
     ):
 
-        auto_index_by_sig = {}
-        for idx in self.get_indexes(
+        indexes = self.get_indexes(
             connection,
             table_name,
             schema=schema,
             include_auto_indexes=True,
             **kw,
-        ):
+        )
+        table_data = self._get_table_sql(
+            connection, table_name, schema=schema, **kw
+        )
+        return self._unique_constraints_from_indexes(table_data, indexes)
+
+    def _unique_constraints_from_indexes(self, table_data, indexes):
+        auto_index_by_sig = {}
+        for idx in indexes:
             if not idx["name"].startswith("sqlite_autoindex"):
                 continue
             sig = tuple(idx["column_names"])
             auto_index_by_sig[sig] = idx
 
-        table_data = self._get_table_sql(
-            connection, table_name, schema=schema, **kw
-        )
         unique_constraints = []
 
         def parse_uqs():
@@ -2596,7 +2689,9 @@ class SQLiteDialect(default.DefaultDialect):
         table_data = self._get_table_sql(
             connection, table_name, schema=schema, **kw
         )
+        return self._check_constraints_from_sql(table_data)
 
+    def _check_constraints_from_sql(self, table_data):
         CHECK_PATTERN = r"(?:CONSTRAINT (.+) +)?" r"CHECK *\( *(.+) *\),? *"
         cks = []
         # NOTE: we aren't using re.S here because we actually are
@@ -2623,9 +2718,27 @@ class SQLiteDialect(default.DefaultDialect):
         pragma_indexes = self._get_table_pragma(
             connection, "index_list", table_name, schema=schema
         )
-        indexes = []
-
         include_auto_indexes = kw.pop("include_auto_indexes", False)
+        indexes = self._indexes_from_pragma(
+            pragma_indexes,
+            lambda index_name: self._get_table_pragma(
+                connection, "index_info", index_name, schema=schema
+            ),
+            include_auto_indexes,
+        )
+        if indexes:
+            return indexes
+        elif not self.has_table(connection, table_name, schema):
+            raise exc.NoSuchTableError(
+                f"{schema}.{table_name}" if schema else table_name
+            )
+        else:
+            return ReflectionDefaults.indexes()
+
+    def _indexes_from_pragma(
+        self, pragma_indexes, get_index_info, include_auto_indexes
+    ):
+        indexes = []
         for row in pragma_indexes:
             # ignore implicit primary key index.
             # https://www.mail-archive.com/sqlite-users@sqlite.org/msg30517.html
@@ -2637,11 +2750,7 @@ class SQLiteDialect(default.DefaultDialect):
 
         # loop thru unique indexes to get the column names.
         for idx in list(indexes):
-            pragma_index = self._get_table_pragma(
-                connection, "index_info", idx["name"], schema=schema
-            )
-
-            for row in pragma_index:
+            for row in get_index_info(idx["name"]):
                 if row[2] is None:
                     util.warn(
                         "Skipped unsupported reflection of "
@@ -2652,14 +2761,7 @@ class SQLiteDialect(default.DefaultDialect):
                 else:
                     idx["column_names"].append(row[2])
         indexes.sort(key=lambda d: d["name"] or "~")  # sort None as last
-        if indexes:
-            return indexes
-        elif not self.has_table(connection, table_name, schema):
-            raise exc.NoSuchTableError(
-                f"{schema}.{table_name}" if schema else table_name
-            )
-        else:
-            return ReflectionDefaults.indexes()
+        return indexes
 
     def _is_sys_table(self, table_name):
         return table_name in {
@@ -2724,3 +2826,416 @@ class SQLiteDialect(default.DefaultDialect):
                 return result
         else:
             return []
+
+    @util.memoized_property
+    def _supports_multi_reflection(self):
+        # table-valued pragma functions are available as of SQLite 3.16
+        return self.server_version_info >= (3, 16)
+
+    @reflection.flexi_cache(
+        ("schema", InternalTraversal.dp_string),
+        ("filter_names", InternalTraversal.dp_string_list),
+        ("scope", InternalTraversal.dp_plain_obj),
+        ("kind", InternalTraversal.dp_plain_obj),
+        ("sqlite_include_internal", InternalTraversal.dp_boolean),
+    )
+    def _get_multi_tables(
+        self,
+        connection,
+        schema,
+        filter_names,
+        scope,
+        kind,
+        sqlite_include_internal,
+        **kw,
+    ):
+        """Locate the tables and views reflected by the ``get_multi_*()``
+        methods.
+
+        Returns a list of ``(pragma schema, table name, table sql)`` tuples,
+        along with a list of names given in ``filter_names`` that weren't
+        located; these are reflected one at a time, as is the case for
+        system tables.
+
+        """
+        types = []
+        if ObjectKind.TABLE in kind:
+            types.append("'table'")
+        if ObjectKind.VIEW in kind:
+            types.append("'view'")
+
+        if schema is not None:
+            schemas = [schema] if ObjectScope.DEFAULT in scope else []
+        else:
+            schemas = []
+            if ObjectScope.DEFAULT in scope:
+                schemas.append("main")
+            if ObjectScope.TEMPORARY in scope:
+                schemas.append("temp")
+
+        # as is the case for the default implementation, names given
+        # along with no qualification on the type of table are taken as
+        # given, including internal tables
+        names_as_given = bool(
+            filter_names
+            and scope is ObjectScope.ANY
+            and kind is ObjectKind.ANY
+        )
+
+        if not sqlite_include_internal and not names_as_given:
+            filter_table = " AND name NOT LIKE 'sqlite~_%' ESCAPE '~'"
+        else:
+            filter_table = ""
+
+        quote = self.identifier_preparer.quote_identifier
+        tables = []
+        found = set()
+        for schema_arg in schemas if types else ():
+            if filter_names and found.issuperset(filter_names):
+                # every name was located in a schema that takes precedence
+                break
+            query = (
+                f"SELECT name, sql FROM {quote(schema_arg)}.sqlite_master "
+                f"WHERE type IN ({', '.join(types)}){filter_table}"
+            )
+            if filter_names:
+                rows = self._execute_for_names(
+                    connection, f"{query} AND name IN :names", filter_names
+                )
+            else:
+                rows = connection.exec_driver_sql(query)
+
+            for name, table_sql in sorted(rows):
+                # tables in "main" take precedence over temp tables
+                # of the same name, as is the case for PRAGMA
+                if name not in found:
+                    found.add(name)
+                    tables.append((schema_arg, name, table_sql))
+
+        if names_as_given:
+            missing = [name for name in filter_names if name not in found]
+        else:
+            missing = []
+        return tables, missing
+
+    def _execute_for_names(self, connection, query, names, **params):
+        """Execute a query that includes an "IN :names" expression for
+        a list of names, which is broken into batches so that each
+        statement stays well within the default limit of 999 parameters.
+
+        """
+        stmt = sql.text(query).bindparams(
+            sql.bindparam("names", expanding=True)
+        )
+        rows = []
+        for idx in range(0, len(names), 500):
+            rows.extend(
+                connection.execute(
+                    stmt, {"names": names[idx : idx + 500], **params}
+                )
+            )
+        return rows
+
+    def _get_multi_pragma(self, connection, tables, pragma, columns):
+        """Run a table-valued pragma function against each of the given
+        tables, returning the rows for each table.
+
+        """
+        quote = self.identifier_preparer.quote_identifier
+
+        names_by_schema = defaultdict(list)
+        for schema_arg, table_name, _ in tables:
+            names_by_schema[schema_arg].append(table_name)
+
+        result = defaultdict(list)
+        for schema_arg, names in names_by_schema.items():
+            rows = self._execute_for_names(
+                connection,
+                f"SELECT m.name, {columns} "
+                f"FROM {quote(schema_arg)}.sqlite_master AS m "
+                f"JOIN {pragma} "
+                "WHERE m.type IN ('table', 'view') AND m.name IN :names",
+                names,
+                schema=schema_arg,
+            )
+            for row in rows:
+                result[(schema_arg, row[0])].append(tuple(row[1:]))
+        return result
+
+    @reflection.flexi_cache(
+        ("schema", InternalTraversal.dp_string),
+        ("filter_names", InternalTraversal.dp_string_list),
+        ("scope", InternalTraversal.dp_plain_obj),
+        ("kind", InternalTraversal.dp_plain_obj),
+        ("sqlite_include_internal", InternalTraversal.dp_boolean),
+    )
+    def _get_multi_columns(
+        self,
+        connection,
+        schema,
+        filter_names,
+        scope,
+        kind,
+        sqlite_include_internal,
+        **kw,
+    ):
+        tables, _ = self._get_multi_tables(
+            connection,
+            schema,
+            filter_names,
+            scope,
+            kind,
+            sqlite_include_internal,
+            **kw,
+        )
+
+        # computed columns are reported as hidden and require table_xinfo
+        if self.server_version_info >= (3, 31):
+            pragma = "table_xinfo"
+            columns = (
+                'p.cid, p.name, p.type, p."notnull", p.dflt_value, '
+                "p.pk, p.hidden"
+            )
+        else:
+            pragma = "table_info"
+            columns = 'p.cid, p.name, p.type, p."notnull", p.dflt_value, p.pk'
+
+        rows = self._get_multi_pragma(
+            connection,
+            tables,
+            f"pragma_{pragma}(m.name, :schema) AS p",
+            columns,
+        )
+        return {
+            (schema_arg, table_name): self._columns_from_pragma(
+                rows[(schema_arg, table_name)],
+                pragma,
+                lambda table_sql=table_sql: table_sql,
+            )
+            for schema_arg, table_name, table_sql in tables
+        }
+
+    @reflection.flexi_cache(
+        ("schema", InternalTraversal.dp_string),
+        ("filter_names", InternalTraversal.dp_string_list),
+        ("scope", InternalTraversal.dp_plain_obj),
+        ("kind", InternalTraversal.dp_plain_obj),
+        ("sqlite_include_internal", InternalTraversal.dp_boolean),
+    )
+    def _get_multi_indexes(
+        self,
+        connection,
+        schema,
+        filter_names,
+        scope,
+        kind,
+        sqlite_include_internal,
+        **kw,
+    ):
+        """Return the indexes of each table, including the automatic
+        indexes used by UNIQUE and PRIMARY KEY constraints.
+
+        """
+        tables, _ = self._get_multi_tables(
+            connection,
+            schema,
+            filter_names,
+            scope,
+            kind,
+            sqlite_include_internal,
+            **kw,
+        )
+        rows = self._get_multi_pragma(
+            connection,
+            tables,
+            "pragma_index_list(m.name, :schema) AS il "
+            "LEFT OUTER JOIN pragma_index_info(il.name, :schema) AS ii",
+            'il.seq, il.name, il."unique", ii.seqno, ii.cid, ii.name',
+        )
+
+        result = {}
+        for schema_arg, table_name, _ in tables:
+            pragma_indexes = {}
+            index_info = defaultdict(list)
+            for row in rows[(schema_arg, table_name)]:
+                pragma_indexes.setdefault(row[1], row[0:3])
+                if row[3] is not None:
+                    index_info[row[1]].append(row[3:6])
+            result[(schema_arg, table_name)] = self._indexes_from_pragma(
+                pragma_indexes.values(), index_info.__getitem__, True
+            )
+        return result
+
+    def _sqlite_multi_reflect(
+        self,
+        single_tbl_method,
+        multi_tbl_method,
+        connection,
+        schema,
+        filter_names,
+        scope,
+        kind,
+        **kw,
+    ):
+        if not self._supports_multi_reflection:
+            yield from self._default_multi_reflect(
+                single_tbl_method,
+                connection,
+                schema=schema,
+                filter_names=filter_names,
+                scope=scope,
+                kind=kind,
+                **kw,
+            )
+            return
+
+        multi_args = (
+            schema,
+            filter_names,
+            scope,
+            kind,
+            kw.pop("sqlite_include_internal", False),
+        )
+        tables, missing = self._get_multi_tables(connection, *multi_args, **kw)
+
+        for table_name, value in multi_tbl_method(
+            connection, tables, multi_args, **kw
+        ):
+            yield (schema, table_name), value
+
+        if missing:
+            yield from self._default_multi_reflect(
+                single_tbl_method,
+                connection,
+                schema=schema,
+                filter_names=missing,
+                scope=scope,
+                kind=kind,
+                **kw,
+            )
+
+    def get_multi_columns(self, connection, **kw):
+        return self._sqlite_multi_reflect(
+            self.get_columns, self._multi_columns, connection, **kw
+        )
+
+    def _multi_columns(self, connection, tables, multi_args, **kw):
+        columns = self._get_multi_columns(connection, *multi_args, **kw)
+        for schema_arg, table_name, _ in tables:
+            yield table_name, (
+                columns[(schema_arg, table_name)]
+                or ReflectionDefaults.columns()
+            )
+
+    def get_multi_pk_constraint(self, connection, **kw):
+        return self._sqlite_multi_reflect(
+            self.get_pk_constraint, self._multi_pk_constraint, connection, **kw
+        )
+
+    def _multi_pk_constraint(self, connection, tables, multi_args, **kw):
+        columns = self._get_multi_columns(connection, *multi_args, **kw)
+        for schema_arg, table_name, table_sql in tables:
+            yield table_name, self._pk_constraint_from_columns(
+                table_sql, columns[(schema_arg, table_name)]
+            )
+
+    def get_multi_foreign_keys(self, connection, **kw):
+        return self._sqlite_multi_reflect(
+            self.get_foreign_keys, self._multi_foreign_keys, connection, **kw
+        )
+
+    def _multi_foreign_keys(self, connection, tables, multi_args, **kw):
+        fks = self._get_multi_foreign_keys(connection, *multi_args, **kw)
+        for schema_arg, table_name, _ in tables:
+            yield table_name, fks[(schema_arg, table_name)]
+
+    @reflection.flexi_cache(
+        ("schema", InternalTraversal.dp_string),
+        ("filter_names", InternalTraversal.dp_string_list),
+        ("scope", InternalTraversal.dp_plain_obj),
+        ("kind", InternalTraversal.dp_plain_obj),
+        ("sqlite_include_internal", InternalTraversal.dp_boolean),
+    )
+    def _get_multi_foreign_keys(
+        self,
+        connection,
+        schema,
+        filter_names,
+        scope,
+        kind,
+        sqlite_include_internal,
+        **kw,
+    ):
+        tables, _ = self._get_multi_tables(
+            connection,
+            schema,
+            filter_names,
+            scope,
+            kind,
+            sqlite_include_internal,
+            **kw,
+        )
+        rows = self._get_multi_pragma(
+            connection,
+            tables,
+            "pragma_foreign_key_list(m.name, :schema) AS p",
+            'p.id, p.seq, p."table", p."from", p."to", '
+            'p.on_update, p.on_delete, p."match"',
+        )
+        return {
+            (schema_arg, table_name): self._foreign_keys_from_pragma(
+                connection,
+                table_name,
+                schema,
+                rows[(schema_arg, table_name)],
+                table_sql,
+                **kw,
+            )
+            for schema_arg, table_name, table_sql in tables
+        }
+
+    def get_multi_indexes(self, connection, **kw):
+        return self._sqlite_multi_reflect(
+            self.get_indexes, self._multi_indexes, connection, **kw
+        )
+
+    def _multi_indexes(self, connection, tables, multi_args, **kw):
+        indexes = self._get_multi_indexes(connection, *multi_args, **kw)
+        include_auto_indexes = kw.pop("include_auto_indexes", False)
+        for schema_arg, table_name, _ in tables:
+            table_indexes = indexes[(schema_arg, table_name)]
+            if not include_auto_indexes:
+                # ignore implicit primary key index.
+                table_indexes = [
+                    idx
+                    for idx in table_indexes
+                    if not idx["name"].startswith("sqlite_autoindex")
+                ]
+            yield table_name, table_indexes or ReflectionDefaults.indexes()
+
+    def get_multi_unique_constraints(self, connection, **kw):
+        return self._sqlite_multi_reflect(
+            self.get_unique_constraints,
+            self._multi_unique_constraints,
+            connection,
+            **kw,
+        )
+
+    def _multi_unique_constraints(self, connection, tables, multi_args, **kw):
+        indexes = self._get_multi_indexes(connection, *multi_args, **kw)
+        for schema_arg, table_name, table_sql in tables:
+            yield table_name, self._unique_constraints_from_indexes(
+                table_sql, indexes[(schema_arg, table_name)]
+            )
+
+    def get_multi_check_constraints(self, connection, **kw):
+        return self._sqlite_multi_reflect(
+            self.get_check_constraints,
+            self._multi_check_constraints,
+            connection,
+            **kw,
+        )
+
+    def _multi_check_constraints(self, connection, tables, multi_args, **kw):
+        for _, table_name, table_sql in tables:
+            yield table_name, self._check_constraints_from_sql(table_sql)
@@ -20,6 +20,7 @@ from . import util as util
 from .base import Connection as Connection
 from .base import Engine as Engine
 from .base import NestedTransaction as NestedTransaction
+from .base import QueryCacheStats as QueryCacheStats
 from .base import RootTransaction as RootTransaction
 from .base import Transaction as Transaction
 from .base import TwoPhaseTransaction as TwoPhaseTransaction
@@ -29,11 +30,15 @@ from .cursor import CursorResult as CursorResult
 from .cursor import ResultProxy as ResultProxy
 from .interfaces import AdaptedConnection as AdaptedConnection
 from .interfaces import BindTyping as BindTyping
+from .interfaces import CacheStats as CacheStats
+from .interfaces import CacheWarmResult as CacheWarmResult
 from .interfaces import Compiled as Compiled
+from .interfaces import CompiledStatementStats as CompiledStatementStats
 from .interfaces import ConnectArgsType as ConnectArgsType
 from .interfaces import CreateEnginePlugin as CreateEnginePlugin
 from .interfaces import Dialect as Dialect
 from .interfaces import ExceptionContext as ExceptionContext
+from .interfaces import ExecuteStyle as ExecuteStyle
 from .interfaces import ExecutionContext as ExecutionContext
 from .interfaces import TypeCompiler as TypeCompiler
 from .mock import create_mock_engine as create_mock_engine
@@ -8,6 +8,8 @@ from __future__ import annotations
 
 import contextlib
 import sys
+import threading
+from time import perf_counter
 import typing
 from typing import Any
 from typing import Callable
@@ -26,9 +28,13 @@ from typing import Union
 
 from .interfaces import _IsolationLevel
 from .interfaces import BindTyping
+from .interfaces import CacheStats
+from .interfaces import CacheWarmResult
+from .interfaces import CompiledStatementStats
 from .interfaces import ConnectionEventsTarget
 from .interfaces import DBAPICursor
 from .interfaces import ExceptionContext
+from .interfaces import ExecuteStyle
 from .interfaces import ExecutionContext
 from .util import _distill_params_20
 from .util import _distill_raw_params
@@ -438,6 +444,24 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
             :ref:`orm_queryguide_yield_per` - in the :ref:`queryguide_toplevel`
             describing the ORM version of ``yield_per``
 
+        :param insertmanyvalues_page_size: Available on:
+          :class:`_engine.Connection`, :class:`_engine.Engine`,
+          :class:`_sql.Executable`.  Number of rows to format into an
+          INSERT statement when the statement uses "insertmanyvalues" mode,
+          which is a paged form of bulk insert that is used for many backends
+          when using :term:`executemany` execution typically in conjunction
+          with RETURNING. Defaults to 1000, or the value of the
+          :paramref:`_sa.create_engine.insertmanyvalues_page_size` parameter.
+          The effective number of rows per batch may be lower in order to
+          stay within the dialect's limit on the total number of bound
+          parameters per statement.
+
+          .. versionadded:: 2.0
+
+          .. seealso::
+
+            :ref:`engine_insertmanyvalues`
+
         :param schema_translate_map: Available on: :class:`_engine.Connection`,
           :class:`_engine.Engine`, :class:`_sql.Executable`.
 
@@ -1589,6 +1613,12 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
             "compiled_cache", self.engine._compiled_cache
         )
 
+        instrument = self.engine._query_cache_stats is not None or (
+            has_events and bool(self.dispatch.statement_compiled)
+        )
+        if instrument:
+            start = perf_counter()
+
         compiled_sql, extracted_params, cache_hit = elem._compile_w_cache(
             dialect=dialect,
             compiled_cache=compiled_cache,
@@ -1597,6 +1627,11 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
             schema_translate_map=schema_translate_map,
             linting=self.dialect.compiler_linting | compiler.WARN_LINTING,
         )
+
+        if instrument:
+            self.engine._instrument_compile(
+                self, elem, compiled_sql, cache_hit, start
+            )
         ret = self._execute_context(
             dialect,
             dialect.execution_ctx_cls._init_compiled,
@@ -1795,6 +1830,18 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
 
         context.pre_exec()
 
+        if context.execute_style is ExecuteStyle.INSERTMANYVALUES:
+            return self._exec_insertmany_context(dialect, context)
+        else:
+            return self._exec_single_context(dialect, context)
+
+    def _exec_single_context(
+        self, dialect: Dialect, context: ExecutionContext
+    ) -> CursorResult[Any]:
+        """continue the _execute_context() method for a single DBAPI
+        cursor.execute() or cursor.executemany() call.
+
+        """
         if dialect.bind_typing is BindTyping.SETINPUTSIZES:
             context._set_input_sizes()
 
@@ -1914,6 +1961,115 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
 
         return result
 
+    def _exec_insertmany_context(
+        self, dialect: Dialect, context: ExecutionContext
+    ) -> CursorResult[Any]:
+        """continue the _execute_context() method for an "insertmanyvalues"
+        operation, which will invoke DBAPI cursor.execute() one or more
+        times with individual log and event hook calls, accumulating
+        the rows returned by RETURNING for each batch.
+
+        """
+        cursor, str_statement, parameters = (
+            context.cursor,
+            context.statement,
+            context.parameters,
+        )
+
+        compiled = cast(compiler.SQLCompiler, context.compiled)
+
+        engine_events = self._has_events or self.engine._has_events
+        if self.dialect._has_events:
+            do_execute_dispatch: Any = self.dialect.dispatch.do_execute
+        else:
+            do_execute_dispatch = ()
+
+        if self._echo:
+            stats = context._get_cache_stats()
+
+        page_size = context.execution_options.get(
+            "insertmanyvalues_page_size", dialect.insertmanyvalues_page_size
+        )
+
+        rows: List[Any] = []
+
+        for (
+            sub_stmt,
+            sub_params,
+            batchnum,
+            total_batches,
+        ) in compiled._deliver_insertmanyvalues_batches(
+            str_statement, parameters, page_size
+        ):
+            if engine_events:
+                for fn in self.dispatch.before_cursor_execute:
+                    sub_stmt, sub_params = fn(
+                        self,
+                        cursor,
+                        sub_stmt,
+                        sub_params,
+                        context,
+                        False,
+                    )
+
+            if self._echo:
+                self._log_info(sub_stmt)
+
+                if not self.engine.hide_parameters:
+                    self._log_info(
+                        "[%s insertmanyvalues batch %d of %d] %r",
+                        stats,
+                        batchnum,
+                        total_batches,
+                        sql_util._repr_params(
+                            sub_params, batches=10, ismulti=False
+                        ),
+                    )
+                else:
+                    self._log_info(
+                        "[%s insertmanyvalues batch %d of %d] "
+                        "[SQL parameters hidden due to hide_parameters=True]"
+                        % (stats, batchnum, total_batches)
+                    )
+
+            try:
+                for fn in do_execute_dispatch:
+                    if fn(cursor, sub_stmt, sub_params, context):
+                        break
+                else:
+                    dialect.do_execute(cursor, sub_stmt, sub_params, context)
+
+                if engine_events:
+                    self.dispatch.after_cursor_execute(
+                        self,
+                        cursor,
+                        sub_stmt,
+                        sub_params,
+                        context,
+                        False,
+                    )
+
+                rows.extend(cursor.fetchall())
+
+            except BaseException as e:
+                self._handle_dbapi_exception(
+                    e, sub_stmt, sub_params, cursor, context
+                )
+
+        try:
+            context._insertmanyvalues_rows = rows
+
+            context.post_exec()
+
+            result = context._setup_result_proxy()
+
+        except BaseException as e:
+            self._handle_dbapi_exception(
+                e, str_statement, parameters, cursor, context
+            )
+
+        return result
+
     def _cursor_execute(
         self,
         cursor: DBAPICursor,
@@ -2656,6 +2812,201 @@ class TwoPhaseTransaction(RootTransaction):
         self.connection._commit_twophase_impl(self.xid, self._is_prepared)
 
 
+class QueryCacheStats:
+    """Collects statistics regarding the compiled cache of an
+    :class:`_engine.Engine`.
+
+    An instance of this object is available from the
+    :attr:`_engine.Engine.query_cache_stats` attribute when the
+    :paramref:`_sa.create_engine.query_cache_stats` parameter is set to
+    ``True``.   Statistics include all statements invoked by way of
+    :meth:`_engine.Connection.execute` on connections procured from the
+    engine, as well as those compiled by :meth:`_engine.Engine.warm_cache`,
+    regardless of which compiled cache is in use; this includes the
+    per-mapper caches used by the ORM unit of work.  The :attr:`.size`,
+    :attr:`.size_bytes` and :attr:`.evictions` values describe the
+    engine's own cache, as configured by
+    :paramref:`_sa.create_engine.query_cache_size`.
+
+    Individual compilations may be intercepted as well using the
+    :meth:`_events.ConnectionEvents.statement_compiled` event.
+
+    .. versionadded:: 2.0
+
+    .. seealso::
+
+        :ref:`sql_caching_stats`
+
+    """
+
+    hits: int
+    """Number of statements located in the cache."""
+
+    misses: int
+    """Number of statements that were not present in the cache, and
+    were compiled and added to it."""
+
+    uncacheable: int
+    """Number of statements that were compiled without using the cache,
+    as they could not produce a cache key.
+
+    These statements are compiled each time they are invoked, and are
+    typically those which make use of constructs that don't participate
+    in caching, such as custom constructs and types which don't set the
+    ``inherit_cache`` or ``cache_ok`` attributes.
+
+    """
+
+    evictions: int
+    """Number of entries removed from the cache by the pruning of least
+    recently used items."""
+
+    compilations: int
+    """Total number of statements compiled, including those compiled
+    when caching is disabled."""
+
+    compile_time: float
+    """Total time in seconds spent producing cache keys for and compiling
+    statements which were not located in the cache."""
+
+    max_tracked_statements: int = 1000
+    """The maximum number of distinct SQL strings for which individual
+    compilation statistics are retained, beyond which the statistics for
+    the least recently compiled strings are discarded."""
+
+    def __init__(self, cache: Optional[_CompiledCacheType]):
+        self._cache = cache
+        self._mutex = threading.Lock()
+        self._statements: util.LRUCache[str, List[Any]] = util.LRUCache(
+            self.max_tracked_statements
+        )
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset all statistics to zero.
+
+        Entries present in the cache itself are not affected.
+
+        """
+        with self._mutex:
+            self.hits = self.misses = self.uncacheable = 0
+            self.evictions = self.compilations = 0
+            self.compile_time = 0.0
+            self._statements.clear()
+
+    @property
+    def hit_ratio(self) -> float:
+        """The ratio of :attr:`.hits` to the total number of statements
+        invoked, including those which were not cacheable, as a float
+        between zero and one.
+
+        Is ``0.0`` if no statements were invoked.
+
+        """
+        total = self.hits + self.misses + self.uncacheable
+        return self.hits / total if total else 0.0
+
+    @property
+    def size(self) -> int:
+        """Current number of entries in the engine's compiled cache."""
+        return len(self._cache) if self._cache is not None else 0
+
+    @property
+    def size_bytes(self) -> int:
+        """An estimate of the memory in bytes used by the compiled objects
+        present in the engine's compiled cache.
+
+        The estimate is computed each time this attribute is accessed and
+        includes the compiled objects and their direct attributes, as
+        reported by ``sys.getsizeof()``; objects shared among compiled
+        forms, such as the :class:`_schema.Table` and :class:`_schema.Column`
+        objects referred to by statements, are not included.
+
+        """
+        if self._cache is None:
+            return 0
+        getsizeof = sys.getsizeof
+        total = 0
+        for compiled in list(self._cache.values()):
+            total += getsizeof(compiled)
+            attrs = getattr(compiled, "__dict__", None)
+            if attrs is not None:
+                total += getsizeof(attrs)
+                total += sum(getsizeof(value) for value in attrs.values())
+        return total
+
+    def most_compiled(
+        self, limit: Optional[int] = 10
+    ) -> List[CompiledStatementStats]:
+        """Return compilation statistics for the SQL strings compiled most
+        often, in descending order of the number of times compiled.
+
+        SQL strings which are compiled repeatedly indicate statements that
+        are not cacheable, or a cache that is too small for the number of
+        distinct statements in use, such that entries are evicted and
+        compiled again.
+
+        :param limit: maximum number of entries to return; pass ``None``
+         to return statistics for all tracked SQL strings.
+
+        """
+        with self._mutex:
+            entries = [
+                CompiledStatementStats(statement, *counts)
+                for statement, counts in self._statements.items()
+            ]
+        entries.sort(
+            key=lambda entry: (entry.compile_count, entry.total_compile_time),
+            reverse=True,
+        )
+        return entries[:limit] if limit is not None else entries
+
+    def _record_hit(self) -> None:
+        with self._mutex:
+            self.hits += 1
+
+    def _record_compile(
+        self, compiled: Compiled, cache_hit: CacheStats, compile_time: float
+    ) -> None:
+        with self._mutex:
+            if cache_hit is CacheStats.CACHE_MISS:
+                self.misses += 1
+            elif cache_hit is CacheStats.NO_CACHE_KEY:
+                self.uncacheable += 1
+            self.compilations += 1
+            self.compile_time += compile_time
+
+            counts = self._statements.get(compiled.string)
+            if counts is None:
+                self._statements[compiled.string] = [
+                    1,
+                    compile_time,
+                    compile_time,
+                ]
+            else:
+                counts[0] += 1
+                counts[1] += compile_time
+                if compile_time > counts[2]:
+                    counts[2] = compile_time
+
+    def _record_evictions(self, count: int) -> None:
+        with self._mutex:
+            self.evictions += count
+
+    def __repr__(self) -> str:
+        return (
+            "<QueryCacheStats hits=%d misses=%d uncacheable=%d "
+            "evictions=%d size=%d>"
+            % (
+                self.hits,
+                self.misses,
+                self.uncacheable,
+                self.evictions,
+                self.size,
+            )
+        )
+
+
 class Engine(
     ConnectionEventsTarget, log.Identified, inspection.Inspectable["Inspector"]
 ):
@@ -2682,6 +3033,7 @@ class Engine(
     dispatch: dispatcher[ConnectionEventsTarget]
 
     _compiled_cache: Optional[_CompiledCacheType]
+    _query_cache_stats: Optional[QueryCacheStats]
 
     _execution_options: _ExecuteOptions = _EMPTY_EXECUTION_OPTS
     _has_events: bool = False
@@ -2707,6 +3059,7 @@ class Engine(
         query_cache_size: int = 500,
         execution_options: Optional[Mapping[str, Any]] = None,
         hide_parameters: bool = False,
+        query_cache_stats: bool = False,
     ):
         self.pool = pool
         self.url = url
@@ -2721,6 +3074,10 @@ class Engine(
             )
         else:
             self._compiled_cache = None
+        if query_cache_stats:
+            self._query_cache_stats = QueryCacheStats(self._compiled_cache)
+        else:
+            self._query_cache_stats = None
         log.instance_logger(self, echoflag=echo)
         if execution_options:
             self.update_execution_options(**execution_options)
@@ -2733,6 +3090,46 @@ class Engine(
                 len(cache),
                 cache.capacity,
             )
+        if self._query_cache_stats is not None:
+            self._query_cache_stats._record_evictions(
+                len(cache) - cache.capacity
+            )
+
+    @property
+    def query_cache_stats(self) -> Optional[QueryCacheStats]:
+        """Statistics regarding the compiled cache of this
+        :class:`_engine.Engine`, if enabled.
+
+        Returns a :class:`.QueryCacheStats` object when the
+        :paramref:`_sa.create_engine.query_cache_stats` parameter is set to
+        ``True``, else ``None``.
+
+        .. versionadded:: 2.0
+
+        """
+        return self._query_cache_stats
+
+    def _instrument_compile(
+        self,
+        connection: Connection,
+        elem: Executable,
+        compiled: Compiled,
+        cache_hit: CacheStats,
+        start: float,
+    ) -> None:
+        stats = self._query_cache_stats
+        if cache_hit is CacheStats.CACHE_HIT:
+            if stats is not None:
+                stats._record_hit()
+            return
+
+        compile_time = compiled._gen_time - start
+        if stats is not None:
+            stats._record_compile(compiled, cache_hit, compile_time)
+        if connection._has_events or self._has_events:
+            connection.dispatch.statement_compiled(
+                connection, elem, compiled, cache_hit, compile_time
+            )
 
     @property
     def engine(self) -> Engine:
@@ -2758,6 +3155,131 @@ class Engine(
         if self._compiled_cache:
             self._compiled_cache.clear()
 
+    def warm_cache(
+        self,
+        statements: typing.Iterable[
+            Union[Executable, Tuple[Executable, _CoreAnyExecuteParams]]
+        ],
+        *,
+        execution_options: Optional[_ExecuteOptionsParameter] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[CacheWarmResult]:
+        """Compile the given statements ahead of time, placing their
+        compiled forms in the compiled cache.
+
+        Each statement is compiled in the same way as when it's invoked
+        using :meth:`_engine.Connection.execute`, so that a subsequent
+        execution of an equivalent statement locates the compiled form
+        in the cache instead of compiling it, avoiding the cost of
+        compilation for the first requests made after an application
+        starts.   ORM-enabled statements such as ``select(User)``, including
+        those which make use of loader options, are compiled through the
+        ORM in the same way as when invoked with :meth:`_orm.Session.execute`.
+
+        The cache key of a compiled statement includes the names of the
+        parameters passed when it's executed, as well as whether a single
+        parameter set or a list of them is passed.   Statements which will
+        be invoked with parameters may be given as a tuple of
+        ``(statement, parameters)``, where ``parameters`` is a dictionary
+        or list of dictionaries as would be passed to
+        :meth:`_engine.Connection.execute`; only the keys of these
+        dictionaries are significant.
+
+        A connection is procured from the connection pool for the duration
+        of the operation, so that the dialect is initialized against the
+        database in use.  No SQL is emitted for the given statements.
+
+        :param statements: iterable of statements, or tuples of
+         ``(statement, parameters)``.
+
+        :param execution_options: optional execution options, which are
+         merged with those of the :class:`_engine.Engine` and of each
+         statement in order to determine the
+         :paramref:`_engine.Connection.execution_options.compiled_cache` and
+         :paramref:`_engine.Connection.execution_options.schema_translate_map`
+         in use.
+
+        :param max_workers: when given, statements are compiled using a
+         :class:`concurrent.futures.ThreadPoolExecutor` with this number of
+         worker threads.
+
+        :return: a list of :class:`.CacheWarmResult` objects, one for each
+         statement in the order given, indicating if each statement was
+         cached.   Errors raised when generating the cache key for a
+         statement or compiling it are reported in the result and are not
+         raised.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`sql_caching`
+
+        """
+
+        dialect = self.dialect
+        linting = dialect.compiler_linting | compiler.WARN_LINTING
+        options = self._execution_options.merge_with(execution_options)
+
+        def warm(
+            entry: Union[Executable, Tuple[Executable, _CoreAnyExecuteParams]]
+        ) -> CacheWarmResult:
+            if isinstance(entry, tuple):
+                elem, parameters = entry
+                distilled_parameters = _distill_params_20(parameters)
+            else:
+                elem, distilled_parameters = entry, ()
+
+            if distilled_parameters:
+                keys = sorted(distilled_parameters[0])
+                for_executemany = len(distilled_parameters) > 1
+            else:
+                keys = []
+                for_executemany = False
+
+            elem_options = elem._execution_options.merge_with(options)
+
+            if instrument:
+                start = perf_counter()
+
+            try:
+                compiled, _, cache_hit = elem._compile_w_cache(
+                    dialect=dialect,
+                    compiled_cache=elem_options.get(
+                        "compiled_cache", self._compiled_cache
+                    ),
+                    column_keys=keys,
+                    for_executemany=for_executemany,
+                    schema_translate_map=elem_options.get(
+                        "schema_translate_map", None
+                    ),
+                    linting=linting,
+                )
+            except exc.SQLAlchemyError as err:
+                return CacheWarmResult(elem, None, err)
+
+            if instrument:
+                self._instrument_compile(
+                    connection, elem, compiled, cache_hit, start
+                )
+            return CacheWarmResult(elem, cache_hit, None)
+
+        # the connection ensures the dialect is initialized; it's also
+        # passed to the statement_compiled event
+        with self.connect() as connection:
+            instrument = self._query_cache_stats is not None or (
+                self._has_events
+                and bool(connection.dispatch.statement_compiled)
+            )
+
+            if max_workers:
+                from concurrent.futures import ThreadPoolExecutor
+
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    return list(executor.map(warm, statements))
+            else:
+                return [warm(entry) for entry in statements]
+
     def update_execution_options(self, **opt: Any) -> None:
         r"""Update the default execution_options dictionary
         of this :class:`_engine.Engine`.
@@ -3040,6 +3562,7 @@ class OptionEngineMixin(log.Identified):
 
     dispatch: dispatcher[ConnectionEventsTarget]
     _compiled_cache: Optional[_CompiledCacheType]
+    _query_cache_stats: Optional[QueryCacheStats]
     dialect: Dialect
     pool: Pool
     url: URL
@@ -3055,6 +3578,7 @@ class OptionEngineMixin(log.Identified):
         self.logging_name = proxied.logging_name
         self.echo = proxied.echo
         self._compiled_cache = proxied._compiled_cache
+        self._query_cache_stats = proxied._query_cache_stats
         self.hide_parameters = proxied.hide_parameters
         log.instance_logger(self, echoflag=self.echo)
 
@@ -40,6 +40,7 @@ if typing.TYPE_CHECKING:
     from ..pool import _CreatorFnType
     from ..pool import _CreatorWRecFnType
     from ..pool import _ResetStyleArgType
+    from ..pool import ConnectionBudget
     from ..pool import Pool
     from ..util.typing import Literal
 
@@ -48,6 +49,7 @@ if typing.TYPE_CHECKING:
 def create_engine(
     url: Union[str, URL],
     *,
+    array_in_expansion: bool = ...,
     connect_args: Dict[Any, Any] = ...,
     convert_unicode: bool = ...,
     creator: Union[_CreatorFnType, _CreatorWRecFnType] = ...,
@@ -58,6 +60,7 @@ def create_engine(
     future: Literal[True],
     hide_parameters: bool = ...,
     implicit_returning: Literal[True] = ...,
+    insertmanyvalues_page_size: int = ...,
     isolation_level: _IsolationLevel = ...,
     json_deserializer: Callable[..., Any] = ...,
     json_serializer: Callable[..., Any] = ...,
@@ -70,7 +73,13 @@ def create_engine(
     paramstyle: Optional[_ParamStyle] = ...,
     pool: Optional[Pool] = ...,
     poolclass: Optional[Type[Pool]] = ...,
+    pool_budget: Optional[ConnectionBudget] = ...,
+    pool_idle_timeout: Optional[float] = ...,
     pool_logging_name: str = ...,
+    pool_maintenance_interval: Optional[float] = ...,
+    pool_metrics: bool = ...,
+    pool_metrics_interval: Optional[float] = ...,
+    pool_min_idle: int = ...,
     pool_pre_ping: bool = ...,
     pool_size: int = ...,
     pool_recycle: int = ...,
@@ -79,6 +88,7 @@ def create_engine(
     pool_use_lifo: bool = ...,
     plugins: List[str] = ...,
     query_cache_size: int = ...,
+    query_cache_stats: bool = ...,
     **kwargs: Any,
 ) -> Engine:
     ...
@@ -168,6 +178,22 @@ def create_engine(url: Union[str, "_url.URL"], **kwargs: Any) -> Engine:
 
         :ref:`connections_toplevel`
 
+    :param array_in_expansion: when ``True``, IN expressions which use
+        "expanding" bound parameters, such as ``column.in_([1, 2, 3])``,
+        are rendered using a single bound parameter that receives the
+        list of values as an array, rather than being rendered as one bound
+        parameter per value at statement execution time.  The SQL string
+        then stays the same regardless of how many values are passed, so
+        that server side prepared statements may be reused.  Raises
+        :class:`.ArgumentError` if the dialect in use does not support
+        this; currently supported by the PostgreSQL and SQLite dialects.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`engine_array_in_expansion`
+
     :param connect_args: a dictionary of options which will be
         passed directly to the DBAPI's ``connect()`` method as
         additional keyword arguments.  See the example
@@ -273,6 +299,22 @@ def create_engine(url: Union[str, "_url.URL"], **kwargs: Any) -> Engine:
         :paramref:`.Table.implicit_returning` parameter.
 
 
+    :param insertmanyvalues_page_size: number of rows to format into an
+        INSERT statement when the statement uses "insertmanyvalues" mode,
+        which is a paged form of bulk insert that is used for many backends
+        when using :term:`executemany` execution typically in conjunction
+        with RETURNING. Defaults to 1000, but may also be subject to
+        dialect-specific limiting factors which may override this value on
+        a per-statement basis.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`engine_insertmanyvalues`
+
+            :paramref:`_engine.Connection.execution_options.insertmanyvalues_page_size`
+
     :param isolation_level: optional string name of an isolation level
         which will be set on all new connections unconditionally.
         Isolation levels are typically some subset of the string names
@@ -402,6 +444,33 @@ def create_engine(url: Union[str, "_url.URL"], **kwargs: Any) -> Engine:
         instantiate the pool in this case, you just indicate what type
         of pool to be used.
 
+    :param pool_budget: a :class:`.ConnectionBudget` shared by the
+        :class:`.QueuePool` of several engines, such as those of the
+        tenants of a multi-tenant application, which limits the total
+        number of connections held by the pools, replacing the least
+        recently used idle connection of any of the pools when a new
+        connection is needed.  See :paramref:`_pool.QueuePool.budget`.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`pool_budget`
+
+    :param pool_idle_timeout: number of seconds after which a connection
+        that has remained idle in a :class:`.QueuePool` is closed by
+        background maintenance, down to ``pool_min_idle`` connections.
+        Setting this parameter enables background maintenance with an
+        interval of 30 seconds or of ``pool_idle_timeout``, whichever is
+        less, unless ``pool_maintenance_interval`` is also set.  See
+        :paramref:`_pool.QueuePool.idle_timeout`.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`pool_idle_timeout`
+
     :param pool_logging_name:  String identifier which will be used within
        the "name" field of logging records generated within the
        "sqlalchemy.pool" logger. Defaults to a hexstring of the object's
@@ -412,6 +481,51 @@ def create_engine(url: Union[str, "_url.URL"], **kwargs: Any) -> Engine:
             :ref:`dbengine_logging` - further detail on how to configure
             logging.
 
+    :param pool_maintenance_interval: enable background maintenance of the
+        idle connections in a :class:`.QueuePool`, running at the given
+        interval in seconds, which opens connections up to
+        ``pool_min_idle``, replaces connections approaching
+        ``pool_recycle`` and, when ``pool_pre_ping`` is set, pings idle
+        connections so that checkouts don't need to.  See
+        :paramref:`_pool.QueuePool.maintenance_interval`.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`pool_maintenance`
+
+    :param pool_metrics: boolean, if True the connection pool will collect
+        metrics regarding checkouts, new and overflow connections, checkout
+        timeouts and pre-ping failures, which are available from the
+        :attr:`_pool.Pool.metrics` attribute of the engine's pool.
+        Defaults to False.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`pool_metrics`
+
+    :param pool_metrics_interval=60: the minimum interval in seconds
+        between invocations of the :meth:`_events.PoolEvents.metrics_sample`
+        event, when ``pool_metrics`` is enabled.  ``None`` disables the event.
+
+        .. versionadded:: 2.0
+
+    :param pool_min_idle=0: the number of idle connections that background
+        maintenance keeps open in a :class:`.QueuePool`, up to
+        ``pool_size`` connections in total.  Setting this parameter enables
+        background maintenance with an interval of 30 seconds, unless
+        ``pool_maintenance_interval`` is also set.  See
+        :paramref:`_pool.QueuePool.min_idle`.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`pool_maintenance`
+
     :param pool_pre_ping: boolean, if True will enable the connection pool
         "pre-ping" feature that tests connections for liveness upon
         each checkout.
@@ -508,6 +622,18 @@ def create_engine(url: Union[str, "_url.URL"], **kwargs: Any) -> Engine:
 
      .. versionadded:: 1.4
 
+    :param query_cache_stats: when ``True``, statistics regarding the
+     compiled cache are collected, including cache hits, misses and
+     evictions as well as the time spent compiling statements, and are
+     made available from the :attr:`_engine.Engine.query_cache_stats`
+     attribute.  Defaults to ``False``.
+
+     .. versionadded:: 2.0
+
+     .. seealso::
+
+        :ref:`sql_caching_stats`
+
     """  # noqa
 
     if "strategy" in kwargs:
@@ -629,6 +755,12 @@ def create_engine(url: Union[str, "_url.URL"], **kwargs: Any) -> Engine:
             "reset_on_return": "pool_reset_on_return",
             "pre_ping": "pool_pre_ping",
             "use_lifo": "pool_use_lifo",
+            "metrics": "pool_metrics",
+            "metrics_interval": "pool_metrics_interval",
+            "min_idle": "pool_min_idle",
+            "maintenance_interval": "pool_maintenance_interval",
+            "idle_timeout": "pool_idle_timeout",
+            "budget": "pool_budget",
         }
         for k in util.get_cls_kwargs(poolclass):
             tk = translate.get(k, k)
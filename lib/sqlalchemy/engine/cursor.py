@@ -29,6 +29,8 @@ from typing import TYPE_CHECKING
 from typing import TypeVar
 from typing import Union
 
+from .result import _fuse_row_processors
+from .result import _FusedRowConverters
 from .result import MergedResult
 from .result import Result
 from .result import ResultMetaData
@@ -48,6 +50,7 @@ from ..sql.compiler import RM_RENDERED_NAME
 from ..sql.compiler import RM_TYPE
 from ..sql.type_api import TypeEngine
 from ..util import compat
+from ..util._has_cy import HAS_CYEXTENSION
 from ..util.typing import Literal
 
 _UNPICKLED = util.symbol("unpickled")
@@ -104,7 +107,8 @@ class CursorResultMetaData(ResultMetaData):
         "_tuplefilter",
         "_translated_indexes",
         "_safe_for_cache",
-        "_unpickled"
+        "_unpickled",
+        "_fused_converters",
         # don't need _unique_filters support here for now.  Can be added
         # if a need arises.
     )
@@ -115,6 +119,9 @@ class CursorResultMetaData(ResultMetaData):
     _unpickled: bool
     _safe_for_cache: bool
     _translated_indexes: Optional[List[int]]
+    _fused_converters: Dict[
+        Optional[Tuple[int, ...]], Optional[_FusedRowConverters]
+    ]
 
     returns_rows: ClassVar[bool] = True
 
@@ -127,6 +134,25 @@ class CursorResultMetaData(ResultMetaData):
             extra=[self._keymap[key][MD_OBJECTS] for key in self._keys],
         )
 
+    def _fused_row_converters(self) -> Optional[_FusedRowConverters]:
+        # generated converters are shared among this metadata and the
+        # copies made by _reduce() and _adapt_to_context(), so that they
+        # are generated once per result shape for a cached statement
+        key = (
+            tuple(self._translated_indexes)
+            if self._translated_indexes
+            else None
+        )
+        try:
+            return self._fused_converters[key]
+        except KeyError:
+            if key is None and not any(self._processors):
+                converters = None
+            else:
+                converters = _fuse_row_processors(self._processors, key)
+            self._fused_converters[key] = converters
+            return converters
+
     def _reduce(self, keys: Sequence[_KeyIndexType]) -> ResultMetaData:
         recs = cast(
             "List[_CursorKeyMapRecType]", list(self._metadata_for_keys(keys))
@@ -142,6 +168,7 @@ class CursorResultMetaData(ResultMetaData):
         new_metadata = self.__class__.__new__(self.__class__)
         new_metadata._unpickled = self._unpickled
         new_metadata._processors = self._processors
+        new_metadata._fused_converters = self._fused_converters
         new_metadata._keys = new_keys
         new_metadata._tuplefilter = tup
         new_metadata._translated_indexes = indexes
@@ -214,6 +241,7 @@ class CursorResultMetaData(ResultMetaData):
 
         md._unpickled = self._unpickled
         md._processors = self._processors
+        md._fused_converters = self._fused_converters
         assert not self._tuplefilter
         md._tuplefilter = None
         md._translated_indexes = None
@@ -231,6 +259,7 @@ class CursorResultMetaData(ResultMetaData):
         self._tuplefilter = None
         self._translated_indexes = None
         self._safe_for_cache = self._unpickled = False
+        self._fused_converters = {}
 
         if context.result_column_struct:
             (
@@ -756,6 +785,7 @@ class CursorResultMetaData(ResultMetaData):
 
     def __setstate__(self, state):
         self._processors = [None for _ in range(len(state["_keys"]))]
+        self._fused_converters = {}
         self._keymap = state["_keymap"]
 
         self._keymap_by_result_column_idx = None
@@ -1305,9 +1335,25 @@ class CursorResult(Result[_T]):
             processors = metadata._processors
             process_row = Row
             key_style = process_row._default_key_style
-            _make_row = functools.partial(
-                process_row, metadata, processors, keymap, key_style
-            )
+
+            if HAS_CYEXTENSION:
+                # the C extension row applies processors itself
+                _make_row = functools.partial(
+                    process_row, metadata, processors, keymap, key_style
+                )
+            else:
+                converters = metadata._fused_row_converters()
+                if converters is None:
+                    # no processors; rows are built from raw rows directly
+                    _make_row = functools.partial(
+                        process_row, metadata, None, keymap, key_style
+                    )
+                else:
+                    _make_row = converters.make_row_fn(
+                        functools.partial(
+                            process_row, metadata, None, keymap, key_style
+                        )
+                    )
             if log_row:
 
                 def _make_row_2(row):
@@ -1418,24 +1464,15 @@ class CursorResult(Result[_T]):
         as a row contained within a list; some dialects may support a
         multiple row form as well.
 
-        .. note:: As indicated below, in current SQLAlchemy versions this
-           accessor is only useful beyond what's already supplied by
-           :attr:`_engine.CursorResult.inserted_primary_key` when using the
-           :ref:`postgresql_psycopg2` dialect.   Future versions hope to
-           generalize this feature to more dialects.
-
-        This accessor is added to support dialects that offer the feature
-        that is currently implemented by the :ref:`psycopg2_executemany_mode`
-        feature, currently **only the psycopg2 dialect**, which provides
-        for many rows to be INSERTed at once while still retaining the
-        behavior of being able to return server-generated primary key values.
-
-        * **When using the psycopg2 dialect, or other dialects that may support
-          "fast executemany" style inserts in upcoming releases** : When
-          invoking an INSERT statement while passing a list of rows as the
-          second argument to :meth:`_engine.Connection.execute`, this accessor
-          will then provide a list of rows, where each row contains the primary
-          key value for each row that was INSERTed.
+        * **When using dialects that support "insert executemany returning"**,
+          which includes SQLite, PostgreSQL and MariaDB by way of the
+          :ref:`engine_insertmanyvalues` feature, as well as the
+          :ref:`postgresql_psycopg2` and cx_Oracle dialects : When invoking an
+          INSERT statement while passing a list of rows as the second argument
+          to :meth:`_engine.Connection.execute`, and the statement makes use
+          of :meth:`.ValuesBase.return_defaults`, this accessor will then
+          provide a list of rows, where each row contains the primary key
+          value for each row that was INSERTed.
 
         * **When using all other dialects / backends that don't yet support
           this feature**: This accessor is only useful for **single row INSERT
@@ -1446,10 +1483,6 @@ class CursorResult(Result[_T]):
           one row per row inserted in the statement, however it will contain
           ``None`` for any server-generated values.
 
-        Future releases of SQLAlchemy will further generalize the
-        "fast execution helper" feature of psycopg2 to suit other dialects,
-        thus allowing this accessor to be of more general use.
-
         .. versionadded:: 1.4
 
         .. seealso::
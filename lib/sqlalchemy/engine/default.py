@@ -44,6 +44,7 @@ from .base import Connection
 from .interfaces import CacheStats
 from .interfaces import DBAPICursor
 from .interfaces import Dialect
+from .interfaces import ExecuteStyle
 from .interfaces import ExecutionContext
 from .reflection import ObjectKind
 from .reflection import ObjectScope
@@ -146,7 +147,16 @@ class DefaultDialect(Dialect):
     update_returning_multifrom = False
     delete_returning_multifrom = False
     insert_returning = False
-    insert_executemany_returning = False
+
+    use_insertmanyvalues = False
+
+    insertmanyvalues_page_size = 1000
+    insertmanyvalues_max_parameters = 32700
+
+    max_bind_parameters = 32700
+
+    supports_array_in_expansion = False
+    array_in_expansion = False
 
     cte_follows_insert = False
 
@@ -274,6 +284,8 @@ class DefaultDialect(Dialect):
         # Linting.NO_LINTING constant
         compiler_linting: Linting = int(compiler.NO_LINTING),  # type: ignore
         server_side_cursors: bool = False,
+        insertmanyvalues_page_size: Optional[int] = None,
+        array_in_expansion: bool = False,
         **kwargs: Any,
     ):
         if server_side_cursors:
@@ -284,6 +296,14 @@ class DefaultDialect(Dialect):
             else:
                 self.server_side_cursors = True
 
+        if array_in_expansion:
+            if not self.supports_array_in_expansion:
+                raise exc.ArgumentError(
+                    "Dialect %s does not support array IN expansion" % self
+                )
+            else:
+                self.array_in_expansion = True
+
         if getattr(self, "use_setinputsizes", False):
             util.warn_deprecated(
                 "The dialect-level use_setinputsizes attribute is "
@@ -328,8 +348,31 @@ class DefaultDialect(Dialect):
                 self._user_defined_max_identifier_length
             )
         self.label_length = label_length
+
+        if insertmanyvalues_page_size is not None:
+            self.insertmanyvalues_page_size = insertmanyvalues_page_size
+
         self.compiler_linting = compiler_linting
 
+    @util.memoized_property
+    def insert_executemany_returning(self):
+        """Default implementation for insert_executemany_returning, if not
+        otherwise overridden by the specific dialect.
+
+        The default dialect determines "insert_executemany_returning" is
+        available if the dialect in use has opted into using the
+        "use_insertmanyvalues" feature. If they haven't opted into that, then
+        this attribute is False, unless the dialect in question overrides this
+        and provides some other implementation (such as the Oracle dialect).
+
+        """
+        return (
+            self.insert_returning
+            and self.supports_multivalues_insert
+            and self.use_insertmanyvalues
+            and self.bind_typing is not interfaces.BindTyping.SETINPUTSIZES
+        )
+
     @util.deprecated_property(
         "2.0",
         "full_returning is deprecated, please use insert_returning, "
@@ -931,6 +974,7 @@ class DefaultExecutionContext(ExecutionContext):
     is_text = False
     isddl = False
 
+    execute_style: ExecuteStyle = ExecuteStyle.EXECUTE
     executemany = False
     compiled: Optional[Compiled] = None
     result_column_struct: Optional[
@@ -952,6 +996,8 @@ class DefaultExecutionContext(ExecutionContext):
 
     _has_rowcount = False
 
+    _insertmanyvalues_rows: Optional[List[Tuple[Any, ...]]] = None
+
     # a hook for SQLite's translation of
     # result column names
     # NOTE: pyhive is using this hook, can't remove it :(
@@ -1091,6 +1137,11 @@ class DefaultExecutionContext(ExecutionContext):
             ]
 
             self.executemany = len(parameters) > 1
+            if self.executemany:
+                if compiled._insertmanyvalues is not None:
+                    self.execute_style = ExecuteStyle.INSERTMANYVALUES
+                else:
+                    self.execute_style = ExecuteStyle.EXECUTEMANY
 
         self.unicode_statement = compiled.string
 
@@ -1233,6 +1284,8 @@ class DefaultExecutionContext(ExecutionContext):
             ]
 
         self.executemany = len(parameters) > 1
+        if self.executemany:
+            self.execute_style = ExecuteStyle.EXECUTEMANY
 
         self.statement = self.unicode_statement = statement
 
@@ -1559,7 +1612,14 @@ class DefaultExecutionContext(ExecutionContext):
             # return an "empty" primary key collection when accessed.
 
         strategy = self.cursor_fetch_strategy
-        if self._is_server_side and strategy is _cursor._DEFAULT_FETCH:
+        if self._insertmanyvalues_rows is not None:
+            # the rows returned by each "insertmanyvalues" batch were
+            # accumulated as the batches were invoked; deliver them all
+            # from a buffer
+            strategy = _cursor.FullyBufferedCursorFetchStrategy(
+                self.cursor, initial_buffer=self._insertmanyvalues_rows
+            )
+        elif self._is_server_side and strategy is _cursor._DEFAULT_FETCH:
             strategy = _cursor.BufferedRowCursorFetchStrategy(
                 self.cursor, self.execution_options
             )
@@ -1584,9 +1644,9 @@ class DefaultExecutionContext(ExecutionContext):
                 )
 
                 # test that it has a cursor metadata that is accurate. the
-                # first row will have been fetched and current assumptions
-                # are that the result has only one row, until executemany()
-                # support is added here.
+                # rows will have been fetched; there is one row per
+                # parameter set for an "insertmanyvalues" / executemany
+                # execution, otherwise a single row.
                 assert result._metadata.returns_rows
                 result._soft_close()
             elif not self._is_explicit_returning:
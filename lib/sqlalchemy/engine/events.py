@@ -33,11 +33,13 @@ if typing.TYPE_CHECKING:
     from .interfaces import _DBAPIMultiExecuteParams
     from .interfaces import _DBAPISingleExecuteParams
     from .interfaces import _ExecuteOptions
+    from .interfaces import CacheStats
     from .interfaces import ExceptionContext
     from .interfaces import ExecutionContext
     from .result import Result
     from ..pool import ConnectionPoolEntry
     from ..sql import Executable
+    from ..sql.compiler import Compiled
     from ..sql.elements import BindParameter
 
 
@@ -368,6 +370,51 @@ class ConnectionEvents(event.Events[ConnectionEventsTarget]):
 
         """
 
+    def statement_compiled(
+        self,
+        conn: Connection,
+        clauseelement: Executable,
+        compiled: Compiled,
+        cache_hit: CacheStats,
+        compile_time: float,
+    ) -> None:
+        """Intercept the compilation of a statement which was not located
+        in the compiled cache.
+
+        This event is invoked each time a statement is compiled when
+        invoked with :meth:`_engine.Connection.execute`, or when compiled
+        by :meth:`_engine.Engine.warm_cache`.  It is not invoked for
+        statements whose compiled form was located in the cache.
+        The event is useful for feeding compilation counts and timings
+        into a metrics system; for aggregate statistics, see
+        :class:`.QueryCacheStats`.
+
+        e.g.::
+
+            from sqlalchemy import event
+            from sqlalchemy.engine import CacheStats
+
+            @event.listens_for(engine, "statement_compiled")
+            def statement_compiled(
+                conn, clauseelement, compiled, cache_hit, compile_time
+            ):
+                if cache_hit is CacheStats.NO_CACHE_KEY:
+                    log.warning("uncacheable statement: %s", compiled)
+
+        :param conn: :class:`_engine.Connection` object
+        :param clauseelement: the statement that was compiled.
+        :param compiled: the :class:`.Compiled` object produced.
+        :param cache_hit: a :class:`.CacheStats` value indicating why the
+         statement was compiled; ``CACHE_MISS`` when the compiled form was
+         added to the cache, otherwise a value indicating why it could not
+         be cached, such as ``NO_CACHE_KEY``.
+        :param compile_time: time in seconds spent producing the cache key
+         for and compiling the statement.
+
+        .. versionadded:: 2.0
+
+        """
+
     @event._legacy_signature(
         "2.0", ["conn", "branch"], converter=lambda conn: (conn, False)
     )
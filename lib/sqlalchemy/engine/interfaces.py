@@ -21,6 +21,7 @@ from typing import Iterable
 from typing import List
 from typing import Mapping
 from typing import MutableMapping
+from typing import NamedTuple
 from typing import Optional
 from typing import Sequence
 from typing import Set
@@ -80,6 +81,65 @@ class CacheStats(Enum):
     NO_DIALECT_SUPPORT = 4
 
 
+class CacheWarmResult(NamedTuple):
+    """Describes the outcome of compiling a single statement using
+    :meth:`_engine.Engine.warm_cache`.
+
+    .. versionadded:: 2.0
+
+    """
+
+    statement: Executable
+    """The statement that was compiled."""
+
+    cache_stats: Optional[CacheStats]
+    """A :class:`.CacheStats` value indicating if the compiled form of
+    the statement was newly placed in the cache (``CACHE_MISS``), was
+    already present (``CACHE_HIT``), or could not be cached, such as
+    ``NO_CACHE_KEY`` for a statement that does not produce a cache key or
+    ``NO_DIALECT_SUPPORT`` for a dialect that does not support caching.
+
+    Is ``None`` if compilation raised an error.
+
+    """
+
+    error: Optional[Exception]
+    """The exception raised when producing the cache key for the statement
+    or compiling it, if any."""
+
+    @property
+    def cached(self) -> bool:
+        """True if the compiled form of the statement is present in the
+        cache."""
+        return self.cache_stats in (
+            CacheStats.CACHE_HIT,
+            CacheStats.CACHE_MISS,
+        )
+
+
+class CompiledStatementStats(NamedTuple):
+    """Compilation statistics for a single SQL string, as tracked by
+    :class:`.QueryCacheStats`.
+
+    .. versionadded:: 2.0
+
+    """
+
+    statement: str
+    """The SQL string produced by compilation."""
+
+    compile_count: int
+    """The number of times a statement producing this SQL string was
+    compiled."""
+
+    total_compile_time: float
+    """Total time in seconds spent producing a cache key for and compiling
+    statements which produced this SQL string."""
+
+    max_compile_time: float
+    """The longest time in seconds spent for a single compilation."""
+
+
 class DBAPIConnection(Protocol):
     """protocol representing a :pep:`249` database connection.
 
@@ -524,6 +584,28 @@ class ReflectedTableComment(TypedDict):
     """text of the comment"""
 
 
+class ExecuteStyle(Enum):
+    """indicates the :term:`DBAPI` cursor method that will be used to invoke
+    a statement."""
+
+    EXECUTE = 0
+    """indicates cursor.execute() will be used"""
+
+    EXECUTEMANY = 1
+    """indicates cursor.executemany() will be used."""
+
+    INSERTMANYVALUES = 2
+    """indicates cursor.execute() will be used with an INSERT where the
+    VALUES expression will be expanded to accommodate for multiple
+    parameter sets, with the statement invoked as many times as needed
+    to deliver batches of rows; the rows returned by RETURNING from each
+    batch are combined into a single result.
+
+    .. versionadded:: 2.0
+
+    """
+
+
 class BindTyping(Enum):
     """Define different methods of passing typing information for
     bound parameters in a statement to the database driver.
@@ -1016,6 +1098,86 @@ class Dialect(EventTarget):
 
     """
 
+    use_insertmanyvalues: bool
+    """if True, indicates "insertmanyvalues" functionality should be used
+    to allow for ``insert_executemany_returning`` behavior, if possible.
+
+    In practice, setting this to True means:
+
+    if ``supports_multivalues_insert``, ``insert_returning`` and
+    ``use_insertmanyvalues`` are all True, the SQL compiler will produce
+    an INSERT that will be interpreted by the :class:`.DefaultDialect`
+    as an :attr:`.ExecuteStyle.INSERTMANYVALUES` execution that allows
+    for INSERT of many rows with RETURNING by rewriting a single-row
+    INSERT statement to have multiple VALUES clauses, also executing
+    the statement multiple times for a series of batches when large numbers
+    of rows are given.
+
+    The parameter is False for the default dialect, and is set to
+    True for SQLAlchemy internal dialects SQLite, MySQL/MariaDB, PostgreSQL.
+
+    .. versionadded:: 2.0
+
+    """
+
+    insertmanyvalues_page_size: int
+    """Number of rows to render into an individual INSERT..VALUES() statement
+    for :attr:`.ExecuteStyle.INSERTMANYVALUES` executions.
+
+    The default dialect defaults this to 1000.
+
+    .. versionadded:: 2.0
+
+    .. seealso::
+
+        :paramref:`_engine.Connection.execution_options.insertmanyvalues_page_size` -
+        execution option available on :class:`_engine.Connection`, statements
+
+    """  # noqa: E501
+
+    insertmanyvalues_max_parameters: int
+    """Alternate to insertmanyvalues_page_size, will additionally limit
+    page size based on number of parameters total in the statement.
+
+    .. versionadded:: 2.0
+
+    """
+
+    max_bind_parameters: int
+    """The largest number of bound parameters the database accepts in a
+    single statement.
+
+    This value limits the number of keys included in each SELECT..IN
+    statement emitted by the ORM, such as by the :func:`_orm.selectinload`
+    and :func:`_orm.selectin_polymorphic` loaders.
+
+    The default dialect defaults this to 32700.
+
+    .. versionadded:: 2.0
+
+    """
+
+    supports_array_in_expansion: bool
+    """indicates if the dialect is able to render "expanding" IN parameters
+    as a single array-valued parameter.
+
+    .. versionadded:: 2.0
+
+    """
+
+    array_in_expansion: bool
+    """indicates if "expanding" IN parameters should be rendered as a
+    single array-valued parameter, rather than being rendered as
+    individual parameters at statement execution time.
+
+    .. versionadded:: 2.0
+
+    .. seealso::
+
+        :paramref:`_sa.create_engine.array_in_expansion`
+
+    """
+
     _type_memos: MutableMapping[TypeEngine[Any], "_TypeMemoDict"]
 
     def _builtin_onconnect(self) -> Optional[_ListenerFnType]:
@@ -1724,6 +1886,32 @@ class Dialect(EventTarget):
 
         raise NotImplementedError()
 
+    def get_schema_fingerprint(
+        self, connection: Connection, schema: Optional[str] = None, **kw: Any
+    ) -> str:
+        """Return a string that identifies the current state of the schema
+        in the database.
+
+        The string is expected to be inexpensive to compute compared to
+        reflecting the schema, and to change whenever any DDL that affects
+        reflection results for objects in the given schema takes place,
+        such as tables, columns, constraints, indexes or comments being
+        created, altered or dropped.
+        It's used to validate a reflection cache that was persisted using
+        :meth:`_engine.Inspector.save_cache`.
+
+        This is an internal dialect method. Applications should use
+        :meth:`_engine.Inspector.get_schema_fingerprint`.
+
+        :raise: ``NotImplementedError`` for dialects that don't support
+         schema fingerprints.
+
+        .. versionadded:: 2.0
+
+        """
+
+        raise NotImplementedError()
+
     def _get_server_version_info(self, connection: Connection) -> Any:
         """Retrieve the server version info from the given connection.
 
@@ -2738,6 +2926,14 @@ class ExecutionContext:
     executemany: bool
     """True if the parameters have determined this to be an executemany"""
 
+    execute_style: ExecuteStyle
+    """the style of DBAPI cursor method that will be used to execute
+    a statement.
+
+    .. versionadded:: 2.0
+
+    """
+
     prefetch_cols: util.generic_fn_descriptor[Optional[Sequence[Column[Any]]]]
     """a list of Column objects for which a client-side default
       was fired off.  Applies to inserts and updates."""
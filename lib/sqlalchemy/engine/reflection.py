@@ -26,11 +26,15 @@ methods such as get_table_names, get_columns, etc.
 """
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 import contextlib
 from dataclasses import dataclass
 from enum import auto
 from enum import Flag
 from enum import unique
+import os
+import pickle
+import tempfile
 from typing import Any
 from typing import Callable
 from typing import Collection
@@ -52,6 +56,8 @@ from .. import exc
 from .. import inspection
 from .. import sql
 from .. import util
+from ..pool import SingletonThreadPool
+from ..pool import StaticPool
 from ..sql import operators
 from ..sql import schema as sa_schema
 from ..sql.cache_key import _ad_hoc_cache_key_from_args
@@ -199,6 +205,7 @@ class Inspector(inspection.Inspectable["Inspector"]):
     _op_context_requires_connect: bool
     dialect: Dialect
     info_cache: Dict[Any, Any]
+    _cache_fingerprint: Optional[Tuple[Optional[str], str]] = None
 
     @util.deprecated(
         "1.4",
@@ -267,6 +274,7 @@ class Inspector(inspection.Inspectable["Inspector"]):
 
         """
         self.info_cache.clear()
+        self._cache_fingerprint = None
 
     @classmethod
     @util.deprecated(
@@ -488,6 +496,172 @@ class Inspector(inspection.Inspectable["Inspector"]):
                 conn, schema_name, info_cache=self.info_cache, **kw
             )
 
+    def get_schema_fingerprint(
+        self, schema: Optional[str] = None, **kw: Any
+    ) -> str:
+        r"""Return a string that identifies the current state of the schema
+        in the database.
+
+        The fingerprint changes whenever DDL that affects reflection of the
+        objects in the schema takes place; it's used by
+        :meth:`_reflection.Inspector.load_cache` to determine if a persisted
+        reflection cache is still valid.  The value is never cached.
+
+        :param schema: string schema name; if omitted, uses the default
+         schema of the database connection.  DDL which affects objects in
+         other schemas may not change the fingerprint; see the documentation
+         of the dialect in use for the objects that are included.
+
+        :param \**kw: Additional keyword argument to pass to the dialect
+         specific implementation. See the documentation of the dialect
+         in use for more information.
+
+        :raise: ``NotImplementedError`` for dialects that don't support
+         schema fingerprints.
+
+        .. versionadded:: 2.0
+
+        """
+        with self._operation_context() as conn:
+            return self.dialect.get_schema_fingerprint(
+                conn, schema=schema, **kw
+            )
+
+    def _cache_header(
+        self, schema: Optional[str], fingerprint: str
+    ) -> Dict[str, Any]:
+        from .. import __version__
+
+        return {
+            "sqlalchemy": __version__,
+            "dialect": "%s+%s" % (self.dialect.name, self.dialect.driver),
+            "server_version_info": self.dialect.server_version_info,
+            "schema": schema,
+            "fingerprint": fingerprint,
+        }
+
+    def load_cache(
+        self,
+        path: Union[str, os.PathLike[str]],
+        schema: Optional[str] = None,
+    ) -> bool:
+        """Load reflection results persisted by
+        :meth:`_reflection.Inspector.save_cache` into this
+        :class:`_reflection.Inspector`.
+
+        The file is used only if it was written for the same kind of
+        database and SQLAlchemy version, and the schema fingerprint stored
+        within it matches the one returned by
+        :meth:`_reflection.Inspector.get_schema_fingerprint`; in that case
+        subsequent inspection methods, as well as :meth:`.MetaData.reflect`
+        and :class:`.Table` autoload when passed this
+        :class:`_reflection.Inspector`, will not emit SQL for information
+        that was present in the file.  If the file does not exist or is out
+        of date, or the dialect doesn't support schema fingerprints, it's
+        ignored.
+
+        The fingerprint is also retained, so that a following call to
+        :meth:`_reflection.Inspector.save_cache` will record the state of
+        the schema as of when reflection began::
+
+            insp = inspect(engine)
+            if not insp.load_cache("reflection.cache"):
+                metadata_obj.reflect(insp)
+                insp.save_cache("reflection.cache")
+            else:
+                # no catalog queries are emitted
+                metadata_obj.reflect(insp)
+
+        .. warning:: The file is read using ``pickle``; only load files
+           that were written by a trusted process.
+
+        :param path: path of the file to load.
+
+        :param schema: string schema name whose fingerprint validates the
+         file, which should be the same as that passed to
+         :meth:`_reflection.Inspector.save_cache`; if omitted, uses the
+         default schema of the database connection.
+
+        :return: ``True`` if the file was loaded, ``False`` otherwise.
+
+        .. versionadded:: 2.0
+
+        """
+        try:
+            fingerprint = self.get_schema_fingerprint(schema)
+        except NotImplementedError:
+            return False
+
+        self._cache_fingerprint = (schema, fingerprint)
+        try:
+            with open(path, "rb") as file_:
+                header = pickle.load(file_)
+                if header != self._cache_header(schema, fingerprint):
+                    return False
+                info_cache = pickle.load(file_)
+        except FileNotFoundError:
+            return False
+        except (pickle.UnpicklingError, EOFError, ValueError) as err:
+            util.warn(
+                "Ignoring unreadable reflection cache %r: %s" % (path, err)
+            )
+            return False
+
+        info_cache.update(self.info_cache)
+        self.info_cache.update(info_cache)
+        return True
+
+    def save_cache(
+        self,
+        path: Union[str, os.PathLike[str]],
+        schema: Optional[str] = None,
+    ) -> None:
+        """Persist the reflection results cached by this
+        :class:`_reflection.Inspector` to a file, so that they may be
+        loaded by :meth:`_reflection.Inspector.load_cache` in another
+        process.
+
+        The file records the schema fingerprint retrieved by a previous
+        call to :meth:`_reflection.Inspector.load_cache` for the same
+        schema, or the current one if there was no such call.  The file is
+        replaced atomically.  For dialects that don't support schema
+        fingerprints, no file is written, as it could not be validated
+        when loaded.
+
+        :param path: path of the file to write.
+
+        :param schema: string schema name whose fingerprint is recorded;
+         if omitted, uses the default schema of the database connection.
+
+        .. versionadded:: 2.0
+
+        """
+        if (
+            self._cache_fingerprint is not None
+            and self._cache_fingerprint[0] == schema
+        ):
+            fingerprint = self._cache_fingerprint[1]
+        else:
+            try:
+                fingerprint = self.get_schema_fingerprint(schema)
+            except NotImplementedError:
+                return
+
+        dirname = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=dirname, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file_:
+                pickle.dump(
+                    self._cache_header(schema, fingerprint),
+                    file_,
+                    pickle.HIGHEST_PROTOCOL,
+                )
+                pickle.dump(self.info_cache, file_, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
     def get_sorted_table_and_fkc_names(
         self,
         schema: Optional[str] = None,
@@ -2017,6 +2191,71 @@ class Inspector(inspection.Inspectable["Inspector"]):
         else:
             return info
 
+    def _get_reflection_info_concurrently(
+        self,
+        max_workers: int,
+        schema: Optional[str] = None,
+        filter_names: Optional[Collection[str]] = None,
+        **kw: Any,
+    ) -> _ReflectionInfo:
+        """Run :meth:`._get_reflection_info` for batches of
+        ``filter_names`` in a pool of threads, each using its own
+        connection from the engine.
+
+        The results are merged in the order of the batches; the
+        information cache of this :class:`.Inspector` is available to each
+        batch and receives the entries that each one adds.
+
+        """
+        if not self._op_context_requires_connect:
+            raise exc.ArgumentError(
+                "Concurrent reflection requires an Engine, so that each "
+                "thread may use its own connection; got %r" % self.bind
+            )
+
+        names = list(filter_names or ())
+        num_batches = min(max_workers, len(names))
+        if num_batches < 2 or isinstance(
+            self.engine.pool, (SingletonThreadPool, StaticPool)
+        ):
+            with self._inspection_context() as insp:
+                return insp._get_reflection_info(
+                    schema=schema, filter_names=filter_names, **kw
+                )
+
+        batch_size = -(-len(names) // num_batches)
+        batches = [
+            names[idx : idx + batch_size]
+            for idx in range(0, len(names), batch_size)
+        ]
+
+        def reflect_batch(
+            batch: List[str], info_cache: Dict[Any, Any]
+        ) -> Tuple[_ReflectionInfo, Dict[Any, Any]]:
+            with self.engine.connect() as conn:
+                insp = self._construct(self.__class__._init_connection, conn)
+                insp.info_cache = info_cache
+                return (
+                    insp._get_reflection_info(
+                        schema=schema, filter_names=batch, **kw
+                    ),
+                    info_cache,
+                )
+
+        with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+            futures = [
+                executor.submit(reflect_batch, batch, dict(self.info_cache))
+                for batch in batches
+            ]
+            results = [future.result() for future in futures]
+
+        info, info_cache = results[0]
+        self.info_cache.update(info_cache)
+        for batch_info, info_cache in results[1:]:
+            info.update(batch_info)
+            self.info_cache.update(info_cache)
+        return info
+
 
 @final
 class ReflectionDefaults:
@@ -9,6 +9,7 @@
 
 from __future__ import annotations
 
+import array
 from enum import Enum
 import functools
 import itertools
@@ -22,6 +23,7 @@ from typing import Generic
 from typing import Iterable
 from typing import Iterator
 from typing import List
+from typing import NamedTuple
 from typing import NoReturn
 from typing import Optional
 from typing import overload
@@ -86,6 +88,93 @@ _TupleGetterType = Callable[[Sequence[Any]], Tuple[Any, ...]]
 _UniqueFilterType = Callable[[Any], Any]
 _UniqueFilterStateType = Tuple[Set[Any], Optional[_UniqueFilterType]]
 
+_ARRAY_TYPECODES = {int: "q", float: "d"}
+
+
+def _accumulate_column(
+    accumulated: Union[None, List[Any], "array.array[Any]"],
+    values: Sequence[Any],
+) -> Union[List[Any], "array.array[Any]"]:
+    """Add a chunk of values for a single column to the collection of
+    values fetched so far, using an ``array.array`` for columns that
+    contain only ``int`` or only ``float`` values."""
+
+    if accumulated is None:
+        types = set(map(type, values))
+        if len(types) == 1:
+            typecode = _ARRAY_TYPECODES.get(types.pop())
+            if typecode is not None:
+                try:
+                    return array.array(typecode, values)
+                except OverflowError:
+                    pass
+        return list(values)
+    elif isinstance(accumulated, array.array):
+        if set(map(type, values)) <= {type(accumulated[0])}:
+            num = len(accumulated)
+            try:
+                accumulated.extend(values)
+            except OverflowError:
+                accumulated = accumulated.tolist()[0:num]
+                accumulated.extend(values)
+        else:
+            accumulated = accumulated.tolist()
+            accumulated.extend(values)
+        return accumulated
+    else:
+        accumulated.extend(values)
+        return accumulated
+
+
+class _FusedRowConverters(NamedTuple):
+    make_row_fn: Callable[[Callable[..., Any]], Callable[[Any], Any]]
+    make_rows: Callable[[Callable[..., Any], Sequence[Any]], List[Any]]
+
+
+def _fuse_row_processors(
+    processors: _ProcessorsType, indexes: Optional[Sequence[int]] = None
+) -> _FusedRowConverters:
+    """Generate functions that apply the given result processors to raw
+    rows and pass the resulting tuple to a row constructor.
+
+    The generated code applies processors inline, only for those columns
+    that have one, and also selects the given subset of column
+    ``indexes`` if any, so that a row is converted in a single step
+    rather than by applying each processor in a loop.   ``make_rows``
+    converts a whole chunk of raw rows in a single call.
+
+    """
+    width = len(processors)
+    if indexes is None:
+        indexes = range(width)
+
+    env: Dict[str, Any] = {}
+    values = []
+    for idx in indexes:
+        proc = processors[idx]
+        if proc is None:
+            values.append("c%d" % idx)
+        else:
+            env["p%d" % idx] = proc
+            values.append("p%d(c%d)" % (idx, idx))
+
+    target = "(%s)" % "".join("c%d, " % idx for idx in range(width))
+    value = "(%s)" % "".join("%s, " % v for v in values)
+
+    code = (
+        "def make_row_fn(make_row):\n"
+        "    def convert_row(row):\n"
+        "        %(target)s = row\n"
+        "        return make_row(%(value)s)\n"
+        "    return convert_row\n"
+        "\n"
+        "def make_rows(make_row, rows):\n"
+        "    return [make_row(%(value)s) for %(target)s in rows]\n"
+    ) % {"target": target, "value": value}
+
+    exec(code, env)
+    return _FusedRowConverters(env["make_row_fn"], env["make_rows"])
+
 
 class ResultMetaData:
     """Base for metadata about result rows."""
@@ -109,6 +198,12 @@ class ResultMetaData:
     def _for_freeze(self) -> ResultMetaData:
         raise NotImplementedError()
 
+    def _fused_row_converters(self) -> Optional[_FusedRowConverters]:
+        """Return functions that build rows from raw rows with processors
+        and tuple filtering applied, or None if rows should be built using
+        the processors directly."""
+        return None
+
     def _key_fallback(
         self, key: _KeyType, err: Exception, raiseerr: bool = True
     ) -> NoReturn:
@@ -425,7 +520,23 @@ class ResultInternal(InPlaceGenerative, Generic[_R]):
         processors = metadata._processors
         tf = metadata._tuplefilter
 
-        if tf and not real_result._source_supports_scalars:
+        # the fused per-row converter is a Python function; when the
+        # C extension is in use, it's used only in place of the tuple
+        # filter step.  See also _chunk_row_getter
+        converters = (
+            metadata._fused_row_converters()
+            if not real_result._source_supports_scalars
+            and (tf or not HAS_CYEXTENSION)
+            else None
+        )
+
+        if converters is not None:
+            make_row = converters.make_row_fn(
+                functools.partial(
+                    process_row, metadata, None, keymap, key_style
+                )
+            )
+        elif tf and not real_result._source_supports_scalars:
             if processors:
                 processors = tf(processors)
 
@@ -461,6 +572,52 @@ class ResultInternal(InPlaceGenerative, Generic[_R]):
 
         return make_row
 
+    @HasMemoized_ro_memoized_attribute
+    def _chunk_row_getter(self) -> Optional[Callable[[List[Any]], List[_R]]]:
+        """Return a function that produces rows from a list of raw rows,
+        as fetched by fetchmany() or fetchall()."""
+
+        make_row = self._row_getter
+        if make_row is None:
+            return None
+
+        real_result: Result[Any] = (
+            self._real_result
+            if self._real_result
+            else cast("Result[Any]", self)
+        )
+
+        metadata = self._metadata
+
+        # as in _row_getter, the fused converters take the place of only
+        # the tuple filter step when the C extension is in use
+        converters = (
+            metadata._fused_row_converters()
+            if not real_result._source_supports_scalars
+            and not real_result._row_logging_fn
+            and (metadata._tuplefilter or not HAS_CYEXTENSION)
+            else None
+        )
+
+        if converters is not None:
+            return functools.partial(
+                converters.make_rows,
+                functools.partial(
+                    Row,
+                    metadata,
+                    None,
+                    metadata._keymap,
+                    Row._default_key_style,
+                ),
+            )
+        else:
+            fixed_make_row = make_row
+
+            def make_rows(rows: List[Any]) -> List[_R]:
+                return [fixed_make_row(row) for row in rows]
+
+            return make_rows
+
     @HasMemoized_ro_memoized_attribute
     def _iterator_getter(self) -> Callable[..., Iterator[_R]]:
 
@@ -498,21 +655,20 @@ class ResultInternal(InPlaceGenerative, Generic[_R]):
         return iterrows
 
     def _raw_all_rows(self) -> List[_R]:
-        make_row = self._row_getter
-        assert make_row is not None
-        rows = self._fetchall_impl()
-        return [make_row(row) for row in rows]
+        make_rows = self._chunk_row_getter
+        assert make_rows is not None
+        return make_rows(self._fetchall_impl())
 
     def _allrows(self) -> List[_R]:
 
         post_creational_filter = self._post_creational_filter
 
-        make_row = self._row_getter
+        make_rows = self._chunk_row_getter
 
         rows = self._fetchall_impl()
         made_rows: List[_InterimRowType[_R]]
-        if make_row:
-            made_rows = [make_row(row) for row in rows]
+        if make_rows:
+            made_rows = make_rows(rows)  # type: ignore
         else:
             made_rows = rows  # type: ignore
 
@@ -589,7 +745,7 @@ class ResultInternal(InPlaceGenerative, Generic[_R]):
 
     @HasMemoized_ro_memoized_attribute
     def _manyrow_getter(self) -> Callable[..., List[_R]]:
-        make_row = self._row_getter
+        make_rows = self._chunk_row_getter
 
         post_creational_filter = self._post_creational_filter
 
@@ -597,13 +753,13 @@ class ResultInternal(InPlaceGenerative, Generic[_R]):
             uniques, strategy = self._unique_strategy
 
             def filterrows(
-                make_row: Optional[Callable[..., _R]],
+                make_rows: Optional[Callable[[List[Any]], List[_R]]],
                 rows: List[Any],
                 strategy: Optional[Callable[[List[Any]], Any]],
                 uniques: Set[Any],
             ) -> List[_R]:
-                if make_row:
-                    rows = [make_row(row) for row in rows]
+                if make_rows:
+                    rows = make_rows(rows)
 
                 if strategy:
                     made_rows = (
@@ -640,9 +796,9 @@ class ResultInternal(InPlaceGenerative, Generic[_R]):
                     else:
                         rows = _manyrows(num)
                         num = len(rows)
-                        assert make_row is not None
+                        assert make_rows is not None
                         collect.extend(
-                            filterrows(make_row, rows, strategy, uniques)
+                            filterrows(make_rows, rows, strategy, uniques)
                         )
                         num_required = num - len(collect)
                 else:
@@ -656,7 +812,7 @@ class ResultInternal(InPlaceGenerative, Generic[_R]):
                         break
 
                     collect.extend(
-                        filterrows(make_row, rows, strategy, uniques)
+                        filterrows(make_rows, rows, strategy, uniques)
                     )
                     num_required = num - len(collect)
 
@@ -678,8 +834,8 @@ class ResultInternal(InPlaceGenerative, Generic[_R]):
                     num = real_result._yield_per
 
                 rows: List[_InterimRowType[Any]] = self._fetchmany_impl(num)
-                if make_row:
-                    rows = [make_row(row) for row in rows]
+                if make_rows:
+                    rows = make_rows(rows)
                 if post_creational_filter:
                     rows = [post_creational_filter(row) for row in rows]
                 return rows  # type: ignore
@@ -1266,6 +1422,126 @@ class Result(_WithKeys, ResultInternal[Row[_TP]]):
             else:
                 break
 
+    def columns_as_arrays(
+        self, *, chunk_size: Optional[int] = None, numpy: bool = False
+    ) -> Dict[str, Any]:
+        """Fetch all remaining rows, returning a dictionary of the values
+        for each column, keyed on column name.
+
+        This method is intended for analytical use cases that consume
+        results as columns rather than rows.   Rows are fetched in chunks
+        and the values for each column are collected directly into a
+        per-column sequence, without producing a :class:`_engine.Row`
+        object for each row; result processing for column types that
+        require it, such as conversion of date or decimal values, is
+        applied to each column as a whole for each chunk.
+
+        Columns where every value is a Python ``int`` or every value is a
+        Python ``float`` are returned as an ``array.array`` of typecode
+        ``"q"`` or ``"d"`` respectively; all other columns, including those
+        which contain ``None`` values, are returned as a Python list.
+        When the ``numpy`` parameter is set to ``True``, each column is
+        instead returned as a ``numpy.ndarray``, which requires that the
+        `NumPy <https://numpy.org>`_ library is installed.
+
+        E.g.::
+
+            result = conn.execute(select(table.c.id, table.c.value))
+            columns = result.columns_as_arrays()
+
+            ids = columns["id"]  # array('q', [1, 2, 3, ...])
+            values = columns["value"]
+
+        The result is closed after all rows are fetched.  Filters such as
+        :meth:`_engine.Result.unique` are honored, however they require
+        that rows be produced as usual before being converted to columns.
+
+        .. versionadded:: 2.0
+
+        :param chunk_size: number of rows to fetch at a time.  Defaults to
+         the value set by :meth:`_engine.Result.yield_per` or the
+         :paramref:`_engine.Connection.execution_options.yield_per`
+         execution option if set, else 1000.
+
+        :param numpy: if True, return each column as a ``numpy.ndarray``.
+
+        :return: a dictionary of column name to sequence of values, in the
+         order in which columns are present in the result.
+
+        """
+        keys = list(self._metadata.keys)
+        if len(set(keys)) != len(keys):
+            raise exc.InvalidRequestError(
+                "Result has duplicate column names; use label() to give "
+                "each column a unique name in order to fetch columns as "
+                "arrays"
+            )
+
+        if numpy:
+            try:
+                import numpy as np
+            except ImportError as err:
+                raise ImportError(
+                    "The numpy library is required in order to use "
+                    "columns_as_arrays(numpy=True)"
+                ) from err
+
+        size = chunk_size or self._yield_per or 1000
+
+        accumulated: List[Any] = [None] * len(keys)
+
+        if (
+            self._source_supports_scalars
+            or self._unique_filter_state
+            or self._post_creational_filter
+            or self._row_logging_fn
+        ):
+            # rows must be produced in order to be filtered; transpose
+            # each chunk of rows into columns
+            getter = self._manyrow_getter
+            while True:
+                rows = getter(self, size)
+                if not rows:
+                    break
+                for index, values in enumerate(zip(*rows)):
+                    accumulated[index] = _accumulate_column(
+                        accumulated[index], values
+                    )
+        else:
+            metadata = self._metadata
+            processors = metadata._processors
+            tf = metadata._tuplefilter
+            if tf and processors:
+                processors = tf(processors)
+
+            fetchmany = self._fetchmany_impl
+            while True:
+                raw_rows = fetchmany(size)
+                if not raw_rows:
+                    break
+                if tf:
+                    raw_rows = [tf(row) for row in raw_rows]
+
+                for index, values in enumerate(zip(*raw_rows)):
+                    if processors:
+                        proc = processors[index]
+                        if proc:
+                            values = list(map(proc, values))
+                    accumulated[index] = _accumulate_column(
+                        accumulated[index], values
+                    )
+
+        if numpy:
+            return {
+                key: np.asarray(values if values is not None else [])
+                for key, values in zip(keys, accumulated)
+            }
+        else:
+            return {
+                key: values if values is not None else []
+                for key, values in zip(keys, accumulated)
+            }
+
     def fetchall(self) -> Sequence[Row[_TP]]:
         """A synonym for the :meth:`_engine.Result.all` method."""
 
@@ -12,6 +12,7 @@ from typing import Callable
 from typing import Generic
 from typing import Iterable
 from typing import Iterator
+from typing import List
 from typing import Optional
 from typing import overload
 from typing import Sequence
@@ -84,9 +85,11 @@ _T = TypeVar("_T", bound=Any)
         "expunge_all",
         "flush",
         "get_bind",
+        "get_many",
         "is_modified",
         "invalidate",
         "merge",
+        "merge_all",
         "refresh",
         "rollback",
         "scalar",
@@ -797,6 +800,46 @@ class async_scoped_session(Generic[_AS]):
             mapper=mapper, clause=clause, bind=bind, **kw
         )
 
+    async def get_many(
+        self,
+        entity: _EntityBindKey[_O],
+        idents: Iterable[_PKIdentityArgument],
+        *,
+        options: Optional[Sequence[ORMOption]] = None,
+        populate_existing: bool = False,
+        with_for_update: Optional[ForUpdateArg] = None,
+        identity_token: Optional[Any] = None,
+        execution_options: _ExecuteOptionsParameter = util.EMPTY_DICT,
+    ) -> List[Optional[_O]]:
+        r"""Return a list of instances based on the given primary key
+        identifiers, with ``None`` in place of each identifier that isn't
+        found.
+
+        .. container:: class_bases
+
+            Proxied for the :class:`_asyncio.AsyncSession` class on
+            behalf of the :class:`_asyncio.scoping.async_scoped_session` class.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :meth:`_orm.Session.get_many` - main documentation for get_many
+
+
+
+        """  # noqa: E501
+
+        return await self._proxied.get_many(
+            entity,
+            idents,
+            options=options,
+            populate_existing=populate_existing,
+            with_for_update=with_for_update,
+            identity_token=identity_token,
+            execution_options=execution_options,
+        )
+
     def is_modified(
         self, instance: object, include_collections: bool = True
     ) -> bool:
@@ -905,6 +948,34 @@ class async_scoped_session(Generic[_AS]):
 
         return await self._proxied.merge(instance, load=load, options=options)
 
+    async def merge_all(
+        self,
+        instances: Iterable[_O],
+        *,
+        load: bool = True,
+        options: Optional[Sequence[ORMOption]] = None,
+    ) -> List[_O]:
+        r"""Copy the state of each of the given instances into a corresponding
+        instance within this :class:`_asyncio.AsyncSession`.
+
+        .. container:: class_bases
+
+            Proxied for the :class:`_asyncio.AsyncSession` class on
+            behalf of the :class:`_asyncio.scoping.async_scoped_session` class.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :meth:`_orm.Session.merge_all` - main documentation for merge_all
+
+
+        """  # noqa: E501
+
+        return await self._proxied.merge_all(
+            instances, load=load, options=options
+        )
+
     async def refresh(
         self,
         instance: object,
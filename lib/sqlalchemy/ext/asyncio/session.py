@@ -13,6 +13,7 @@ from typing import Dict
 from typing import Generic
 from typing import Iterable
 from typing import Iterator
+from typing import List
 from typing import NoReturn
 from typing import Optional
 from typing import overload
@@ -466,6 +467,42 @@ class AsyncSession(ReversibleProxy[Session]):
         )
         return result_obj
 
+    async def get_many(
+        self,
+        entity: _EntityBindKey[_O],
+        idents: Iterable[_PKIdentityArgument],
+        *,
+        options: Optional[Sequence[ORMOption]] = None,
+        populate_existing: bool = False,
+        with_for_update: Optional[ForUpdateArg] = None,
+        identity_token: Optional[Any] = None,
+        execution_options: _ExecuteOptionsParameter = util.EMPTY_DICT,
+    ) -> List[Optional[_O]]:
+
+        """Return a list of instances based on the given primary key
+        identifiers, with ``None`` in place of each identifier that isn't
+        found.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :meth:`_orm.Session.get_many` - main documentation for get_many
+
+
+        """
+
+        return await greenlet_spawn(
+            self.sync_session.get_many,
+            entity,
+            idents,
+            options=options,
+            populate_existing=populate_existing,
+            with_for_update=with_for_update,
+            identity_token=identity_token,
+            execution_options=execution_options,
+        )
+
     @overload
     async def stream(
         self,
@@ -612,6 +649,27 @@ class AsyncSession(ReversibleProxy[Session]):
             self.sync_session.merge, instance, load=load, options=options
         )
 
+    async def merge_all(
+        self,
+        instances: Iterable[_O],
+        *,
+        load: bool = True,
+        options: Optional[Sequence[ORMOption]] = None,
+    ) -> List[_O]:
+        """Copy the state of each of the given instances into a corresponding
+        instance within this :class:`_asyncio.AsyncSession`.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :meth:`_orm.Session.merge_all` - main documentation for merge_all
+
+        """
+        return await greenlet_spawn(
+            self.sync_session.merge_all, instances, load=load, options=options
+        )
+
     async def flush(self, objects: Optional[Sequence[Any]] = None) -> None:
         """Flush all the object changes to the database.
 
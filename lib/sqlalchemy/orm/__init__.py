@@ -117,6 +117,7 @@ from .session import sessionmaker as sessionmaker
 from .session import SessionTransaction as SessionTransaction
 from .state import AttributeState as AttributeState
 from .state import InstanceState as InstanceState
+from .strategy_options import batchload as batchload
 from .strategy_options import contains_eager as contains_eager
 from .strategy_options import defaultload as defaultload
 from .strategy_options import defer as defer
@@ -141,6 +142,7 @@ from .util import object_mapper as object_mapper
 from .util import polymorphic_union as polymorphic_union
 from .util import was_deleted as was_deleted
 from .util import with_parent as with_parent
+from .writeonly import WriteOnlyCollection as WriteOnlyCollection
 from .. import util as _sa_util
 
 
@@ -1150,6 +1150,13 @@ def relationship(
         first accessed, using a separate SELECT statement, or identity map
         fetch for simple many-to-one references.
 
+      * ``batch`` - items should be loaded lazily when the property is
+        first accessed on any of the parent objects loaded by the same
+        statement, for all of those objects at once, using a SELECT
+        statement with an IN clause in the same way as ``selectin``.
+
+        .. versionadded:: 2.0
+
       * ``immediate`` - items should be loaded as the parents are loaded,
         using a separate SELECT statement, or identity map fetch for
         simple many-to-one references.
@@ -1201,6 +1208,14 @@ def relationship(
         applied before iterating the results.  See
         the section :ref:`dynamic_relationship` for more details.
 
+      * ``write_only`` - the attribute will return a
+        :class:`_orm.WriteOnlyCollection`, which accepts new and removed
+        items without loading the collection, and produces SELECT
+        statements in order to read from it.  See the section
+        :ref:`write_only_relationship` for more details.
+
+        .. versionadded:: 2.0
+
       * True - a synonym for 'select'
 
       * False - a synonym for 'joined'
@@ -1214,6 +1229,8 @@ def relationship(
 
         :ref:`dynamic_relationship` - detail on the ``dynamic`` option.
 
+        :ref:`write_only_relationship` - detail on the ``write_only`` option.
+
         :ref:`collections_noload_raiseload` - notes on "noload" and "raise"
 
     :param load_on_pending=False:
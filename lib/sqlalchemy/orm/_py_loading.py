@@ -0,0 +1,94 @@
+# orm/_py_loading.py
+# Copyright (C) 2005-2022 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: https://www.opensource.org/licenses/mit-license.php
+# mypy: allow-untyped-defs, allow-untyped-calls
+
+from __future__ import annotations
+
+
+def _instance_fast_path(
+    fallback,
+    identity_class,
+    primary_key_getter,
+    identity_token,
+    session_identity_map,
+    is_not_primary_key,
+    new_instance,
+    instance_state,
+    instance_dict,
+    session_id,
+    runid,
+    load_options,
+    load_path,
+    populators,
+):
+    """Produce a row processor for the common case where rows are
+    loaded into new instances that aren't present in the identity map.
+
+    Rows whose identity is already present in the identity map are
+    delivered to the given ``fallback``, which is the full
+    ``_instance()`` function produced by
+    :func:`.loading._instance_processor`.   The caller is responsible
+    for only using this function when there is no refresh state,
+    populate existing, load events or post load in effect.
+
+    """
+    quick_populators = tuple(populators["quick"])
+    expire_keys = tuple(
+        key for key, set_callable in populators["expire"] if set_callable
+    )
+    new_populators = tuple(populators["new"])
+
+    get_instance = session_identity_map.get
+
+    def _instance(row):
+        # the primary key and "quick" getters are itemgetters against
+        # row positions, which are applied to the row's tuple directly
+        data = row._data
+
+        identitykey = (
+            identity_class,
+            primary_key_getter(data),
+            identity_token,
+        )
+
+        if get_instance(identitykey) is not None:
+            return fallback(row)
+
+        # check for non-NULL values in the primary key columns,
+        # else no entity is returned for the row
+        if is_not_primary_key(identitykey[1]):
+            return None
+
+        instance = new_instance()
+
+        dict_ = instance_dict(instance)
+        state = instance_state(instance)
+        state.key = identitykey
+        state.identity_token = identity_token
+
+        # attach instance to session.  _add_unpresent() is looked up
+        # for each row as it's replaced when the identity map is discarded
+        state.session_id = session_id
+        session_identity_map._add_unpresent(state, identitykey)
+
+        state.load_options = load_options
+        state.load_path = load_path
+        state.runid = runid
+
+        for key, getter in quick_populators:
+            dict_[key] = getter(data)
+        if expire_keys:
+            state.expired_attributes.update(expire_keys)
+        for key, populator in new_populators:
+            populator(state, dict_, row)
+
+        if state.modified:
+            state._commit_all(dict_, session_identity_map)
+
+        return instance
+
+    return _instance
@@ -93,11 +93,11 @@ if TYPE_CHECKING:
     from ._typing import _O
     from .collections import _AdaptedCollectionProtocol
     from .collections import CollectionAdapter
-    from .dynamic import DynamicAttributeImpl
     from .interfaces import MapperProperty
     from .relationships import Relationship
     from .state import InstanceState
     from .util import AliasedInsp
+    from .writeonly import WriteOnlyAttributeImpl
     from ..event.base import _Dispatch
     from ..sql._typing import _ColumnExpressionArgument
     from ..sql._typing import _DMLColumnArgument
@@ -2553,9 +2553,9 @@ def register_attribute_impl(
     impl: AttributeImpl
 
     if impl_class:
-        # TODO: this appears to be the DynamicAttributeImpl constructor
-        # which is hardcoded
-        impl = cast("Type[DynamicAttributeImpl]", impl_class)(
+        # TODO: this appears to be the WriteOnlyAttributeImpl /
+        # DynamicAttributeImpl constructor which is hardcoded
+        impl = cast("Type[WriteOnlyAttributeImpl]", impl_class)(
             class_, key, typecallable, dispatch, **kw
         )
     elif uselist:
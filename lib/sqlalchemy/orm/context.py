@@ -73,6 +73,7 @@ if TYPE_CHECKING:
     from .query import Query
     from .session import _BindArguments
     from .session import Session
+    from .state import InstanceState
     from ..engine.interfaces import _CoreSingleExecuteParams
     from ..engine.interfaces import _ExecuteOptionsParameter
     from ..sql._typing import _ColumnsClauseArgument
@@ -118,12 +119,18 @@ class QueryContext:
         "post_load_paths",
         "identity_token",
         "yield_per",
+        "readonly_entities",
+        "readonly_identity_map",
+        "auto_expunge",
+        "auto_expunge_states",
         "loaders_require_buffering",
         "loaders_require_uniquing",
+        "__weakref__",
     )
 
     runid: int
     post_load_paths: Dict[PathRegistry, PostLoad]
+    auto_expunge_states: Optional[List[InstanceState[Any]]]
     compile_state: ORMCompileState
 
     class default_load_options(Options):
@@ -134,6 +141,8 @@ class QueryContext:
         _autoflush = True
         _refresh_identity_token = None
         _yield_per = None
+        _readonly_entities = False
+        _auto_expunge = False
         _refresh_state = None
         _lazy_loaded_from = None
         _legacy_uniquing = False
@@ -195,6 +204,10 @@ class QueryContext:
         self.version_check = load_options._version_check
         self.refresh_state = load_options._refresh_state
         self.yield_per = load_options._yield_per
+        self.readonly_entities = load_options._readonly_entities
+        self.readonly_identity_map = {} if self.readonly_entities else None
+        self.auto_expunge = load_options._auto_expunge
+        self.auto_expunge_states = None
         self.identity_token = load_options._refresh_identity_token
 
     def _get_top_level_context(self) -> QueryContext:
@@ -263,6 +276,7 @@ class ORMCompileState(AbstractORMCompileState):
             ("_for_refresh_state", InternalTraversal.dp_boolean),
             ("_render_for_subquery", InternalTraversal.dp_boolean),
             ("_is_star", InternalTraversal.dp_boolean),
+            ("_for_yield_per", InternalTraversal.dp_boolean),
         ]
 
         # set to True by default from Query._statement_20(), to indicate
@@ -287,6 +301,11 @@ class ORMCompileState(AbstractORMCompileState):
         _render_for_subquery = False
         _is_star = False
 
+        # set when the statement is executed with the yield_per option, so
+        # that rows which are part of joined eager loaded collections may
+        # be ordered to allow streaming.
+        _for_yield_per = False
+
     attributes: Dict[Any, Any]
     global_attributes: Dict[Any, Any]
 
@@ -382,6 +401,8 @@ class ORMCompileState(AbstractORMCompileState):
                 "populate_existing",
                 "autoflush",
                 "yield_per",
+                "readonly_entities",
+                "auto_expunge",
                 "sa_top_level_orm_context",
             },
             execution_options,
@@ -406,6 +427,7 @@ class ORMCompileState(AbstractORMCompileState):
             execution_options = execution_options.union(
                 {"yield_per": load_options._yield_per}
             )
+            statement = cls._statement_for_yield_per(statement)
 
         if (
             getattr(statement._compile_options, "_current_path", None)
@@ -446,6 +468,12 @@ class ORMCompileState(AbstractORMCompileState):
 
         return statement, execution_options
 
+    @classmethod
+    def _statement_for_yield_per(cls, statement):
+        """Return the statement to be executed when the ``yield_per``
+        option is in use."""
+        return statement
+
     @classmethod
     def orm_setup_cursor_result(
         cls,
@@ -511,6 +539,30 @@ class ORMCompileState(AbstractORMCompileState):
             for m in m2.iterate_to_root():  # TODO: redundant ?
                 self._polymorphic_adapters[m.local_table] = adapter
 
+    def _order_by_entity_primary_keys(self):
+        """Add the primary key columns of each mapped entity to the ORDER BY,
+        so that the rows delivered for each entity, including those of
+        joined eager loaded collections, are contiguous.
+
+        This allows joined eager loading of collections to be used with
+        yield_per, where rows are processed in batches; see
+        :func:`.loading.instances`.
+
+        """
+        order_by = list(self.order_by or ())
+        existing = set(order_by)
+        for entity in self._entities:
+            if not isinstance(entity, _MapperEntity):
+                continue
+            adapter = entity._get_entity_clauses(self)
+            for col in entity.mapper.primary_key:
+                if adapter:
+                    col = adapter.columns[col]
+                if col not in existing:
+                    existing.add(col)
+                    order_by.append(col)
+        self.order_by = order_by
+
     @classmethod
     def _create_entities_collection(cls, query, legacy):
         raise NotImplementedError(
@@ -801,6 +853,18 @@ class ORMSelectCompileState(ORMCompileState, SelectState):
     _where_criteria = ()
     _having_criteria = ()
 
+    @classmethod
+    def _statement_for_yield_per(cls, statement):
+        compile_options = cls.default_compile_options.safe_merge(
+            statement._compile_options
+        )
+        if compile_options._for_yield_per:
+            return statement
+
+        statement = statement._generate()
+        statement._compile_options = compile_options + {"_for_yield_per": True}
+        return statement
+
     @classmethod
     def create_for_statement(
         cls,
@@ -1106,6 +1170,12 @@ class ORMSelectCompileState(ORMCompileState, SelectState):
         if self.order_by is False:
             self.order_by = None
 
+        if (
+            self.multi_row_eager_loaders
+            and self.compile_options._for_yield_per
+        ):
+            self._order_by_entity_primary_keys()
+
         if self.multi_row_eager_loaders and self._should_nest_selectable:
             self.statement = self._compound_eager_statement()
         else:
@@ -2477,8 +2547,7 @@ class _MapperEntity(_QueryEntity):
 
         return ret
 
-    def row_processor(self, context, result):
-        compile_state = context.compile_state
+    def _get_row_adapter(self, compile_state):
         adapter = self._get_entity_clauses(compile_state)
 
         if compile_state.compound_eager_adapter and adapter:
@@ -2486,6 +2555,23 @@ class _MapperEntity(_QueryEntity):
         elif not adapter:
             adapter = compile_state.compound_eager_adapter
 
+        return adapter
+
+    def primary_key_getter(self, context, result):
+        """Return a callable which will return the primary key identity
+        of this entity from a result row."""
+
+        adapter = self._get_row_adapter(context.compile_state)
+
+        pk_cols = self.mapper.primary_key
+        if adapter:
+            pk_cols = [adapter.columns[c] for c in pk_cols]
+        return result._tuple_getter(pk_cols)
+
+    def row_processor(self, context, result):
+        compile_state = context.compile_state
+        adapter = self._get_row_adapter(compile_state)
+
         if compile_state._primary_entity is self:
             only_load_props = compile_state.compile_options._only_load_props
             refresh_state = context.refresh_state
@@ -16,12 +16,6 @@ basic add/delete mutation.
 
 from __future__ import annotations
 
-from typing import Any
-from typing import Optional
-from typing import overload
-from typing import TYPE_CHECKING
-from typing import Union
-
 from . import attributes
 from . import exc as orm_exc
 from . import interfaces
@@ -29,22 +23,14 @@ from . import relationships
 from . import strategies
 from . import util as orm_util
 from .base import object_mapper
-from .base import PassiveFlag
 from .query import Query
 from .session import object_session
+from .writeonly import WriteOnlyAttributeImpl
+from .writeonly import WriteOnlyHistory
 from .. import exc
 from .. import log
 from .. import util
 from ..engine import result
-from ..util.typing import Literal
-
-if TYPE_CHECKING:
-    from ._typing import _InstanceDict
-    from .attributes import _AdaptedCollectionProtocol
-    from .attributes import AttributeEventToken
-    from .attributes import CollectionAdapter
-    from .base import LoaderCallableStatus
-    from .state import InstanceState
 
 
 @log.class_logger
@@ -80,15 +66,23 @@ class DynaLoader(strategies.AbstractRelationshipLoader, log.Identified):
         )
 
 
-class DynamicAttributeImpl(
-    attributes.HasCollectionAdapter, attributes.AttributeImpl
-):
-    uses_objects = True
-    default_accepts_scalar_loader = False
-    supports_population = False
-    collection = False
-    dynamic = True
-    order_by = ()
+class DynamicCollectionHistory(WriteOnlyHistory):
+    def __init__(self, attr, state, passive, apply_to=None):
+        if apply_to:
+            coll = AppenderQuery(attr, state).autoflush(False)
+            self.unchanged_items = util.OrderedIdentitySet(coll)
+            self.added_items = apply_to.added_items
+            self.deleted_items = apply_to.deleted_items
+            self._reconcile_collection = True
+        else:
+            super(DynamicCollectionHistory, self).__init__(
+                attr, state, passive
+            )
+
+
+class DynamicAttributeImpl(WriteOnlyAttributeImpl):
+    _supports_dynamic_iteration = True
+    collection_history_cls = DynamicCollectionHistory
 
     def __init__(
         self,
@@ -102,11 +96,8 @@ class DynamicAttributeImpl(
         **kw,
     ):
         super(DynamicAttributeImpl, self).__init__(
-            class_, key, typecallable, dispatch, **kw
+            class_, key, typecallable, dispatch, target_mapper, order_by, **kw
         )
-        self.target_mapper = target_mapper
-        if order_by:
-            self.order_by = tuple(order_by)
         if not query_class:
             self.query_class = AppenderQuery
         elif AppenderMixin in query_class.mro():
@@ -122,221 +113,6 @@ class DynamicAttributeImpl(
         else:
             return self.query_class(self, state)
 
-    @overload
-    def get_collection(
-        self,
-        state: InstanceState[Any],
-        dict_: _InstanceDict,
-        user_data: Literal[None] = ...,
-        passive: Literal[PassiveFlag.PASSIVE_OFF] = ...,
-    ) -> CollectionAdapter:
-        ...
-
-    @overload
-    def get_collection(
-        self,
-        state: InstanceState[Any],
-        dict_: _InstanceDict,
-        user_data: _AdaptedCollectionProtocol = ...,
-        passive: PassiveFlag = ...,
-    ) -> CollectionAdapter:
-        ...
-
-    @overload
-    def get_collection(
-        self,
-        state: InstanceState[Any],
-        dict_: _InstanceDict,
-        user_data: Optional[_AdaptedCollectionProtocol] = ...,
-        passive: PassiveFlag = ...,
-    ) -> Union[
-        Literal[LoaderCallableStatus.PASSIVE_NO_RESULT], CollectionAdapter
-    ]:
-        ...
-
-    def get_collection(
-        self,
-        state: InstanceState[Any],
-        dict_: _InstanceDict,
-        user_data: Optional[_AdaptedCollectionProtocol] = None,
-        passive: PassiveFlag = PassiveFlag.PASSIVE_OFF,
-    ) -> Union[
-        Literal[LoaderCallableStatus.PASSIVE_NO_RESULT], CollectionAdapter
-    ]:
-        if not passive & attributes.SQL_OK:
-            data = self._get_collection_history(state, passive).added_items
-        else:
-            history = self._get_collection_history(state, passive)
-            data = history.added_plus_unchanged
-        return DynamicCollectionAdapter(data)
-
-    @util.memoized_property
-    def _append_token(self):
-        return attributes.AttributeEventToken(self, attributes.OP_APPEND)
-
-    @util.memoized_property
-    def _remove_token(self):
-        return attributes.AttributeEventToken(self, attributes.OP_REMOVE)
-
-    def fire_append_event(
-        self, state, dict_, value, initiator, collection_history=None
-    ):
-        if collection_history is None:
-            collection_history = self._modified_event(state, dict_)
-
-        collection_history.add_added(value)
-
-        for fn in self.dispatch.append:
-            value = fn(state, value, initiator or self._append_token)
-
-        if self.trackparent and value is not None:
-            self.sethasparent(attributes.instance_state(value), state, True)
-
-    def fire_remove_event(
-        self, state, dict_, value, initiator, collection_history=None
-    ):
-        if collection_history is None:
-            collection_history = self._modified_event(state, dict_)
-
-        collection_history.add_removed(value)
-
-        if self.trackparent and value is not None:
-            self.sethasparent(attributes.instance_state(value), state, False)
-
-        for fn in self.dispatch.remove:
-            fn(state, value, initiator or self._remove_token)
-
-    def _modified_event(self, state, dict_):
-
-        if self.key not in state.committed_state:
-            state.committed_state[self.key] = CollectionHistory(self, state)
-
-        state._modified_event(dict_, self, attributes.NEVER_SET)
-
-        # this is a hack to allow the fixtures.ComparableEntity fixture
-        # to work
-        dict_[self.key] = True
-        return state.committed_state[self.key]
-
-    def set(
-        self,
-        state: InstanceState[Any],
-        dict_: _InstanceDict,
-        value: Any,
-        initiator: Optional[AttributeEventToken] = None,
-        passive: PassiveFlag = PassiveFlag.PASSIVE_OFF,
-        check_old: Any = None,
-        pop: bool = False,
-        _adapt: bool = True,
-    ) -> None:
-        if initiator and initiator.parent_token is self.parent_token:
-            return
-
-        if pop and value is None:
-            return
-
-        iterable = value
-        new_values = list(iterable)
-        if state.has_identity:
-            old_collection = util.IdentitySet(self.get(state, dict_))
-
-        collection_history = self._modified_event(state, dict_)
-        if not state.has_identity:
-            old_collection = collection_history.added_items
-        else:
-            old_collection = old_collection.union(
-                collection_history.added_items
-            )
-
-        idset = util.IdentitySet
-        constants = old_collection.intersection(new_values)
-        additions = idset(new_values).difference(constants)
-        removals = old_collection.difference(constants)
-
-        for member in new_values:
-            if member in additions:
-                self.fire_append_event(
-                    state,
-                    dict_,
-                    member,
-                    None,
-                    collection_history=collection_history,
-                )
-
-        for member in removals:
-            self.fire_remove_event(
-                state,
-                dict_,
-                member,
-                None,
-                collection_history=collection_history,
-            )
-
-    def delete(self, *args, **kwargs):
-        raise NotImplementedError()
-
-    def set_committed_value(self, state, dict_, value):
-        raise NotImplementedError(
-            "Dynamic attributes don't support " "collection population."
-        )
-
-    def get_history(self, state, dict_, passive=attributes.PASSIVE_OFF):
-        c = self._get_collection_history(state, passive)
-        return c.as_history()
-
-    def get_all_pending(
-        self, state, dict_, passive=attributes.PASSIVE_NO_INITIALIZE
-    ):
-        c = self._get_collection_history(state, passive)
-        return [(attributes.instance_state(x), x) for x in c.all_items]
-
-    def _get_collection_history(self, state, passive=attributes.PASSIVE_OFF):
-        if self.key in state.committed_state:
-            c = state.committed_state[self.key]
-        else:
-            c = CollectionHistory(self, state)
-
-        if state.has_identity and (passive & attributes.INIT_OK):
-            return CollectionHistory(self, state, apply_to=c)
-        else:
-            return c
-
-    def append(
-        self, state, dict_, value, initiator, passive=attributes.PASSIVE_OFF
-    ):
-        if initiator is not self:
-            self.fire_append_event(state, dict_, value, initiator)
-
-    def remove(
-        self, state, dict_, value, initiator, passive=attributes.PASSIVE_OFF
-    ):
-        if initiator is not self:
-            self.fire_remove_event(state, dict_, value, initiator)
-
-    def pop(
-        self, state, dict_, value, initiator, passive=attributes.PASSIVE_OFF
-    ):
-        self.remove(state, dict_, value, initiator, passive=passive)
-
-
-class DynamicCollectionAdapter:
-    """simplified CollectionAdapter for internal API consistency"""
-
-    def __init__(self, data):
-        self.data = data
-
-    def __iter__(self):
-        return iter(self.data)
-
-    def _reset_empty(self):
-        pass
-
-    def __len__(self):
-        return len(self.data)
-
-    def __bool__(self):
-        return True
-
 
 class AppenderMixin:
     query_class = None
@@ -489,57 +265,3 @@ def mixin_user_query(cls):
     """Return a new class with AppenderQuery functionality layered over."""
     name = "Appender" + cls.__name__
     return type(name, (AppenderMixin, cls), {"query_class": cls})
-
-
-class CollectionHistory:
-    """Overrides AttributeHistory to receive append/remove events directly."""
-
-    def __init__(self, attr, state, apply_to=None):
-        if apply_to:
-            coll = AppenderQuery(attr, state).autoflush(False)
-            self.unchanged_items = util.OrderedIdentitySet(coll)
-            self.added_items = apply_to.added_items
-            self.deleted_items = apply_to.deleted_items
-            self._reconcile_collection = True
-        else:
-            self.deleted_items = util.OrderedIdentitySet()
-            self.added_items = util.OrderedIdentitySet()
-            self.unchanged_items = util.OrderedIdentitySet()
-            self._reconcile_collection = False
-
-    @property
-    def added_plus_unchanged(self):
-        return list(self.added_items.union(self.unchanged_items))
-
-    @property
-    def all_items(self):
-        return list(
-            self.added_items.union(self.unchanged_items).union(
-                self.deleted_items
-            )
-        )
-
-    def as_history(self):
-        if self._reconcile_collection:
-            added = self.added_items.difference(self.unchanged_items)
-            deleted = self.deleted_items.intersection(self.unchanged_items)
-            unchanged = self.unchanged_items.difference(deleted)
-        else:
-            added, unchanged, deleted = (
-                self.added_items,
-                self.unchanged_items,
-                self.deleted_items,
-            )
-        return attributes.History(list(added), list(unchanged), list(deleted))
-
-    def indexed(self, index):
-        return list(self.added_items)[index]
-
-    def add_added(self, value):
-        self.added_items.add(value)
-
-    def add_removed(self, value):
-        if value in self.added_items:
-            self.added_items.remove(value)
-        else:
-            self.deleted_items.add(value)
@@ -37,10 +37,13 @@ from .base import _DEFER_FOR_STATE
 from .base import _RAISE_FOR_STATE
 from .base import _SET_DEFERRED_EXPIRED
 from .base import PassiveFlag
+from .context import ORMCompileState
+from .context import QueryContext
 from .util import _none_set
 from .util import state_str
 from .. import exc as sa_exc
 from .. import future
+from .. import sql
 from .. import util
 from ..engine import result_tuple
 from ..engine.result import ChunkedIteratorResult
@@ -50,11 +53,11 @@ from ..sql import util as sql_util
 from ..sql.selectable import ForUpdateArg
 from ..sql.selectable import LABEL_STYLE_TABLENAME_PLUS_COL
 from ..sql.selectable import SelectState
+from ..util._has_cy import HAS_CYEXTENSION
 
 if TYPE_CHECKING:
     from ._typing import _IdentityKeyType
     from .base import LoaderCallableStatus
-    from .context import QueryContext
     from .interfaces import ORMOption
     from .mapper import Mapper
     from .query import Query
@@ -65,10 +68,21 @@ if TYPE_CHECKING:
     from ..engine.result import Result
     from ..sql import Select
 
+if TYPE_CHECKING or not HAS_CYEXTENSION:
+    from ._py_loading import _instance_fast_path as _instance_fast_path
+else:
+    from sqlalchemy.cyextension.loading import (  # noqa: F401
+        _instance_fast_path as _instance_fast_path,
+    )
+
 _T = TypeVar("_T", bound=Any)
 _O = TypeVar("_O", bound=object)
 _new_runid = util.counter()
 
+# default number of keys included in each SELECT..IN statement emitted
+# by "selectin" loaders
+_SELECTIN_CHUNKSIZE = 500
+
 
 _PopulatorDict = Dict[str, List[Tuple[str, Any]]]
 
@@ -97,6 +111,21 @@ def instances(cursor: CursorResult[Any], context: QueryContext) -> Result[Any]:
         is_top_level = True
         context.post_load_paths = {}
 
+    if (
+        context.auto_expunge
+        and context.yield_per
+        and is_top_level
+        and not context.execution_options.get("prebuffer_rows", False)
+    ):
+        # the objects newly loaded into the Session by any load, including
+        # this one, while the result is being iterated are recorded by
+        # the row processors set up by _instance_processor(), so that
+        # they are expunged as each following batch is fetched
+        loaded_states = context.auto_expunge_states = []
+        context.session._auto_expunge_contexts.add(context)
+    else:
+        loaded_states = None
+
     compile_state = context.compile_state
     filtered = compile_state._has_mapper_entities
     single_entity = (
@@ -115,17 +144,38 @@ def instances(cursor: CursorResult[Any], context: QueryContext) -> Result[Any]:
             )
         )
 
-        if context.yield_per and (
-            context.loaders_require_buffering
-            or context.loaders_require_uniquing
-        ):
+        if context.yield_per and context.loaders_require_buffering:
             raise sa_exc.InvalidRequestError(
-                "Can't use yield_per with eager loaders that require uniquing "
-                "or row buffering, e.g. joinedload() against collections "
-                "or subqueryload().  Consider the selectinload() strategy "
-                "for better flexibility in loading objects."
+                "Can't use yield_per with eager loaders that require row "
+                "buffering, e.g. subqueryload().  Consider the "
+                "selectinload() strategy for better flexibility in loading "
+                "objects."
             )
 
+        if context.auto_expunge and not context.yield_per:
+            raise sa_exc.InvalidRequestError(
+                "The 'auto_expunge' execution option may only be used in "
+                "conjunction with the 'yield_per' execution option"
+            )
+
+        if context.yield_per and context.loaders_require_uniquing:
+            # joined eager loading of collections with yield_per; the rows
+            # are ordered by the primary key of each entity, so that the rows
+            # for a particular combination of entities are contiguous.
+            # rows are buffered until that combination changes, so that
+            # each batch contains complete collections.
+            primary_key_getters = [
+                query_entity.primary_key_getter(context, cursor)
+                for query_entity in compile_state._entities
+                if query_entity.use_id_for_hash
+            ]
+
+            def group_key(row):
+                return tuple([getter(row) for getter in primary_key_getters])
+
+        else:
+            group_key = None
+
     except Exception:
         with util.safe_reraise():
             cursor.close()
@@ -174,6 +224,24 @@ def instances(cursor: CursorResult[Any], context: QueryContext) -> Result[Any]:
         labels, extra, _unique_filters=unique_filters
     )
 
+    if group_key is not None:
+        # raw rows held over from the previous batch, which belong to
+        # the same entities as the rows that will begin the next one
+        held_rows = []
+
+        # each batch contains all the rows for its entities, so rows are
+        # uniqued within each batch, rather than across the full result
+        batch_unique_filters = [
+            id
+            if (
+                ent.use_id_for_hash
+                or ent._non_hashable_value
+                or ent._null_column_type
+            )
+            else None
+            for ent in compile_state._entities
+        ]
+
     def chunks(size):  # type: ignore
         while True:
             yield_per = size
@@ -181,12 +249,43 @@ def instances(cursor: CursorResult[Any], context: QueryContext) -> Result[Any]:
             context.partials = {}
 
             if yield_per:
+                if loaded_states:
+                    _expunge_loaded(context.session, loaded_states)
+
+                if context.readonly_entities:
+                    # read-only entities from previous batches aren't
+                    # retained
+                    context.readonly_identity_map.clear()
+
                 fetch = cursor.fetchmany(yield_per)
 
+                if group_key is not None:
+                    if fetch:
+                        fetch = held_rows + fetch
+                        last_key = group_key(fetch[-1])
+                        idx = len(fetch) - 1
+                        while (
+                            idx > 0 and group_key(fetch[idx - 1]) == last_key
+                        ):
+                            idx -= 1
+                        held_rows[:] = fetch[idx:]
+                        del fetch[idx:]
+
+                        if not fetch:
+                            # the whole batch belongs to the same entities;
+                            # keep buffering
+                            continue
+                    else:
+                        fetch = held_rows[:]
+                        del held_rows[:]
+
                 if not fetch:
                     break
             else:
                 fetch = cursor._raw_all_rows()
+                if group_key is not None:
+                    fetch = held_rows + fetch
+                    del held_rows[:]
 
             if single_entity:
                 proc = process[0]
@@ -196,6 +295,9 @@ def instances(cursor: CursorResult[Any], context: QueryContext) -> Result[Any]:
                     tuple([proc(row) for proc in process]) for row in fetch
                 ]
 
+            if group_key is not None:
+                rows = _unique_rows(rows, batch_unique_filters, single_entity)
+
             # if we are the originating load from a query, meaning we
             # aren't being called as a result of a nested "post load",
             # iterate through all the collected post loaders and fire them
@@ -224,6 +326,9 @@ def instances(cursor: CursorResult[Any], context: QueryContext) -> Result[Any]:
             if not yield_per:
                 break
 
+        if loaded_states is not None:
+            context.session._auto_expunge_contexts.discard(context)
+
     if context.execution_options.get("prebuffer_rows", False):
         # this is a bit of a hack at the moment.
         # I would rather have some option in the result to pre-buffer
@@ -249,7 +354,7 @@ def instances(cursor: CursorResult[Any], context: QueryContext) -> Result[Any]:
     )
 
     # multi_row_eager_loaders OTOH is specific to joinedload.
-    if context.compile_state.multi_row_eager_loaders:
+    if context.compile_state.multi_row_eager_loaders and group_key is None:
 
         def require_unique(obj):
             raise sa_exc.InvalidRequestError(
@@ -266,6 +371,64 @@ def instances(cursor: CursorResult[Any], context: QueryContext) -> Result[Any]:
     return result
 
 
+def _expunge_loaded(session, loaded_states):
+    """Expunge the objects which were loaded into the given
+    :class:`.Session` since the previous batch of an ``auto_expunge``
+    result was fetched.
+
+    Objects which have pending changes are retained, and are expunged
+    along with a following batch once these changes are flushed.
+
+    """
+
+    identity_map = session.identity_map
+    deleted = session._deleted
+    to_expunge = []
+    retained = []
+    for state in loaded_states:
+        if not identity_map.contains_state(state):
+            # expunged or deleted, or garbage collected
+            continue
+        elif state.modified or state in deleted:
+            retained.append(state)
+        else:
+            to_expunge.append(state)
+
+    loaded_states[:] = retained
+    if to_expunge:
+        session._expunge_states(to_expunge)
+
+
+def _unique_rows(rows, unique_filters, single_entity):
+    """Unique a list of ORM rows, given the unique filter for each
+    entity."""
+
+    if single_entity:
+        unique_filter = unique_filters[0]
+
+        def hashed(row):
+            return unique_filter(row) if unique_filter else row
+
+    else:
+
+        def hashed(row):
+            return tuple(
+                [
+                    fn(elem) if fn else elem
+                    for fn, elem in zip(unique_filters, row)
+                ]
+            )
+
+    seen = set()
+    uniqued = []
+    for row in rows:
+        key = hashed(row)
+        if key not in seen:
+            seen.add(key)
+            uniqued.append(row)
+    return uniqued
+
+
 @util.preload_module("sqlalchemy.orm.context")
 def merge_frozen_result(session, statement, frozen_result, load=True):
     """Merge a :class:`_engine.FrozenResult` back into a :class:`_orm.Session`,
@@ -615,6 +778,145 @@ def load_on_pk_identity(
         return None
 
 
+def load_on_pk_identities(
+    session: Session,
+    statement: Select,
+    primary_key_identities: Sequence[Tuple[Any, ...]],
+    *,
+    load_options: Optional[Sequence[ORMOption]] = None,
+    identity_token: Optional[Any] = None,
+    bind_arguments: Mapping[str, Any] = util.EMPTY_DICT,
+    execution_options: _ExecuteOptions = util.EMPTY_DICT,
+) -> Dict[Tuple[Any, ...], Any]:
+    """Load the given primary key identities from the database using
+    SELECT..IN statements.
+
+    Returns a dictionary of primary key identity to object, for those
+    objects that were located.
+
+    """
+
+    if load_options is None:
+        load_options = QueryContext.default_load_options
+
+    mapper = statement._propagate_attrs["plugin_subject"]
+    pk_cols = mapper.primary_key
+
+    results = {}
+
+    # NULL values can't be located with IN; these rows are loaded
+    # individually using "IS NULL"
+    to_load = []
+    for primary_key_identity in primary_key_identities:
+        if None in primary_key_identity:
+            results[primary_key_identity] = load_on_pk_identity(
+                session,
+                statement,
+                primary_key_identity,
+                load_options=load_options,
+                identity_token=identity_token,
+                bind_arguments=bind_arguments,
+                execution_options=execution_options,
+            )
+        else:
+            to_load.append(primary_key_identity)
+
+    if not to_load:
+        return results
+
+    if len(pk_cols) == 1:
+        in_expr = pk_cols[0]
+        primary_keys = [
+            primary_key_identity[0] for primary_key_identity in to_load
+        ]
+    else:
+        in_expr = sql.tuple_(*pk_cols)
+        primary_keys = to_load
+
+    q = statement._clone()
+    q._where_criteria = (
+        sql_util._deep_annotate(
+            in_expr.in_(sql.bindparam("primary_keys", expanding=True)),
+            {"_orm_adapt": True},
+        ),
+    )
+    q._order_by = None
+
+    if (
+        statement._compile_options
+        is SelectState.default_select_compile_options
+    ):
+        compile_options = ORMCompileState.default_compile_options
+    else:
+        compile_options = statement._compile_options
+
+    version_check = statement._for_update_arg is not None
+    q._compile_options, in_load_options = _set_get_options(
+        compile_options,
+        load_options,
+        version_check=version_check,
+        identity_token=identity_token,
+    )
+
+    in_execution_options = util.EMPTY_DICT.merge_with(
+        execution_options, {"_sa_orm_load_options": in_load_options}
+    )
+
+    chunksize = _selectin_chunksize(
+        session.get_bind(mapper=mapper).dialect,
+        None,
+        _SELECTIN_CHUNKSIZE,
+        len(pk_cols),
+    )
+
+    loaded = {}
+    while primary_keys:
+        chunk = primary_keys[0:chunksize]
+        primary_keys = primary_keys[chunksize:]
+
+        for obj in (
+            session.execute(
+                q,
+                {"primary_keys": chunk},
+                execution_options=in_execution_options,
+                bind_arguments=bind_arguments,
+            )
+            .unique()
+            .scalars()
+        ):
+            loaded[attributes.instance_state(obj).key[1]] = obj
+
+    unmatched = []
+    for primary_key_identity in to_load:
+        if primary_key_identity in loaded:
+            results[primary_key_identity] = loaded[primary_key_identity]
+        else:
+            unmatched.append(primary_key_identity)
+
+    # an identity with values of a different type than those of the
+    # primary key, such as the string "5" for an integer column, may
+    # locate a row whose identity key doesn't compare equal to it; these
+    # identities are loaded individually as is the case for Session.get()
+    if unmatched and loaded:
+        key_types = [type(value) for value in next(iter(loaded))]
+        for primary_key_identity in unmatched:
+            if any(
+                type(value) is not key_type
+                for value, key_type in zip(primary_key_identity, key_types)
+            ):
+                results[primary_key_identity] = load_on_pk_identity(
+                    session,
+                    statement,
+                    primary_key_identity,
+                    load_options=load_options,
+                    identity_token=identity_token,
+                    bind_arguments=bind_arguments,
+                    execution_options=execution_options,
+                )
+
+    return results
+
+
 def _set_get_options(
     compile_opt,
     load_opt,
@@ -862,12 +1164,54 @@ def _instance_processor(
 
     cached_populators = getters["cached_populators"]
 
-    populators = {key: list(value) for key, value in cached_populators.items()}
+    readonly_entities = context.readonly_entities and not refresh_state
+
+    if readonly_entities:
+        # read-only entities have no InstanceState, so only the "quick"
+        # column populators, which write directly to the instance
+        # dictionary, apply from the cached set
+        populators = {key: [] for key in cached_populators}
+        populators["quick"].extend(cached_populators["quick"])
+    else:
+        populators = {
+            key: list(value) for key, value in cached_populators.items()
+        }
     for prop in getters["todo"]:
         prop.create_row_processor(
             context, query_entity, path, mapper, result, adapter, populators
         )
 
+    if context.session.batch_refresh and not (
+        refresh_state or readonly_entities
+    ):
+        # the objects loaded along this path by this result refresh their
+        # expired or deferred attributes together; see
+        # _load_scalar_attributes_for_siblings()
+        batch_refresh_siblings = []
+
+        def set_batch_refresh_siblings(state, dict_, row):
+            state._batch_refresh_siblings = batch_refresh_siblings
+            batch_refresh_siblings.append(state.obj)
+
+        populators["new"].append(
+            ("_batch_refresh_siblings", set_batch_refresh_siblings)
+        )
+
+    if context.session._auto_expunge_contexts:
+        # objects created by this load are recorded for each auto_expunge
+        # result being iterated in the Session; see instances()
+        auto_expunge_states = [
+            auto_expunge_context.auto_expunge_states
+            for auto_expunge_context in context.session._auto_expunge_contexts
+        ]
+
+        def record_loaded_state(state, dict_, row):
+            for loaded_states in auto_expunge_states:
+                loaded_states.append(state)
+
+    else:
+        record_loaded_state = None
+
     propagated_loader_options = context.propagated_loader_options
     load_path = (
         context.compile_state.current_path + path
@@ -904,14 +1248,17 @@ def _instance_processor(
         if key in context.attributes and context.attributes[key].strategy == (
             ("selectinload_polymorphic", True),
         ):
+            local_opts = context.attributes[key].local_opts
             selectin_load_via = mapper._should_selectin_load(
-                context.attributes[key].local_opts["entities"],
+                local_opts["entities"],
                 _polymorphic_from,
             )
+            chunksize = local_opts.get("chunksize")
         else:
             selectin_load_via = mapper._should_selectin_load(
                 None, _polymorphic_from
             )
+            chunksize = None
 
         if selectin_load_via and selectin_load_via is not _polymorphic_from:
             # only_load_props goes w/ refresh_state only, and in a refresh
@@ -919,7 +1266,24 @@ def _instance_processor(
             # loading does not apply
             assert only_load_props is None
 
-            callable_ = _load_subclass_via_in(context, path, selectin_load_via)
+            if readonly_entities:
+                raise sa_exc.InvalidRequestError(
+                    "Polymorphic selectin loading for %s isn't supported "
+                    "with the 'readonly_entities' execution option"
+                    % selectin_load_via
+                )
+
+            callable_ = _load_subclass_via_in(
+                context,
+                path,
+                selectin_load_via,
+                _selectin_chunksize(
+                    result.context.dialect,
+                    chunksize,
+                    _SELECTIN_CHUNKSIZE,
+                    len(selectin_load_via.mapper.primary_key),
+                ),
+            )
 
             PostLoad.callable_for_path(
                 context,
@@ -1010,6 +1374,9 @@ def _instance_processor(
                 state.session_id = session_id
                 session_identity_map._add_unpresent(state, identitykey)
 
+                if record_loaded_state is not None:
+                    record_loaded_state(state, dict_, row)
+
         effective_populate_existing = populate_existing
         if refresh_state is state:
             effective_populate_existing = True
@@ -1112,6 +1479,54 @@ def _instance_processor(
 
         return instance
 
+    if readonly_entities:
+        _instance = _readonly_instance_processor(  # noqa: F811
+            context,
+            mapper,
+            identity_class,
+            primary_key_getter,
+            identity_token,
+            is_not_primary_key,
+            populators,
+            post_load,
+        )
+    elif (
+        not refresh_state
+        and not populate_existing
+        and not load_evt
+        and not persistent_evt
+        and not post_load
+    ):
+        # the common case of rows that are loaded into new instances
+        # which are fully populated from the row; rows that locate an
+        # instance already present in the identity map are delivered to
+        # the full _instance() function above
+        if record_loaded_state is not None:
+            # "new" populators are only run for new instances by the
+            # fast path
+            populators = dict(
+                populators,
+                new=populators["new"]
+                + [("_auto_expunge", record_loaded_state)],
+            )
+
+        _instance = _instance_fast_path(
+            _instance,
+            identity_class,
+            primary_key_getter,
+            identity_token,
+            session_identity_map,
+            is_not_primary_key,
+            mapper.class_manager.new_instance,
+            instance_state,
+            instance_dict,
+            session_id,
+            runid,
+            propagated_loader_options,
+            load_path,
+            populators,
+        )
+
     if mapper.polymorphic_map and not _polymorphic_from and not refresh_state:
         # if we are doing polymorphic, dispatch to a different _instance()
         # method specific to the subclass mapper
@@ -1141,7 +1556,196 @@ def _instance_processor(
     return _instance
 
 
-def _load_subclass_via_in(context, path, entity):
+def _readonly_instance_processor(
+    context,
+    mapper,
+    identity_class,
+    primary_key_getter,
+    identity_token,
+    is_not_primary_key,
+    populators,
+    post_load,
+):
+    """Produce a row processor which loads rows into read-only entities,
+    for the ``readonly_entities`` execution option.
+
+    Read-only entities are instances of the mapped class whose
+    ``__dict__`` is populated directly from the row.  They have no
+    :class:`.InstanceState` and aren't added to the :class:`.Session`;
+    instead, an identity map local to the load ensures that each
+    identity in the result produces a single instance, which eager
+    loaders then populate.
+
+    """
+    class_ = mapper.class_
+    manager = mapper.class_manager
+    state_attr = manager.STATE_ATTR
+    readonly_state = _ReadOnlyEntityState(class_)
+    identity_map = context.readonly_identity_map
+
+    quick_populators = tuple(populators["quick"])
+    new_populators = tuple(populators["new"])
+    existing_populators = tuple(populators["existing"])
+
+    def _instance(row):
+        # as in _instance_fast_path(), the primary key and "quick" getters
+        # are applied to the row's tuple directly
+        data = row._data
+
+        identitykey = (
+            identity_class,
+            primary_key_getter(data),
+            identity_token,
+        )
+
+        instance = identity_map.get(identitykey)
+
+        if instance is not None:
+            # further rows for the same identity deliver additional
+            # eagerly loaded collection members
+            if existing_populators:
+                dict_ = instance.__dict__
+                for key, populator in existing_populators:
+                    populator(None, dict_, row)
+            return instance
+
+        # check for non-NULL values in the primary key columns,
+        # else no entity is returned for the row
+        if is_not_primary_key(identitykey[1]):
+            return None
+
+        instance = class_.__new__(class_)
+        dict_ = instance.__dict__
+        dict_[state_attr] = readonly_state
+        identity_map[identitykey] = instance
+
+        for key, getter in quick_populators:
+            dict_[key] = getter(data)
+
+        if post_load:
+            state = _ReadOnlyLoadState(identitykey, dict_, manager)
+            post_load.add_state(state, True)
+        else:
+            state = None
+
+        for key, populator in new_populators:
+            populator(state, dict_, row)
+
+        return instance
+
+    return _instance
+
+
+def _readonly_entity_error(class_):
+    return sa_exc.InvalidRequestError(
+        "Instance of %s was loaded with the 'readonly_entities' execution "
+        "option; read-only entities can't be modified, added to a "
+        "Session, or load attributes which weren't loaded up front"
+        % class_.__name__
+    )
+
+
+class _ReadOnlyEntityState:
+    """Stand-in for the :class:`.InstanceState` of a read-only entity.
+
+    A single object is shared among all the entities produced by a
+    read-only row processor.  Any ORM operation that makes use of the
+    state of an entity, such as setting an attribute, loading an
+    unloaded attribute, or adding the object to a :class:`.Session`,
+    raises :class:`.InvalidRequestError`.
+
+    """
+
+    __slots__ = ("class_",)
+
+    def __init__(self, class_):
+        object.__setattr__(self, "class_", class_)
+
+    def __getattr__(self, key):
+        raise _readonly_entity_error(self.class_)
+
+    def __setattr__(self, key, value):
+        raise _readonly_entity_error(self.class_)
+
+
+class _ReadOnlyLoadState:
+    """Minimal state passed to :class:`.PostLoad` loaders such as
+    selectinload on behalf of a read-only entity."""
+
+    __slots__ = ("key", "dict", "manager")
+
+    def __init__(self, key, dict_, manager):
+        self.key = key
+        self.dict = dict_
+        self.manager = manager
+
+    def get_impl(self, key):
+        return _ReadOnlyAttributeImpl(key, self.manager[key].impl.collection)
+
+
+class _ReadOnlyAttributeImpl:
+    __slots__ = ("key", "collection")
+
+    def __init__(self, key, collection):
+        self.key = key
+        self.collection = collection
+
+    def set_committed_value(self, state, dict_, value):
+        if self.collection:
+            value = dict_[self.key] = _ReadOnlyCollection(value or ())
+        else:
+            dict_[self.key] = value
+        return value
+
+
+class _ReadOnlyCollection(list):
+    """A list which raises on mutation, used for the relationship
+    collections of read-only entities.
+
+    Loaders populate the collection using the ``_append()`` method.
+
+    """
+
+    __slots__ = ()
+
+    _append = list.append
+
+    def _readonly(self, *arg, **kw):
+        raise sa_exc.InvalidRequestError(
+            "Collections of entities loaded with the 'readonly_entities' "
+            "execution option are read-only"
+        )
+
+    append = extend = insert = _readonly
+    remove = pop = clear = _readonly
+    sort = reverse = _readonly
+    __setitem__ = __delitem__ = _readonly
+    __iadd__ = __imul__ = _readonly
+
+
+def _selectin_chunksize(dialect, chunksize, default_chunksize, key_length):
+    """Return the number of keys to include in each SELECT..IN statement
+    emitted by a "selectin" loader.
+
+    This is the chunk size given to the loader option if any, else the
+    default, limited such that the bound parameters rendered for the IN
+    expression, where each key consists of ``key_length`` parameters,
+    don't exceed the dialect's ``max_bind_parameters``.
+    Single-column keys aren't limited when the dialect renders the IN
+    expression as one array parameter.
+
+    """
+    if chunksize is None:
+        chunksize = default_chunksize
+    if key_length == 1 and dialect.array_in_expansion:
+        return max(1, chunksize)
+    return max(
+        1,
+        min(chunksize, dialect.max_bind_parameters // key_length),
+    )
+
+
+def _load_subclass_via_in(context, path, entity, chunksize):
     mapper = entity.mapper
 
     zero_idx = len(mapper.base_mapper.primary_key) == 1
@@ -1163,15 +1767,18 @@ def _load_subclass_via_in(context, path, entity):
         if context.populate_existing:
             q2 = q2.execution_options(populate_existing=True)
 
-        context.session.execute(
-            q2,
-            dict(
-                primary_keys=[
-                    state.key[1][0] if zero_idx else state.key[1]
-                    for state, load_attrs in states
-                ]
-            ),
-        ).unique().scalars().all()
+        primary_keys = [
+            state.key[1][0] if zero_idx else state.key[1]
+            for state, load_attrs in states
+        ]
+
+        while primary_keys:
+            chunk = primary_keys[0:chunksize]
+            primary_keys = primary_keys[chunksize:]
+
+            context.session.execute(
+                q2, dict(primary_keys=chunk)
+            ).unique().scalars().all()
 
     return do_load
 
@@ -1476,6 +2083,16 @@ def load_scalar_attributes(mapper, state, attribute_names, passive):
     if attribute_names:
         attribute_names = attribute_names.intersection(mapper.attrs.keys())
 
+    if (
+        session.batch_refresh
+        and has_key
+        and attribute_names
+        and _load_scalar_attributes_for_siblings(
+            mapper, state, attribute_names, session, no_autoflush
+        )
+    ):
+        return
+
     if mapper.inherits and not mapper.concrete:
         statement = mapper._optimized_get_statement(state, attribute_names)
         if statement is not None:
@@ -1540,3 +2157,131 @@ def load_scalar_attributes(mapper, state, attribute_names, passive):
     # may not complete (even if PK attributes are assigned)
     if has_key and result is None:
         raise orm_exc.ObjectDeletedError(state)
+
+
+def _load_scalar_attributes_for_siblings(
+    mapper, state, attribute_names, session, no_autoflush
+):
+    """Refresh the given attributes of ``state`` along with those of the
+    other objects of the same mapper which were loaded by the same result
+    and don't have any of these attributes loaded, using a SELECT..IN
+    statement.
+
+    Returns True if the row for ``state`` was located, else False, in which
+    case the refresh for ``state`` proceeds individually.
+
+    """
+
+    siblings = state._batch_refresh_siblings
+    if not siblings or state.key[2] is not None:
+        # identity tokens are used by the horizontal sharding extension,
+        # where each object may need to be loaded from a different database
+        return False
+
+    pk_cols = mapper.primary_key
+    chunksize = _selectin_chunksize(
+        session.get_bind(mapper=mapper).dialect,
+        None,
+        _SELECTIN_CHUNKSIZE,
+        len(pk_cols),
+    )
+
+    instance = state.obj()
+    objects = [instance]
+    batch = [state.obj]
+    scanned = 0
+    for ref in siblings:
+        if len(objects) >= chunksize:
+            break
+        scanned += 1
+
+        obj = ref()
+        if obj is None:
+            continue
+        sibling = attributes.instance_state(obj)
+
+        # the object is still in the same session, hasn't been loaded
+        # by another result since, and has neither loaded values nor
+        # pending changes for the attributes
+        if (
+            sibling is not state
+            and sibling._batch_refresh_siblings is siblings
+            and sibling.session_id == state.session_id
+            and sibling.key is not None
+            and sibling.manager.mapper is mapper
+            and attributes.instance_dict(obj)
+            .keys()
+            .isdisjoint(attribute_names)
+            and attribute_names.isdisjoint(sibling.committed_state)
+        ):
+            objects.append(obj)
+            batch.append(ref)
+
+    # each object examined is either loaded now, after which it's loaded
+    # along with the others loaded now, or loads individually from here on
+    del siblings[:scanned]
+
+    if len(objects) < 2:
+        state._batch_refresh_siblings = None
+        return False
+
+    for obj in objects:
+        attributes.instance_state(obj)._batch_refresh_siblings = batch
+
+    if len(pk_cols) == 1:
+        in_expr = pk_cols[0]
+        primary_keys = [
+            attributes.instance_state(obj).key[1][0] for obj in objects
+        ]
+    else:
+        in_expr = sql.tuple_(*pk_cols)
+        primary_keys = [
+            attributes.instance_state(obj).key[1] for obj in objects
+        ]
+
+    q = future.select(mapper).set_label_style(LABEL_STYLE_TABLENAME_PLUS_COL)
+    q._where_criteria = (
+        sql_util._deep_annotate(
+            in_expr.in_(sql.bindparam("primary_keys", expanding=True)),
+            {"_orm_adapt": True},
+        ),
+    )
+
+    compile_options = ORMCompileState.default_compile_options
+    if state.load_options:
+        compile_options += {"_current_path": state.load_path.parent}
+        q = q.options(*state.load_options)
+
+    # the primary key columns are needed in order to locate each object
+    # in the identity map; they're already loaded, so aren't populated
+    compile_options, orm_load_options = _set_get_options(
+        compile_options,
+        QueryContext.default_load_options,
+        only_load_props=attribute_names.union(
+            mapper._columntoproperty[col].key for col in pk_cols
+        ),
+    )
+    q._compile_options = compile_options
+
+    if no_autoflush:
+        orm_load_options += {"_autoflush": False}
+
+    execution_options = {"_sa_orm_load_options": orm_load_options}
+
+    # existing objects in the identity map which don't have the
+    # attributes loaded are populated with those attributes; see
+    # _populate_partial()
+    found = False
+    for obj in (
+        session.execute(
+            q,
+            {"primary_keys": primary_keys},
+            execution_options=execution_options,
+        )
+        .unique()
+        .scalars()
+    ):
+        if obj is instance:
+            found = True
+
+    return found
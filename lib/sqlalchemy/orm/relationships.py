@@ -136,6 +136,7 @@ _RelationshipArgumentType = Union[
 
 _LazyLoadArgumentType = Literal[
     "select",
+    "batch",
     "joined",
     "selectin",
     "subquery",
@@ -144,6 +145,7 @@ _LazyLoadArgumentType = Literal[
     "noload",
     "immediate",
     "dynamic",
+    "write_only",
     True,
     False,
     None,
@@ -13,6 +13,7 @@ from typing import Dict
 from typing import Generic
 from typing import Iterable
 from typing import Iterator
+from typing import List
 from typing import Optional
 from typing import overload
 from typing import Sequence
@@ -56,6 +57,7 @@ if TYPE_CHECKING:
     from ..engine.interfaces import _CoreSingleExecuteParams
     from ..engine.interfaces import _ExecuteOptions
     from ..engine.interfaces import _ExecuteOptionsParameter
+    from ..engine.interfaces import CacheWarmResult
     from ..engine.result import ScalarResult
     from ..sql._typing import _ColumnsClauseArgument
     from ..sql._typing import _T0
@@ -109,17 +111,20 @@ __all__ = ["scoped_session"]
         "expunge_all",
         "flush",
         "get",
+        "get_many",
         "get_bind",
         "is_modified",
         "bulk_save_objects",
         "bulk_insert_mappings",
         "bulk_update_mappings",
         "merge",
+        "merge_all",
         "query",
         "refresh",
         "rollback",
         "scalar",
         "scalars",
+        "warm_cache",
     ],
     attributes=[
         "bind",
@@ -952,6 +957,97 @@ class scoped_session(Generic[_S]):
             execution_options=execution_options,
         )
 
+    def get_many(
+        self,
+        entity: _EntityBindKey[_O],
+        idents: Iterable[_PKIdentityArgument],
+        *,
+        options: Optional[Sequence[ORMOption]] = None,
+        populate_existing: bool = False,
+        with_for_update: Optional[ForUpdateArg] = None,
+        identity_token: Optional[Any] = None,
+        execution_options: _ExecuteOptionsParameter = util.EMPTY_DICT,
+    ) -> List[Optional[_O]]:
+        r"""Return a list of instances based on the given primary key
+        identifiers, with ``None`` in place of each identifier that isn't
+        found.
+
+        .. container:: class_bases
+
+            Proxied for the :class:`_orm.Session` class on
+            behalf of the :class:`_orm.scoping.scoped_session` class.
+
+        E.g.::
+
+            users = session.get_many(User, [5, 7, 10])
+
+            some_objects = session.get_many(VersionedFoo, [(5, 10), (7, 2)])
+
+        Each element of ``idents`` accepts the same forms as the
+        :paramref:`_orm.Session.get.ident` parameter of
+        :meth:`_orm.Session.get`, and the list returned has one element
+        corresponding to each element of ``idents``, in the same order.
+
+        In the same way as :meth:`_orm.Session.get`, objects that are present
+        in the identity map of the :class:`.Session` and aren't expired are
+        returned directly.  The remaining objects are loaded using SELECT
+        statements which locate the primary key values using an IN
+        expression, emitted in chunks of primary key values in the same way
+        as :ref:`selectin_eager_loading`; a composite primary key makes use of
+        a tuple IN expression.  Objects which are marked as expired in
+        the identity map are loaded in the same way, and if their row isn't
+        present, they are removed from the :class:`.Session` and ``None`` is
+        returned for them.
+
+        .. versionadded:: 2.0
+
+        :param entity: a mapped class or :class:`.Mapper` indicating the
+         type of entity to be loaded.
+
+        :param idents: a sequence of scalar, tuple, or dictionary primary key
+         values, each in the form accepted by :meth:`_orm.Session.get`.
+
+        :param options: optional sequence of loader options which will be
+         applied to the queries, if any are emitted.
+
+        :param populate_existing: causes the method to unconditionally emit
+         SQL queries and refresh the objects with the newly loaded data,
+         regardless of whether or not the objects are already present.
+
+        :param with_for_update: optional boolean ``True`` indicating FOR UPDATE
+          should be used, or may be a dictionary containing flags to
+          indicate a more specific set of FOR UPDATE flags for the SELECT;
+          flags should match the parameters of
+          :meth:`_query.Query.with_for_update`.  When present, all the
+          objects are loaded from the database.
+
+        :param identity_token: identity token used for identity map lookups
+         and for the objects loaded, as for :meth:`_orm.Session.get`.
+
+        :param execution_options: optional dictionary of execution options,
+         which will be associated with the query executions if any are
+         emitted.
+
+        :return: a list of object instances, with ``None`` for each
+         identifier not found.
+
+        .. seealso::
+
+            :meth:`_orm.Session.get`
+
+
+        """  # noqa: E501
+
+        return self._proxied.get_many(
+            entity,
+            idents,
+            options=options,
+            populate_existing=populate_existing,
+            with_for_update=with_for_update,
+            identity_token=identity_token,
+            execution_options=execution_options,
+        )
+
     def get_bind(
         self,
         mapper: Optional[_EntityBindKey[_O]] = None,
@@ -1482,6 +1578,53 @@ class scoped_session(Generic[_S]):
 
         return self._proxied.merge(instance, load=load, options=options)
 
+    def merge_all(
+        self,
+        instances: Iterable[_O],
+        *,
+        load: bool = True,
+        options: Optional[Sequence[ORMOption]] = None,
+    ) -> List[_O]:
+        r"""Copy the state of each of the given instances into a
+        corresponding instance within this :class:`.Session`.
+
+        .. container:: class_bases
+
+            Proxied for the :class:`_orm.Session` class on
+            behalf of the :class:`_orm.scoping.scoped_session` class.
+
+        :meth:`.Session.merge_all` produces the same result as calling
+        :meth:`.Session.merge` for each instance in turn, and returns a list
+        of the resulting target instances, in the same order as the given
+        instances.  When ``load=True``, rather than locating each object
+        that isn't present in the identity map with its own SELECT statement,
+        the primary key identities of the given instances, as well as those of
+        the related instances that the merge cascades to, are first loaded
+        using :meth:`.Session.get_many`, which emits SELECT statements with
+        an IN expression against chunks of primary keys for each mapped
+        class.  Collections which are merged are also loaded for the objects
+        located in this way using :ref:`selectin_eager_loading`.
+
+        .. versionadded:: 2.0
+
+        :param instances: a sequence of instances to be merged.
+
+        :param load: Boolean, when False, the merge is performed without
+         any database access, as described at :paramref:`.Session.merge.load`.
+
+        :param options: optional sequence of loader options which will be
+         applied when the existing versions of the objects are loaded from
+         the database.
+
+        .. seealso::
+
+            :meth:`.Session.merge`
+
+
+        """  # noqa: E501
+
+        return self._proxied.merge_all(instances, load=load, options=options)
+
     @overload
     def query(self, _entity: _EntityType[_O]) -> Query[_O]:
         ...
@@ -1821,6 +1964,53 @@ class scoped_session(Generic[_S]):
             **kw,
         )
 
+    def warm_cache(
+        self,
+        statements: Iterable[
+            Union[Executable, Tuple[Executable, _CoreAnyExecuteParams]]
+        ],
+        *,
+        execution_options: _ExecuteOptionsParameter = util.EMPTY_DICT,
+        bind_arguments: Optional[_BindArguments] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[CacheWarmResult]:
+        r"""Compile the given statements ahead of time, placing their
+        compiled forms in the compiled cache of the bind that each statement
+        would be invoked against.
+
+        .. container:: class_bases
+
+            Proxied for the :class:`_orm.Session` class on
+            behalf of the :class:`_orm.scoping.scoped_session` class.
+
+        The bind for each statement is determined using
+        :meth:`_orm.Session.get_bind` in the same way as
+        :meth:`_orm.Session.execute`, and the statements are then compiled
+        using :meth:`_engine.Engine.warm_cache`; see that method for a
+        description of the arguments and return value.   ORM-enabled
+        statements, such as
+        ``select(User).options(selectinload(User.addresses))``, are compiled
+        fully, including the setup of ORM loading for each entity and
+        loader option present.   Statements that are
+        emitted by loaders in turn, such as those of lazy loaders or the
+        :func:`_orm.selectinload` loader, are not part of this process.
+
+        Statements which are altered when executed by
+        :meth:`_orm.SessionEvents.do_orm_execute` event handlers will
+        generally not locate the compiled form produced here.
+
+        .. versionadded:: 2.0
+
+
+        """  # noqa: E501
+
+        return self._proxied.warm_cache(
+            statements,
+            execution_options=execution_options,
+            bind_arguments=bind_arguments,
+            max_workers=max_workers,
+        )
+
     @property
     def bind(self) -> Optional[Union[Engine, Connection]]:
         r"""Proxy for the :attr:`_orm.Session.bind` attribute
@@ -106,6 +106,7 @@ if typing.TYPE_CHECKING:
     from ..engine.interfaces import _CoreSingleExecuteParams
     from ..engine.interfaces import _ExecuteOptions
     from ..engine.interfaces import _ExecuteOptionsParameter
+    from ..engine.interfaces import CacheWarmResult
     from ..engine.result import ScalarResult
     from ..event import _InstanceLevelDispatch
     from ..sql._typing import _ColumnsClauseArgument
@@ -1294,9 +1295,11 @@ class Session(_SessionClassMethods, EventTarget):
     _warn_on_events: bool
     _transaction: Optional[SessionTransaction]
     _nested_transaction: Optional[SessionTransaction]
+    _auto_expunge_contexts: weakref.WeakSet[context.QueryContext]
     hash_key: int
     autoflush: bool
     expire_on_commit: bool
+    batch_refresh: bool
     enable_baked_queries: bool
     twophase: bool
     _query_cls: Type[Query[Any]]
@@ -1313,6 +1316,7 @@ class Session(_SessionClassMethods, EventTarget):
         info: Optional[_InfoType] = None,
         query_cls: Optional[Type[Query[Any]]] = None,
         autocommit: Literal[False] = False,
+        batch_refresh: bool = False,
     ):
         r"""Construct a new Session.
 
@@ -1330,6 +1334,22 @@ class Session(_SessionClassMethods, EventTarget):
 
                :ref:`session_flushing` - additional background on autoflush
 
+        :param batch_refresh: When ``True``, the load of an expired or
+           deferred attribute on a persistent object also loads the same
+           attributes for the other objects of the same class that were
+           loaded by the same result and don't have any of those attributes
+           loaded, using a SELECT statement with an IN clause against a
+           chunk of primary key values, rather than emitting one SELECT per
+           object.  This greatly reduces the number of statements emitted
+           when iterating through many objects after a
+           :meth:`~.Session.commit` has expired them.
+
+           .. versionadded:: 2.0
+
+           .. seealso::
+
+               :ref:`session_batch_refresh`
+
         :param bind: An optional :class:`_engine.Engine` or
            :class:`_engine.Connection` to
            which this ``Session`` should be bound. When specified, all SQL
@@ -1454,9 +1474,11 @@ class Session(_SessionClassMethods, EventTarget):
         self._warn_on_events = False
         self._transaction = None
         self._nested_transaction = None
+        self._auto_expunge_contexts = weakref.WeakSet()
         self.hash_key = _new_sessionid()
         self.autoflush = autoflush
         self.expire_on_commit = expire_on_commit
+        self.batch_refresh = batch_refresh
         self.enable_baked_queries = enable_baked_queries
 
         self.twophase = twophase
@@ -2117,6 +2139,83 @@ class Session(_SessionClassMethods, EventTarget):
             **kw,
         ).scalars()
 
+    def warm_cache(
+        self,
+        statements: Iterable[
+            Union[Executable, Tuple[Executable, _CoreAnyExecuteParams]]
+        ],
+        *,
+        execution_options: _ExecuteOptionsParameter = util.EMPTY_DICT,
+        bind_arguments: Optional[_BindArguments] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[CacheWarmResult]:
+        """Compile the given statements ahead of time, placing their
+        compiled forms in the compiled cache of the bind that each statement
+        would be invoked against.
+
+        The bind for each statement is determined using
+        :meth:`_orm.Session.get_bind` in the same way as
+        :meth:`_orm.Session.execute`, and the statements are then compiled
+        using :meth:`_engine.Engine.warm_cache`; see that method for a
+        description of the arguments and return value.   ORM-enabled
+        statements, such as
+        ``select(User).options(selectinload(User.addresses))``, are compiled
+        fully, including the setup of ORM loading for each entity and
+        loader option present.   Statements that are
+        emitted by loaders in turn, such as those of lazy loaders or the
+        :func:`_orm.selectinload` loader, are not part of this process.
+
+        Statements which are altered when executed by
+        :meth:`_orm.SessionEvents.do_orm_execute` event handlers will
+        generally not locate the compiled form produced here.
+
+        .. versionadded:: 2.0
+
+        """
+        entries = list(statements)
+        results: List[Optional[CacheWarmResult]] = [None] * len(entries)
+        by_bind: Dict[
+            Union[Engine, Connection],
+            List[
+                Tuple[
+                    int,
+                    Union[
+                        Executable, Tuple[Executable, _CoreAnyExecuteParams]
+                    ],
+                ]
+            ],
+        ] = {}
+
+        for idx, entry in enumerate(entries):
+            statement = entry[0] if isinstance(entry, tuple) else entry
+
+            bind_args = dict(bind_arguments or {})
+            bind_args.setdefault("clause", statement)
+            if "mapper" not in bind_args:
+                plugin_subject = statement._propagate_attrs.get(
+                    "plugin_subject", None
+                )
+                if plugin_subject is not None:
+                    bind_args["mapper"] = plugin_subject.mapper
+
+            bind = self.get_bind(**bind_args)
+            by_bind.setdefault(bind, []).append((idx, entry))
+
+        for bind, bind_entries in by_bind.items():
+            for (idx, _), result in zip(
+                bind_entries,
+                bind.engine.warm_cache(
+                    [entry for _, entry in bind_entries],
+                    execution_options=bind._execution_options.merge_with(
+                        execution_options
+                    ),
+                    max_workers=max_workers,
+                ),
+            ):
+                results[idx] = result
+
+        return cast("List[CacheWarmResult]", results)
+
     def close(self) -> None:
         """Close out the transactional resources and ORM objects used by this
         :class:`_orm.Session`.
@@ -3233,67 +3332,185 @@ class Session(_SessionClassMethods, EventTarget):
             execution_options=execution_options,
         )
 
-    def _get_impl(
+    def get_many(
         self,
         entity: _EntityBindKey[_O],
-        primary_key_identity: _PKIdentityArgument,
-        db_load_fn: Callable[..., _O],
+        idents: Iterable[_PKIdentityArgument],
         *,
-        options: Optional[Sequence[ExecutableOption]] = None,
+        options: Optional[Sequence[ORMOption]] = None,
         populate_existing: bool = False,
         with_for_update: Optional[ForUpdateArg] = None,
         identity_token: Optional[Any] = None,
-        execution_options: Optional[_ExecuteOptionsParameter] = None,
-    ) -> Optional[_O]:
+        execution_options: _ExecuteOptionsParameter = util.EMPTY_DICT,
+    ) -> List[Optional[_O]]:
+        """Return a list of instances based on the given primary key
+        identifiers, with ``None`` in place of each identifier that isn't
+        found.
+
+        E.g.::
+
+            users = session.get_many(User, [5, 7, 10])
+
+            some_objects = session.get_many(VersionedFoo, [(5, 10), (7, 2)])
+
+        Each element of ``idents`` accepts the same forms as the
+        :paramref:`_orm.Session.get.ident` parameter of
+        :meth:`_orm.Session.get`, and the list returned has one element
+        corresponding to each element of ``idents``, in the same order.
+
+        In the same way as :meth:`_orm.Session.get`, objects that are present
+        in the identity map of the :class:`.Session` and aren't expired are
+        returned directly.  The remaining objects are loaded using SELECT
+        statements which locate the primary key values using an IN
+        expression, emitted in chunks of primary key values in the same way
+        as :ref:`selectin_eager_loading`; a composite primary key makes use of
+        a tuple IN expression.  Objects which are marked as expired in
+        the identity map are loaded in the same way, and if their row isn't
+        present, they are removed from the :class:`.Session` and ``None`` is
+        returned for them.  Identifiers with values of a different Python
+        type than those of the primary key, such as the string ``"5"`` for
+        an integer column, are loaded individually.
+
+        .. versionadded:: 2.0
+
+        :param entity: a mapped class or :class:`.Mapper` indicating the
+         type of entity to be loaded.
+
+        :param idents: a sequence of scalar, tuple, or dictionary primary key
+         values, each in the form accepted by :meth:`_orm.Session.get`.
+
+        :param options: optional sequence of loader options which will be
+         applied to the queries, if any are emitted.
+
+        :param populate_existing: causes the method to unconditionally emit
+         SQL queries and refresh the objects with the newly loaded data,
+         regardless of whether or not the objects are already present.
+
+        :param with_for_update: optional boolean ``True`` indicating FOR UPDATE
+          should be used, or may be a dictionary containing flags to
+          indicate a more specific set of FOR UPDATE flags for the SELECT;
+          flags should match the parameters of
+          :meth:`_query.Query.with_for_update`.  When present, all the
+          objects are loaded from the database.
+
+        :param identity_token: identity token used for identity map lookups
+         and for the objects loaded, as for :meth:`_orm.Session.get`.
+
+        :param execution_options: optional dictionary of execution options,
+         which will be associated with the query executions if any are
+         emitted.
+
+        :return: a list of object instances, with ``None`` for each
+         identifier not found.
+
+        .. seealso::
+
+            :meth:`_orm.Session.get`
+
+        """
+        mapper = self._mapper_for_get(entity)
+        primary_key_identities = [
+            tuple(self._coerce_primary_key_identity(mapper, ident))
+            for ident in idents
+        ]
+
+        found: Dict[Tuple[Any, ...], Optional[_O]] = {}
+        expired: Dict[Tuple[Any, ...], InstanceState[Any]] = {}
 
-        # convert composite types to individual args
         if (
-            is_composite_class(primary_key_identity)
-            and type(primary_key_identity)
-            in descriptor_props._composite_getters
+            not populate_existing
+            and not mapper.always_refresh
+            and with_for_update is None
         ):
-            getter = descriptor_props._composite_getters[
-                type(primary_key_identity)
-            ]
-            primary_key_identity = getter(primary_key_identity)
+            for primary_key_identity in primary_key_identities:
+                if primary_key_identity in found:
+                    continue
 
-        mapper: Optional[Mapper[_O]] = inspect(entity)
+                key = mapper.identity_key_from_primary_key(
+                    primary_key_identity, identity_token=identity_token
+                )
+                instance = loading.get_from_identity(
+                    self, mapper, key, PassiveFlag.PASSIVE_NO_FETCH
+                )
 
-        if mapper is None or not mapper.is_mapper:
-            raise sa_exc.ArgumentError(
-                "Expected mapped class or mapper, got: %r" % entity
-            )
+                if instance is LoaderCallableStatus.PASSIVE_NO_RESULT:
+                    # expired; load it along with the objects that are
+                    # not present
+                    expired[primary_key_identity] = attributes.instance_state(
+                        self.identity_map[key]
+                    )
+                elif instance is LoaderCallableStatus.PASSIVE_CLASS_MISMATCH:
+                    # reject calls for id in identity map but class
+                    # mismatch.
+                    found[primary_key_identity] = None
+                elif instance is not None:
+                    found[primary_key_identity] = instance
+
+        to_load = [
+            primary_key_identity
+            for primary_key_identity in dict.fromkeys(primary_key_identities)
+            if primary_key_identity not in found
+        ]
 
-        is_dict = isinstance(primary_key_identity, dict)
-        if not is_dict:
-            primary_key_identity = util.to_list(
-                primary_key_identity, default=[None]
+        if to_load:
+            load_options = context.QueryContext.default_load_options
+
+            if populate_existing:
+                load_options += {"_populate_existing": populate_existing}
+            statement = sql.select(mapper).set_label_style(
+                LABEL_STYLE_TABLENAME_PLUS_COL
             )
+            if with_for_update is not None:
+                statement._for_update_arg = ForUpdateArg._from_argument(
+                    with_for_update
+                )
 
-        if len(primary_key_identity) != len(mapper.primary_key):
-            raise sa_exc.InvalidRequestError(
-                "Incorrect number of values in identifier to formulate "
-                "primary key for session.get(); primary key columns "
-                "are %s" % ",".join("'%s'" % c for c in mapper.primary_key)
+            if options:
+                statement = statement.options(*options)
+            if execution_options:
+                statement = statement.execution_options(**execution_options)
+
+            loaded = loading.load_on_pk_identities(
+                self,
+                statement,
+                to_load,
+                load_options=load_options,
+                identity_token=identity_token,
             )
 
-        if is_dict:
-            try:
-                primary_key_identity = list(
-                    primary_key_identity[prop.key]
-                    for prop in mapper._identity_key_props
-                )
+            deleted = [
+                state
+                for primary_key_identity, state in expired.items()
+                if loaded.get(primary_key_identity) is None
+            ]
+            if deleted:
+                self._remove_newly_deleted(deleted)
 
-            except KeyError as err:
-                raise sa_exc.InvalidRequestError(
-                    "Incorrect names of values in identifier to formulate "
-                    "primary key for session.get(); primary key attribute "
-                    "names are %s"
-                    % ",".join(
-                        "'%s'" % prop.key
-                        for prop in mapper._identity_key_props
-                    )
-                ) from err
+            for primary_key_identity in to_load:
+                found[primary_key_identity] = loaded.get(primary_key_identity)
+
+        return [
+            found[primary_key_identity]
+            for primary_key_identity in primary_key_identities
+        ]
+
+    def _get_impl(
+        self,
+        entity: _EntityBindKey[_O],
+        primary_key_identity: _PKIdentityArgument,
+        db_load_fn: Callable[..., _O],
+        *,
+        options: Optional[Sequence[ExecutableOption]] = None,
+        populate_existing: bool = False,
+        with_for_update: Optional[ForUpdateArg] = None,
+        identity_token: Optional[Any] = None,
+        execution_options: Optional[_ExecuteOptionsParameter] = None,
+    ) -> Optional[_O]:
+
+        mapper = self._mapper_for_get(entity)
+        primary_key_identity = self._coerce_primary_key_identity(
+            mapper, primary_key_identity
+        )
 
         if (
             not populate_existing
@@ -3342,6 +3559,66 @@ class Session(_SessionClassMethods, EventTarget):
             load_options=load_options,
         )
 
+    def _mapper_for_get(self, entity: _EntityBindKey[_O]) -> Mapper[_O]:
+        mapper: Optional[Mapper[_O]] = inspect(entity)
+
+        if mapper is None or not mapper.is_mapper:
+            raise sa_exc.ArgumentError(
+                "Expected mapped class or mapper, got: %r" % entity
+            )
+        return mapper
+
+    def _coerce_primary_key_identity(
+        self, mapper: Mapper[_O], primary_key_identity: _PKIdentityArgument
+    ) -> List[Any]:
+        """Convert the primary key argument accepted by
+        :meth:`_orm.Session.get` into a list of primary key values in
+        the order of the mapper's primary key columns."""
+
+        # convert composite types to individual args
+        if (
+            is_composite_class(primary_key_identity)
+            and type(primary_key_identity)
+            in descriptor_props._composite_getters
+        ):
+            getter = descriptor_props._composite_getters[
+                type(primary_key_identity)
+            ]
+            primary_key_identity = getter(primary_key_identity)
+
+        is_dict = isinstance(primary_key_identity, dict)
+        if not is_dict:
+            primary_key_identity = util.to_list(
+                primary_key_identity, default=[None]
+            )
+
+        if len(primary_key_identity) != len(mapper.primary_key):
+            raise sa_exc.InvalidRequestError(
+                "Incorrect number of values in identifier to formulate "
+                "primary key for session.get(); primary key columns "
+                "are %s" % ",".join("'%s'" % c for c in mapper.primary_key)
+            )
+
+        if is_dict:
+            try:
+                primary_key_identity = list(
+                    primary_key_identity[prop.key]
+                    for prop in mapper._identity_key_props
+                )
+
+            except KeyError as err:
+                raise sa_exc.InvalidRequestError(
+                    "Incorrect names of values in identifier to formulate "
+                    "primary key for session.get(); primary key attribute "
+                    "names are %s"
+                    % ",".join(
+                        "'%s'" % prop.key
+                        for prop in mapper._identity_key_props
+                    )
+                ) from err
+
+        return primary_key_identity
+
     def merge(
         self,
         instance: _O,
@@ -3433,6 +3710,172 @@ class Session(_SessionClassMethods, EventTarget):
         finally:
             self.autoflush = autoflush
 
+    def merge_all(
+        self,
+        instances: Iterable[_O],
+        *,
+        load: bool = True,
+        options: Optional[Sequence[ORMOption]] = None,
+    ) -> List[_O]:
+        """Copy the state of each of the given instances into a
+        corresponding instance within this :class:`.Session`.
+
+        :meth:`.Session.merge_all` produces the same result as calling
+        :meth:`.Session.merge` for each instance in turn, and returns a list
+        of the resulting target instances, in the same order as the given
+        instances.  When ``load=True``, rather than locating each object
+        that isn't present in the identity map with its own SELECT statement,
+        the primary key identities of the given instances, as well as those of
+        the related instances that the merge cascades to, are first loaded
+        using :meth:`.Session.get_many`, which emits SELECT statements with
+        an IN expression against chunks of primary keys for each mapped
+        class.  Collections which are merged are also loaded for the objects
+        located in this way using :ref:`selectin_eager_loading`.
+
+        .. versionadded:: 2.0
+
+        :param instances: a sequence of instances to be merged.
+
+        :param load: Boolean, when False, the merge is performed without
+         any database access, as described at :paramref:`.Session.merge.load`.
+
+        :param options: optional sequence of loader options which will be
+         applied when the existing versions of the objects are loaded from
+         the database.
+
+        .. seealso::
+
+            :meth:`.Session.merge`
+
+        """
+
+        if self._warn_on_events:
+            self._flush_warning("Session.merge_all()")
+
+        _recursive: Dict[InstanceState[Any], object] = {}
+        _resolve_conflict_map: Dict[_IdentityKeyType[Any], object] = {}
+
+        states = []
+        for instance in instances:
+            object_mapper(instance)  # verify mapped
+            states.append(attributes.instance_state(instance))
+
+        if load:
+            # flush current contents if we expect to load data
+            self._autoflush()
+
+        autoflush = self.autoflush
+        try:
+            self.autoflush = False
+
+            if load:
+                # strong references to the objects located, which are
+                # otherwise only present in the weak-referencing identity map
+                loaded = self._load_for_merge(
+                    states, options, _resolve_conflict_map
+                )
+            else:
+                loaded = []
+
+            merged = [
+                self._merge(
+                    state,
+                    state.dict,
+                    load=load,
+                    options=options,
+                    _recursive=_recursive,
+                    _resolve_conflict_map=_resolve_conflict_map,
+                )
+                for state in states
+            ]
+            del loaded
+            return merged
+        finally:
+            self.autoflush = autoflush
+
+    @util.preload_module("sqlalchemy.orm.strategy_options")
+    def _load_for_merge(
+        self,
+        states: Sequence[InstanceState[Any]],
+        options: Optional[Sequence[ORMOption]],
+        _resolve_conflict_map: Dict[_IdentityKeyType[Any], object],
+    ) -> List[Any]:
+        """Load the objects that the given states and the states they
+        cascade to along "merge" cascades would be merged into, for those
+        that aren't present in the identity map.
+
+        The identity keys of objects not found are added to
+        ``_resolve_conflict_map`` with a value of ``None``, so that
+        :meth:`.Session._merge` creates a new instance for them rather than
+        emitting a SELECT.
+
+        """
+        strategy_options = util.preloaded.orm_strategy_options
+
+        to_load: Dict[
+            Tuple[Mapper[Any], Any], Dict[_IdentityKeyType[Any], None]
+        ] = {}
+        collections: Dict[Mapper[Any], Set[str]] = {}
+
+        visited: Set[InstanceState[Any]] = set()
+        for state in states:
+            if state in visited:
+                continue
+            visited.add(state)
+            mapper = state.manager.mapper
+            for st, m in itertools.chain(
+                [(state, mapper)],
+                (
+                    (st, m)
+                    for obj, m, st, dict_ in mapper.cascade_iterator(
+                        "merge", state, halt_on=visited.__contains__
+                    )
+                ),
+            ):
+                visited.add(st)
+
+                key = st.key
+                if key is None:
+                    key = m._identity_key_from_state(st)
+                    if (
+                        LoaderCallableStatus.NEVER_SET in key[1]
+                        or None in key[1]
+                    ):
+                        continue
+                if key in self.identity_map:
+                    continue
+
+                to_load.setdefault((m, key[2]), {})[key] = None
+
+                dict_ = st.dict
+                for prop in m.relationships:
+                    if (
+                        prop.uselist
+                        and "merge" in prop._cascade
+                        and prop.key in dict_
+                    ):
+                        collections.setdefault(m, set()).add(prop.key)
+
+        loaded = []
+        for (mapper, identity_token), keys in to_load.items():
+            load_options = list(options or ())
+            load_options.extend(
+                strategy_options.selectinload(getattr(mapper.class_, key))
+                for key in sorted(collections.get(mapper, ()))
+            )
+            result = self.get_many(
+                mapper,
+                [key[1] for key in keys],
+                options=load_options,
+                identity_token=identity_token,
+            )
+            for key, obj in zip(keys, result):
+                if obj is None:
+                    _resolve_conflict_map[key] = None
+                else:
+                    loaded.append(obj)
+        return loaded
+
     def _merge(
         self,
         state: InstanceState[_O],
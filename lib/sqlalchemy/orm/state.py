@@ -19,6 +19,7 @@ from typing import Callable
 from typing import Dict
 from typing import Generic
 from typing import Iterable
+from typing import List
 from typing import Optional
 from typing import Set
 from typing import Tuple
@@ -143,6 +144,7 @@ class InstanceState(interfaces.InspectionAttrInfo, Generic[_O]):
     runid: Optional[int] = None
     load_options: Tuple[ORMOption, ...] = ()
     load_path: PathRegistry = PathRegistry.root
+    _batch_refresh_siblings: Optional[List[weakref.ref[Any]]] = None
     insert_order: Optional[int] = None
     _strong_obj: Optional[object] = None
     obj: weakref.ref[_O]
@@ -417,6 +417,9 @@ class DeferredColumnLoader(LoaderStrategy):
                 populators,
             )
 
+        elif context.readonly_entities:
+            # read-only entities don't load deferred attributes
+            pass
         elif not self.is_class_level:
             if self.raiseload:
                 set_deferred_for_local_state = (
@@ -621,11 +624,21 @@ class NoLoader(AbstractRelationshipLoader):
         adapter,
         populators,
     ):
-        def invoke_no_load(state, dict_, row):
-            if self.uselist:
-                attributes.init_state_collection(state, dict_, self.key)
-            else:
-                dict_[self.key] = None
+        if context.readonly_entities:
+
+            def invoke_no_load(state, dict_, row):
+                if self.uselist:
+                    dict_[self.key] = loading._ReadOnlyCollection()
+                else:
+                    dict_[self.key] = None
+
+        else:
+
+            def invoke_no_load(state, dict_, row):
+                if self.uselist:
+                    attributes.init_state_collection(state, dict_, self.key)
+                else:
+                    dict_[self.key] = None
 
         populators["new"].append((self.key, invoke_no_load))
 
@@ -1129,6 +1142,10 @@ class LazyLoader(
         adapter,
         populators,
     ):
+        if context.readonly_entities:
+            # read-only entities don't lazy load
+            return
+
         key = self.key
 
         if not self.is_class_level or (loadopt and loadopt._extra_criteria):
@@ -1224,6 +1241,206 @@ class LoadLazyAttribute:
         )
 
 
+@log.class_logger
+@relationships.Relationship.strategy_for(lazy="batch")
+class BatchLazyLoader(LazyLoader):
+    """Provide loading behavior for a :class:`.Relationship`
+    with "lazy='batch'", that is loads when first accessed on any object,
+    for all the objects that were loaded by the same result and haven't
+    yet loaded the attribute, using the "selectin" loader.
+
+    """
+
+    __slots__ = ()
+
+    def create_row_processor(
+        self,
+        context,
+        query_entity,
+        path,
+        loadopt,
+        mapper,
+        result,
+        adapter,
+        populators,
+    ):
+        if context.readonly_entities:
+            # read-only entities don't lazy load
+            return
+
+        if context.refresh_state or (loadopt and loadopt._extra_criteria):
+            # a single object is being refreshed, or the criteria for the
+            # load is local to this query; load each object individually
+            return super().create_row_processor(
+                context,
+                query_entity,
+                path,
+                loadopt,
+                mapper,
+                result,
+                adapter,
+                populators,
+            )
+
+        key = self.key
+
+        # the objects of this result that will load the attribute together;
+        # weak references to the objects are maintained.  the loader
+        # callable installed on each object, which holds the list, is
+        # shared among the mappers of a polymorphic result that load
+        # along this path
+        loader_key = ("batch_lazy_loader", path.path, self.parent_property)
+        loader = context.attributes.get(loader_key)
+        if loader is None:
+            loader = context.attributes[loader_key] = LoadBatchedAttribute(
+                key, self, loadopt, []
+            )
+        batch = loader.batch
+        set_lazy_callable = InstanceState._instance_level_callable_processor(
+            mapper.class_manager, loader, key
+        )
+        populate_existing = context.populate_existing or mapper.always_refresh
+
+        def set_batch_callable(state, dict_, row):
+            if populate_existing:
+                state._reset(dict_, key)
+            set_lazy_callable(state, dict_, row)
+            batch.append(state.obj)
+
+        populators["new"].append((key, set_batch_callable))
+
+    def _load_for_batch(self, state, passive, loader):
+        if (
+            not state.key
+            or passive & PASSIVE_OFF != PASSIVE_OFF
+            or passive
+            & (
+                PassiveFlag.LOAD_AGAINST_COMMITTED
+                | PassiveFlag.DEFERRED_HISTORY_LOAD
+            )
+            or self._raise_always
+            or self._raise_on_sql
+        ):
+            return self._load_for_state(state, passive, loadopt=loader.loadopt)
+
+        if self.use_get:
+            # a many-to-one that may be present in the identity map
+            # doesn't need to load anything
+            value = self._load_for_state(
+                state, passive ^ PassiveFlag.SQL_OK, loadopt=loader.loadopt
+            )
+            if value is not LoaderCallableStatus.PASSIVE_NO_RESULT:
+                return value
+
+        session = _state_session(state)
+        if not session:
+            return self._load_for_state(state, passive, loadopt=loader.loadopt)
+
+        key = self.key
+        states = []
+        for ref in loader.batch:
+            obj = ref()
+            if obj is None:
+                continue
+            sibling = attributes.instance_state(obj)
+
+            # the object is still in the same session, and the attribute
+            # hasn't been loaded, set or expired since
+            if (
+                sibling.session_id == state.session_id
+                and sibling.key is not None
+                and key not in sibling.dict
+                and sibling.callables.get(key) is loader
+            ):
+                states.append((sibling, False))
+
+        # each object in the batch is either loaded now or loads
+        # individually from here on
+        del loader.batch[:]
+
+        if len(states) < 2:
+            return self._load_for_state(state, passive, loadopt=loader.loadopt)
+
+        if passive & PassiveFlag.NO_AUTOFLUSH:
+            execution_options = util.immutabledict({"autoflush": False})
+        else:
+            execution_options = util.EMPTY_DICT
+
+        selectin_loader = self.parent_property._get_strategy(
+            (("lazy", "selectin"),)
+        )
+        selectin_loader._load_for_path(
+            _BatchLoadContext(session, state.load_options),
+            state.load_path,
+            states,
+            None,
+            self.entity,
+            loader.loadopt,
+            None,
+            execution_options,
+            session.get_bind(mapper=self.parent).dialect,
+        )
+
+        if key in state.dict:
+            return LoaderCallableStatus.ATTR_WAS_SET
+        else:
+            return self._load_for_state(state, passive, loadopt=loader.loadopt)
+
+
+class LoadBatchedAttribute(LoadLazyAttribute):
+    """loader callable used by BatchLazyLoader, which is shared among
+    the objects loaded by one result.
+
+    When serialized, the object loads individually like
+    :class:`.LoadLazyAttribute`.
+
+    """
+
+    def __init__(self, key, initiating_strategy, loadopt, batch):
+        super().__init__(key, initiating_strategy, loadopt, None)
+        self.batch = batch
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.batch = None
+
+    def __call__(self, state, passive=attributes.PASSIVE_OFF):
+        if self.batch is None:
+            return super().__call__(state, passive)
+
+        prop = state.manager.mapper._props[self.key]
+        strategy = prop._strategies[self.strategy_key]
+        return strategy._load_for_batch(state, passive, self)
+
+
+class _BatchLoadContext:
+    """Provide the parts of :class:`.QueryContext` that are used by
+    :meth:`.SelectInLoader._load_for_path`, for a batched lazy load that
+    takes place after the originating result is consumed.
+
+    As is the case for a lazy load, the loader options that propagate
+    from the original query are applied.
+
+    """
+
+    readonly_entities = False
+    populate_existing = False
+
+    def __init__(self, session, load_options):
+        self.session = session
+        self.query = Select._create_raw_select(
+            _with_options=tuple(load_options)
+        )
+
+    @property
+    def compile_state(self):
+        return self
+
+    @property
+    def select_statement(self):
+        return self.query
+
+
 class PostLoader(AbstractRelationshipLoader):
     """A relationship loader that emits a second SELECT statement."""
 
@@ -1239,6 +1456,10 @@ class PostLoader(AbstractRelationshipLoader):
         execution_options = util.immutabledict(
             {"sa_top_level_orm_context": top_level_context}
         )
+        if context.readonly_entities:
+            execution_options = execution_options.union(
+                {"readonly_entities": True}
+            )
 
         if loadopt:
             recursion_depth = loadopt.local_opts.get("recursion_depth", None)
@@ -1300,6 +1521,15 @@ class PostLoader(AbstractRelationshipLoader):
 
         return effective_path, True, execution_options, recursion_depth
 
+    def _check_readonly_entities(self, context):
+        if context.readonly_entities:
+            raise sa_exc.InvalidRequestError(
+                "Loader strategy for %s isn't supported with the "
+                "'readonly_entities' execution option; use joinedload(), "
+                "selectinload() or noload() for this relationship"
+                % self.parent_property
+            )
+
     def _immediateload_create_row_processor(
         self,
         context,
@@ -1345,6 +1575,7 @@ class ImmediateLoader(PostLoader):
         adapter,
         populators,
     ):
+        self._check_readonly_entities(context)
 
         (
             effective_path,
@@ -1938,6 +2169,8 @@ class SubqueryLoader(PostLoader):
                 populators,
             )
 
+        self._check_readonly_entities(context)
+
         _, run_loader, _, _ = self._setup_for_recursion(
             context, path, loadopt, self.join_depth
         )
@@ -2675,6 +2908,10 @@ class JoinedLoader(AbstractRelationshipLoader):
 
             if not self.uselist:
                 self._create_scalar_loader(context, key, _instance, populators)
+            elif context.readonly_entities:
+                self._create_readonly_collection_loader(
+                    context, key, _instance, populators
+                )
             else:
                 self._create_collection_loader(
                     context, key, _instance, populators
@@ -2740,6 +2977,38 @@ class JoinedLoader(AbstractRelationshipLoader):
                 (self.key, load_collection_from_joined_exec)
             )
 
+    def _create_readonly_collection_loader(
+        self, context, key, _instance, populators
+    ):
+        # read-only entities have no state; appenders are tracked in
+        # terms of the parent's dictionary, which is present for the
+        # lifespan of the load
+        def load_collection_from_joined_new_row(state, dict_, row):
+            collection = dict_[key] = loading._ReadOnlyCollection()
+            result_list = util.UniqueAppender(collection, "_append")
+            context.attributes[(id(dict_), key)] = result_list
+            inst = _instance(row)
+            if inst is not None:
+                result_list.append(inst)
+
+        def load_collection_from_joined_existing_row(state, dict_, row):
+            if (id(dict_), key) in context.attributes:
+                result_list = context.attributes[(id(dict_), key)]
+            else:
+                collection = dict_[key] = loading._ReadOnlyCollection()
+                result_list = util.UniqueAppender(collection, "_append")
+                context.attributes[(id(dict_), key)] = result_list
+            inst = _instance(row)
+            if inst is not None:
+                result_list.append(inst)
+
+        populators["new"].append(
+            (self.key, load_collection_from_joined_new_row)
+        )
+        populators["existing"].append(
+            (self.key, load_collection_from_joined_existing_row)
+        )
+
     def _create_scalar_loader(self, context, key, _instance, populators):
         def load_scalar_from_joined_new_row(state, dict_, row):
             # set a scalar object instance directly on the parent
@@ -2801,7 +3070,7 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
         ],
     )
 
-    _chunksize = 500
+    _chunksize = loading._SELECTIN_CHUNKSIZE
 
     def __init__(self, parent, strategy_key):
         super(SelectInLoader, self).__init__(parent, strategy_key)
@@ -2965,6 +3234,7 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
             loadopt,
             recursion_depth,
             execution_options,
+            result.context.dialect,
         )
 
     def _load_for_path(
@@ -2977,6 +3247,7 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
         loadopt,
         recursion_depth,
         execution_options,
+        dialect,
     ):
         if load_only and self.key not in load_only:
             return
@@ -2989,17 +3260,33 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
 
             mapper = self.parent
 
+            if context.readonly_entities:
+                # read-only entities can't load unloaded attributes; use
+                # only the foreign key values present in the dictionary
+                lookup_keys = [
+                    mapper._columntoproperty[lk].key
+                    for lk in query_info.child_lookup_cols
+                ]
+
             for state, overwrite in states:
                 state_dict = state.dict
-                related_ident = tuple(
-                    mapper._get_state_attr_by_column(
-                        state,
-                        state_dict,
-                        lk,
-                        passive=attributes.PASSIVE_NO_FETCH,
+                if context.readonly_entities:
+                    related_ident = tuple(
+                        state_dict.get(
+                            key, LoaderCallableStatus.PASSIVE_NO_RESULT
+                        )
+                        for key in lookup_keys
+                    )
+                else:
+                    related_ident = tuple(
+                        mapper._get_state_attr_by_column(
+                            state,
+                            state_dict,
+                            lk,
+                            passive=attributes.PASSIVE_NO_FETCH,
+                        )
+                        for lk in query_info.child_lookup_cols
                     )
-                    for lk in query_info.child_lookup_cols
-                )
                 # if the loaded parent objects do not have the foreign key
                 # to the related item loaded, then degrade into the joined
                 # version of selectinload
@@ -3028,6 +3315,13 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
         pk_cols = query_info.pk_cols
         in_expr = query_info.in_expr
 
+        chunksize = loading._selectin_chunksize(
+            dialect,
+            loadopt.local_opts.get("chunksize") if loadopt else None,
+            self._chunksize,
+            len(pk_cols),
+        )
+
         if not query_info.load_with_join:
             # in "omit join" mode, the primary key column and the
             # "in" expression are in terms of the related entity.  So
@@ -3187,10 +3481,16 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
                 q,
                 context,
                 execution_options,
+                chunksize,
             )
         else:
             self._load_via_parent(
-                our_states, query_info, q, context, execution_options
+                our_states,
+                query_info,
+                q,
+                context,
+                execution_options,
+                chunksize,
             )
 
     def _load_via_child(
@@ -3201,14 +3501,15 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
         q,
         context,
         execution_options,
+        chunksize,
     ):
         uselist = self.uselist
 
         # this sort is really for the benefit of the unit tests
         our_keys = sorted(our_states)
         while our_keys:
-            chunk = our_keys[0 : self._chunksize]
-            our_keys = our_keys[self._chunksize :]
+            chunk = our_keys[0:chunksize]
+            our_keys = our_keys[chunksize:]
             data = {
                 k: v
                 for k, v in context.session.execute(
@@ -3249,14 +3550,14 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
             state.get_impl(self.key).set_committed_value(state, dict_, None)
 
     def _load_via_parent(
-        self, our_states, query_info, q, context, execution_options
+        self, our_states, query_info, q, context, execution_options, chunksize
     ):
         uselist = self.uselist
         _empty_result = () if uselist else None
 
         while our_states:
-            chunk = our_states[0 : self._chunksize]
-            our_states = our_states[self._chunksize :]
+            chunk = our_states[0:chunksize]
+            our_states = our_states[chunksize:]
 
             primary_keys = [
                 key[0] if query_info.zero_idx else key
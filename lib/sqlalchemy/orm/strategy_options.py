@@ -346,6 +346,7 @@ class _AbstractLoad(traversals.GenerativeOnTraversal, LoaderOption):
         self: Self_AbstractLoad,
         attr: _AttrType,
         recursion_depth: Optional[int] = None,
+        chunksize: Optional[int] = None,
     ) -> Self_AbstractLoad:
         """Indicate that the given attribute should be loaded using
         SELECT IN eager loading.
@@ -383,6 +384,14 @@ class _AbstractLoad(traversals.GenerativeOnTraversal, LoaderOption):
          .. versionadded:: 2.0 added
             :paramref:`_orm.selectinload.recursion_depth`
 
+        :param chunksize: optional int; the number of parent keys to
+         include in each SELECT statement emitted, which defaults to 500.
+         The chunk size is additionally limited so that the number of
+         bound parameters in each statement doesn't exceed the limit
+         of the database in use.
+
+         .. versionadded:: 2.0 added :paramref:`_orm.selectinload.chunksize`
+
 
         .. seealso::
 
@@ -394,7 +403,7 @@ class _AbstractLoad(traversals.GenerativeOnTraversal, LoaderOption):
         return self._set_relationship_strategy(
             attr,
             {"lazy": "selectin"},
-            opts={"recursion_depth": recursion_depth},
+            opts={"recursion_depth": recursion_depth, "chunksize": chunksize},
         )
 
     def lazyload(
@@ -415,6 +424,31 @@ class _AbstractLoad(traversals.GenerativeOnTraversal, LoaderOption):
         """
         return self._set_relationship_strategy(attr, {"lazy": "select"})
 
+    def batchload(
+        self: Self_AbstractLoad, attr: _AttrType
+    ) -> Self_AbstractLoad:
+        """Indicate that the given attribute should be loaded using "batch"
+        lazy loading.
+
+        The attribute is loaded when first accessed on any of the objects
+        loaded by the statement, for all of those objects at once that
+        haven't yet loaded it, using a SELECT IN statement in the same way
+        as :func:`_orm.selectinload`.
+
+        This function is part of the :class:`_orm.Load` interface and supports
+        both method-chained and standalone operation.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`loading_toplevel`
+
+            :ref:`batch_lazy_loading`
+
+        """
+        return self._set_relationship_strategy(attr, {"lazy": "batch"})
+
     def immediateload(
         self: Self_AbstractLoad,
         attr: _AttrType,
@@ -750,7 +784,9 @@ class _AbstractLoad(traversals.GenerativeOnTraversal, LoaderOption):
         )
 
     def selectin_polymorphic(
-        self: Self_AbstractLoad, classes: Iterable[Type[Any]]
+        self: Self_AbstractLoad,
+        classes: Iterable[Type[Any]],
+        chunksize: Optional[int] = None,
     ) -> Self_AbstractLoad:
         """Indicate an eager load should take place for all attributes
         specific to a subclass.
@@ -761,6 +797,14 @@ class _AbstractLoad(traversals.GenerativeOnTraversal, LoaderOption):
 
         .. versionadded:: 1.2
 
+        :param chunksize: optional int; the number of primary keys to
+         include in each SELECT statement emitted, which defaults to 500.
+         As with :paramref:`_orm.selectinload.chunksize`, the chunk size
+         is additionally limited by the bound parameter limit of the
+         database in use.
+
+         .. versionadded:: 2.0
+
         .. seealso::
 
             :ref:`polymorphic_selectin`
@@ -771,7 +815,8 @@ class _AbstractLoad(traversals.GenerativeOnTraversal, LoaderOption):
             opts={
                 "entities": tuple(
                     sorted((inspect(cls) for cls in classes), key=id)
-                )
+                ),
+                "chunksize": chunksize,
             },
         )
         return self
@@ -2404,10 +2449,15 @@ def subqueryload(*keys: _AttrType) -> _AbstractLoad:
 
 @loader_unbound_fn
 def selectinload(
-    *keys: _AttrType, recursion_depth: Optional[int] = None
+    *keys: _AttrType,
+    recursion_depth: Optional[int] = None,
+    chunksize: Optional[int] = None,
 ) -> _AbstractLoad:
     return _generate_from_keys(
-        Load.selectinload, keys, False, {"recursion_depth": recursion_depth}
+        Load.selectinload,
+        keys,
+        False,
+        {"recursion_depth": recursion_depth, "chunksize": chunksize},
     )
 
 
@@ -2416,6 +2466,11 @@ def lazyload(*keys: _AttrType) -> _AbstractLoad:
     return _generate_from_keys(Load.lazyload, keys, False, {})
 
 
+@loader_unbound_fn
+def batchload(*keys: _AttrType) -> _AbstractLoad:
+    return _generate_from_keys(Load.batchload, keys, False, {})
+
+
 @loader_unbound_fn
 def immediateload(
     *keys: _AttrType, recursion_depth: Optional[int] = None
@@ -2481,7 +2536,9 @@ def with_expression(
 
 @loader_unbound_fn
 def selectin_polymorphic(
-    base_cls: _EntityType[Any], classes: Iterable[Type[Any]]
+    base_cls: _EntityType[Any],
+    classes: Iterable[Type[Any]],
+    chunksize: Optional[int] = None,
 ) -> _AbstractLoad:
     ul = Load(base_cls)
-    return ul.selectin_polymorphic(classes)
+    return ul.selectin_polymorphic(classes, chunksize=chunksize)
@@ -32,8 +32,10 @@ from .base import PoolProxiedConnection as PoolProxiedConnection
 from .base import reset_commit as reset_commit
 from .base import reset_none as reset_none
 from .base import reset_rollback as reset_rollback
+from .budget import ConnectionBudget as ConnectionBudget
 from .impl import AssertionPool as AssertionPool
 from .impl import AsyncAdaptedQueuePool as AsyncAdaptedQueuePool
+from .impl import AsyncQueuePool as AsyncQueuePool
 from .impl import (
     FallbackAsyncAdaptedQueuePool as FallbackAsyncAdaptedQueuePool,
 )
@@ -41,3 +43,6 @@ from .impl import NullPool as NullPool
 from .impl import QueuePool as QueuePool
 from .impl import SingletonThreadPool as SingletonThreadPool
 from .impl import StaticPool as StaticPool
+from .metrics import HistogramSnapshot as HistogramSnapshot
+from .metrics import PoolMetrics as PoolMetrics
+from .metrics import PoolMetricsSnapshot as PoolMetricsSnapshot
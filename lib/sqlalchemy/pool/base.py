@@ -29,6 +29,7 @@ from typing import TYPE_CHECKING
 from typing import Union
 import weakref
 
+from .metrics import PoolMetrics
 from .. import event
 from .. import exc
 from .. import log
@@ -119,6 +120,18 @@ class Pool(log.Identified, event.EventTarget):
     _invoke_creator: _CreatorWRecFnType
     _invalidate_time: float
 
+    _maintenance_interval: Optional[float] = None
+    _idle_timeout: Optional[float] = None
+
+    metrics: Optional[PoolMetrics] = None
+    """The :class:`.PoolMetrics` collecting metrics for this pool, if the
+    :paramref:`_pool.Pool.metrics` parameter is set to ``True``, else
+    ``None``.
+
+    .. versionadded:: 2.0
+
+    """
+
     def __init__(
         self,
         creator: Union[_CreatorFnType, _CreatorWRecFnType],
@@ -129,6 +142,8 @@ class Pool(log.Identified, event.EventTarget):
         events: Optional[List[Tuple[_ListenerFnType, str]]] = None,
         dialect: Optional[Union[_ConnDialect, Dialect]] = None,
         pre_ping: bool = False,
+        metrics: bool = False,
+        metrics_interval: Optional[float] = 60.0,
         _dispatch: Optional[_DispatchCommon[Pool]] = None,
     ):
         """
@@ -222,6 +237,27 @@ class Pool(log.Identified, event.EventTarget):
 
          .. versionadded:: 1.2
 
+        :param metrics: if True, the pool will collect metrics regarding
+         checkouts, new and overflow connections, checkout timeouts and
+         pre-ping failures, including histograms of the time spent acquiring
+         connections and of the age of connections, which are available
+         from the :attr:`_pool.Pool.metrics` attribute.  Defaults to
+         ``False``.
+
+         .. versionadded:: 2.0
+
+         .. seealso::
+
+            :ref:`pool_metrics`
+
+        :param metrics_interval: when :paramref:`_pool.Pool.metrics` is
+         enabled, the minimum interval in seconds between invocations of
+         the :meth:`_events.PoolEvents.metrics_sample` event, which is
+         invoked upon connection checkout.  Defaults to 60 seconds; pass
+         ``None`` to disable the event.
+
+         .. versionadded:: 2.0
+
         """
         if logging_name:
             self.logging_name = self._orig_logging_name = logging_name
@@ -233,6 +269,9 @@ class Pool(log.Identified, event.EventTarget):
         self._recycle = recycle
         self._invalidate_time = 0
         self._pre_ping = pre_ping
+        self._metrics_interval = metrics_interval
+        if metrics:
+            self.metrics = PoolMetrics(metrics_interval)
         self._reset_on_return = util.parse_user_argument_for_enum(
             reset_on_return,
             {
@@ -630,6 +669,8 @@ class _ConnectionRecord(ConnectionPoolEntry):
         return self.dbapi_connection
 
     _soft_invalidate_time: float = 0
+    _verified_time: float = 0
+    _checkin_time: float = 0
 
     @util.ro_memoized_property
     def info(self) -> _InfoType:
@@ -641,6 +682,10 @@ class _ConnectionRecord(ConnectionPoolEntry):
 
     @classmethod
     def checkout(cls, pool: Pool) -> _ConnectionFairy:
+        metrics = pool.metrics
+        if metrics is not None:
+            start = time.perf_counter()
+
         if TYPE_CHECKING:
             rec = cast(_ConnectionRecord, pool._do_get())
         else:
@@ -653,6 +698,13 @@ class _ConnectionRecord(ConnectionPoolEntry):
                 rec._checkin_failed(err, _fairy_was_created=False)
             raise
 
+        if metrics is not None:
+            sample = metrics._record_checkout(
+                time.perf_counter() - start, time.time() - rec.starttime
+            )
+            if sample is not None and pool.dispatch.metrics_sample:
+                pool.dispatch.metrics_sample(pool, sample)
+
         echo = pool._should_log_debug()
         fairy = _ConnectionFairy(pool, dbapi_connection, rec, echo)
 
@@ -691,6 +743,8 @@ class _ConnectionRecord(ConnectionPoolEntry):
         self.fairy_ref = None
         connection = self.dbapi_connection
         pool = self.__pool
+        if pool.metrics is not None and _fairy_was_created:
+            pool.metrics._record_checkin()
         while self.finalize_callback:
             finalizer = self.finalize_callback.pop()
             if connection is not None:
@@ -698,6 +752,8 @@ class _ConnectionRecord(ConnectionPoolEntry):
         if pool.dispatch.checkin:
             pool.dispatch.checkin(connection, self)
 
+        if pool._idle_timeout is not None:
+            self._checkin_time = time.time()
         pool._return_conn(self)
 
     @property
@@ -718,6 +774,8 @@ class _ConnectionRecord(ConnectionPoolEntry):
         # already invalidated
         if self.dbapi_connection is None:
             return
+        if self.__pool.metrics is not None:
+            self.__pool.metrics._record_invalidate()
         if soft:
             self.__pool.dispatch.soft_invalidate(
                 self.dbapi_connection, self, e
@@ -804,6 +862,47 @@ class _ConnectionRecord(ConnectionPoolEntry):
             or (self._soft_invalidate_time > self.starttime)
         )
 
+    def _maintain(self, recycle_time: Optional[float], ping: bool) -> None:
+        """Reconnect or ping an idle connection on behalf of the pool's
+        background maintenance.
+
+        Connections which are invalidated, or which were established
+        before the given recycle time, are replaced with a new connection;
+        otherwise the connection is pinged if requested.
+
+        """
+        pool = self.__pool
+
+        if self._is_hard_or_soft_invalidated() or (
+            recycle_time is not None and self.starttime < recycle_time
+        ):
+            if self.dbapi_connection is not None:
+                pool.logger.info(
+                    "Connection %r recycled by pool maintenance",
+                    self.dbapi_connection,
+                )
+                self.__close()
+            self.info.clear()  # type: ignore  # our info is always present
+            self.__connect()
+        elif ping:
+            assert self.dbapi_connection is not None
+            result = pool._dialect.do_ping(self.dbapi_connection)
+            if pool.metrics is not None:
+                pool.metrics._record_ping(result)
+            if result:
+                self._verified_time = time.time()
+            else:
+                pool.logger.info(
+                    "Pool maintenance ping on connection %r failed, "
+                    "invalidating all pooled connections prior to "
+                    "current timestamp",
+                    self.dbapi_connection,
+                )
+                if pool._invalidate_time < self.starttime:
+                    pool._invalidate_time = time.time()
+                self.invalidate()
+                self.__connect()
+
     def __close(self) -> None:
         self.finalize_callback.clear()
         if self.__pool.dispatch.close:
@@ -823,6 +922,8 @@ class _ConnectionRecord(ConnectionPoolEntry):
             self.dbapi_connection = connection = pool._invoke_creator(self)
             pool.logger.debug("Created new connection %r", connection)
             self.fresh = True
+            if pool.metrics is not None:
+                pool.metrics._record_connect()
         except Exception as e:
             with util.safe_reraise():
                 pool.logger.debug("Error on connect(): %s", e)
@@ -1202,13 +1303,28 @@ class _ConnectionFairy(PoolProxiedConnection):
             fairy._connection_record.fresh = False
             try:
                 if pool._pre_ping:
-                    if not connection_is_fresh:
+                    if (
+                        pool._maintenance_interval is not None
+                        and not connection_is_fresh
+                        and time.time()
+                        - fairy._connection_record._verified_time
+                        < pool._maintenance_interval
+                    ):
+                        if fairy._echo:
+                            pool.logger.debug(
+                                "Connection %s was pinged by pool "
+                                "maintenance, skipping pre-ping",
+                                fairy.dbapi_connection,
+                            )
+                    elif not connection_is_fresh:
                         if fairy._echo:
                             pool.logger.debug(
                                 "Pool pre-ping on connection %s",
                                 fairy.dbapi_connection,
                             )
                         result = pool._dialect.do_ping(fairy.dbapi_connection)
+                        if pool.metrics is not None:
+                            pool.metrics._record_ping(result)
                         if not result:
                             if fairy._echo:
                                 pool.logger.debug(
@@ -1361,6 +1477,8 @@ class _ConnectionFairy(PoolProxiedConnection):
             rec = self._connection_record
             rec.fairy_ref = None
             rec.dbapi_connection = None
+            if self._pool.metrics is not None:
+                self._pool.metrics._record_checkin()
             # TODO: should this be _return_conn?
             self._pool._do_return_conn(self._connection_record)
 
@@ -0,0 +1,207 @@
+# sqlalchemy/pool/budget.py
+# Copyright (C) 2005-2022 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: https://www.opensource.org/licenses/mit-license.php
+
+
+"""A limit on the total number of connections held by a group of pools.
+
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import threading
+import time
+import typing
+from typing import Optional
+from typing import Tuple
+import weakref
+
+from .. import exc
+
+if typing.TYPE_CHECKING:
+    from .base import ConnectionPoolEntry
+    from .impl import QueuePool
+
+
+class ConnectionBudget:
+    """Limits the total number of connections held open by a group of
+    :class:`.QueuePool` objects.
+
+    A :class:`.ConnectionBudget` is passed to each pool in the group using
+    the :paramref:`_pool.QueuePool.budget` parameter, or the
+    :paramref:`_sa.create_engine.pool_budget` parameter of
+    :func:`_sa.create_engine`, typically for a group of engines which each
+    connect to the database of one tenant of a multi-tenant application.
+    Each pool continues to apply its own ``pool_size`` and
+    ``max_overflow``; in addition, when the pools of the group hold
+    :attr:`.ConnectionBudget.max_connections` connections in total, a pool
+    that needs a new connection closes the idle connection, among all the
+    pools of the group, which was returned to its pool least recently.
+    When none of the connections are idle, the pool waits for a connection
+    to become idle or to be closed, up to the pool's
+    :paramref:`_pool.QueuePool.timeout`, before raising
+    :class:`~sqlalchemy.exc.TimeoutError`; pools used with asyncio don't
+    wait, raising immediately.
+
+    .. versionadded:: 2.0
+
+    .. seealso::
+
+        :ref:`pool_budget`
+
+    """
+
+    max_connections: int
+    """The largest number of connections held by the pools of the group."""
+
+    def __init__(self, max_connections: int):
+        self.max_connections = max_connections
+        self._cond = threading.Condition(threading.Lock())
+        self._open = 0
+
+        # idle connections of all pools, least recently returned first
+        self._idle: OrderedDict[ConnectionPoolEntry, QueuePool] = OrderedDict()
+
+        # pools which were disposed and haven't opened a connection since
+        self._disposed: weakref.WeakSet[QueuePool] = weakref.WeakSet()
+
+    def open_connections(self) -> int:
+        """Return the number of connections held by the pools of the
+        group, including those which are checked out."""
+        return self._open
+
+    def idle_connections(self) -> int:
+        """Return the number of connections idle in the pools of the
+        group."""
+        return len(self._idle)
+
+    def status(self) -> str:
+        return "Budget max connections: %d  Open: %d  Idle: %d" % (
+            self.max_connections,
+            self._open,
+            len(self._idle),
+        )
+
+    def _acquire(
+        self, pool: QueuePool, timeout: float
+    ) -> Optional[ConnectionPoolEntry]:
+        """Reserve the budget for a new connection of the given pool,
+        closing an idle connection if the budget is exhausted.
+
+        If an idle connection of the same pool is found instead, it's
+        returned so that the pool may use it in place of a new one.
+
+        """
+
+        endtime: Optional[float] = None
+        with self._cond:
+            self._disposed.discard(pool)
+            while True:
+                if self._open < self.max_connections:
+                    self._open += 1
+                    return None
+
+                idle = self._take_idle(pool)
+                if idle is not None:
+                    break
+
+                if pool._is_asyncio:
+                    remaining = 0.0
+                else:
+                    if endtime is None:
+                        endtime = time.time() + timeout
+                    remaining = endtime - time.time()
+                if remaining <= 0:
+                    if pool.metrics is not None:
+                        pool.metrics._record_timeout()
+                    raise exc.TimeoutError(
+                        "Connection budget of %d connections reached, "
+                        "connection timed out, timeout %0.2f"
+                        % (self.max_connections, timeout)
+                    )
+                self._cond.wait(remaining)
+
+        # the connection's share of the budget passes on to the new
+        # connection
+        rec, owner = idle
+        if owner is pool:
+            return rec
+        owner._shrink(rec)
+        return None
+
+    def _try_acquire(self) -> bool:
+        """Reserve the budget for a new connection, only if the budget
+        isn't exhausted."""
+
+        with self._cond:
+            if self._open < self.max_connections:
+                self._open += 1
+                return True
+            return False
+
+    def _take_idle(
+        self, pool: QueuePool
+    ) -> Optional[Tuple[ConnectionPoolEntry, QueuePool]]:
+        idle = self._idle
+
+        # a connection returned to the requesting pool itself is used
+        # before closing one of another pool
+        for rec in [rec for rec, owner in idle.items() if owner is pool]:
+            del idle[rec]
+            if pool._pool.get_matching(lambda item: item is rec, 1):
+                return rec, pool
+
+        while idle:
+            rec, owner = idle.popitem(last=False)
+
+            # the connection may have been checked out or taken for
+            # maintenance in the meantime
+            if owner._pool.get_matching(lambda item: item is rec, 1):
+                return rec, owner
+        return None
+
+    def _release(self, record: Optional[ConnectionPoolEntry]) -> None:
+        """Release the budget of a connection which was closed, or which
+        failed to connect."""
+
+        with self._cond:
+            self._open -= 1
+            if record is not None:
+                self._idle.pop(record, None)
+            self._cond.notify()
+
+    def _checkin(self, record: ConnectionPoolEntry, pool: QueuePool) -> None:
+        with self._cond:
+            self._idle[record] = pool
+            self._idle.move_to_end(record)
+            self._cond.notify()
+
+    def _checkout(self, record: ConnectionPoolEntry) -> None:
+        with self._cond:
+            self._idle.pop(record, None)
+
+    def _dispose(self, pool: QueuePool) -> None:
+        """Forget the idle connections of a pool which was disposed, whose
+        connections are closed when returned to it from then on."""
+
+        with self._cond:
+            self._disposed.add(pool)
+            for rec in [
+                rec for rec, owner in self._idle.items() if owner is pool
+            ]:
+                del self._idle[rec]
+
+    def _is_disposed(self, pool: QueuePool) -> bool:
+        with self._cond:
+            return pool in self._disposed
+
+    def __repr__(self) -> str:
+        return "<ConnectionBudget max_connections=%d open=%d idle=%d>" % (
+            self.max_connections,
+            self._open,
+            len(self._idle),
+        )
@@ -19,6 +19,7 @@ from .. import event
 from .. import util
 
 if typing.TYPE_CHECKING:
+    from .metrics import PoolMetricsSnapshot
     from ..engine import Engine
     from ..engine.interfaces import DBAPIConnection
 
@@ -346,3 +347,71 @@ class PoolEvents(event.Events[Pool]):
          The :attr:`.ConnectionPoolEntry.dbapi_connection` attribute.
 
         """
+
+    def shrink(
+        self,
+        dbapi_connection: DBAPIConnection,
+        connection_record: ConnectionPoolEntry,
+    ) -> None:
+        """Called when an idle DBAPI connection is closed in order to shrink
+        the pool.
+
+        This event is emitted by the background maintenance of a
+        :class:`.QueuePool` which has the
+        :paramref:`_pool.QueuePool.idle_timeout` parameter set, for each
+        connection that remained in the pool without being checked out for
+        longer than the idle timeout, as well as for a pool which shares a
+        :class:`.ConnectionBudget`, when an idle connection of the pool is
+        closed so that another pool sharing the budget may open a new
+        connection.   The event is emitted before the connection is closed,
+        and is followed by the :meth:`.close` event.
+
+        :param dbapi_connection: a DBAPI connection.
+         The :attr:`.ConnectionPoolEntry.dbapi_connection` attribute.
+
+        :param connection_record: the :class:`.ConnectionPoolEntry` managing
+         the DBAPI connection.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`pool_idle_timeout`
+
+            :ref:`pool_budget`
+
+        """
+
+    def metrics_sample(
+        self, pool: Pool, snapshot: PoolMetricsSnapshot
+    ) -> None:
+        """Called periodically with a snapshot of the metrics collected by
+        a :class:`_pool.Pool`.
+
+        This event is only invoked for a pool that has the
+        :paramref:`_pool.Pool.metrics` parameter set to ``True``.   It's
+        invoked upon a connection checkout, when at least
+        :paramref:`_pool.Pool.metrics_interval` seconds have passed since
+        it was last invoked, and is intended for delivering pool metrics to
+        an external metrics system.
+
+        e.g.::
+
+            from sqlalchemy import event
+
+            @event.listens_for(engine, "metrics_sample")
+            def metrics_sample(pool, snapshot):
+                statsd.gauge("db.pool.max_checked_out", snapshot.max_checked_out)
+                statsd.gauge(
+                    "db.pool.checkout_wait.p99",
+                    snapshot.checkout_wait.percentile(99),
+                )
+
+        :param pool: the :class:`_pool.Pool`.
+
+        :param snapshot: a :class:`.PoolMetricsSnapshot` with the current
+         values of the pool's metrics.
+
+        .. versionadded:: 2.0
+
+        """  # noqa: E501
@@ -11,7 +11,9 @@
 """
 from __future__ import annotations
 
+import asyncio
 import threading
+import time
 import traceback
 import typing
 from typing import Any
@@ -32,10 +34,12 @@ from .base import _CreatorWRecFnType
 from .base import ConnectionPoolEntry
 from .base import Pool
 from .base import PoolProxiedConnection
+from .budget import ConnectionBudget
 from .. import exc
 from .. import util
 from ..util import chop_traceback
 from ..util import queue as sqla_queue
+from ..util.concurrency import greenlet_spawn
 from ..util.typing import Literal
 
 if typing.TYPE_CHECKING:
@@ -67,6 +71,10 @@ class QueuePool(Pool):
         max_overflow: int = 10,
         timeout: float = 30.0,
         use_lifo: bool = False,
+        min_idle: int = 0,
+        maintenance_interval: Optional[float] = None,
+        idle_timeout: Optional[float] = None,
+        budget: Optional[ConnectionBudget] = None,
         **kw: Any,
     ):
         r"""
@@ -117,6 +125,77 @@ class QueuePool(Pool):
 
             :ref:`pool_disconnects`
 
+            :paramref:`_pool.QueuePool.idle_timeout`
+
+        :param min_idle: the number of idle connections that background
+          maintenance keeps open in the pool, up to ``pool_size``
+          connections in total, so that callers don't need to wait for new
+          connections to be established.  This is also the number of idle
+          connections below which :paramref:`_pool.QueuePool.idle_timeout`
+          won't close connections.  Defaults to 0.  When set,
+          background maintenance is enabled with an interval of 30 seconds,
+          unless :paramref:`_pool.QueuePool.maintenance_interval` is also
+          set.
+
+          .. versionadded:: 2.0
+
+          .. seealso::
+
+            :ref:`pool_maintenance`
+
+        :param maintenance_interval: enable background maintenance of idle
+          connections, running at the given interval in seconds.  Background
+          maintenance opens connections up to
+          :paramref:`_pool.QueuePool.min_idle`, replaces idle connections
+          which would exceed :paramref:`_pool.Pool.recycle` before the next
+          run, or which were invalidated, and when
+          :paramref:`_pool.Pool.pre_ping` is set, pings idle connections, so
+          that the "pre ping" is skipped upon checkout for connections pinged
+          within the interval.   Maintenance takes place in a daemon thread,
+          or in an asyncio task for :class:`.AsyncAdaptedQueuePool`, which is
+          started upon the first checkout.  Defaults to ``None``.
+
+          .. versionadded:: 2.0
+
+          .. seealso::
+
+            :ref:`pool_maintenance`
+
+        :param idle_timeout: number of seconds after which background
+          maintenance closes a connection that has remained in the pool
+          without being checked out, shrinking the pool so that connections
+          opened during a peak in use aren't held open indefinitely.  Idle
+          connections are closed down to
+          :paramref:`_pool.QueuePool.min_idle` connections.  The
+          :meth:`_events.PoolEvents.shrink` event is emitted for each
+          connection closed.   When set, background maintenance is enabled
+          with an interval of 30 seconds or of ``idle_timeout``, whichever is
+          less, unless :paramref:`_pool.QueuePool.maintenance_interval` is
+          also set.  Defaults to ``None``.
+
+          As connections are checked out in a round-robin fashion by
+          default, an idle timeout is most effective in conjunction with
+          :paramref:`_pool.QueuePool.use_lifo`, where connections beyond
+          those needed for current use remain idle.
+
+          .. versionadded:: 2.0
+
+          .. seealso::
+
+            :ref:`pool_idle_timeout`
+
+        :param budget: a :class:`.ConnectionBudget` shared with other
+          pools, limiting the total number of connections held by the pools
+          which share it.  When the limit is reached, a new connection
+          replaces the idle connection of any of the pools that was returned
+          least recently.  Defaults to ``None``.
+
+          .. versionadded:: 2.0
+
+          .. seealso::
+
+            :ref:`pool_budget`
+
         :param \**kw: Other keyword arguments including
           :paramref:`_pool.Pool.recycle`, :paramref:`_pool.Pool.echo`,
           :paramref:`_pool.Pool.reset_on_return` and others are passed to the
@@ -129,31 +208,71 @@ class QueuePool(Pool):
         self._max_overflow = max_overflow
         self._timeout = timeout
         self._overflow_lock = threading.Lock()
+        self._min_idle = min_idle
+        self._idle_timeout = idle_timeout
+        self._budget = budget
+        if maintenance_interval is None:
+            if idle_timeout is not None:
+                maintenance_interval = min(idle_timeout, 30.0)
+            elif min_idle > 0:
+                maintenance_interval = 30.0
+        self._maintenance_interval = maintenance_interval
+        self._maintenance_pending = maintenance_interval is not None
+        self._maintenance_lock = threading.Lock()
+        self._maintainer: Optional[
+            Union[threading.Thread, asyncio.Task[None]]
+        ] = None
+        self._maintenance_stop: Optional[threading.Event] = None
 
     def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
+        if self._budget is not None and self._budget._is_disposed(self):
+            # the pool was disposed while the connection was checked out;
+            # close it rather than holding a share of the budget for it
+            try:
+                record.close()
+            finally:
+                self._budget._release(record)
+            return
+
         try:
             self._pool.put(record, False)
         except sqla_queue.Full:
+            if self.metrics is not None:
+                self.metrics._record_overflow_discarded()
             try:
                 record.close()
             finally:
                 self._dec_overflow()
+                if self._budget is not None:
+                    self._budget._release(record)
+        else:
+            if self._budget is not None:
+                self._budget._checkin(record, self)
 
     def _do_get(self) -> ConnectionPoolEntry:
+        if self._maintenance_pending:
+            self._start_maintenance()
+
         use_overflow = self._max_overflow > -1
 
         wait = use_overflow and self._overflow >= self._max_overflow
         try:
-            return self._pool.get(wait, self._timeout)
+            rec = self._pool.get(wait, self._timeout)
         except sqla_queue.Empty:
             # don't do things inside of "except Empty", because when we say
             # we timed out or can't connect and raise, Python 3 tells
             # people the real error is queue.Empty which it isn't.
             pass
+        else:
+            if self._budget is not None:
+                self._budget._checkout(rec)
+            return rec
         if use_overflow and self._overflow >= self._max_overflow:
             if not wait:
                 return self._do_get()
             else:
+                if self.metrics is not None:
+                    self.metrics._record_timeout()
                 raise exc.TimeoutError(
                     "QueuePool limit of size %d overflow %d reached, "
                     "connection timed out, timeout %0.2f"
@@ -162,14 +281,38 @@ class QueuePool(Pool):
                 )
 
         if self._inc_overflow():
+            return self._open_connection()
+        else:
+            return self._do_get()
+
+    def _open_connection(self) -> ConnectionPoolEntry:
+        """Open a new connection, once the overflow has been
+        incremented."""
+
+        budget = self._budget
+        if budget is not None:
             try:
-                return self._create_connection()
+                rec = budget._acquire(self, self._timeout)
             except:
                 with util.safe_reraise():
                     self._dec_overflow()
                 raise
-        else:
-            return self._do_get()
+            if rec is not None:
+                # a connection was returned to this pool meanwhile
+                self._dec_overflow()
+                return rec
+
+        try:
+            rec = self._create_connection()
+        except:
+            with util.safe_reraise():
+                self._dec_overflow()
+                if budget is not None:
+                    budget._release(None)
+            raise
+        if self.metrics is not None and self._overflow > 0:
+            self.metrics._record_overflow_created()
+        return rec
 
     def _inc_overflow(self) -> bool:
         if self._max_overflow == -1:
@@ -190,6 +333,171 @@ class QueuePool(Pool):
             self._overflow -= 1
             return True
 
+    def _start_maintenance(self) -> None:
+        # checkouts in several threads may arrive here at once
+        with self._maintenance_lock:
+            if not self._maintenance_pending:
+                return
+            self._maintenance_pending = False
+            assert self._maintenance_interval is not None
+
+            pool_ref = weakref.ref(self)
+            if self._is_asyncio:
+                try:
+                    loop = asyncio.get_running_loop()
+                except RuntimeError:
+                    self.logger.info(
+                        "No running event loop; pool maintenance not started"
+                    )
+                    return
+                self._maintainer = loop.create_task(
+                    _maintain_pool_async(pool_ref, self._maintenance_interval)
+                )
+            else:
+                self._maintenance_stop = stop = threading.Event()
+                self._maintainer = threading.Thread(
+                    target=_maintain_pool,
+                    args=(pool_ref, stop, self._maintenance_interval),
+                    name="sqlalchemy-pool-maintenance",
+                    daemon=True,
+                )
+                self._maintainer.start()
+
+    def _stop_maintenance(self) -> None:
+        with self._maintenance_lock:
+            maintainer = self._maintainer
+            if maintainer is None:
+                return
+            self._maintainer = None
+            self._maintenance_pending = True
+
+            if isinstance(maintainer, threading.Thread):
+                assert self._maintenance_stop is not None
+                self._maintenance_stop.set()
+                self._maintenance_stop = None
+            else:
+                maintainer.cancel()
+
+    def _maintain(self) -> None:
+        """Perform a single run of background maintenance."""
+
+        interval = self._maintenance_interval
+        assert interval is not None
+        now = time.time()
+
+        # connections which would exceed the recycle time before the
+        # next run are replaced now
+        recycle_time = (
+            now + interval - self._recycle if self._recycle > -1 else None
+        )
+        ping_time = now - interval if self._pre_ping else None
+
+        if self._idle_timeout is not None:
+            self._close_idle(now - self._idle_timeout)
+
+        maintained: Set[ConnectionPoolEntry] = set()
+
+        def needs_maintenance(rec: ConnectionPoolEntry) -> bool:
+            rec = cast(_ConnectionRecord, rec)
+            return rec not in maintained and (
+                rec._is_hard_or_soft_invalidated()
+                or (recycle_time is not None and rec.starttime < recycle_time)
+                or (
+                    ping_time is not None
+                    and max(rec._verified_time, rec.starttime) <= ping_time
+                )
+            )
+
+        # connections are taken out of the pool one at a time, so that
+        # the others remain available for checkout; once callers are
+        # waiting for a connection, the rest wait for the next run
+        while not self._pool.has_waiters():
+            recs = self._pool.get_matching(needs_maintenance, 1)
+            if not recs:
+                break
+            rec = recs[0]
+            maintained.add(rec)
+            try:
+                cast(_ConnectionRecord, rec)._maintain(
+                    recycle_time, ping_time is not None
+                )
+            except Exception:
+                self.logger.error(
+                    "Exception during pool maintenance", exc_info=True
+                )
+            finally:
+                self._do_return_conn(rec)
+
+        budget = self._budget
+        while (
+            self._pool.qsize() < self._min_idle
+            and self._overflow < 0
+            and self._inc_overflow()
+        ):
+            # idle connections are only opened within the budget, without
+            # closing those of other pools
+            if budget is not None and not budget._try_acquire():
+                self._dec_overflow()
+                break
+            try:
+                rec = self._create_connection()
+            except Exception:
+                self._dec_overflow()
+                if budget is not None:
+                    budget._release(None)
+                self.logger.error(
+                    "Exception during pool maintenance", exc_info=True
+                )
+                break
+            if self._idle_timeout is not None:
+                cast(_ConnectionRecord, rec)._checkin_time = time.time()
+            self._do_return_conn(rec)
+
+    def _close_idle(self, idle_time: float) -> None:
+        """Close connections which were returned to the pool before the
+        given time, leaving at least ``min_idle`` connections in the pool."""
+
+        excess = self._pool.qsize() - self._min_idle
+        if excess <= 0:
+            return
+
+        # connections returned to the pool least recently are first in
+        # the queue
+        def is_idle(rec: ConnectionPoolEntry) -> bool:
+            nonlocal excess
+            if (
+                excess > 0
+                and cast(_ConnectionRecord, rec)._checkin_time < idle_time
+            ):
+                excess -= 1
+                return True
+            return False
+
+        for rec in self._pool.get_matching(is_idle):
+            self._shrink(rec)
+            if self._budget is not None:
+                self._budget._release(rec)
+            if self.metrics is not None:
+                self.metrics._record_idle_closed()
+
+    def _shrink(self, rec: ConnectionPoolEntry) -> None:
+        """Close an idle connection which was removed from the pool."""
+
+        try:
+            if rec.dbapi_connection is not None:
+                self.logger.debug(
+                    "Closing idle connection %r", rec.dbapi_connection
+                )
+                if self.dispatch.shrink:
+                    self.dispatch.shrink(rec.dbapi_connection, rec)
+            rec.close()
+        except Exception:
+            self.logger.error(
+                "Exception closing idle connection", exc_info=True
+            )
+        finally:
+            self._dec_overflow()
+
     def recreate(self) -> QueuePool:
         self.logger.info("Pool recreating")
         return self.__class__(
@@ -199,21 +507,34 @@ class QueuePool(Pool):
             pre_ping=self._pre_ping,
             use_lifo=self._pool.use_lifo,
             timeout=self._timeout,
+            min_idle=self._min_idle,
+            maintenance_interval=self._maintenance_interval,
+            idle_timeout=self._idle_timeout,
+            budget=self._budget,
             recycle=self._recycle,
             echo=self.echo,
             logging_name=self._orig_logging_name,
             reset_on_return=self._reset_on_return,
+            metrics=self.metrics is not None,
+            metrics_interval=self._metrics_interval,
             _dispatch=self.dispatch,
             dialect=self._dialect,
         )
 
     def dispose(self) -> None:
+        self._stop_maintenance()
+
         while True:
             try:
                 conn = self._pool.get(False)
                 conn.close()
             except sqla_queue.Empty:
                 break
+            if self._budget is not None:
+                self._budget._release(conn)
+
+        if self._budget is not None:
+            self._budget._dispose(self)
 
         self._overflow = 0 - self.size()
         self.logger.info("Pool disposed. %s", self.status())
@@ -247,6 +568,44 @@ class QueuePool(Pool):
         return self._pool.maxsize - self._pool.qsize() + self._overflow
 
 
+def _maintain_pool(
+    pool_ref: weakref.ref[QueuePool],
+    stop: threading.Event,
+    interval: float,
+) -> None:
+    # refer to the pool weakly between runs, so that a pool which is no
+    # longer referenced may be garbage collected
+    while not stop.is_set():
+        pool = pool_ref()
+        if pool is None:
+            return
+        try:
+            pool._maintain()
+        except Exception:
+            pool.logger.error(
+                "Exception during pool maintenance", exc_info=True
+            )
+        del pool
+        stop.wait(interval)
+
+
+async def _maintain_pool_async(
+    pool_ref: weakref.ref[QueuePool], interval: float
+) -> None:
+    while True:
+        pool = pool_ref()
+        if pool is None:
+            return
+        try:
+            await greenlet_spawn(pool._maintain)
+        except Exception:
+            pool.logger.error(
+                "Exception during pool maintenance", exc_info=True
+            )
+        del pool
+        await asyncio.sleep(interval)
+
+
 class AsyncAdaptedQueuePool(QueuePool):
     _is_asyncio = True  # type: ignore[assignment]
     _queue_class: Type[
@@ -260,6 +619,106 @@ class FallbackAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
     _queue_class = sqla_queue.FallbackAsyncAdaptedQueue
 
 
+class AsyncQueuePool(QueuePool):
+    """A :class:`.QueuePool` designed for use with asyncio engines.
+
+    :class:`.AsyncQueuePool` accepts the same arguments as
+    :class:`.QueuePool`, and may be used in place of the default
+    :class:`.AsyncAdaptedQueuePool` by passing it as the ``poolclass``
+    argument of :func:`_asyncio.create_async_engine`.  Checkouts and
+    checkins take place entirely within the event loop without any lock,
+    and a connection that's available is checked out without awaiting.
+    When the pool has reached its overflow limit, callers wait for a
+    connection to be returned in the order in which they began waiting,
+    with each returned connection handed directly to the caller that has
+    waited longest, so that callers arriving later can't take it first;
+    the :paramref:`_pool.QueuePool.timeout` applies to each caller
+    individually.  New connections, as well as the "pre ping" of
+    :paramref:`_pool.Pool.pre_ping`, are awaited by the caller checking out
+    the connection, without preventing other callers from checking out
+    and returning connections meanwhile.
+
+    The pool must only be used within a single event loop.
+
+    .. versionadded:: 2.0
+
+    .. seealso::
+
+        :ref:`asyncio_pool`
+
+    """
+
+    _is_asyncio = True  # type: ignore[assignment]
+    _queue_class = sqla_queue.AsyncQueue
+
+    _pool: sqla_queue.AsyncQueue[ConnectionPoolEntry]
+
+    _dialect = _AsyncConnDialect()
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        if self._maintenance_pending:
+            self._start_maintenance()
+
+        pool = self._pool
+        deadline: Optional[float] = None
+        while True:
+            try:
+                rec = pool.get_nowait()
+            except sqla_queue.Empty:
+                pass
+            else:
+                break
+
+            if self._inc_overflow():
+                return self._open_connection()
+
+            now = time.monotonic()
+            if deadline is None:
+                deadline = now + self._timeout
+            elif now >= deadline:
+                if self.metrics is not None:
+                    self.metrics._record_timeout()
+                raise exc.TimeoutError(
+                    "QueuePool limit of size %d overflow %d reached, "
+                    "connection timed out, timeout %0.2f"
+                    % (self.size(), self.overflow(), self._timeout),
+                    code="3o7r",
+                )
+
+            # the wait also ends without a connection when the timeout
+            # is reached, or when a connection is closed, so that a new
+            # one may be opened
+            try:
+                rec = pool.get(True, deadline - now)
+            except sqla_queue.Empty:
+                pass
+            else:
+                break
+
+        if self._budget is not None:
+            self._budget._checkout(rec)
+        return rec
+
+    # all checkouts take place within the thread running the event loop,
+    # and the overflow is checked and incremented without an await in
+    # between, so that no lock is needed
+
+    def _inc_overflow(self) -> bool:
+        if self._max_overflow == -1 or self._overflow < self._max_overflow:
+            self._overflow += 1
+            return True
+        else:
+            return False
+
+    def _dec_overflow(self) -> Literal[True]:
+        self._overflow -= 1
+
+        # a caller waiting for a connection to be returned may now open
+        # a new connection instead
+        self._pool.expire_waiter()
+        return True
+
+
 class NullPool(Pool):
 
     """A Pool which does not pool connections.
@@ -292,6 +751,8 @@ class NullPool(Pool):
             logging_name=self._orig_logging_name,
             reset_on_return=self._reset_on_return,
             pre_ping=self._pre_ping,
+            metrics=self.metrics is not None,
+            metrics_interval=self._metrics_interval,
             _dispatch=self.dispatch,
             dialect=self._dialect,
         )
@@ -355,6 +816,8 @@ class SingletonThreadPool(Pool):
             pre_ping=self._pre_ping,
             logging_name=self._orig_logging_name,
             reset_on_return=self._reset_on_return,
+            metrics=self.metrics is not None,
+            metrics_interval=self._metrics_interval,
             _dispatch=self.dispatch,
             dialect=self._dialect,
         )
@@ -455,6 +918,8 @@ class StaticPool(Pool):
             pre_ping=self._pre_ping,
             echo=self.echo,
             logging_name=self._orig_logging_name,
+            metrics=self.metrics is not None,
+            metrics_interval=self._metrics_interval,
             _dispatch=self.dispatch,
             dialect=self._dialect,
         )
@@ -528,6 +993,8 @@ class AssertionPool(Pool):
             recycle=self._recycle,
             reset_on_return=self._reset_on_return,
             logging_name=self._orig_logging_name,
+            metrics=self.metrics is not None,
+            metrics_interval=self._metrics_interval,
             _dispatch=self.dispatch,
             dialect=self._dialect,
         )
@@ -0,0 +1,358 @@
+# sqlalchemy/pool/metrics.py
+# Copyright (C) 2005-2022 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: https://www.opensource.org/licenses/mit-license.php
+
+
+"""Metrics collection for connection pools.
+
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+import threading
+import time
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+
+class HistogramSnapshot(NamedTuple):
+    """A point-in-time copy of a histogram collected by
+    :class:`.PoolMetrics`.
+
+    Values are counted into fixed buckets; the bucket at index ``i`` counts
+    values greater than ``bounds[i - 1]`` and less than or equal to
+    ``bounds[i]``, with the final bucket counting values greater than the
+    last bound.
+
+    .. versionadded:: 2.0
+
+    """
+
+    bounds: Tuple[float, ...]
+    """The upper bound of each bucket, excluding the final bucket, which
+    has no upper bound."""
+
+    counts: Tuple[int, ...]
+    """The number of values counted into each bucket; this tuple has one
+    more element than :attr:`.HistogramSnapshot.bounds`."""
+
+    count: int
+    """The total number of values recorded."""
+
+    total: float
+    """The sum of all values recorded."""
+
+    max: float
+    """The largest value recorded, or ``0.0`` if no values were
+    recorded."""
+
+    @property
+    def mean(self) -> float:
+        """The mean of all values recorded, or ``0.0`` if no values were
+        recorded."""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """Return an estimate of the given percentile, as the upper bound
+        of the bucket which contains it.
+
+        E.g. ``snapshot.percentile(99)`` returns a value which at least
+        99% of the recorded values are less than or equal to.  For the
+        final bucket, which has no upper bound, :attr:`.HistogramSnapshot.max`
+        is returned.   Returns ``0.0`` if no values were recorded.
+
+        :param percent: a percentage between 0 and 100.
+
+        """
+        if not self.count:
+            return 0.0
+        threshold = self.count * percent / 100.0
+        cumulative = 0
+        for bound, count in zip(self.bounds, self.counts):
+            cumulative += count
+            if cumulative >= threshold:
+                return min(bound, self.max)
+        return self.max
+
+
+class PoolMetricsSnapshot(NamedTuple):
+    """A point-in-time copy of the metrics collected by
+    :class:`.PoolMetrics`, as returned by :meth:`.PoolMetrics.snapshot`
+    and delivered to the :meth:`_events.PoolEvents.metrics_sample` event.
+
+    Counters accumulate from the time the :class:`_pool.Pool` was created,
+    or from the last call to :meth:`.PoolMetrics.reset`.
+
+    .. versionadded:: 2.0
+
+    """
+
+    timestamp: float
+    """The time at which the snapshot was taken, as returned by
+    ``time.time()``."""
+
+    checkouts: int
+    """Number of connections checked out from the pool."""
+
+    checked_out: int
+    """Number of connections checked out at the time of the snapshot."""
+
+    max_checked_out: int
+    """The largest number of connections checked out at the same time."""
+
+    connects: int
+    """Number of new DBAPI connections established, including those that
+    replaced recycled or invalidated connections."""
+
+    overflow_created: int
+    """Number of connections established beyond the ``pool_size`` of a
+    :class:`.QueuePool`."""
+
+    overflow_discarded: int
+    """Number of connections closed upon return to a :class:`.QueuePool`,
+    as the pool already contained ``pool_size`` connections."""
+
+    idle_closed: int
+    """Number of idle connections closed by the background maintenance of
+    a :class:`.QueuePool`, as they exceeded the pool's
+    :paramref:`_pool.QueuePool.idle_timeout`."""
+
+    timeouts: int
+    """Number of checkouts which raised :class:`.exc.TimeoutError`, as no
+    connection became available within the pool's ``timeout``."""
+
+    invalidations: int
+    """Number of connections invalidated, including soft
+    invalidations."""
+
+    pings: int
+    """Number of "pre ping" operations emitted on checkout."""
+
+    ping_failures: int
+    """Number of "pre ping" operations which detected a disconnected
+    connection."""
+
+    checkout_wait: HistogramSnapshot
+    """Time in seconds spent acquiring each connection on checkout,
+    including waiting for a connection to be returned to the pool and
+    establishing new connections."""
+
+    connection_age: HistogramSnapshot
+    """Age in seconds of the DBAPI connection delivered by each
+    checkout."""
+
+    @property
+    def ping_failure_rate(self) -> float:
+        """The ratio of :attr:`.PoolMetricsSnapshot.ping_failures` to
+        :attr:`.PoolMetricsSnapshot.pings`, or ``0.0`` if no pings were
+        emitted."""
+        return self.ping_failures / self.pings if self.pings else 0.0
+
+
+class _Histogram:
+    """Counts values into fixed buckets."""
+
+    __slots__ = ("bounds", "counts", "count", "total", "max")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def snapshot(self) -> HistogramSnapshot:
+        return HistogramSnapshot(
+            self.bounds, tuple(self.counts), self.count, self.total, self.max
+        )
+
+
+class PoolMetrics:
+    """Collects metrics for a :class:`_pool.Pool`.
+
+    An instance of this object is available from the
+    :attr:`_pool.Pool.metrics` attribute when the
+    :paramref:`_pool.Pool.metrics` parameter, or the
+    :paramref:`_sa.create_engine.pool_metrics` parameter of
+    :func:`_sa.create_engine`, is set to ``True``.  Metrics include
+    counters for checkouts, new connections, overflow connections,
+    checkout timeouts and pre-ping failures, as well as histograms of the
+    time spent acquiring connections and of the age of connections
+    checked out.  :meth:`.PoolMetrics.snapshot` returns a consistent copy
+    of all values, which is also delivered periodically to the
+    :meth:`_events.PoolEvents.metrics_sample` event.
+
+    .. versionadded:: 2.0
+
+    .. seealso::
+
+        :ref:`pool_metrics`
+
+    """
+
+    checkout_wait_buckets: Tuple[float, ...] = (
+        0.001,
+        0.005,
+        0.01,
+        0.05,
+        0.1,
+        0.5,
+        1.0,
+        5.0,
+        10.0,
+        30.0,
+    )
+    """Upper bounds, in seconds, of the buckets for the
+    :attr:`.PoolMetricsSnapshot.checkout_wait` histogram."""
+
+    connection_age_buckets: Tuple[float, ...] = (
+        1.0,
+        10.0,
+        60.0,
+        300.0,
+        900.0,
+        1800.0,
+        3600.0,
+        14400.0,
+        86400.0,
+    )
+    """Upper bounds, in seconds, of the buckets for the
+    :attr:`.PoolMetricsSnapshot.connection_age` histogram."""
+
+    sample_interval: Optional[float]
+    """The minimum interval in seconds between invocations of the
+    :meth:`_events.PoolEvents.metrics_sample` event, or ``None`` if
+    the event isn't invoked."""
+
+    def __init__(self, sample_interval: Optional[float] = 60.0):
+        self.sample_interval = sample_interval
+        self._mutex = threading.Lock()
+        self._checked_out = 0
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset all counters and histograms to zero.
+
+        The number of connections currently checked out is not affected,
+        and becomes the new maximum.
+
+        """
+        with self._mutex:
+            self._checkouts = self._connects = 0
+            self._overflow_created = self._overflow_discarded = 0
+            self._idle_closed = 0
+            self._timeouts = self._invalidations = 0
+            self._pings = self._ping_failures = 0
+            self._max_checked_out = self._checked_out
+            self._checkout_wait = _Histogram(self.checkout_wait_buckets)
+            self._connection_age = _Histogram(self.connection_age_buckets)
+            self._next_sample = (
+                time.time() + self.sample_interval
+                if self.sample_interval is not None
+                else None
+            )
+
+    def snapshot(self) -> PoolMetricsSnapshot:
+        """Return a :class:`.PoolMetricsSnapshot` with the current
+        values of all metrics."""
+        with self._mutex:
+            return self._snapshot()
+
+    def _snapshot(self) -> PoolMetricsSnapshot:
+        return PoolMetricsSnapshot(
+            time.time(),
+            self._checkouts,
+            self._checked_out,
+            self._max_checked_out,
+            self._connects,
+            self._overflow_created,
+            self._overflow_discarded,
+            self._idle_closed,
+            self._timeouts,
+            self._invalidations,
+            self._pings,
+            self._ping_failures,
+            self._checkout_wait.snapshot(),
+            self._connection_age.snapshot(),
+        )
+
+    def _record_checkout(
+        self, wait: float, age: float
+    ) -> Optional[PoolMetricsSnapshot]:
+        """Record a checkout; return a snapshot if the sample interval
+        has elapsed."""
+        with self._mutex:
+            self._checkouts += 1
+            self._checked_out += 1
+            if self._checked_out > self._max_checked_out:
+                self._max_checked_out = self._checked_out
+            self._checkout_wait.record(wait)
+            self._connection_age.record(age)
+
+            if self._next_sample is not None:
+                now = time.time()
+                if now >= self._next_sample:
+                    assert self.sample_interval is not None
+                    self._next_sample = now + self.sample_interval
+                    return self._snapshot()
+            return None
+
+    def _record_checkin(self) -> None:
+        with self._mutex:
+            self._checked_out -= 1
+
+    def _record_connect(self) -> None:
+        with self._mutex:
+            self._connects += 1
+
+    def _record_overflow_created(self) -> None:
+        with self._mutex:
+            self._overflow_created += 1
+
+    def _record_overflow_discarded(self) -> None:
+        with self._mutex:
+            self._overflow_discarded += 1
+
+    def _record_idle_closed(self) -> None:
+        with self._mutex:
+            self._idle_closed += 1
+
+    def _record_timeout(self) -> None:
+        with self._mutex:
+            self._timeouts += 1
+
+    def _record_invalidate(self) -> None:
+        with self._mutex:
+            self._invalidations += 1
+
+    def _record_ping(self, success: bool) -> None:
+        with self._mutex:
+            self._pings += 1
+            if not success:
+                self._ping_failures += 1
+
+    def __repr__(self) -> str:
+        return (
+            "<PoolMetrics checkouts=%d checked_out=%d max_checked_out=%d "
+            "connects=%d timeouts=%d>"
+            % (
+                self._checkouts,
+                self._checked_out,
+                self._max_checked_out,
+                self._connects,
+                self._timeouts,
+            )
+        )
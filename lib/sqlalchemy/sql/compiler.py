@@ -40,6 +40,7 @@ from typing import cast
 from typing import Dict
 from typing import FrozenSet
 from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Mapping
 from typing import MutableMapping
@@ -106,6 +107,8 @@ if typing.TYPE_CHECKING:
     from .type_api import _BindProcessorType
     from ..engine.cursor import CursorResultMetaData
     from ..engine.interfaces import _CoreSingleExecuteParams
+    from ..engine.interfaces import _DBAPIMultiExecuteParams
+    from ..engine.interfaces import _DBAPISingleExecuteParams
     from ..engine.interfaces import _ExecuteOptions
     from ..engine.interfaces import _MutableCoreSingleExecuteParams
     from ..engine.interfaces import _SchemaTranslateMapType
@@ -396,6 +399,34 @@ class ExpandedState(NamedTuple):
     parameter_expansion: Mapping[str, List[str]]
 
 
+class _InsertManyValues(NamedTuple):
+    """represents state to use for executing an "insertmanyvalues" statement
+
+    .. versionadded:: 2.0
+
+    """
+
+    single_values_expr: Optional[str]
+    """the rendered contents of the VALUES clause for a single row, i.e.
+    the comma-separated expressions inside of the parenthesis.
+
+    If None, the statement can't be rewritten as a multi-row INSERT, such
+    as ``INSERT INTO table DEFAULT VALUES`` or an INSERT that includes an
+    ON CONFLICT clause; in this case the statement is invoked once for each
+    parameter set.
+
+    """
+
+    expand_names: Sequence[str]
+    """names of bound parameters, as rendered in the statement, which are
+    local to the VALUES clause and are to be renamed for each row within
+    a batch, when a named paramstyle is in use"""
+
+    num_params_per_row: int
+    """number of bound parameter placeholders rendered in the VALUES clause
+    for a single row"""
+
+
 class Linting(IntEnum):
     NO_LINTING = 0
     "Disable all linting."
@@ -835,6 +866,16 @@ class SQLCompiler(Compiled):
 
     """
 
+    _insertmanyvalues: Optional[_InsertManyValues] = None
+    """when an INSERT with RETURNING is compiled for an "executemany"
+    execution on a dialect that supports "insertmanyvalues", this
+    structure describes how the statement is to be rewritten into
+    batches of multi-row INSERT statements.
+
+    .. versionadded:: 2.0
+
+    """
+
     literal_execute_params: FrozenSet[BindParameter[Any]] = frozenset()
     """bindparameter objects that are rendered as literal values at statement
     execution time.
@@ -2423,6 +2464,62 @@ class SQLCompiler(Compiled):
             binary, OPERATORS[operator], **kw
         )
 
+    def _array_in_bindparam(
+        self, element, literal_binds=False, literal_execute=False, **kw
+    ):
+        """Given the right side of an IN / NOT IN expression, return a
+        non-expanding copy of the parameter which receives its list of
+        values as a single array value, or None if the expression
+        should be rendered using the usual "expanding" parameter.
+
+        Used when the ``array_in_expansion`` dialect option is in effect.
+
+        """
+        if (
+            not isinstance(element, elements.BindParameter)
+            or not element.expanding
+            or element.literal_execute
+            or literal_binds
+            or literal_execute
+        ):
+            return None
+
+        type_ = element.type
+        if (
+            type_._isnull
+            or type_._is_tuple_type
+            or type_._is_array
+            or type_._type_affinity is sqltypes.JSON
+        ):
+            return None
+
+        impl = type_.dialect_impl(self.dialect)
+        if impl._has_bind_expression:
+            return None
+
+        array_type = self._array_in_type(type_, impl)
+        if array_type is None:
+            return None
+
+        array_bind = element._clone(maintain_key=True)
+        array_bind.expanding = False
+        array_bind.type = array_type
+        return array_bind
+
+    def _array_in_type(self, type_, impl):
+        """Return the datatype used to send the values of an IN expression
+        against the given element type as a single array parameter, or
+        None if values of this type can't be sent as an array.
+
+        Dialects that set ``supports_array_in_expansion`` implement this
+        method along with a ``visit_array_in_op_binary()`` method which
+        renders the IN expression given the array parameter.   The default
+        implementation returns None, so that the usual "expanding" parameter
+        is rendered.
+
+        """
+        return None
+
     def visit_empty_set_op_expr(self, type_, expand_op):
         if expand_op is operators.not_in_op:
             if len(type_) > 1:
@@ -2604,6 +2701,26 @@ class SQLCompiler(Compiled):
             kw["literal_execute"] = True
 
         operator_ = override_operator or binary.operator
+
+        if (
+            self.dialect.array_in_expansion
+            and self.dialect.supports_array_in_expansion
+            and (
+                operator_ is operators.in_op
+                or operator_ is operators.not_in_op
+            )
+        ):
+            array_bind = self._array_in_bindparam(binary.right, **kw)
+            if array_bind is not None:
+                return self.visit_array_in_op_binary(
+                    binary,
+                    operator_,
+                    array_bind,
+                    from_linter=from_linter,
+                    lateral_from_linter=lateral_from_linter,
+                    **kw,
+                )
+
         disp = self._get_operator_dispatch(operator_, "binary", None)
         if disp:
             return disp(binary, operator_, **kw)
@@ -4430,11 +4547,34 @@ class SQLCompiler(Compiled):
             }
         )
 
+        use_insertmanyvalues = (
+            toplevel
+            and self.for_executemany
+            and self.dialect.use_insertmanyvalues
+            and self.dialect.insert_executemany_returning
+            and not self._numeric_binds
+        )
+        if use_insertmanyvalues:
+            binds_before_values = set(self.binds)
+            if self.positional:
+                positions_before_values = len(self.positiontup)
+
         crud_params_struct = crud._get_crud_params(
             self, insert_stmt, compile_state, toplevel, **kw
         )
         crud_params_single = crud_params_struct.single_params
 
+        if use_insertmanyvalues:
+            values_bind_names = [
+                name for name in self.binds if name not in binds_before_values
+            ]
+            if self.positional:
+                num_params_per_row = (
+                    len(self.positiontup) - positions_before_values
+                )
+            else:
+                num_params_per_row = len(values_bind_names)
+
         if (
             not crud_params_single
             and not self.dialect.supports_default_values
@@ -4555,10 +4695,150 @@ class SQLCompiler(Compiled):
                 + text
             )
 
+        if use_insertmanyvalues and (
+            self.implicit_returning or insert_stmt._returning
+        ):
+            single_values_expr = self.insert_single_values_expr
+            if insert_stmt._post_values_clause is not None or (
+                self.positional and len(self.positiontup) != num_params_per_row
+            ):
+                # rows would either not line up with parameter sets, or
+                # there are bound parameters outside of the VALUES clause
+                # which we can't interleave positionally; run one row
+                # at a time
+                single_values_expr = None
+
+            escaped_bind_names = self.escaped_bind_names
+            self._insertmanyvalues = _InsertManyValues(
+                single_values_expr,
+                [
+                    escaped_bind_names.get(name, name)
+                    for name in values_bind_names
+                ],
+                num_params_per_row,
+            )
+
         self.stack.pop(-1)
 
         return text
 
+    def _deliver_insertmanyvalues_batches(
+        self,
+        statement: str,
+        parameters: _DBAPIMultiExecuteParams,
+        batch_size: int,
+    ) -> Iterator[Tuple[str, _DBAPISingleExecuteParams, int, int]]:
+        """Given the final statement string and the list of DBAPI parameter
+        sets for an "insertmanyvalues" execution, yield tuples of
+        ``(statement, parameters, batchnum, total_batches)`` each of which
+        is to be invoked using a single ``cursor.execute()``.
+
+        .. versionadded:: 2.0
+
+        """
+        imv = self._insertmanyvalues
+        assert imv is not None
+
+        single_values_expr = imv.single_values_expr
+        if single_values_expr is not None:
+            values_clause = "VALUES (%s)" % single_values_expr
+
+            # guard for statement that was altered via event hook or similar
+            if values_clause not in statement:
+                single_values_expr = None
+
+        if single_values_expr is None:
+            total_batches = len(parameters)
+            for batchnum, param in enumerate(parameters, 1):
+                yield statement, param, batchnum, total_batches
+            return
+
+        statement = statement.replace(
+            values_clause, "VALUES __EXECMANY_TOKEN__", 1
+        )
+
+        if imv.num_params_per_row:
+            batch_size = min(
+                batch_size,
+                self.dialect.insertmanyvalues_max_parameters
+                // imv.num_params_per_row,
+            )
+        batch_size = max(batch_size, 1)
+
+        batches = [
+            parameters[idx : idx + batch_size]
+            for idx in range(0, len(parameters), batch_size)
+        ]
+        total_batches = len(batches)
+
+        if self.positional:
+            row_expr = "(%s)" % single_values_expr
+            execute_sequence_format = self.dialect.execute_sequence_format
+
+            for batchnum, batch in enumerate(batches, 1):
+                yield (
+                    statement.replace(
+                        "__EXECMANY_TOKEN__",
+                        ", ".join([row_expr] * len(batch)),
+                    ),
+                    execute_sequence_format(
+                        itertools.chain.from_iterable(batch)
+                    ),
+                    batchnum,
+                    total_batches,
+                )
+        else:
+            expand_names = set(imv.expand_names)
+            if expand_names:
+                bindtemplate = self.bindtemplate
+                names_re = re.compile(
+                    r"(%s)(?!\w)"
+                    % "|".join(
+                        re.escape(bindtemplate % {"name": name})
+                        for name in sorted(expand_names, key=len, reverse=True)
+                    )
+                )
+                token_to_name = {
+                    bindtemplate % {"name": name}: name
+                    for name in expand_names
+                }
+                row_expr = "(%s)" % names_re.sub(
+                    lambda m: bindtemplate
+                    % {
+                        "name": "%s__EXECMANY_INDEX__"
+                        % token_to_name[m.group(1)]
+                    },
+                    single_values_expr,
+                )
+            else:
+                row_expr = "(%s)" % single_values_expr
+
+            for batchnum, batch in enumerate(batches, 1):
+                batch_parameters = {
+                    key: value
+                    for key, value in batch[0].items()
+                    if key not in expand_names
+                }
+                for idx, param in enumerate(batch):
+                    batch_parameters.update(
+                        ("%s__%d" % (name, idx), param[name])
+                        for name in expand_names
+                    )
+                yield (
+                    statement.replace(
+                        "__EXECMANY_TOKEN__",
+                        ", ".join(
+                            row_expr.replace(
+                                "__EXECMANY_INDEX__", "__%d" % idx
+                            )
+                            for idx in range(len(batch))
+                        ),
+                    ),
+                    batch_parameters,
+                    batchnum,
+                    total_batches,
+                )
+
     def update_limit_clause(self, update_stmt):
         """Provide a hook for MySQL to add LIMIT to the UPDATE"""
         return None
@@ -5289,6 +5289,7 @@ class MetaData(HasSchemaAttr):
         extend_existing: bool = False,
         autoload_replace: bool = True,
         resolve_fks: bool = True,
+        max_workers: Optional[int] = None,
         **dialect_kwargs: Any,
     ) -> None:
         r"""Load all available table definitions from the database.
@@ -5361,6 +5362,27 @@ class MetaData(HasSchemaAttr):
 
             :paramref:`_schema.Table.resolve_fks`
 
+        :param max_workers: when set to a number greater than one, the
+         tables to be reflected are divided into up to this many batches,
+         each of which is reflected in a separate thread using its own
+         connection checked out from the :class:`_engine.Engine`, so that
+         the catalog queries for each batch run concurrently.  The
+         :class:`_schema.Table` objects are then constructed from the
+         combined results in the calling thread, in the same order as
+         when ``max_workers`` is not used, so the :class:`_schema.MetaData`
+         is never accessed by more than one thread.  Requires that ``bind``
+         is an :class:`_engine.Engine`, or an :class:`_reflection.Inspector`
+         against one; the engine's pool should allow ``max_workers``
+         connections to be checked out in addition to the one used by this
+         method.  Ignored for pools that share a single connection, such as
+         those used by default for SQLite ``:memory:`` databases.
+
+         .. versionadded:: 2.0
+
+         .. seealso::
+
+            :ref:`metadata_reflection_concurrent`
+
         :param \**dialect_kwargs: Additional keyword arguments not mentioned
          above are dialect specific, and passed in the form
          ``<dialectname>_<argname>``.  See the documentation regarding an
@@ -5374,7 +5396,8 @@ class MetaData(HasSchemaAttr):
 
         """
 
-        with inspection.inspect(bind)._inspection_context() as insp:
+        bind_insp = inspection.inspect(bind)
+        with bind_insp._inspection_context() as insp:
             reflect_opts: Any = {
                 "autoload_with": insp,
                 "extend_existing": extend_existing,
@@ -5438,16 +5461,26 @@ class MetaData(HasSchemaAttr):
                     for name in only
                     if extend_existing or name not in current
                 ]
-            # pass the available tables so the inspector can
-            # choose to ignore the filter_names
-            _reflect_info = insp._get_reflection_info(
-                schema=schema,
-                filter_names=load,
-                available=available,
-                kind=kind,
-                scope=util.preloaded.engine_reflection.ObjectScope.ANY,
-                **dialect_kwargs,
-            )
+            if max_workers is not None and max_workers > 1:
+                _reflect_info = bind_insp._get_reflection_info_concurrently(
+                    max_workers,
+                    schema=schema,
+                    filter_names=load,
+                    kind=kind,
+                    scope=util.preloaded.engine_reflection.ObjectScope.ANY,
+                    **dialect_kwargs,
+                )
+            else:
+                # pass the available tables so the inspector can
+                # choose to ignore the filter_names
+                _reflect_info = insp._get_reflection_info(
+                    schema=schema,
+                    filter_names=load,
+                    available=available,
+                    kind=kind,
+                    scope=util.preloaded.engine_reflection.ObjectScope.ANY,
+                    **dialect_kwargs,
+                )
             reflect_opts["_reflect_info"] = _reflect_info
 
             for name in load:
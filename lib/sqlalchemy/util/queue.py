@@ -27,9 +27,12 @@ from time import time as _time
 import typing
 from typing import Any
 from typing import Awaitable
+from typing import Callable
 from typing import Deque
 from typing import Generic
+from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import TypeVar
 
 from .concurrency import await_fallback
@@ -83,6 +86,14 @@ class QueueCommon(Generic[_T]):
     def get(self, block: bool = True, timeout: Optional[float] = None) -> _T:
         raise NotImplementedError()
 
+    def get_matching(
+        self, predicate: Callable[[_T], bool], limit: Optional[int] = None
+    ) -> List[_T]:
+        raise NotImplementedError()
+
+    def has_waiters(self) -> bool:
+        raise NotImplementedError()
+
 
 class Queue(QueueCommon[_T]):
     queue: Deque[_T]
@@ -109,6 +120,8 @@ class Queue(QueueCommon[_T]):
         self.not_full = threading.Condition(self.mutex)
         # If this queue uses LIFO or FIFO
         self.use_lifo = use_lifo
+        # number of threads waiting to get
+        self._waiting = 0
 
     def qsize(self) -> int:
         """Return the approximate size of the queue (not reliable!)."""
@@ -189,17 +202,25 @@ class Queue(QueueCommon[_T]):
                 if self._empty():
                     raise Empty
             elif timeout is None:
-                while self._empty():
-                    self.not_empty.wait()
+                self._waiting += 1
+                try:
+                    while self._empty():
+                        self.not_empty.wait()
+                finally:
+                    self._waiting -= 1
             else:
                 if timeout < 0:
                     raise ValueError("'timeout' must be a positive number")
                 endtime = _time() + timeout
-                while self._empty():
-                    remaining = endtime - _time()
-                    if remaining <= 0.0:
-                        raise Empty
-                    self.not_empty.wait(remaining)
+                self._waiting += 1
+                try:
+                    while self._empty():
+                        remaining = endtime - _time()
+                        if remaining <= 0.0:
+                            raise Empty
+                        self.not_empty.wait(remaining)
+                finally:
+                    self._waiting -= 1
             item = self._get()
             self.not_full.notify()
             return item
@@ -213,6 +234,34 @@ class Queue(QueueCommon[_T]):
 
         return self.get(False)
 
+    def get_matching(
+        self, predicate: Callable[[_T], bool], limit: Optional[int] = None
+    ) -> List[_T]:
+        """Remove and return the items for which the given predicate
+        returns True, without blocking, up to the given limit.
+
+        The order of the remaining items is maintained.
+        """
+
+        with self.not_full:
+            matched: List[_T] = []
+            remaining: Deque[_T] = deque()
+            for item in self.queue:
+                if (limit is None or len(matched) < limit) and predicate(item):
+                    matched.append(item)
+                else:
+                    remaining.append(item)
+            if matched:
+                self.queue = remaining
+                self.not_full.notify(len(matched))
+            return matched
+
+    def has_waiters(self) -> bool:
+        """Return True if any thread is waiting to get an item."""
+
+        with self.mutex:
+            return self._waiting > 0
+
     def _init(self, maxsize: int) -> None:
         self.maxsize = maxsize
         self.queue = deque()
@@ -251,6 +300,7 @@ class AsyncAdaptedQueue(QueueCommon[_T]):
     def __init__(self, maxsize: int = 0, use_lifo: bool = False):
         self.use_lifo = use_lifo
         self.maxsize = maxsize
+        self._waiting = 0
 
     def empty(self) -> bool:
         return self._queue.empty()
@@ -308,6 +358,7 @@ class AsyncAdaptedQueue(QueueCommon[_T]):
         if not block:
             return self.get_nowait()
 
+        self._waiting += 1
         try:
             if timeout is not None:
                 return self.await_(
@@ -317,8 +368,190 @@ class AsyncAdaptedQueue(QueueCommon[_T]):
                 return self.await_(self._queue.get())
         except (asyncio.QueueEmpty, asyncio.TimeoutError) as err:
             raise Empty() from err
+        finally:
+            self._waiting -= 1
+
+    def get_matching(
+        self, predicate: Callable[[_T], bool], limit: Optional[int] = None
+    ) -> List[_T]:
+        queue = self._queue
+        items: List[_T] = []
+        while True:
+            try:
+                items.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+        if self.use_lifo:
+            # restore the original order, so that the remaining items are
+            # put back in the same positions
+            items.reverse()
+
+        matched: List[_T] = []
+        for item in items:
+            if (limit is None or len(matched) < limit) and predicate(item):
+                matched.append(item)
+            else:
+                queue.put_nowait(item)
+        return matched
+
+    def has_waiters(self) -> bool:
+        return self._waiting > 0
 
 
 class FallbackAsyncAdaptedQueue(AsyncAdaptedQueue[_T]):
     if not typing.TYPE_CHECKING:
         await_ = staticmethod(await_fallback)
+
+
+class AsyncQueue(QueueCommon[_T]):
+    """A queue used within a single asyncio event loop, which hands items
+    directly to waiting callers in the order in which they began waiting.
+
+    Unlike :class:`.AsyncAdaptedQueue`, an available item is returned
+    without awaiting, and a caller waits for an item by awaiting a single
+    future, rather than a task created by ``asyncio.wait_for()``, with the
+    timeouts of all callers handled by one timer.  As items are handed to
+    waiting callers upon ``put()``, items are only present in the queue
+    when no callers are waiting, so that a caller which didn't wait can't
+    take an item ahead of those which did.
+
+    """
+
+    if typing.TYPE_CHECKING:
+
+        @staticmethod
+        def await_(coroutine: Awaitable[Any]) -> _T:
+            ...
+
+    else:
+        await_ = staticmethod(await_only)
+
+    queue: Deque[_T]
+    _waiters: Deque[Tuple[asyncio.Future[_T], Optional[float]]]
+    _timer: Optional[asyncio.TimerHandle]
+
+    def __init__(self, maxsize: int = 0, use_lifo: bool = False):
+        self.maxsize = maxsize
+        self.use_lifo = use_lifo
+        self.queue = deque()
+        self._waiters = deque()
+        self._timer = None
+
+    def empty(self) -> bool:
+        return not self.queue
+
+    def full(self) -> bool:
+        return self.maxsize > 0 and len(self.queue) >= self.maxsize
+
+    def qsize(self) -> int:
+        return len(self.queue)
+
+    def put_nowait(self, item: _T) -> None:
+        waiters = self._waiters
+        while waiters:
+            waiter, deadline = waiters.popleft()
+            # skip callers which timed out or were cancelled
+            if not waiter.done():
+                waiter.set_result(item)
+                return
+
+        if self.full():
+            raise Full()
+        self.queue.append(item)
+
+    def put(
+        self, item: _T, block: bool = True, timeout: Optional[float] = None
+    ) -> None:
+        # items are only returned to the pool without blocking, so waiting
+        # for the queue to have room isn't supported
+        self.put_nowait(item)
+
+    def get_nowait(self) -> _T:
+        if not self.queue:
+            raise Empty()
+        if self.use_lifo:
+            return self.queue.pop()
+        else:
+            return self.queue.popleft()
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> _T:
+        if self.queue or not block:
+            return self.get_nowait()
+
+        loop = asyncio.get_running_loop()
+        waiter: asyncio.Future[_T] = loop.create_future()
+        if timeout is not None:
+            deadline: Optional[float] = loop.time() + timeout
+            timer = self._timer
+            if timer is None or deadline < timer.when():  # type: ignore
+                if timer is not None:
+                    timer.cancel()
+                self._timer = loop.call_at(
+                    deadline, self._expire_waiters, loop  # type: ignore
+                )
+        else:
+            deadline = None
+        self._waiters.append((waiter, deadline))
+
+        try:
+            return self.await_(waiter)
+        except BaseException:
+            if not waiter.done():
+                waiter.cancel()
+            elif not waiter.cancelled() and waiter.exception() is None:
+                # the caller was cancelled after an item was handed to it;
+                # pass the item on to the next caller
+                self.put_nowait(waiter.result())
+            raise
+
+    def _expire_waiters(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._timer = None
+        now = loop.time()
+        next_deadline: Optional[float] = None
+        waiters: Deque[Tuple[asyncio.Future[_T], Optional[float]]] = deque()
+
+        for waiter, deadline in self._waiters:
+            if waiter.done():
+                continue
+            if deadline is not None:
+                if deadline <= now:
+                    waiter.set_exception(Empty())
+                    continue
+                elif next_deadline is None or deadline < next_deadline:
+                    next_deadline = deadline
+            waiters.append((waiter, deadline))
+
+        self._waiters = waiters
+        if next_deadline is not None:
+            self._timer = loop.call_at(
+                next_deadline, self._expire_waiters, loop
+            )
+
+    def expire_waiter(self) -> None:
+        """Cause the caller which has waited longest for an item, if any,
+        to stop waiting, raising :class:`.Empty`."""
+
+        waiters = self._waiters
+        while waiters:
+            waiter, deadline = waiters.popleft()
+            if not waiter.done():
+                waiter.set_exception(Empty())
+                return
+
+    def get_matching(
+        self, predicate: Callable[[_T], bool], limit: Optional[int] = None
+    ) -> List[_T]:
+        matched: List[_T] = []
+        remaining: Deque[_T] = deque()
+        for item in self.queue:
+            if (limit is None or len(matched) < limit) and predicate(item):
+                matched.append(item)
+            else:
+                remaining.append(item)
+        if matched:
+            self.queue = remaining
+        return matched
+
+    def has_waiters(self) -> bool:
+        return any(not waiter.done() for waiter, deadline in self._waiters)
@@ -42,6 +42,7 @@ if sys.platform == "win32":
 cython_files = [
     "collections.pyx",
     "immutabledict.pyx",
+    "loading.pyx",
     "processors.pyx",
     "resultproxy.pyx",
     "util.pyx",
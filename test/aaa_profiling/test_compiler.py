@@ -1,3 +1,7 @@
+import os
+import shutil
+import tempfile
+
 from sqlalchemy import Column
 from sqlalchemy import Integer
 from sqlalchemy import MetaData
@@ -5,6 +9,8 @@ from sqlalchemy import select
 from sqlalchemy import String
 from sqlalchemy import Table
 from sqlalchemy.engine import default
+from sqlalchemy.ext.compiled_cache import PersistentCompiledCache
+from sqlalchemy.ext.compiled_cache import SQLiteCompiledCacheStore
 from sqlalchemy.sql.selectable import LABEL_STYLE_TABLENAME_PLUS_COL
 from sqlalchemy.testing import AssertsExecutionResults
 from sqlalchemy.testing import fixtures
@@ -105,3 +111,30 @@ class CompileTest(fixtures.TestBase, AssertsExecutionResults):
             s.compile(dialect=self.dialect)
 
         go()
+
+    def test_select_persistent_cache(self):
+        """a statement compiled in a previous process is loaded from the
+        persistent cache rather than being compiled again; compare to
+        test_select"""
+
+        dirname = tempfile.mkdtemp()
+        try:
+            store = SQLiteCompiledCacheStore(os.path.join(dirname, "c.db"))
+            cache = PersistentCompiledCache(store, metadata)
+
+            s = select(t1).where(t1.c.c2 == t2.c.c1)
+            s._compile_w_cache(
+                self.dialect, compiled_cache=cache, column_keys=[]
+            )
+
+            @profiling.function_call_count(variance=0.15, warmup=1)
+            def go():
+                cache.clear()
+                s = select(t1).where(t1.c.c2 == t2.c.c1)
+                s._compile_w_cache(
+                    self.dialect, compiled_cache=cache, column_keys=[]
+                )
+
+            go()
+        finally:
+            shutil.rmtree(dirname)
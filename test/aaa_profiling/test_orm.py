@@ -610,6 +610,93 @@ class QueryTest(NoCache, fixtures.MappedTest):
         go()
 
 
+class LoadManyEntitiesTest(NoCache, fixtures.MappedTest):
+    __requires__ = ("python_profiling_backend",)
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "parent",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("data1", String(20)),
+            Column("data2", String(20)),
+            Column("data3", String(20)),
+            Column("data4", String(20)),
+        )
+        Table(
+            "child",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("parent_id", ForeignKey("parent.id")),
+        )
+
+    @classmethod
+    def setup_classes(cls):
+        class Parent(cls.Basic):
+            pass
+
+        class Child(cls.Basic):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        Parent, Child = cls.classes("Parent", "Child")
+        parent, child = cls.tables("parent", "child")
+
+        cls.mapper_registry.map_imperatively(
+            Parent, parent, properties={"children": relationship(Child)}
+        )
+        cls.mapper_registry.map_imperatively(Child, child)
+
+    @classmethod
+    def insert_data(cls, connection):
+        connection.execute(
+            cls.tables.parent.insert(),
+            [
+                {
+                    "id": i,
+                    "data1": "d1",
+                    "data2": "d2",
+                    "data3": "d3",
+                    "data4": "d4",
+                }
+                for i in range(1, 501)
+            ],
+        )
+
+    def test_load_new_instances(self):
+        Parent = self.classes.Parent
+        sess = fixture_session()
+
+        q = sess.query(Parent)
+        q.all()
+        sess.close()
+
+        @profiling.function_call_count(variance=0.10)
+        def go():
+            for i in range(5):
+                q.all()
+                sess.close()
+
+        go()
+
+    def test_load_present_instances(self):
+        Parent = self.classes.Parent
+        sess = fixture_session()
+
+        q = sess.query(Parent)
+        objs = q.all()
+
+        @profiling.function_call_count(variance=0.10)
+        def go():
+            for i in range(5):
+                q.all()
+
+        go()
+        del objs
+
+
 class SelectInEagerLoadTest(NoCache, fixtures.MappedTest):
     """basic test for selectin() loading, which uses a lambda query.
 
@@ -258,3 +258,53 @@ class TestAsyncAdaptedQueue(fixtures.TestBase):
         t.join()
 
         is_true(run[0])
+
+
+class TestAsyncQueue(fixtures.TestBase):
+    __requires__ = ("greenlet",)
+
+    def test_get_available(self):
+        q = queue.AsyncQueue()
+        q.put_nowait(1)
+
+        # an available item is returned outside of a greenlet
+        eq_(q.get(timeout=0.1), 1)
+
+    @async_test
+    async def test_timeouts(self):
+        q = queue.AsyncQueue()
+        results = []
+
+        async def get(timeout):
+            try:
+                results.append(await greenlet_spawn(q.get, True, timeout))
+            except queue.Empty:
+                results.append("timeout %s" % timeout)
+
+        t1 = asyncio.create_task(get(1))
+        t2 = asyncio.create_task(get(0.05))
+        t3 = asyncio.create_task(get(None))
+        await asyncio.sleep(0.2)
+
+        # the later, shorter timeout expires first
+        eq_(results, ["timeout 0.05"])
+
+        q.put_nowait("a")
+        q.put_nowait("b")
+        await asyncio.gather(t1, t2, t3)
+        eq_(results, ["timeout 0.05", "a", "b"])
+        eq_(q.qsize(), 0)
+
+    @async_test
+    async def test_expire_waiter(self):
+        q = queue.AsyncQueue()
+
+        task = asyncio.create_task(greenlet_spawn(q.get))
+        await asyncio.sleep(0)
+        q.expire_waiter()
+
+        with expect_raises(queue.Empty):
+            await task
+
+        q.put_nowait(1)
+        eq_(q.qsize(), 1)
@@ -1,3 +1,5 @@
+import array
+
 from sqlalchemy import exc
 from sqlalchemy import testing
 from sqlalchemy.engine import result
@@ -226,6 +228,30 @@ class ResultTupleTest(fixtures.TestBase):
             is_true(isinstance(row3, _CyRow))
 
 
+class FuseRowProcessorsTest(fixtures.TestBase):
+    @testing.combinations(
+        ([None, str, None], None, [(1, "2", 3), (4, "5", 6)]),
+        ([str, None, float], None, [("1", 2, 3.0), ("4", 5, 6.0)]),
+        ([None, None, None], None, [(1, 2, 3), (4, 5, 6)]),
+        ([str, None, float], (2, 0), [(3.0, "1"), (6.0, "4")]),
+        ([None, str, None], (1,), [("2",), ("5",)]),
+        argnames="processors, indexes, expected",
+    )
+    def test_fused(self, processors, indexes, expected):
+        data = [(1, 2, 3), (4, 5, 6)]
+
+        converters = result._fuse_row_processors(processors, indexes)
+
+        eq_(converters.make_rows(tuple, data), expected)
+
+        convert_row = converters.make_row_fn(tuple)
+        eq_([convert_row(row) for row in data], expected)
+
+    def test_empty(self):
+        converters = result._fuse_row_processors([])
+        eq_(converters.make_rows(tuple, [(), ()]), [(), ()])
+
+
 class ResultTest(fixtures.TestBase):
     def _fixture(
         self,
@@ -904,6 +930,81 @@ class ResultTest(fixtures.TestBase):
         r2 = frozen().scalars(1).unique()
         eq_(r2.fetchall(), [1, 3])
 
+    @testing.combinations(None, 1, 3, 10, argnames="chunk_size")
+    def test_columns_as_arrays(self, chunk_size):
+        result = self._fixture()
+
+        cols = result.columns_as_arrays(chunk_size=chunk_size)
+        eq_(list(cols), ["a", "b", "c"])
+        eq_(cols["a"], array.array("q", [1, 2, 1, 4]))
+        eq_(cols["b"], array.array("q", [1, 1, 3, 1]))
+        eq_(cols["c"], array.array("q", [1, 2, 2, 2]))
+
+        eq_(result.all(), [])
+
+    def test_columns_as_arrays_mixed_types(self):
+        result = self._fixture(
+            data=[
+                (1, 1.5, "x"),
+                (2, 2.5, None),
+                (None, 3.5, "z"),
+                (4, 5, "q"),
+                (5 << 64, 6.5, "r"),
+            ]
+        )
+
+        cols = result.columns_as_arrays(chunk_size=2)
+        eq_(cols["a"], [1, 2, None, 4, 5 << 64])
+        eq_(cols["b"], [1.5, 2.5, 3.5, 5, 6.5])
+        eq_(cols["c"], ["x", None, "z", "q", "r"])
+
+    def test_columns_as_arrays_overflow(self):
+        result = self._fixture(data=[(1, 1, 1), (5 << 64, 2, 2)])
+
+        cols = result.columns_as_arrays(chunk_size=1)
+        eq_(cols["a"], [1, 5 << 64])
+        eq_(cols["b"], array.array("q", [1, 2]))
+
+    def test_columns_as_arrays_empty(self):
+        result = self._fixture(num_rows=0)
+
+        eq_(result.columns_as_arrays(), {"a": [], "b": [], "c": []})
+
+    def test_columns_as_arrays_columns(self):
+        result = self._fixture().columns("c", "a")
+
+        eq_(
+            result.columns_as_arrays(),
+            {
+                "c": array.array("q", [1, 2, 2, 2]),
+                "a": array.array("q", [1, 2, 1, 4]),
+            },
+        )
+
+    def test_columns_as_arrays_unique(self):
+        result = self._fixture().unique()
+
+        eq_(
+            result.columns_as_arrays(chunk_size=1),
+            {
+                "a": array.array("q", [1, 2, 1, 4]),
+                "b": array.array("q", [1, 1, 3, 1]),
+                "c": array.array("q", [1, 2, 2, 2]),
+            },
+        )
+
+        result = self._fixture().columns("c").unique()
+        eq_(result.columns_as_arrays(), {"c": array.array("q", [1, 2])})
+
+    def test_columns_as_arrays_duplicate_names(self):
+        result = self._fixture().columns("a", "b", "a")
+
+        assert_raises_message(
+            exc.InvalidRequestError,
+            "Result has duplicate column names",
+            result.columns_as_arrays,
+        )
+
 
 class MergeResultTest(fixtures.TestBase):
     @testing.fixture
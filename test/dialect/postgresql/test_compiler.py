@@ -56,6 +56,7 @@ from sqlalchemy.testing import fixtures
 from sqlalchemy.testing.assertions import assert_raises
 from sqlalchemy.testing.assertions import assert_raises_message
 from sqlalchemy.testing.assertions import AssertsCompiledSQL
+from sqlalchemy.testing.assertions import eq_
 from sqlalchemy.testing.assertions import eq_ignore_whitespace
 from sqlalchemy.testing.assertions import expect_warnings
 from sqlalchemy.testing.assertions import is_
@@ -3451,3 +3452,89 @@ class RegexpTest(fixtures.TestBase, testing.AssertsCompiledSQL):
             "SELECT 1 " + exp,
             checkparams=params,
         )
+
+
+class ArrayInExpansionTest(fixtures.TestBase, AssertsCompiledSQL):
+    __dialect__ = PGDialect_psycopg2(array_in_expansion=True)
+
+    def setup_test(self):
+        self.table = table(
+            "mytable", column("myid", Integer), column("name", String)
+        )
+
+    def test_in(self):
+        self.assert_compile(
+            self.table.c.myid.in_([1, 2, 3]),
+            "mytable.myid = ANY (%(myid_1)s::INTEGER[])",
+            checkparams={"myid_1": [1, 2, 3]},
+        )
+
+    def test_not_in(self):
+        self.assert_compile(
+            self.table.c.name.not_in(["a", "b"]),
+            "(mytable.name != ALL (%(name_1)s::VARCHAR[]))",
+            checkparams={"name_1": ["a", "b"]},
+        )
+
+    def test_named_expanding_param(self):
+        stmt = select(self.table.c.myid).where(
+            self.table.c.myid.in_(bindparam("q", expanding=True))
+        )
+        self.assert_compile(
+            stmt,
+            "SELECT mytable.myid FROM mytable "
+            "WHERE mytable.myid = ANY (%(q)s::INTEGER[])",
+            params={"q": (5, 6)},
+            checkparams={"q": (5, 6)},
+        )
+
+        compiled = stmt.compile(dialect=self.__dialect__)
+        eq_(compiled.post_compile_params, frozenset())
+        eq_(compiled._bind_processors["q"]((5, 6)), [5, 6])
+
+    def test_cache_key_params(self):
+        """a statement compiled from the cache receives the list of values
+        from the statement at hand"""
+
+        s1 = select(self.table.c.myid).where(self.table.c.myid.in_([1, 2]))
+        s2 = select(self.table.c.myid).where(self.table.c.myid.in_([3, 4, 5]))
+
+        compiled = s1.compile(
+            dialect=self.__dialect__, cache_key=s1._generate_cache_key()
+        )
+        eq_(
+            compiled.construct_params(
+                extracted_parameters=s2._generate_cache_key()[1]
+            ),
+            {"myid_1": [3, 4, 5]},
+        )
+
+    def test_tuple_not_converted(self):
+        self.assert_compile(
+            tuple_(self.table.c.myid, self.table.c.name).in_([(1, "a")]),
+            "(mytable.myid, mytable.name) IN (__[POSTCOMPILE_param_1])",
+        )
+
+    def test_literal_binds_not_converted(self):
+        self.assert_compile(
+            self.table.c.myid.in_([1, 2]),
+            "mytable.myid IN (1, 2)",
+            literal_binds=True,
+        )
+
+    def test_not_enabled(self):
+        self.assert_compile(
+            self.table.c.myid.in_([1, 2]),
+            "mytable.myid IN (__[POSTCOMPILE_myid_1])",
+            dialect=postgresql.dialect(),
+        )
+
+    def test_unsupported_dialect(self):
+        from sqlalchemy.dialects.mysql import base as mysql
+
+        assert_raises_message(
+            exc.ArgumentError,
+            "Dialect .* does not support array IN expansion",
+            mysql.MySQLDialect,
+            array_in_expansion=True,
+        )
@@ -39,6 +39,8 @@ from sqlalchemy.dialects.sqlite import base as sqlite
 from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.dialects.sqlite import provision
 from sqlalchemy.dialects.sqlite import pysqlite as pysqlite_dialect
+from sqlalchemy.engine import ObjectKind
+from sqlalchemy.engine import ObjectScope
 from sqlalchemy.engine.url import make_url
 from sqlalchemy.schema import CreateTable
 from sqlalchemy.schema import FetchedValue
@@ -57,6 +59,7 @@ from sqlalchemy.testing import expect_warnings
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
 from sqlalchemy.testing import mock
+from sqlalchemy.testing import provision as testing_provision
 from sqlalchemy.types import Boolean
 from sqlalchemy.types import Date
 from sqlalchemy.types import DateTime
@@ -840,6 +843,19 @@ class AttachedDBTest(fixtures.TestBase):
         self.conn.close()
         self.engine.dispose()
 
+    @classmethod
+    def teardown_test_class(cls):
+        # the attached database of a follower is removed when the
+        # follower's databases are dropped; the one attached under the
+        # main ident here isn't otherwise cleaned up
+        if not testing_provision.FOLLOWER_IDENT:
+            path = "%s_%s_test_schema.db" % (
+                config.ident,
+                config.db.driver,
+            )
+            if os.path.exists(path):
+                os.remove(path)
+
     def test_no_tables(self):
         insp = inspect(self.conn)
         eq_(insp.get_table_names("test_schema"), [])
@@ -2742,6 +2758,107 @@ class RegexpTest(fixtures.TestBase, testing.AssertsCompiledSQL):
         )
 
 
+class ArrayInExpansionTest(fixtures.TestBase, AssertsCompiledSQL):
+    __dialect__ = sqlite.dialect(array_in_expansion=True)
+
+    def setup_test(self):
+        self.table = table(
+            "mytable",
+            column("myid", Integer),
+            column("name", String),
+            column("data", sqltypes.LargeBinary),
+        )
+
+    def test_in(self):
+        self.assert_compile(
+            self.table.c.myid.in_([1, 2, 3]),
+            "mytable.myid IN (SELECT value FROM json_each(?))",
+            checkpositional=([1, 2, 3],),
+        )
+
+    def test_not_in(self):
+        self.assert_compile(
+            self.table.c.name.not_in(["a", "b"]),
+            "(mytable.name NOT IN (SELECT value FROM json_each(?)))",
+            checkpositional=(["a", "b"],),
+        )
+
+    def test_bind_processing(self):
+        stmt = select(self.table.c.myid).where(
+            self.table.c.myid.in_(bindparam("q", expanding=True))
+        )
+        compiled = stmt.compile(dialect=self.__dialect__)
+        eq_(compiled.post_compile_params, frozenset())
+
+        processors = compiled._bind_processors
+        eq_(processors["q"]((1, 2, 3)), "[1, 2, 3]")
+        eq_(processors["q"]([]), "[]")
+
+    def test_binary_not_converted(self):
+        self.assert_compile(
+            self.table.c.data.in_([b"x"]),
+            "mytable.data IN (__[POSTCOMPILE_data_1])",
+        )
+
+    def test_tuple_not_converted(self):
+        self.assert_compile(
+            tuple_(self.table.c.myid, self.table.c.name).in_([(1, "a")]),
+            "(mytable.myid, mytable.name) IN (__[POSTCOMPILE_param_1])",
+        )
+
+    def test_literal_binds_not_converted(self):
+        self.assert_compile(
+            self.table.c.myid.in_([1, 2]),
+            "mytable.myid IN (1, 2)",
+            literal_binds=True,
+        )
+
+    @testing.only_on("sqlite")
+    @testing.combinations(
+        (lambda t: t.c.id.in_([1, 3]), [1, 3]),
+        (lambda t: t.c.id.not_in([1, 3]), [2, 4, 5]),
+        (lambda t: t.c.id.in_([]), []),
+        (lambda t: t.c.id.not_in([]), [1, 2, 3, 4, 5]),
+        (lambda t: t.c.name.in_(["n2", "n5", "nx"]), [2, 5]),
+        (
+            lambda t: t.c.created.in_(
+                [datetime.date(2020, 1, 2), datetime.date(2020, 1, 4)]
+            ),
+            [2, 4],
+        ),
+        argnames="criteria, expected",
+    )
+    def test_round_trip(self, metadata, criteria, expected):
+        t = Table(
+            "t",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("name", String(10)),
+            Column("created", Date),
+        )
+        eng = engines.testing_engine(options={"array_in_expansion": True})
+
+        with eng.begin() as conn:
+            metadata.create_all(conn)
+            conn.execute(
+                t.insert(),
+                [
+                    {
+                        "id": i,
+                        "name": "n%d" % i,
+                        "created": datetime.date(2020, 1, i),
+                    }
+                    for i in range(1, 6)
+                ],
+            )
+            eq_(
+                conn.scalars(
+                    select(t.c.id).where(criteria(t)).order_by(t.c.id)
+                ).all(),
+                expected,
+            )
+
+
 class OnConflictTest(AssertsCompiledSQL, fixtures.TablesTest):
 
     __only_on__ = ("sqlite >= 3.24.0",)
@@ -3470,3 +3587,197 @@ class ReflectInternalSchemaTables(fixtures.TablesTest):
             eq_(res, ["sqlitetempview"])
         finally:
             connection.exec_driver_sql("DROP VIEW sqlitetempview")
+
+
+class MultiReflectionTest(fixtures.TablesTest, AssertsExecutionResults):
+    """test the set-based get_multi_*() methods against the per-table
+    methods."""
+
+    __only_on__ = "sqlite"
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "parent",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("name", String(30), unique=True),
+            Column("data", String(50), server_default="x"),
+            sqlite_autoincrement=True,
+        )
+        Table(
+            "child",
+            metadata,
+            Column("id", Integer),
+            Column("pid", ForeignKey("parent.id", ondelete="CASCADE")),
+            Column("x", Integer),
+            Column("y", Integer, Computed("x + 5")),
+            PrimaryKeyConstraint("id", name="child_pk"),
+            UniqueConstraint("pid", "x", name="child_uq"),
+            CheckConstraint("x > 5", name="child_ck"),
+            Index("child_x_idx", "x"),
+        )
+        Table("no_pk", metadata, Column("q", Integer))
+        view = "CREATE VIEW some_view AS SELECT id, name FROM parent"
+        event.listen(metadata, "after_create", DDL(view))
+        event.listen(metadata, "before_drop", DDL("DROP VIEW some_view"))
+
+    @testing.fixture
+    def temp_table(self, connection):
+        connection.exec_driver_sql(
+            "CREATE TEMPORARY TABLE temp_t (id INTEGER PRIMARY KEY, "
+            "tx INTEGER UNIQUE)"
+        )
+        yield
+        connection.exec_driver_sql("DROP TABLE temp_t")
+
+    def _single(self, insp, method, names):
+        return {
+            (None, name): getattr(insp, method)(name, **kw)
+            for name, kw in names
+        }
+
+    def _eq_reflected(self, multi, single):
+        # types don't implement __eq__; compare them by repr
+        def _fixtypes(result):
+            return {
+                key: [
+                    dict(rec, type=repr(rec["type"])) if "type" in rec else rec
+                    for rec in value
+                ]
+                if isinstance(value, list)
+                else value
+                for key, value in result.items()
+            }
+
+        eq_(_fixtypes(multi), _fixtypes(single))
+
+    @combinations(
+        ("columns",),
+        ("pk_constraint",),
+        ("foreign_keys",),
+        ("indexes",),
+        ("unique_constraints",),
+        ("check_constraints",),
+        argnames="method",
+    )
+    @combinations((True,), (False,), argnames="use_kind_any")
+    def test_multi_matches_single(
+        self, connection, temp_table, method, use_kind_any
+    ):
+        insp = inspect(connection)
+        multi_method = "get_multi_%s" % method
+        method = "get_%s" % method
+
+        if use_kind_any:
+            result = getattr(insp, multi_method)(
+                kind=ObjectKind.ANY, scope=ObjectScope.ANY
+            )
+            names = [
+                "child",
+                "no_pk",
+                "parent",
+                "some_view",
+                "temp_t",
+            ]
+        else:
+            result = getattr(insp, multi_method)()
+            names = ["child", "no_pk", "parent"]
+
+        self._eq_reflected(
+            result, self._single(insp, method, [(n, {}) for n in names])
+        )
+
+    def test_multi_include_auto_indexes(self, connection):
+        insp = inspect(connection)
+        result = insp.get_multi_indexes(include_auto_indexes=True)
+        eq_(
+            result,
+            self._single(
+                insp,
+                "get_indexes",
+                [
+                    (name, {"include_auto_indexes": True})
+                    for name in ("child", "no_pk", "parent")
+                ],
+            ),
+        )
+        assert any(
+            idx["name"].startswith("sqlite_autoindex")
+            for idx in result[(None, "parent")]
+        )
+
+    def test_filter_names_as_given(self, connection):
+        """names given with ObjectKind.ANY / ObjectScope.ANY are reflected
+        as given, including internal tables; names that aren't present
+        are skipped."""
+
+        insp = inspect(connection)
+
+        self._eq_reflected(
+            insp.get_multi_columns(
+                filter_names=["sqlite_sequence", "parent"],
+                kind=ObjectKind.ANY,
+                scope=ObjectScope.ANY,
+            ),
+            self._single(
+                insp,
+                "get_columns",
+                [("parent", {}), ("sqlite_sequence", {})],
+            ),
+        )
+        eq_(
+            insp.get_multi_columns(filter_names=["sqlite_sequence"]),
+            {},
+        )
+        eq_(
+            insp.get_multi_columns(
+                filter_names=["nonexistent"],
+                kind=ObjectKind.ANY,
+                scope=ObjectScope.ANY,
+            ),
+            {},
+        )
+
+    def test_statement_count(self, connection):
+        """reflecting all tables uses a fixed number of statements,
+        independent of the number of tables"""
+
+        statements = []
+
+        @event.listens_for(connection, "before_cursor_execute")
+        def go(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        m = MetaData()
+        m.reflect(connection)
+        eq_(set(m.tables), {"parent", "child", "no_pk"})
+        eq_(m.tables["child"].c.pid.references(m.tables["parent"].c.id), True)
+
+        # table and temp table names, the table listing, then one query
+        # each for columns, foreign keys, and indexes, which are shared
+        # with unique constraints.  check constraints are parsed from the
+        # table listing
+        eq_(len(statements), 6, "\n".join(statements))
+
+    def test_fallback_no_pragma_functions(self, connection):
+        """SQLite versions before 3.16 reflect one table at a time"""
+
+        insp = inspect(connection)
+        expected = insp.get_multi_indexes()
+        insp.clear_cache()
+
+        with mock.patch.object(
+            connection.dialect, "_supports_multi_reflection", False
+        ), mock.patch.object(
+            connection.dialect,
+            "get_indexes",
+            wraps=connection.dialect.get_indexes,
+        ) as get_indexes:
+            eq_(insp.get_multi_indexes(), expected)
+
+        eq_(
+            sorted(c[1][1] for c in get_indexes.mock_calls),
+            ["child", "no_pk", "parent"],
+        )
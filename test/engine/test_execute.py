@@ -15,6 +15,7 @@ import weakref
 
 import sqlalchemy as tsa
 from sqlalchemy import bindparam
+from sqlalchemy import cast
 from sqlalchemy import create_engine
 from sqlalchemy import create_mock_engine
 from sqlalchemy import event
@@ -33,6 +34,7 @@ from sqlalchemy import TypeDecorator
 from sqlalchemy import util
 from sqlalchemy import VARCHAR
 from sqlalchemy.engine import BindTyping
+from sqlalchemy.engine import CacheStats
 from sqlalchemy.engine import default
 from sqlalchemy.engine.base import Connection
 from sqlalchemy.engine.base import Engine
@@ -1203,6 +1205,281 @@ class CompiledCacheTest(fixtures.TestBase):
         eq_(conn.scalar(stmt), 1)
 
 
+class WarmCacheTest(fixtures.TestBase):
+    __backend__ = True
+
+    @testing.fixture
+    def warm_fixture(self, metadata, testing_engine):
+        users = Table(
+            "users",
+            metadata,
+            Column("user_id", INT, primary_key=True, autoincrement=False),
+            Column("user_name", VARCHAR(20)),
+        )
+        eng = testing_engine()
+        metadata.create_all(eng)
+        return eng, users
+
+    def test_warm_then_execute(self, warm_fixture):
+        eng, users = warm_fixture
+
+        stmt = select(users).where(users.c.user_id == bindparam("id"))
+        ins = users.insert()
+
+        results = eng.warm_cache(
+            [
+                (stmt, {"id": None}),
+                (ins, {"user_id": 1, "user_name": "u1"}),
+                (ins, [{"user_id": 2, "user_name": "u2"}] * 2),
+            ]
+        )
+        eq_(
+            [(r.statement, r.cache_stats, r.error) for r in results],
+            [
+                (stmt, CacheStats.CACHE_MISS, None),
+                (ins, CacheStats.CACHE_MISS, None),
+                (ins, CacheStats.CACHE_MISS, None),
+            ],
+        )
+        is_true(all(r.cached for r in results))
+
+        with eng.begin() as conn:
+            result = conn.execute(ins, {"user_id": 1, "user_name": "u1"})
+            eq_(result.context.cache_hit, CacheStats.CACHE_HIT)
+
+            result = conn.execute(
+                ins,
+                [
+                    {"user_id": 2, "user_name": "u2"},
+                    {"user_id": 3, "user_name": "u3"},
+                ],
+            )
+            eq_(result.context.cache_hit, CacheStats.CACHE_HIT)
+
+            result = conn.execute(
+                select(users).where(users.c.user_id == bindparam("id")),
+                {"id": 2},
+            )
+            eq_(result.context.cache_hit, CacheStats.CACHE_HIT)
+            eq_(result.all(), [(2, "u2")])
+
+    def test_already_cached(self, warm_fixture):
+        eng, users = warm_fixture
+
+        stmt = select(users).where(users.c.user_id == 5)
+        with eng.connect() as conn:
+            conn.execute(stmt)
+
+        (result,) = eng.warm_cache([stmt])
+        eq_(result.cache_stats, CacheStats.CACHE_HIT)
+        is_true(result.cached)
+
+    def test_no_cache_key(self, warm_fixture):
+        eng, users = warm_fixture
+
+        class MyType(TypeDecorator):
+            impl = Integer
+            cache_ok = False
+
+        stmt = select(users).where(cast(users.c.user_id, MyType()) == 5)
+        (result,) = eng.warm_cache([stmt])
+        eq_(result.cache_stats, CacheStats.NO_CACHE_KEY)
+        is_false(result.cached)
+
+    def test_caching_disabled(self, metadata, testing_engine):
+        users = Table("users", metadata, Column("user_id", INT))
+        eng = testing_engine(options={"query_cache_size": 0})
+
+        (result,) = eng.warm_cache([select(users)])
+        eq_(result.cache_stats, CacheStats.CACHING_DISABLED)
+        is_false(result.cached)
+
+    def test_compiled_cache_option(self, warm_fixture):
+        eng, users = warm_fixture
+
+        cache = {}
+        stmt = select(users)
+        (result,) = eng.warm_cache(
+            [stmt], execution_options={"compiled_cache": cache}
+        )
+        eq_(result.cache_stats, CacheStats.CACHE_MISS)
+        eq_(len(cache), 1)
+
+        with eng.connect() as conn:
+            result = conn.execution_options(compiled_cache=cache).execute(stmt)
+            eq_(result.context.cache_hit, CacheStats.CACHE_HIT)
+
+    def test_error_reported(self, warm_fixture):
+        eng, users = warm_fixture
+
+        stmt = users.update().values({"nonexistent": 5})
+        r1, r2 = eng.warm_cache([stmt, select(users)])
+
+        is_(r1.statement, stmt)
+        is_(r1.cache_stats, None)
+        is_true(isinstance(r1.error, tsa.exc.CompileError))
+        is_false(r1.cached)
+
+        eq_(r2.cache_stats, CacheStats.CACHE_MISS)
+        is_(r2.error, None)
+
+    def test_max_workers(self, warm_fixture):
+        eng, users = warm_fixture
+
+        stmts = [select(users.c.user_id.label("id_%d" % i)) for i in range(10)]
+        results = eng.warm_cache(stmts, max_workers=4)
+        eq_([r.statement for r in results], stmts)
+        eq_(
+            [r.cache_stats for r in results],
+            [CacheStats.CACHE_MISS] * 10,
+        )
+
+
+class QueryCacheStatsTest(fixtures.TestBase):
+    @testing.fixture
+    def stats_fixture(self, metadata, testing_engine):
+        t = Table(
+            "t",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("data", String(50)),
+        )
+        eng = testing_engine(options={"query_cache_stats": True})
+        metadata.create_all(eng)
+        eng.query_cache_stats.reset()
+        return eng, t
+
+    def test_disabled_by_default(self, testing_engine):
+        eng = testing_engine()
+        is_(eng.query_cache_stats, None)
+
+    def test_hits_misses(self, stats_fixture):
+        eng, t = stats_fixture
+        stats = eng.query_cache_stats
+
+        with eng.connect() as conn:
+            for i in range(3):
+                conn.execute(select(t).where(t.c.id == i))
+            conn.execute(select(t.c.data))
+
+        eq_(
+            (stats.hits, stats.misses, stats.uncacheable, stats.compilations),
+            (2, 2, 0, 2),
+        )
+        eq_(stats.hit_ratio, 0.5)
+        eq_(stats.size, 2)
+        is_true(stats.size_bytes > 0)
+        is_true(stats.compile_time > 0)
+
+        stats.reset()
+        eq_((stats.hits, stats.misses, stats.compile_time), (0, 0, 0.0))
+        eq_(stats.most_compiled(), [])
+        eq_(stats.size, 2)
+
+    def test_uncacheable(self, stats_fixture):
+        eng, t = stats_fixture
+        stats = eng.query_cache_stats
+
+        class MyType(TypeDecorator):
+            impl = Integer
+            cache_ok = False
+
+        with eng.connect() as conn:
+            for i in range(3):
+                conn.execute(select(cast(t.c.id, MyType())))
+
+        eq_((stats.hits, stats.misses, stats.uncacheable), (0, 0, 3))
+
+        (entry,) = stats.most_compiled()
+        eq_(entry.statement, "SELECT CAST(t.id AS INTEGER) AS id \nFROM t")
+        eq_(entry.compile_count, 3)
+        is_true(entry.max_compile_time <= entry.total_compile_time)
+
+    def test_evictions_most_compiled(self, metadata, testing_engine):
+        t = Table("t", metadata, Column("id", Integer))
+        eng = testing_engine(
+            options={"query_cache_stats": True, "query_cache_size": 2}
+        )
+        metadata.create_all(eng)
+        stats = eng.query_cache_stats
+        stats.reset()
+
+        stmts = [select(t.c.id.label("c%d" % i)) for i in range(4)]
+        with eng.connect() as conn:
+            for stmt in stmts:
+                conn.execute(stmt)
+            # pruned at four entries back to two
+            eq_(stats.evictions, 2)
+            eq_(stats.size, 2)
+
+            conn.execute(stmts[0])
+
+        eq_(stats.misses, 5)
+        eq_(
+            [(e.statement, e.compile_count) for e in stats.most_compiled(1)],
+            [("SELECT t.id AS c0 \nFROM t", 2)],
+        )
+        eq_(len(stats.most_compiled(None)), 4)
+
+    def test_statement_compiled_event(self, stats_fixture):
+        eng, t = stats_fixture
+
+        canary = Mock()
+        event.listen(eng, "statement_compiled", canary)
+
+        stmt = select(t)
+        with eng.connect() as conn:
+            conn.execute(stmt)
+            conn.execute(stmt)
+
+        eq_(len(canary.mock_calls), 1)
+        conn_, elem, compiled, cache_hit, compile_time = canary.mock_calls[
+            0
+        ].args
+        is_(elem, stmt)
+        eq_(compiled.string, "SELECT t.id, t.data \nFROM t")
+        eq_(cache_hit, CacheStats.CACHE_MISS)
+        is_true(compile_time > 0)
+
+    def test_event_without_stats(self, metadata, testing_engine):
+        t = Table("t", metadata, Column("id", Integer))
+        eng = testing_engine()
+        metadata.create_all(eng)
+
+        canary = Mock()
+        event.listen(eng, "statement_compiled", canary)
+
+        with eng.connect() as conn:
+            conn.execute(select(t.c.id).where(t.c.id == 5))
+
+        eq_(
+            [c.args[3] for c in canary.mock_calls],
+            [CacheStats.CACHE_MISS],
+        )
+
+    def test_warm_cache_recorded(self, stats_fixture):
+        eng, t = stats_fixture
+        stats = eng.query_cache_stats
+
+        canary = Mock()
+        event.listen(eng, "statement_compiled", canary)
+
+        eng.warm_cache([select(t), select(t)])
+        eq_((stats.hits, stats.misses), (1, 1))
+        eq_(len(canary.mock_calls), 1)
+
+    def test_option_engine(self, stats_fixture):
+        eng, t = stats_fixture
+        stats = eng.query_cache_stats
+
+        opt_eng = eng.execution_options(foo="bar")
+        is_(opt_eng.query_cache_stats, stats)
+
+        with opt_eng.connect() as conn:
+            conn.execute(select(t))
+        eq_(stats.misses, 1)
+
+
 class MockStrategyTest(fixtures.TestBase):
     def _engine_fixture(self):
         buf = StringIO()
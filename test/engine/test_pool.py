@@ -1,5 +1,7 @@
+import asyncio
 import collections
 import random
+import sqlite3
 import threading
 import time
 from unittest.mock import ANY
@@ -19,8 +21,10 @@ from sqlalchemy.pool.base import _ConnDialect
 from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_context_ok
 from sqlalchemy.testing import assert_warns_message
+from sqlalchemy.testing import async_test
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import expect_raises
+from sqlalchemy.testing import expect_raises_message
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
 from sqlalchemy.testing import is_none
@@ -31,6 +35,9 @@ from sqlalchemy.testing import mock
 from sqlalchemy.testing.engines import testing_engine
 from sqlalchemy.testing.util import gc_collect
 from sqlalchemy.testing.util import lazy_gc
+from sqlalchemy.util import await_only
+from sqlalchemy.util import greenlet_spawn
+from sqlalchemy.util import queue as sqla_queue
 
 join_timeout = 10
 
@@ -262,6 +269,7 @@ class PoolTest(PoolTestBase):
             "_invoke_creator",
             "_pool",
             "_overflow_lock",
+            "_maintenance_lock",
             "_fairy",
             "_conn",
             "logger",
@@ -281,6 +289,7 @@ class PoolTest(PoolTestBase):
         (pool.QueuePool, False),
         (pool.AsyncAdaptedQueuePool, True),
         (pool.FallbackAsyncAdaptedQueuePool, True),
+        (pool.AsyncQueuePool, True),
         (pool.NullPool, None),
         (pool.SingletonThreadPool, False),
         (pool.StaticPool, None),
@@ -302,6 +311,7 @@ class PoolTest(PoolTestBase):
         (pool.QueuePool, False),
         (pool.AsyncAdaptedQueuePool, True),
         (pool.FallbackAsyncAdaptedQueuePool, True),
+        (pool.AsyncQueuePool, True),
         (pool.NullPool, False),
         (pool.SingletonThreadPool, False),
         (pool.StaticPool, False),
@@ -1913,6 +1923,1083 @@ class ResetOnReturnTest(PoolTestBase):
         assert not dbapi.connect().commit.called
 
 
+class PoolMetricsTest(PoolTestBase):
+    def test_disabled_by_default(self):
+        p = self._queuepool_fixture()
+        is_none(p.metrics)
+
+        c1 = p.connect()
+        c1.close()
+        is_none(p.metrics)
+
+    def test_checkout_counters(self):
+        p = self._queuepool_fixture(
+            pool_size=2, max_overflow=1, timeout=0.1, metrics=True
+        )
+
+        conns = [p.connect() for i in range(3)]
+
+        snapshot = p.metrics.snapshot()
+        eq_(snapshot.checkouts, 3)
+        eq_(snapshot.checked_out, 3)
+        eq_(snapshot.max_checked_out, 3)
+        eq_(snapshot.connects, 3)
+        eq_(snapshot.overflow_created, 1)
+        eq_(snapshot.timeouts, 0)
+
+        assert_raises(tsa.exc.TimeoutError, p.connect)
+
+        for conn in conns:
+            conn.close()
+
+        snapshot = p.metrics.snapshot()
+        eq_(snapshot.checkouts, 3)
+        eq_(snapshot.checked_out, 0)
+        eq_(snapshot.max_checked_out, 3)
+        eq_(snapshot.overflow_discarded, 1)
+        eq_(snapshot.timeouts, 1)
+        eq_(snapshot.checkout_wait.count, 3)
+        eq_(snapshot.connection_age.count, 3)
+
+        c1 = p.connect()
+        c1.close()
+
+        snapshot = p.metrics.snapshot()
+        eq_(snapshot.checkouts, 4)
+        eq_(snapshot.connects, 3)
+        eq_(snapshot.checkout_wait.count, 4)
+
+    def test_invalidate_detach(self):
+        p = self._queuepool_fixture(pool_size=2, metrics=True)
+
+        c1 = p.connect()
+        c1.invalidate()
+
+        c2 = p.connect()
+        c2.invalidate(soft=True)
+        c2.close()
+
+        c3 = p.connect()
+        c3.detach()
+
+        snapshot = p.metrics.snapshot()
+        eq_(snapshot.invalidations, 2)
+        eq_(snapshot.checkouts, 3)
+        eq_(snapshot.checked_out, 0)
+        c3.close()
+
+    def test_pre_ping(self):
+        ping_results = [True, False]
+
+        class PingDialect(_ConnDialect):
+            def do_ping(self, dbapi_connection):
+                return ping_results.pop(0)
+
+        p = self._queuepool_fixture(
+            pool_size=1, pre_ping=True, dialect=PingDialect(), metrics=True
+        )
+
+        # the first checkout uses a new connection, which isn't pinged
+        for i in range(3):
+            c1 = p.connect()
+            c1.close()
+
+        snapshot = p.metrics.snapshot()
+        eq_(snapshot.pings, 2)
+        eq_(snapshot.ping_failures, 1)
+        eq_(snapshot.ping_failure_rate, 0.5)
+        eq_(snapshot.connects, 2)
+        eq_(snapshot.checked_out, 0)
+
+    def test_connection_age(self):
+        p = self._queuepool_fixture(pool_size=1, metrics=True)
+
+        c1 = p.connect()
+        c1.close()
+
+        with mock.patch(
+            "sqlalchemy.pool.base.time.time",
+            return_value=time.time() + 120,
+        ):
+            c1 = p.connect()
+            c1.close()
+
+        age = p.metrics.snapshot().connection_age
+        eq_(age.count, 2)
+        eq_(
+            age.counts[0 : age.bounds.index(300) + 1],
+            (1, 0, 0, 1),
+        )
+
+    def test_metrics_sample_event(self):
+        p = self._queuepool_fixture(metrics=True, metrics_interval=0)
+
+        canary = Mock()
+        event.listen(p, "metrics_sample", canary)
+
+        for i in range(2):
+            c1 = p.connect()
+            c1.close()
+
+        eq_(canary.call_count, 2)
+        pool_arg, snapshot = canary.mock_calls[1][1]
+        is_(pool_arg, p)
+        eq_(snapshot.checkouts, 2)
+
+    @testing.combinations((None,), (60,), argnames="interval")
+    def test_metrics_sample_event_interval(self, interval):
+        p = self._queuepool_fixture(metrics=True, metrics_interval=interval)
+
+        canary = Mock()
+        event.listen(p, "metrics_sample", canary)
+
+        for i in range(2):
+            c1 = p.connect()
+            c1.close()
+
+        eq_(canary.call_count, 0)
+
+    def test_reset(self):
+        p = self._queuepool_fixture(metrics=True)
+
+        c1 = p.connect()
+        c2 = p.connect()
+        c2.close()
+
+        p.metrics.reset()
+        snapshot = p.metrics.snapshot()
+        eq_(snapshot.checkouts, 0)
+        eq_(snapshot.checked_out, 1)
+        eq_(snapshot.max_checked_out, 1)
+        eq_(snapshot.checkout_wait.count, 0)
+
+        c1.close()
+        eq_(p.metrics.snapshot().checked_out, 0)
+
+    @testing.combinations(
+        (pool.QueuePool,),
+        (pool.NullPool,),
+        (pool.SingletonThreadPool,),
+        (pool.StaticPool,),
+        (pool.AssertionPool,),
+    )
+    def test_pool_classes(self, pool_cls):
+        dbapi = MockDBAPI()
+        p = pool_cls(
+            creator=lambda: dbapi.connect("foo.db"),
+            metrics=True,
+            metrics_interval=5,
+        )
+
+        c1 = p.connect()
+        c1.close()
+
+        snapshot = p.metrics.snapshot()
+        eq_(snapshot.checkouts, 1)
+        eq_(snapshot.checked_out, 0)
+        eq_(snapshot.connects, 1)
+
+        p2 = p.recreate()
+        is_not(p2.metrics, p.metrics)
+        eq_(p2.metrics.sample_interval, 5)
+        eq_(p2.metrics.snapshot().checkouts, 0)
+
+    def test_create_engine(self):
+        e = tsa.create_engine(
+            "sqlite://", pool_metrics=True, pool_metrics_interval=10
+        )
+        with e.connect():
+            pass
+
+        eq_(e.pool.metrics.snapshot().checkouts, 1)
+        eq_(e.pool.metrics.sample_interval, 10)
+
+    def test_histogram_percentile(self):
+        metrics = pool.PoolMetrics()
+        for wait in (0.0005, 0.002, 0.002, 0.02, 0.3, 45):
+            metrics._record_checkout(wait, 0)
+
+        wait = metrics.snapshot().checkout_wait
+        eq_(wait.count, 6)
+        eq_(wait.max, 45)
+        eq_(wait.percentile(10), 0.001)
+        eq_(wait.percentile(50), 0.005)
+        eq_(wait.percentile(80), 0.5)
+        eq_(wait.percentile(100), 45)
+
+        empty = pool.PoolMetrics().snapshot().checkout_wait
+        eq_(empty.percentile(99), 0.0)
+        eq_(empty.mean, 0.0)
+
+
+class PoolMaintenanceTest(PoolTestBase):
+    def test_not_enabled_by_default(self):
+        p = self._queuepool_fixture()
+
+        c1 = p.connect()
+        c1.close()
+        is_none(p._maintenance_interval)
+        is_none(p._maintainer)
+
+    def test_min_idle_default_interval(self):
+        p = self._queuepool_fixture(min_idle=2)
+        eq_(p._maintenance_interval, 30)
+
+    def test_min_idle(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=3, max_overflow=5, min_idle=2, maintenance_interval=60
+        )
+
+        p._maintain()
+        eq_(p.checkedin(), 2)
+        eq_(dbapi.connect.call_count, 2)
+
+        c1 = p.connect()
+        c2 = p.connect()
+        p._maintain()
+
+        # only pool_size connections are opened in total
+        eq_(p.checkedin(), 1)
+        eq_(p.checkedout(), 2)
+        eq_(dbapi.connect.call_count, 3)
+
+        c1.close()
+        c2.close()
+        p._maintain()
+        eq_(p.checkedin(), 3)
+        eq_(dbapi.connect.call_count, 3)
+
+    def test_connect_error(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=3, min_idle=2, maintenance_interval=60
+        )
+
+        dbapi.shutdown(True)
+        p._maintain()
+        eq_(p.checkedin(), 0)
+        eq_(p.overflow(), -3)
+
+        dbapi.shutdown(False)
+        p._maintain()
+        eq_(p.checkedin(), 2)
+
+    def test_recycle(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=2, recycle=10, maintenance_interval=5
+        )
+
+        c1 = p.connect()
+        conn = c1.dbapi_connection
+        c1.close()
+
+        p._maintain()
+        eq_(dbapi.connect.call_count, 1)
+
+        # the connection would exceed the recycle time before the next run
+        with mock.patch(
+            "sqlalchemy.pool.base.time.time", return_value=time.time() + 6
+        ):
+            p._maintain()
+
+        eq_(dbapi.connect.call_count, 2)
+        eq_(conn.close.call_count, 1)
+        eq_(p.checkedin(), 1)
+
+        c1 = p.connect()
+        is_not(c1.dbapi_connection, conn)
+        c1.close()
+
+    def test_invalidated(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=2, maintenance_interval=60
+        )
+
+        c1 = p.connect()
+        c1.invalidate(soft=True)
+        c1.close()
+
+        p._maintain()
+        eq_(dbapi.connect.call_count, 2)
+        eq_(p.checkedin(), 1)
+
+    def _ping_fixture(self, ping_results):
+        class PingDialect(_ConnDialect):
+            def do_ping(self, dbapi_connection):
+                pings.append(dbapi_connection)
+                return ping_results.pop(0)
+
+        pings = []
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=2,
+            pre_ping=True,
+            dialect=PingDialect(),
+            maintenance_interval=5,
+        )
+        return dbapi, p, pings
+
+    def test_ping(self):
+        dbapi, p, pings = self._ping_fixture([True])
+
+        c1 = p.connect()
+        c1.close()
+
+        # a new connection isn't pinged
+        p._maintain()
+        eq_(len(pings), 0)
+
+        with mock.patch(
+            "sqlalchemy.pool.base.time.time", return_value=time.time() + 6
+        ):
+            p._maintain()
+            eq_(len(pings), 1)
+
+            # pinged by maintenance; checkout doesn't ping again
+            c1 = p.connect()
+            c1.close()
+            eq_(len(pings), 1)
+
+    def test_ping_failure(self):
+        dbapi, p, pings = self._ping_fixture([False])
+
+        c1 = p.connect()
+        conn = c1.dbapi_connection
+        c1.close()
+
+        with mock.patch(
+            "sqlalchemy.pool.base.time.time", return_value=time.time() + 6
+        ):
+            p._maintain()
+
+        eq_(len(pings), 1)
+        eq_(conn.close.call_count, 1)
+        eq_(dbapi.connect.call_count, 2)
+        eq_(p.checkedin(), 1)
+
+        c1 = p.connect()
+        is_not(c1.dbapi_connection, conn)
+        c1.close()
+
+    def test_ping_one_at_a_time(self):
+        class PingDialect(_ConnDialect):
+            def do_ping(self, dbapi_connection):
+                checkedin.append(p.checkedin())
+                return True
+
+        checkedin = []
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=3,
+            max_overflow=0,
+            pre_ping=True,
+            dialect=PingDialect(),
+            maintenance_interval=5,
+        )
+        conns = [p.connect() for i in range(3)]
+        for c in conns:
+            c.close()
+
+        with mock.patch(
+            "sqlalchemy.pool.base.time.time", return_value=time.time() + 6
+        ):
+            p._maintain()
+
+        # the other connections remain available during each ping
+        eq_(checkedin, [2, 2, 2])
+        eq_(p.checkedin(), 3)
+
+    def test_skipped_while_waiting(self):
+        dbapi, p, pings = self._ping_fixture([True, True])
+
+        c1 = p.connect()
+        c1.close()
+
+        with mock.patch(
+            "sqlalchemy.pool.base.time.time", return_value=time.time() + 6
+        ):
+            with mock.patch.object(p._pool, "has_waiters", return_value=True):
+                p._maintain()
+            eq_(len(pings), 0)
+
+            p._maintain()
+            eq_(len(pings), 1)
+
+    @testing.requires.threading_with_mock
+    def test_started_once(self):
+        p = self._queuepool_fixture(pool_size=3, maintenance_interval=60)
+
+        threads = [
+            threading.Thread(target=p._start_maintenance) for i in range(5)
+        ]
+        with mock.patch(
+            "sqlalchemy.pool.impl.threading.Thread", wraps=threading.Thread
+        ) as thread_cls:
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join(join_timeout)
+
+        eq_(thread_cls.call_count, 1)
+        p.dispose()
+
+    def test_idle_timeout_default_interval(self):
+        p = self._queuepool_fixture(idle_timeout=300)
+        eq_(p._maintenance_interval, 30)
+
+        p = self._queuepool_fixture(idle_timeout=10)
+        eq_(p._maintenance_interval, 10)
+
+    def _idle_fixture(self, **kw):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=4, use_lifo=True, idle_timeout=60, **kw
+        )
+        canary = Mock()
+        event.listen(p, "shrink", canary.shrink)
+        event.listen(p, "close", canary.close)
+
+        conns = [p.connect() for i in range(4)]
+        dbapi_conns = [c.dbapi_connection for c in conns]
+        for c in conns:
+            c.close()
+        return dbapi, p, dbapi_conns, canary
+
+    def test_idle_timeout(self):
+        dbapi, p, dbapi_conns, canary = self._idle_fixture()
+
+        p._maintain()
+        eq_(p.checkedin(), 4)
+        eq_(canary.mock_calls, [])
+
+        with mock.patch(
+            "sqlalchemy.pool.base.time.time", return_value=time.time() + 30
+        ):
+            # the most recently returned connection remains in use
+            c1 = p.connect()
+            is_(c1.dbapi_connection, dbapi_conns[3])
+            c1.close()
+
+        with mock.patch(
+            "sqlalchemy.pool.base.time.time", return_value=time.time() + 70
+        ):
+            p._maintain()
+
+        # least recently returned connections are closed first
+        eq_(
+            canary.mock_calls,
+            [
+                call.shrink(dbapi_conns[0], ANY),
+                call.close(dbapi_conns[0], ANY),
+                call.shrink(dbapi_conns[1], ANY),
+                call.close(dbapi_conns[1], ANY),
+                call.shrink(dbapi_conns[2], ANY),
+                call.close(dbapi_conns[2], ANY),
+            ],
+        )
+        eq_([conn.close.call_count for conn in dbapi_conns], [1, 1, 1, 0])
+        eq_(p.checkedin(), 1)
+        eq_(p.overflow(), -3)
+
+        # the pool grows again as needed
+        conns = [p.connect() for i in range(4)]
+        eq_(dbapi.connect.call_count, 7)
+        eq_(p.checkedout(), 4)
+        for c in conns:
+            c.close()
+
+    def test_idle_timeout_min_idle(self):
+        dbapi, p, dbapi_conns, canary = self._idle_fixture(min_idle=3)
+
+        with mock.patch(
+            "sqlalchemy.pool.base.time.time", return_value=time.time() + 70
+        ):
+            p._maintain()
+
+        # only the least recently returned connection is closed
+        eq_(canary.shrink.mock_calls, [call(dbapi_conns[0], ANY)])
+        eq_(p.checkedin(), 3)
+        eq_(dbapi.connect.call_count, 4)
+
+    def test_idle_timeout_metrics(self):
+        dbapi, p, dbapi_conns, canary = self._idle_fixture(metrics=True)
+
+        with mock.patch(
+            "sqlalchemy.pool.base.time.time", return_value=time.time() + 70
+        ):
+            p._maintain()
+
+        eq_(p.metrics.snapshot().idle_closed, 4)
+        eq_(p.checkedin(), 0)
+
+    @testing.requires.threading_with_mock
+    def test_thread(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=3, min_idle=2, maintenance_interval=0.05
+        )
+        is_none(p._maintainer)
+
+        c1 = p.connect()
+        maintainer = p._maintainer
+        is_true(maintainer.is_alive())
+
+        for i in range(100):
+            if p.checkedin() == 2:
+                break
+            time.sleep(0.02)
+        eq_(p.checkedin(), 2)
+        c1.close()
+
+        p.dispose()
+        maintainer.join(join_timeout)
+        is_true(not maintainer.is_alive())
+        is_none(p._maintainer)
+
+    @testing.requires.greenlet
+    @async_test
+    async def test_asyncio(self):
+        class PingDialect(_AsyncConnDialect):
+            def do_ping(self, dbapi_connection):
+                cursor = dbapi_connection.cursor()
+                cursor.execute("select 1")
+                cursor.close()
+                pings.append(dbapi_connection)
+                return True
+
+        pings = []
+        p = pool.AsyncAdaptedQueuePool(
+            creator=lambda: sqlite3.connect(":memory:"),
+            pool_size=3,
+            min_idle=2,
+            pre_ping=True,
+            dialect=PingDialect(),
+            maintenance_interval=0.05,
+        )
+        is_none(p._maintainer)
+
+        c1 = await greenlet_spawn(p.connect)
+        maintainer = p._maintainer
+        assert isinstance(maintainer, asyncio.Task)
+
+        for i in range(100):
+            if p.checkedin() == 2 and pings:
+                break
+            await asyncio.sleep(0.02)
+        eq_(p.checkedin(), 2)
+        is_true(pings)
+
+        await greenlet_spawn(c1.close)
+        await greenlet_spawn(p.dispose)
+        await asyncio.sleep(0)
+        is_true(maintainer.done())
+        is_none(p._maintainer)
+
+    @testing.combinations(
+        (sqla_queue.Queue,),
+        (sqla_queue.AsyncAdaptedQueue,),
+        (sqla_queue.AsyncQueue,),
+        argnames="queue_cls",
+    )
+    @testing.combinations((True,), (False,), argnames="use_lifo")
+    def test_queue_get_matching(self, queue_cls, use_lifo):
+        q = queue_cls(10, use_lifo=use_lifo)
+        for i in range(6):
+            q.put_nowait(i)
+
+        eq_(q.get_matching(lambda i: i % 2), [1, 3, 5])
+        eq_(q.get_matching(lambda i: i > 10), [])
+        eq_(q.qsize(), 3)
+        eq_(q.get_matching(lambda i: True, 1), [0])
+
+        eq_(
+            [q.get_nowait() for i in range(2)],
+            [4, 2] if use_lifo else [2, 4],
+        )
+        is_true(not q.has_waiters())
+
+    def test_recreate(self):
+        p = self._queuepool_fixture(
+            min_idle=2, maintenance_interval=10, idle_timeout=60
+        )
+
+        p2 = p.recreate()
+        eq_(p2._min_idle, 2)
+        eq_(p2._maintenance_interval, 10)
+        eq_(p2._idle_timeout, 60)
+
+    def test_create_engine(self):
+        e = tsa.create_engine(
+            "sqlite:///file.db",
+            poolclass=pool.QueuePool,
+            pool_min_idle=2,
+            pool_maintenance_interval=10,
+            pool_idle_timeout=60,
+        )
+        eq_(e.pool._min_idle, 2)
+        eq_(e.pool._maintenance_interval, 10)
+        eq_(e.pool._idle_timeout, 60)
+
+
+class AsyncQueuePoolTest(PoolTestBase):
+    __requires__ = ("greenlet",)
+
+    def _pool_fixture(self, **kw):
+        dbapi = MockDBAPI()
+        p = pool.AsyncQueuePool(creator=lambda: dbapi.connect("foo.db"), **kw)
+        return dbapi, p
+
+    async def _checkout(self, p):
+        return await greenlet_spawn(p.connect)
+
+    def test_checkout_no_await(self):
+        dbapi, p = self._pool_fixture(pool_size=2, max_overflow=0)
+
+        # connections which are available, or are opened without the
+        # driver awaiting, are checked out outside of a greenlet
+        c1 = p.connect()
+        c2 = p.connect()
+        dbapi_conn = c1.dbapi_connection
+        c1.close()
+        c3 = p.connect()
+        is_(c3.dbapi_connection, dbapi_conn)
+        eq_(p.checkedout(), 2)
+        c2.close()
+        c3.close()
+
+    @async_test
+    async def test_waiters_served_in_order(self):
+        dbapi, p = self._pool_fixture(pool_size=1, max_overflow=1)
+
+        c1 = await self._checkout(p)
+        c2 = await self._checkout(p)
+
+        served = []
+
+        async def waiter(n):
+            conn = await greenlet_spawn(p.connect)
+            served.append(n)
+            await greenlet_spawn(conn.close)
+
+        tasks = []
+        for i in range(5):
+            tasks.append(asyncio.create_task(waiter(i)))
+            await asyncio.sleep(0)
+
+        await greenlet_spawn(c2.close)
+        await greenlet_spawn(c1.close)
+        await asyncio.gather(*tasks)
+
+        eq_(served, [0, 1, 2, 3, 4])
+        eq_(dbapi.connect.call_count, 2)
+        eq_(p.checkedin(), 1)
+
+    @async_test
+    async def test_timeout(self):
+        dbapi, p = self._pool_fixture(
+            pool_size=1, max_overflow=0, timeout=0.05, metrics=True
+        )
+
+        c1 = await self._checkout(p)
+        with expect_raises_message(tsa.exc.TimeoutError, "QueuePool limit"):
+            await greenlet_spawn(p.connect)
+
+        eq_(p.metrics.snapshot().timeouts, 1)
+
+        # the expired caller doesn't receive the connection
+        await greenlet_spawn(c1.close)
+        eq_(p.checkedin(), 1)
+
+    @async_test
+    async def test_cancelled_waiter(self):
+        dbapi, p = self._pool_fixture(pool_size=1, max_overflow=0)
+
+        c1 = await self._checkout(p)
+        dbapi_conn = c1.dbapi_connection
+        t1 = asyncio.create_task(self._checkout(p))
+        t2 = asyncio.create_task(self._checkout(p))
+        await asyncio.sleep(0)
+
+        # the connection is handed to the first caller, which is then
+        # cancelled before it resumes; the connection goes to the next
+        await greenlet_spawn(c1.close)
+        t1.cancel()
+        c2 = await t2
+
+        is_(c2.dbapi_connection, dbapi_conn)
+        with expect_raises(asyncio.CancelledError):
+            await t1
+        eq_(p.checkedout(), 1)
+        await greenlet_spawn(c2.close)
+
+    @async_test
+    async def test_connect_error_releases_waiter(self):
+        dbapi, p = self._pool_fixture(pool_size=1, max_overflow=1)
+
+        c1 = await self._checkout(p)
+
+        # pause the second connection attempt, so that another caller
+        # waits while the pool is at its limit
+        connect_started = asyncio.Event()
+        fail_connect = asyncio.Event()
+
+        def creator():
+            connect_started.set()
+            await_only(fail_connect.wait())
+            raise Exception("connect failed")
+
+        p._creator = creator
+
+        t1 = asyncio.create_task(self._checkout(p))
+        await connect_started.wait()
+
+        p._creator = lambda: dbapi.connect("foo.db")
+        t2 = asyncio.create_task(self._checkout(p))
+        await asyncio.sleep(0)
+        eq_(p.overflow(), 1)
+
+        fail_connect.set()
+        with expect_raises_message(Exception, "connect failed"):
+            await t1
+
+        # the waiting caller opens a new connection in place of the one
+        # that failed
+        c2 = await t2
+        is_not(c2.dbapi_connection, c1.dbapi_connection)
+        eq_(p.checkedout(), 2)
+
+        await greenlet_spawn(c1.close)
+        await greenlet_spawn(c2.close)
+
+    @async_test
+    async def test_concurrent_checkouts(self):
+        dbapi, p = self._pool_fixture(pool_size=5, max_overflow=5)
+
+        async def worker():
+            for i in range(10):
+                conn = await greenlet_spawn(p.connect)
+                await asyncio.sleep(0)
+                await greenlet_spawn(conn.close)
+
+        await asyncio.gather(*[worker() for i in range(100)])
+
+        eq_(p.checkedout(), 0)
+        eq_(p.checkedin(), 5)
+        assert dbapi.connect.call_count <= 10
+
+    @async_test
+    async def test_maintenance(self):
+        dbapi, p = self._pool_fixture(
+            pool_size=3, min_idle=2, maintenance_interval=0.01
+        )
+
+        c1 = await self._checkout(p)
+        maintainer = p._maintainer
+        is_true(isinstance(maintainer, asyncio.Task))
+
+        for i in range(100):
+            if p.checkedin() == 2:
+                break
+            await asyncio.sleep(0.01)
+        eq_(p.checkedin(), 2)
+
+        await greenlet_spawn(c1.close)
+        await greenlet_spawn(p.dispose)
+        with expect_raises(asyncio.CancelledError):
+            await maintainer
+        is_none(p._maintainer)
+
+    def test_budget(self):
+        budget = pool.ConnectionBudget(1)
+        d1, p1 = self._pool_fixture(pool_size=2, budget=budget, timeout=10)
+        d2, p2 = self._pool_fixture(pool_size=2, budget=budget, timeout=10)
+
+        c1 = p1.connect()
+        dbapi_conn = c1.dbapi_connection
+
+        # asyncio pools don't wait for the budget
+        with expect_raises_message(
+            tsa.exc.TimeoutError, "Connection budget of 1 connections reached"
+        ):
+            p2.connect()
+        eq_(p2.overflow(), -2)
+
+        c1.close()
+        c2 = p2.connect()
+        eq_(dbapi_conn.close.call_count, 1)
+        eq_(p1.checkedin(), 0)
+        eq_(budget.open_connections(), 1)
+        c2.close()
+
+
+class ConnectionBudgetTest(PoolTestBase):
+    def _budget_fixture(self, max_connections, npools=2, **kw):
+        budget = pool.ConnectionBudget(max_connections)
+        canary = Mock()
+        pools = []
+        for i in range(npools):
+            dbapi, p = self._queuepool_dbapi_fixture(
+                pool_size=3, max_overflow=2, budget=budget, **kw
+            )
+            event.listen(p, "shrink", getattr(canary, "shrink%d" % i))
+            pools.append((dbapi, p))
+        return budget, canary, pools
+
+    def test_within_budget(self):
+        budget, canary, [(d1, p1), (d2, p2)] = self._budget_fixture(4)
+
+        conns = [p1.connect(), p1.connect(), p2.connect()]
+        eq_(budget.open_connections(), 3)
+        eq_(budget.idle_connections(), 0)
+
+        for c in conns:
+            c.close()
+        eq_(budget.open_connections(), 3)
+        eq_(budget.idle_connections(), 3)
+
+        # connections which are idle in the pool are used first
+        c1 = p1.connect()
+        eq_(d1.connect.call_count, 2)
+        eq_(budget.idle_connections(), 2)
+        c1.close()
+        eq_(canary.mock_calls, [])
+
+    def test_evict_least_recently_used(self):
+        budget, canary, [(d1, p1), (d2, p2)] = self._budget_fixture(3)
+
+        c1, c2 = p1.connect(), p1.connect()
+        c3 = p2.connect()
+        dbapi_conns = [c1.dbapi_connection, c2.dbapi_connection]
+
+        c2.close()
+        c3.close()
+        c1.close()
+        eq_(budget.open_connections(), 3)
+
+        # p2 needs two connections; one is idle in p2, the second
+        # replaces the idle connection returned least recently, that of p1
+        c4, c5 = p2.connect(), p2.connect()
+        eq_(canary.mock_calls, [call.shrink0(dbapi_conns[1], ANY)])
+        eq_(dbapi_conns[1].close.call_count, 1)
+        eq_(d2.connect.call_count, 2)
+        eq_(p1.checkedin(), 1)
+        eq_(p1.checkedout(), 0)
+        eq_(budget.open_connections(), 3)
+
+        c6 = p2.connect()
+        eq_(
+            canary.mock_calls,
+            [
+                call.shrink0(dbapi_conns[1], ANY),
+                call.shrink0(dbapi_conns[0], ANY),
+            ],
+        )
+        eq_(p1.checkedin(), 0)
+        eq_(p2.checkedout(), 3)
+
+        for c in (c4, c5, c6):
+            c.close()
+        eq_(budget.open_connections(), 3)
+
+    def test_timeout(self):
+        budget, canary, [(d1, p1), (d2, p2)] = self._budget_fixture(
+            1, timeout=0.05, metrics=True
+        )
+
+        c1 = p1.connect()
+        with expect_raises_message(
+            tsa.exc.TimeoutError, "Connection budget of 1 connections reached"
+        ):
+            p2.connect()
+
+        eq_(p2.metrics.snapshot().timeouts, 1)
+        eq_(p2.overflow(), -3)
+        eq_(budget.open_connections(), 1)
+        c1.close()
+
+    @testing.requires.threading_with_mock
+    def test_wait_for_idle(self):
+        budget, canary, [(d1, p1), (d2, p2)] = self._budget_fixture(1)
+
+        c1 = p1.connect()
+        dbapi_conn = c1.dbapi_connection
+        results = []
+
+        def go(p):
+            conn = p.connect()
+            results.append(conn.dbapi_connection)
+            conn.close()
+
+        t = threading.Thread(target=go, args=(p2,))
+        t.start()
+        time.sleep(0.1)
+        eq_(results, [])
+
+        # the returned connection is closed for use by p2
+        c1.close()
+        t.join(join_timeout)
+        eq_(len(results), 1)
+        is_not(results[0], dbapi_conn)
+        eq_(canary.mock_calls, [call.shrink0(dbapi_conn, ANY)])
+        eq_(budget.open_connections(), 1)
+
+    @testing.requires.threading_with_mock
+    def test_wait_reuses_own_connection(self):
+        budget, canary, [(d1, p1), (d2, p2)] = self._budget_fixture(1)
+
+        c1 = p1.connect()
+        dbapi_conn = c1.dbapi_connection
+        results = []
+
+        def go():
+            conn = p1.connect()
+            results.append(conn.dbapi_connection)
+            conn.close()
+
+        t = threading.Thread(target=go)
+        t.start()
+        time.sleep(0.1)
+
+        # the connection returned to the same pool is used, rather than
+        # being replaced
+        c1.close()
+        t.join(join_timeout)
+        eq_(results, [dbapi_conn])
+        eq_(d1.connect.call_count, 1)
+        eq_(canary.mock_calls, [])
+        eq_(p1.checkedin(), 1)
+        eq_(p1.overflow(), -2)
+
+    def test_prefer_own_idle_connection(self):
+        budget, canary, [(d1, p1), (d2, p2)] = self._budget_fixture(2)
+
+        c1, c2 = p1.connect(), p2.connect()
+        dbapi_conn = c1.dbapi_connection
+        c2.close()
+        c1.close()
+
+        # as when a pool waiting for the budget is woken by a connection
+        # returned to it, its own connection is used although that of p2
+        # was returned less recently
+        rec = budget._acquire(p1, 0)
+        is_(rec.dbapi_connection, dbapi_conn)
+        eq_(canary.mock_calls, [])
+        eq_(p1.checkedin(), 0)
+        eq_(p2.checkedin(), 1)
+        eq_(budget.idle_connections(), 1)
+
+        p1._do_return_conn(rec)
+        eq_(budget.idle_connections(), 2)
+
+    def test_dispose(self):
+        budget, canary, [(d1, p1), (d2, p2)] = self._budget_fixture(3)
+
+        c1, c2 = p1.connect(), p1.connect()
+        dbapi_conn = c1.dbapi_connection
+        c2.close()
+        p1.dispose()
+        eq_(budget.open_connections(), 1)
+        eq_(budget.idle_connections(), 0)
+
+        # the connection returned to the disposed pool is closed, and
+        # the budget doesn't refer to the pool
+        c1.close()
+        eq_(dbapi_conn.close.call_count, 1)
+        eq_(p1.checkedin(), 0)
+        eq_(budget.open_connections(), 0)
+        eq_(budget.idle_connections(), 0)
+
+        p1_ref = weakref.ref(p1)
+        del p1, c1, c2
+        gc_collect()
+        is_none(p1_ref())
+
+    def test_use_after_dispose(self):
+        budget, canary, [(d1, p1), (d2, p2)] = self._budget_fixture(3)
+
+        c1 = p1.connect()
+        c1.close()
+        p1.dispose()
+
+        # a pool used again after dispose keeps its connections
+        c1 = p1.connect()
+        c1.close()
+        eq_(p1.checkedin(), 1)
+        eq_(budget.open_connections(), 1)
+        eq_(budget.idle_connections(), 1)
+
+    def test_release_on_close(self):
+        budget, canary, [(d1, p1), (d2, p2)] = self._budget_fixture(10)
+
+        conns = [p1.connect() for i in range(5)]
+        eq_(budget.open_connections(), 5)
+
+        # overflow connections are closed on return
+        for c in conns:
+            c.close()
+        eq_(budget.open_connections(), 3)
+        eq_(budget.idle_connections(), 3)
+
+        p1.dispose()
+        eq_(budget.open_connections(), 0)
+        eq_(budget.idle_connections(), 0)
+
+    def test_release_on_connect_error(self):
+        budget, canary, [(d1, p1), (d2, p2)] = self._budget_fixture(2)
+
+        d1.shutdown(True)
+        assert_raises(Exception, p1.connect)
+        eq_(budget.open_connections(), 0)
+        eq_(p1.overflow(), -3)
+
+    def test_release_on_idle_timeout(self):
+        budget, canary, [(d1, p1), (d2, p2)] = self._budget_fixture(
+            4, idle_timeout=60
+        )
+
+        c1, c2 = p1.connect(), p1.connect()
+        c1.close()
+        c2.close()
+        eq_(budget.idle_connections(), 2)
+
+        with mock.patch(
+            "sqlalchemy.pool.base.time.time", return_value=time.time() + 70
+        ):
+            p1._maintain()
+
+        eq_(budget.open_connections(), 0)
+        eq_(budget.idle_connections(), 0)
+
+    def test_min_idle_within_budget(self):
+        budget, canary, [(d1, p1), (d2, p2)] = self._budget_fixture(3)
+        p3 = self._queuepool_fixture(
+            pool_size=3, min_idle=2, maintenance_interval=60, budget=budget
+        )
+        event.listen(p3, "shrink", canary.shrink2)
+
+        c1, c2 = p1.connect(), p2.connect()
+        p3._maintain()
+        eq_(p3.checkedin(), 1)
+
+        # maintenance doesn't close the idle connections of other pools
+        c1.close()
+        p3._maintain()
+        eq_(p3.checkedin(), 1)
+        eq_(p1.checkedin(), 1)
+        eq_(budget.open_connections(), 3)
+        eq_(canary.mock_calls, [])
+        c2.close()
+
+    def test_recreate(self):
+        budget = pool.ConnectionBudget(5)
+        p = self._queuepool_fixture(budget=budget)
+
+        p2 = p.recreate()
+        is_(p2._budget, budget)
+
+    def test_create_engine(self):
+        budget = pool.ConnectionBudget(5)
+        e = tsa.create_engine(
+            "sqlite:///file.db", poolclass=pool.QueuePool, pool_budget=budget
+        )
+        is_(e.pool._budget, budget)
+
+
 class SingletonThreadPoolTest(PoolTestBase):
     @testing.requires.threading_with_mock
     def test_cleanup(self):
@@ -1,3 +1,6 @@
+import os
+import shutil
+import tempfile
 import unicodedata
 
 import sqlalchemy as sa
@@ -12,6 +15,7 @@ from sqlalchemy import Index
 from sqlalchemy import inspect
 from sqlalchemy import Integer
 from sqlalchemy import MetaData
+from sqlalchemy import pool
 from sqlalchemy import schema
 from sqlalchemy import select
 from sqlalchemy import sql
@@ -24,6 +28,7 @@ from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import AssertsCompiledSQL
 from sqlalchemy.testing import ComparesTables
 from sqlalchemy.testing import config
+from sqlalchemy.testing import engines
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import eq_regex
 from sqlalchemy.testing import expect_raises_message
@@ -36,6 +41,7 @@ from sqlalchemy.testing import is_instance_of
 from sqlalchemy.testing import is_not
 from sqlalchemy.testing import is_true
 from sqlalchemy.testing import mock
+from sqlalchemy.testing import ne_
 from sqlalchemy.testing import not_in
 from sqlalchemy.testing import skip
 from sqlalchemy.testing.schema import Column
@@ -2410,3 +2416,310 @@ class IncludeColsFksTest(AssertsCompiledSQL, fixtures.TestBase):
             "SELECT b_1.x, b_1.q, b_1.p, b_1.r, b_1.s, b_1.t "
             "FROM b AS b_1 JOIN a ON a.x = b_1.r",
         )
+
+
+class PersistentCacheTest(fixtures.TablesTest):
+    __only_on__ = ("sqlite", "postgresql")
+    __backend__ = True
+
+    run_create_tables = "each"
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "parent",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("name", String(30), unique=True),
+        )
+        Table(
+            "child",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("parent_id", ForeignKey("parent.id")),
+            Index("ix_child_parent_id", "parent_id"),
+        )
+
+    @testing.fixture
+    def cache_path(self):
+        dirname = tempfile.mkdtemp()
+        yield os.path.join(dirname, "reflection.cache")
+        shutil.rmtree(dirname)
+
+    @testing.fixture
+    def statements(self, connection):
+        statements = []
+
+        @event.listens_for(connection, "before_cursor_execute")
+        def go(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        yield statements
+
+    def _reflect(self, insp):
+        m = MetaData()
+        m.reflect(insp)
+        return m
+
+    def test_fingerprint_changes_with_ddl(self, connection):
+        insp = inspect(connection)
+        fp = insp.get_schema_fingerprint()
+        eq_(insp.get_schema_fingerprint(), fp)
+
+        connection.exec_driver_sql("CREATE TABLE fp_test (id INTEGER)")
+        fp2 = insp.get_schema_fingerprint()
+        is_not(fp2, fp)
+        ne_(fp2, fp)
+
+        connection.exec_driver_sql("ALTER TABLE fp_test ADD COLUMN q INTEGER")
+        ne_(insp.get_schema_fingerprint(), fp2)
+
+        connection.exec_driver_sql("DROP TABLE fp_test")
+
+    def test_load_missing_file(self, connection, cache_path):
+        insp = inspect(connection)
+        is_false(insp.load_cache(cache_path))
+        is_false(os.path.exists(cache_path))
+
+    def test_round_trip(self, connection, cache_path, statements):
+        insp = inspect(connection)
+        is_false(insp.load_cache(cache_path))
+        m1 = self._reflect(insp)
+        insp.save_cache(cache_path)
+
+        insp = inspect(connection)
+        del statements[:]
+        is_true(insp.load_cache(cache_path))
+        fingerprint_statements = len(statements)
+
+        m2 = self._reflect(insp)
+
+        # only the fingerprint was queried
+        eq_(len(statements), fingerprint_statements, statements)
+
+        eq_(set(m2.tables), {"parent", "child"})
+        for name in m1.tables:
+            eq_(
+                [
+                    (c.name, repr(c.type), c.primary_key)
+                    for c in m1.tables[name].c
+                ],
+                [
+                    (c.name, repr(c.type), c.primary_key)
+                    for c in m2.tables[name].c
+                ],
+            )
+        is_true(
+            m2.tables["child"].c.parent_id.references(m2.tables["parent"].c.id)
+        )
+        eq_(
+            {ix.name for ix in m2.tables["child"].indexes},
+            {"ix_child_parent_id"},
+        )
+
+    def test_stale_after_ddl(self, connection, cache_path, statements):
+        insp = inspect(connection)
+        insp.load_cache(cache_path)
+        self._reflect(insp)
+        insp.save_cache(cache_path)
+
+        connection.exec_driver_sql(
+            "ALTER TABLE child ADD COLUMN data VARCHAR(20)"
+        )
+
+        insp = inspect(connection)
+        is_false(insp.load_cache(cache_path))
+        eq_(insp.info_cache, {})
+
+        m = self._reflect(insp)
+        in_("data", m.tables["child"].c)
+
+    def test_stale_other_version(self, connection, cache_path):
+        insp = inspect(connection)
+        self._reflect(insp)
+        insp.save_cache(cache_path)
+
+        with mock.patch("sqlalchemy.__version__", "0.0.1"):
+            is_false(inspect(connection).load_cache(cache_path))
+        is_true(inspect(connection).load_cache(cache_path))
+
+    def test_unreadable_file(self, connection, cache_path):
+        with open(cache_path, "wb") as file_:
+            file_.write(b"not a pickle")
+
+        insp = inspect(connection)
+        with expect_warnings("Ignoring unreadable reflection cache"):
+            is_false(insp.load_cache(cache_path))
+
+    def test_save_uses_fingerprint_from_load(self, connection, cache_path):
+        """DDL that takes place after load_cache() invalidates the saved
+        file, since the reflection may have been of the prior state"""
+
+        insp = inspect(connection)
+        insp.load_cache(cache_path)
+        self._reflect(insp)
+
+        connection.exec_driver_sql("CREATE TABLE after_load (id INTEGER)")
+        insp.save_cache(cache_path)
+
+        is_false(inspect(connection).load_cache(cache_path))
+        connection.exec_driver_sql("DROP TABLE after_load")
+
+    def test_not_implemented(self, connection, cache_path):
+        insp = inspect(connection)
+        with mock.patch.object(
+            connection.dialect,
+            "get_schema_fingerprint",
+            side_effect=NotImplementedError(),
+        ):
+            assert_raises(NotImplementedError, insp.get_schema_fingerprint)
+
+            # without a fingerprint, the cache is neither loaded nor
+            # saved
+            is_false(insp.load_cache(cache_path))
+            self._reflect(insp)
+            insp.save_cache(cache_path)
+        is_false(os.path.exists(cache_path))
+
+    @testing.requires.schemas
+    def test_fingerprint_schema(self, connection):
+        insp = inspect(connection)
+        fp = insp.get_schema_fingerprint(schema=config.test_schema)
+
+        # DDL in another schema doesn't affect the fingerprint
+        connection.exec_driver_sql("CREATE TABLE fp_test (id INTEGER)")
+        eq_(insp.get_schema_fingerprint(schema=config.test_schema), fp)
+
+        connection.exec_driver_sql(
+            "CREATE TABLE %s.fp_test (id INTEGER)" % config.test_schema
+        )
+        ne_(insp.get_schema_fingerprint(schema=config.test_schema), fp)
+
+        connection.exec_driver_sql(
+            "DROP TABLE %s.fp_test" % config.test_schema
+        )
+        connection.exec_driver_sql("DROP TABLE fp_test")
+
+    @testing.requires.schemas
+    def test_load_other_schema(self, connection, cache_path):
+        insp = inspect(connection)
+        self._reflect(insp)
+        insp.save_cache(cache_path, schema=config.test_schema)
+
+        is_false(inspect(connection).load_cache(cache_path))
+        is_true(
+            inspect(connection).load_cache(
+                cache_path, schema=config.test_schema
+            )
+        )
+
+
+class ConcurrentReflectionTest(fixtures.TablesTest):
+    __backend__ = True
+    __requires__ = ("foreign_key_constraint_reflection",)
+
+    @classmethod
+    def define_tables(cls, metadata):
+        for i in range(10):
+            Table(
+                "t%d" % i,
+                metadata,
+                Column("id", Integer, primary_key=True),
+                Column("data", String(20), index=True),
+                Column(
+                    "prev_id",
+                    ForeignKey("t%d.id" % (i - 1)) if i else Integer,
+                ),
+                test_needs_fk=True,
+            )
+
+    @testing.fixture
+    def checkouts(self):
+        eng = engines.testing_engine(options={"pool_size": 15})
+        if isinstance(eng.pool, (pool.SingletonThreadPool, pool.StaticPool)):
+            config.skip_test("pool shares a single connection")
+
+        checkouts = []
+
+        @event.listens_for(eng, "checkout")
+        def go(dbapi_connection, connection_record, connection_proxy):
+            checkouts.append(connection_record)
+
+        yield eng, checkouts
+        eng.dispose()
+
+    def _table_names(self):
+        return ["t%d" % i for i in range(10)]
+
+    def _compare(self, m1, m2):
+        eq_(list(m1.tables), list(m2.tables))
+        for name, t1 in m1.tables.items():
+            t2 = m2.tables[name]
+            eq_(
+                [(c.name, repr(c.type), c.primary_key) for c in t1.c],
+                [(c.name, repr(c.type), c.primary_key) for c in t2.c],
+            )
+            eq_(
+                {
+                    (fk.parent.name, fk.target_fullname)
+                    for fk in t1.foreign_keys
+                },
+                {
+                    (fk.parent.name, fk.target_fullname)
+                    for fk in t2.foreign_keys
+                },
+            )
+            eq_(
+                {ix.name for ix in t1.indexes},
+                {ix.name for ix in t2.indexes},
+            )
+
+    @testing.combinations((1,), (None,), argnames="max_workers")
+    def test_sequential(self, checkouts, max_workers):
+        eng, checkouts = checkouts
+        m = MetaData()
+        m.reflect(eng, only=self._table_names(), max_workers=max_workers)
+
+        # one connection to create the inspector, one to reflect
+        eq_(len(checkouts), 2)
+        eq_(set(m.tables), set(self._table_names()))
+
+    @testing.combinations((3,), (20,), argnames="max_workers")
+    def test_concurrent(self, checkouts, max_workers):
+        eng, checkouts = checkouts
+
+        m1 = MetaData()
+        m1.reflect(eng, only=self._table_names())
+
+        del checkouts[:]
+        m2 = MetaData()
+        m2.reflect(eng, only=self._table_names(), max_workers=max_workers)
+
+        # one connection to create the inspector, one for the table
+        # names, and one for each batch
+        eq_(len(checkouts), 2 + min(max_workers, 10))
+
+        self._compare(m1, m2)
+
+    def test_concurrent_w_inspector_cache(self, checkouts):
+        eng, checkouts = checkouts
+        insp = inspect(eng)
+
+        m1 = MetaData()
+        m1.reflect(insp, only=self._table_names(), max_workers=3)
+        cache_size = len(insp.info_cache)
+        is_true(cache_size > 0)
+
+        # entries added by each thread are merged into the inspector's
+        # cache
+        m2 = MetaData()
+        m2.reflect(insp, only=self._table_names(), max_workers=3)
+        eq_(len(insp.info_cache), cache_size)
+        self._compare(m1, m2)
+
+    def test_connection_not_accepted(self, connection):
+        m = MetaData()
+        with expect_raises_message(
+            sa.exc.ArgumentError, "Concurrent reflection requires an Engine"
+        ):
+            m.reflect(connection, only=self._table_names(), max_workers=3)
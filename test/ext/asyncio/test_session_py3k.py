@@ -159,6 +159,18 @@ class AsyncSessionQueryTest(AsyncFixture):
         u3 = await async_session.get(User, 12)
         is_(u3, None)
 
+    @async_test
+    async def test_get_many(self, async_session):
+        User = self.classes.User
+
+        u1 = await async_session.get(User, 7)
+
+        result = await async_session.get_many(User, [8, 7, 12])
+
+        eq_(result[0].name, "ed")
+        is_(result[1], u1)
+        is_(result[2], None)
+
     @async_test
     async def test_get_loader_options(self, async_session):
         User = self.classes.User
@@ -489,6 +501,24 @@ class AsyncSessionTransactionTest(AsyncFixture):
             eq_(new_u_merged.name, "new u1")
             eq_(len(new_u_merged.__dict__["addresses"]), 1)
 
+    @async_test
+    async def test_merge_all(self, async_session):
+        User = self.classes.User
+
+        async with async_session.begin():
+            u1 = User(id=1, name="u1")
+
+            async_session.add(u1)
+
+        await async_session.close()
+
+        async with async_session.begin():
+            merged = await async_session.merge_all(
+                [User(id=1, name="new u1"), User(id=2, name="u2")]
+            )
+
+            eq_([u.name for u in merged], ["new u1", "u2"])
+
     @async_test
     async def test_join_to_external_transaction(self, async_engine):
         User = self.classes.User
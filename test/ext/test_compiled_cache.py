@@ -0,0 +1,368 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import sqlalchemy
+from sqlalchemy import bindparam
+from sqlalchemy import ForeignKey
+from sqlalchemy import func
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import select
+from sqlalchemy import String
+from sqlalchemy import testing
+from sqlalchemy.engine.interfaces import CacheStats
+from sqlalchemy.ext.compiled_cache import PersistentCompiledCache
+from sqlalchemy.ext.compiled_cache import SQLiteCompiledCacheStore
+from sqlalchemy.orm import Session
+from sqlalchemy.testing import eq_
+from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_not
+from sqlalchemy.testing import mock
+from sqlalchemy.testing import ne_
+from sqlalchemy.testing.schema import Column
+from sqlalchemy.testing.schema import Table
+
+
+class SQLiteStoreTest(fixtures.TestBase):
+    @testing.fixture
+    def store(self):
+        dirname = tempfile.mkdtemp()
+        yield SQLiteCompiledCacheStore(os.path.join(dirname, "cache.db"))
+        shutil.rmtree(dirname)
+
+    def test_get_set(self, store):
+        is_(store.get("k1"), None)
+        store.set("k1", "f1", b"some data")
+        eq_(store.get("k1"), b"some data")
+
+        store.set("k1", "f1", b"other data")
+        eq_(store.get("k1"), b"other data")
+
+    def test_invalidate(self, store):
+        store.set("k1", "f1", b"d1")
+        store.set("k2", "f2", b"d2")
+        store.invalidate("f2")
+        is_(store.get("k1"), None)
+        eq_(store.get("k2"), b"d2")
+
+    def test_clear(self, store):
+        store.set("k1", "f1", b"d1")
+        store.clear()
+        is_(store.get("k1"), None)
+
+    def test_shared_among_instances(self, store):
+        store.set("k1", "f1", b"d1")
+        eq_(SQLiteCompiledCacheStore(store.path).get("k1"), b"d1")
+
+    def test_reconnects_in_new_process(self, store):
+        store.set("k1", "f1", b"d1")
+        conn = store._conn
+
+        with mock.patch("os.getpid", return_value=-1):
+            eq_(store.get("k1"), b"d1")
+        is_not(store._conn, conn)
+
+
+class CrossProcessTest(fixtures.TestBase):
+    """Test that entries stored by one process are located by another,
+    whose hash seed is different."""
+
+    _script = """
+import sys
+
+from sqlalchemy import bindparam
+from sqlalchemy import cast
+from sqlalchemy import Column
+from sqlalchemy import create_engine
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import Numeric
+from sqlalchemy import select
+from sqlalchemy import String
+from sqlalchemy import Table
+from sqlalchemy.ext.compiled_cache import PersistentCompiledCache
+from sqlalchemy.ext.compiled_cache import SQLiteCompiledCacheStore
+
+metadata = MetaData()
+t = Table(
+    "t",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("data", String(30)),
+)
+engine = create_engine("sqlite://")
+metadata.create_all(engine)
+cache = PersistentCompiledCache(
+    SQLiteCompiledCacheStore(sys.argv[1]), metadata
+)
+
+with engine.connect() as conn:
+    conn = conn.execution_options(compiled_cache=cache)
+    for stmt in [
+        select(cast(t.c.data, String(30))),
+        select(t.c.id).where(
+            t.c.data == cast(bindparam("x"), Numeric(10, 2))
+        ),
+    ]:
+        print(conn.execute(stmt, {"x": 1}).context.cache_hit.name)
+"""
+
+    @testing.fixture
+    def store(self):
+        dirname = tempfile.mkdtemp()
+        yield SQLiteCompiledCacheStore(os.path.join(dirname, "cache.db"))
+        shutil.rmtree(dirname)
+
+    def _count(self, store):
+        return (
+            store._connection()
+            .execute("SELECT count(*) FROM compiled_cache")
+            .fetchone()[0]
+        )
+
+    def _run(self, store, hashseed):
+        env = dict(os.environ)
+        env["PYTHONHASHSEED"] = str(hashseed)
+        # the subprocess imports the same sqlalchemy as this process
+        path = [os.path.dirname(os.path.dirname(sqlalchemy.__file__))]
+        if env.get("PYTHONPATH"):
+            path.append(env["PYTHONPATH"])
+        env["PYTHONPATH"] = os.pathsep.join(path)
+        return subprocess.check_output(
+            [sys.executable, "-c", self._script, store.path],
+            env=env,
+            universal_newlines=True,
+        ).split()
+
+    def test_hit_with_other_hash_seed(self, store):
+        eq_(self._run(store, 1), ["CACHE_MISS", "CACHE_MISS"])
+        eq_(self._count(store), 2)
+
+        for hashseed in (2, 3):
+            eq_(self._run(store, hashseed), ["CACHE_HIT", "CACHE_HIT"])
+
+        eq_(self._count(store), 2)
+
+
+class PersistentCompiledCacheTest(fixtures.TablesTest):
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "parent",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("data", String(50)),
+        )
+        Table(
+            "child",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("parent_id", ForeignKey("parent.id")),
+        )
+
+    @classmethod
+    def insert_data(cls, connection):
+        connection.execute(
+            cls.tables.parent.insert(),
+            [{"id": 1, "data": "d1"}, {"id": 2, "data": "d2"}],
+        )
+        connection.execute(
+            cls.tables.child.insert(),
+            [
+                {"id": 1, "parent_id": 1},
+                {"id": 2, "parent_id": 1},
+                {"id": 3, "parent_id": 2},
+            ],
+        )
+
+    @testing.fixture
+    def store(self):
+        dirname = tempfile.mkdtemp()
+        yield SQLiteCompiledCacheStore(os.path.join(dirname, "cache.db"))
+        shutil.rmtree(dirname)
+
+    def _stmt(self):
+        parent, child = self.tables("parent", "child")
+        return (
+            select(parent.c.data, func.count(child.c.id))
+            .join_from(parent, child)
+            .where(parent.c.data == bindparam("data"))
+            .group_by(parent.c.data)
+        )
+
+    def _count(self, store):
+        return (
+            store._connection()
+            .execute("SELECT count(*) FROM compiled_cache")
+            .fetchone()[0]
+        )
+
+    def test_warm_from_store(self, connection, store):
+        parent = self.tables.parent
+
+        cache = PersistentCompiledCache(store, self.tables_test_metadata)
+        conn = connection.execution_options(compiled_cache=cache)
+
+        result = conn.execute(self._stmt(), {"data": "d1"})
+        eq_(result.context.cache_hit, CacheStats.CACHE_MISS)
+        eq_(result.all(), [("d1", 2)])
+        eq_(self._count(store), 1)
+
+        # a new cache against the same store, as would be the case
+        # in a new process
+        cache = PersistentCompiledCache(store, self.tables_test_metadata)
+        conn = connection.execution_options(compiled_cache=cache)
+
+        with mock.patch.object(
+            connection.dialect,
+            "statement_compiler",
+            mock.Mock(side_effect=Exception("compiled")),
+        ):
+            result = conn.execute(self._stmt(), {"data": "d2"})
+            eq_(result.context.cache_hit, CacheStats.CACHE_HIT)
+
+            row = result.one()
+            eq_(row, ("d2", 1))
+            eq_(row._mapping[parent.c.data], "d2")
+
+            # subsequently served from the in-memory cache
+            with mock.patch.object(store, "get") as get_:
+                result = conn.execute(self._stmt(), {"data": "d1"})
+                eq_(result.all(), [("d1", 2)])
+            eq_(get_.mock_calls, [])
+
+    def test_bound_values_not_persisted(self, connection, store):
+        parent = self.tables.parent
+
+        cache = PersistentCompiledCache(store, self.tables_test_metadata)
+        conn = connection.execution_options(compiled_cache=cache)
+
+        def go(value, callable_value):
+            return (
+                select(parent.c.id)
+                .where(parent.c.data.in_(["d1", value]))
+                .where(
+                    parent.c.id
+                    < bindparam("limit", callable_=lambda: callable_value)
+                )
+                .order_by(parent.c.id)
+            )
+
+        eq_(conn.execute(go("secret value", 10)).all(), [(1,)])
+        eq_(self._count(store), 1)
+
+        data = (
+            store._connection()
+            .execute("SELECT data FROM compiled_cache")
+            .fetchone()[0]
+        )
+        is_(data.find(b"secret value"), -1)
+
+        # a new cache against the same store receives the values of
+        # the statement being executed
+        cache = PersistentCompiledCache(store, self.tables_test_metadata)
+        conn = connection.execution_options(compiled_cache=cache)
+        result = conn.execute(go("d2", 2))
+        eq_(result.context.cache_hit, CacheStats.CACHE_HIT)
+        eq_(result.all(), [(1,)])
+
+        result = conn.execute(go("d2", 10))
+        eq_(result.all(), [(1,), (2,)])
+
+    def test_schema_change(self, connection, store):
+        cache = PersistentCompiledCache(store, self.tables_test_metadata)
+        conn = connection.execution_options(compiled_cache=cache)
+        conn.execute(self._stmt(), {"data": "d1"})
+
+        m2 = MetaData()
+        for table in self.tables_test_metadata.tables.values():
+            table.to_metadata(m2)
+        m2.tables["parent"].append_column(Column("extra", Integer))
+
+        cache2 = PersistentCompiledCache(store, m2)
+        ne_(cache.schema_fingerprint, cache2.schema_fingerprint)
+
+        stmt = select(m2.tables["parent"].c.id).order_by(
+            m2.tables["parent"].c.id
+        )
+        conn = connection.execution_options(compiled_cache=cache2)
+        eq_(conn.execute(stmt).all(), [(1,), (2,)])
+        eq_(self._count(store), 2)
+
+        cache2.invalidate()
+        eq_(self._count(store), 1)
+
+        cache3 = PersistentCompiledCache(store, self.tables_test_metadata)
+        conn = connection.execution_options(compiled_cache=cache3)
+        result = conn.execute(self._stmt(), {"data": "d1"})
+        eq_(result.context.cache_hit, CacheStats.CACHE_MISS)
+
+    def test_dialect_fingerprint(self, connection, store):
+        cache = PersistentCompiledCache(store, self.tables_test_metadata)
+        stmt = self._stmt()
+        key = (
+            connection.dialect,
+            stmt._generate_cache_key().key,
+            (),
+            False,
+            False,
+        )
+        digest = cache._digest(key)
+
+        dialect = connection.dialect.__class__()
+        dialect.server_version_info = (0, 5)
+        ne_(cache._digest((dialect,) + key[1:]), digest)
+
+    def test_unknown_table_memory_only(self, connection, store):
+        m2 = MetaData()
+        t = Table("parent", m2, Column("id", Integer), Column("data", String))
+
+        cache = PersistentCompiledCache(store, self.tables_test_metadata)
+        conn = connection.execution_options(compiled_cache=cache)
+
+        stmt = select(t.c.data).where(t.c.id == 2)
+        eq_(conn.execute(stmt).all(), [("d2",)])
+        result = conn.execute(stmt)
+        eq_(result.context.cache_hit, CacheStats.CACHE_HIT)
+        eq_(result.all(), [("d2",)])
+
+        eq_(len(cache), 1)
+        eq_(self._count(store), 0)
+
+    def test_schema_translate_memory_only(self, connection, store):
+        parent = self.tables.parent
+
+        cache = PersistentCompiledCache(store, self.tables_test_metadata)
+        conn = connection.execution_options(
+            compiled_cache=cache, schema_translate_map={"foo": "bar"}
+        )
+        eq_(
+            conn.execute(select(parent.c.id).order_by(parent.c.id)).all(),
+            [(1,), (2,)],
+        )
+        eq_(len(cache), 1)
+        eq_(self._count(store), 0)
+
+    def test_orm_memory_only(self, connection, store, decl_base):
+        class Parent(decl_base):
+            __table__ = self.tables.parent
+
+        cache = PersistentCompiledCache(store, self.tables_test_metadata)
+        conn = connection.execution_options(compiled_cache=cache)
+
+        with Session(conn) as sess:
+            eq_(
+                [
+                    p.data
+                    for p in sess.scalars(select(Parent).order_by(Parent.id))
+                ],
+                ["d1", "d2"],
+            )
+        eq_(len(cache), 1)
+        eq_(self._count(store), 0)
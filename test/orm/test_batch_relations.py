@@ -0,0 +1,398 @@
+"""basic tests of batched lazy loaded attributes"""
+
+import pickle
+
+from sqlalchemy import ForeignKey
+from sqlalchemy import Integer
+from sqlalchemy import select
+from sqlalchemy import String
+from sqlalchemy import testing
+from sqlalchemy.orm import batchload
+from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Session
+from sqlalchemy.testing import eq_
+from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
+from sqlalchemy.testing import pickleable
+from sqlalchemy.testing.fixtures import fixture_session
+from sqlalchemy.testing.schema import Column
+from test.orm import _fixtures
+
+
+class BatchTest(_fixtures.FixtureTest):
+    run_inserts = "once"
+    run_deletes = None
+
+    def _o2m_fixture(self, lazy="batch"):
+        Address, addresses, users, User = (
+            self.classes.Address,
+            self.tables.addresses,
+            self.tables.users,
+            self.classes.User,
+        )
+
+        self.mapper_registry.map_imperatively(Address, addresses)
+        self.mapper_registry.map_imperatively(
+            User,
+            users,
+            properties={
+                "addresses": relationship(
+                    Address, lazy=lazy, order_by=addresses.c.id
+                )
+            },
+        )
+        return User, Address
+
+    def _m2o_fixture(self):
+        Address, addresses, users, User = (
+            self.classes.Address,
+            self.tables.addresses,
+            self.tables.users,
+            self.classes.User,
+        )
+
+        self.mapper_registry.map_imperatively(User, users)
+        self.mapper_registry.map_imperatively(
+            Address,
+            addresses,
+            properties={"user": relationship(User, lazy="batch")},
+        )
+        return User, Address
+
+    def test_o2m(self):
+        User, Address = self._o2m_fixture()
+        sess = fixture_session()
+
+        users = sess.query(User).order_by(User.id).all()
+
+        def go():
+            eq_(users, self.static.user_address_result)
+
+        # the first access loads the collection for all four users
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_o2m_loaded_for_all(self):
+        User, Address = self._o2m_fixture()
+        sess = fixture_session()
+
+        users = sess.query(User).order_by(User.id).all()
+
+        def go():
+            eq_(len(users[1].addresses), 3)
+
+        self.assert_sql_count(testing.db, go, 1)
+
+        for u in users:
+            assert "addresses" in u.__dict__
+
+        eq_(users[3].addresses, [])
+
+    def test_m2o(self):
+        User, Address = self._m2o_fixture()
+        sess = fixture_session()
+
+        addresses = sess.query(Address).order_by(Address.id).all()
+
+        def go():
+            eq_(addresses, self.static.address_user_result)
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_m2o_identity_map(self):
+        User, Address = self._m2o_fixture()
+        sess = fixture_session()
+
+        users = sess.query(User).all()
+        addresses = sess.query(Address).order_by(Address.id).all()
+
+        def go():
+            eq_(addresses, self.static.address_user_result)
+
+        # the related objects are all present in the identity map
+        self.assert_sql_count(testing.db, go, 0)
+        eq_(len(users), 4)
+
+    def test_option(self):
+        User, Address = self._o2m_fixture(lazy="select")
+        sess = fixture_session()
+
+        users = (
+            sess.query(User)
+            .options(batchload(User.addresses))
+            .order_by(User.id)
+            .all()
+        )
+
+        def go():
+            eq_(users, self.static.user_address_result)
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_option_propagates(self):
+        users, User, Order, orders, Item, items = (
+            self.tables.users,
+            self.classes.User,
+            self.classes.Order,
+            self.tables.orders,
+            self.classes.Item,
+            self.tables.items,
+        )
+        self.mapper_registry.map_imperatively(
+            User,
+            users,
+            properties={"orders": relationship(Order, order_by=orders.c.id)},
+        )
+        self.mapper_registry.map_imperatively(
+            Order,
+            orders,
+            properties={
+                "items": relationship(
+                    Item,
+                    secondary=self.tables.order_items,
+                    order_by=items.c.id,
+                )
+            },
+        )
+        self.mapper_registry.map_imperatively(Item, items)
+        sess = fixture_session()
+
+        users = (
+            sess.query(User)
+            .options(batchload(User.orders).selectinload(Order.items))
+            .order_by(User.id)
+            .all()
+        )
+
+        def go():
+            eq_(
+                [[len(o.items) for o in u.orders] for u in users],
+                [[3, 3, 1], [], [3, 2], []],
+            )
+
+        # one query for the orders, one for the items
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_separate_results(self):
+        User, Address = self._o2m_fixture()
+        sess = fixture_session()
+
+        u7 = sess.query(User).filter(User.id == 7).one()
+        others = sess.query(User).filter(User.id != 7).order_by(User.id).all()
+
+        def go():
+            eq_(len(u7.addresses), 1)
+
+        self.assert_sql_count(testing.db, go, 1)
+
+        for u in others:
+            assert "addresses" not in u.__dict__
+
+        def go():
+            eq_(
+                [len(u.addresses) for u in others],
+                [3, 1, 0],
+            )
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_expired_loads_individually(self):
+        User, Address = self._o2m_fixture()
+        sess = fixture_session()
+
+        users = sess.query(User).order_by(User.id).all()
+        eq_(len(users[0].addresses), 1)
+
+        sess.expire(users[0], ["addresses"])
+        sess.expire(users[1], ["addresses"])
+
+        def go():
+            eq_(len(users[0].addresses), 1)
+
+        self.assert_sql_count(testing.db, go, 1)
+
+        assert "addresses" not in users[1].__dict__
+
+    def test_populate_existing(self):
+        User, Address = self._o2m_fixture()
+        sess = fixture_session()
+
+        users = sess.query(User).order_by(User.id).all()
+        existing = users[1].addresses
+        eq_(len(existing), 3)
+
+        users = sess.query(User).populate_existing().order_by(User.id).all()
+        for u in users:
+            assert "addresses" not in u.__dict__
+
+        def go():
+            eq_(users, self.static.user_address_result)
+
+        self.assert_sql_count(testing.db, go, 1)
+        assert users[1].addresses is not existing
+
+    def test_expunged_sibling(self):
+        User, Address = self._o2m_fixture()
+        sess = fixture_session()
+
+        users = sess.query(User).order_by(User.id).all()
+        sess.expunge(users[1])
+
+        def go():
+            eq_(len(users[0].addresses), 1)
+
+        self.assert_sql_count(testing.db, go, 1)
+
+        assert "addresses" not in users[1].__dict__
+        assert "addresses" in users[2].__dict__
+
+    def test_single_object(self):
+        User, Address = self._o2m_fixture()
+        sess = fixture_session()
+
+        u8 = sess.query(User).filter(User.id == 8).one()
+
+        def go():
+            eq_(len(u8.addresses), 3)
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_pickled_loads_individually(self):
+        users, addresses = self.tables.users, self.tables.addresses
+
+        self.mapper_registry.map_imperatively(
+            pickleable.User,
+            users,
+            properties={
+                "addresses": relationship(pickleable.Address, lazy="batch")
+            },
+        )
+        self.mapper_registry.map_imperatively(pickleable.Address, addresses)
+        sess = fixture_session()
+
+        result = sess.query(pickleable.User).order_by(pickleable.User.id).all()
+        u8 = pickle.loads(pickle.dumps(result[1]))
+        sess.close()
+
+        sess2 = fixture_session()
+        sess2.add(u8)
+
+        def go():
+            eq_(len(u8.addresses), 3)
+
+        self.assert_sql_count(testing.db, go, 1)
+
+        sess.add_all(result)
+
+        def go():
+            eq_(len(result[0].addresses), 1)
+
+        # the originals still load together
+        self.assert_sql_count(testing.db, go, 1)
+        for u in result:
+            assert "addresses" in u.__dict__
+
+    def test_pending_not_loaded(self):
+        User, Address = self._o2m_fixture()
+        sess = fixture_session()
+
+        users = sess.query(User).order_by(User.id).all()
+        u = User(name="new")
+        sess.add(u)
+
+        eq_(u.addresses, [])
+        is_("addresses" in users[0].__dict__, False)
+
+
+class PolymorphicTest(fixtures.DeclarativeMappedTest):
+    @classmethod
+    def setup_classes(cls):
+        Base = cls.DeclarativeBasic
+
+        class Parent(fixtures.ComparableEntity, Base):
+            __tablename__ = "parent"
+            id = Column(Integer, primary_key=True)
+            type = Column(String(10))
+            children = relationship("Child", lazy="batch", order_by="Child.id")
+
+            __mapper_args__ = {
+                "polymorphic_on": type,
+                "polymorphic_identity": "p",
+            }
+
+        class SubParent(Parent):
+            __mapper_args__ = {"polymorphic_identity": "q"}
+
+        class Child(fixtures.ComparableEntity, Base):
+            __tablename__ = "child"
+            id = Column(Integer, primary_key=True)
+            parent_id = Column(ForeignKey("parent.id"))
+            items = relationship("Item", order_by="Item.id")
+
+        class Item(fixtures.ComparableEntity, Base):
+            __tablename__ = "item"
+            id = Column(Integer, primary_key=True)
+            child_id = Column(ForeignKey("child.id"))
+
+    @classmethod
+    def insert_data(cls, connection):
+        Parent, SubParent, Child, Item = cls.classes(
+            "Parent", "SubParent", "Child", "Item"
+        )
+        s = Session(connection)
+        s.add_all(
+            [
+                Parent(
+                    id=1,
+                    children=[Child(id=1, items=[Item(id=1), Item(id=2)])],
+                ),
+                SubParent(id=2, children=[Child(id=2, items=[Item(id=3)])]),
+                Parent(id=3, children=[]),
+                SubParent(
+                    id=4,
+                    children=[Child(id=3, items=[]), Child(id=4, items=[])],
+                ),
+            ]
+        )
+        s.commit()
+
+    def test_subclasses_load_together(self):
+        Parent, SubParent = self.classes("Parent", "SubParent")
+
+        sess = fixture_session()
+        parents = sess.scalars(select(Parent).order_by(Parent.id)).all()
+        eq_(
+            [type(p) for p in parents],
+            [Parent, SubParent, Parent, SubParent],
+        )
+
+        def go():
+            eq_(
+                [[c.id for c in p.children] for p in parents],
+                [[1], [2], [], [3, 4]],
+            )
+
+        # the first access loads the collection for the objects of
+        # each subclass
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_subclasses_load_together_chained(self):
+        Parent, Child = self.classes("Parent", "Child")
+
+        sess = fixture_session()
+        parents = sess.scalars(
+            select(Parent)
+            .options(batchload(Parent.children).selectinload(Child.items))
+            .order_by(Parent.id)
+        ).all()
+
+        def go():
+            eq_(
+                [
+                    [[i.id for i in c.items] for c in p.children]
+                    for p in parents
+                ],
+                [[[1, 2]], [[3]], [], [[], []]],
+            )
+
+        # one query for the children, one for the items
+        self.assert_sql_count(testing.db, go, 2)
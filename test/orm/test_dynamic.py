@@ -16,6 +16,7 @@ from sqlalchemy.orm import exc as orm_exc
 from sqlalchemy.orm import noload
 from sqlalchemy.orm import Query
 from sqlalchemy.orm import relationship
+from sqlalchemy.orm import WriteOnlyCollection
 from sqlalchemy.orm.session import make_transient_to_detached
 from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_message
@@ -30,6 +31,8 @@ from test.orm import _fixtures
 
 
 class _DynamicFixture:
+    lazy = "dynamic"
+
     def _user_address_fixture(self, addresses_args={}):
         users, Address, addresses, User = (
             self.tables.users,
@@ -43,7 +46,7 @@ class _DynamicFixture:
             users,
             properties={
                 "addresses": relationship(
-                    Address, lazy="dynamic", **addresses_args
+                    Address, lazy=self.lazy, **addresses_args
                 )
             },
         )
@@ -64,7 +67,7 @@ class _DynamicFixture:
             orders,
             properties={
                 "items": relationship(
-                    Item, secondary=order_items, lazy="dynamic", **items_args
+                    Item, secondary=order_items, lazy=self.lazy, **items_args
                 )
             },
         )
@@ -1422,3 +1425,312 @@ class HistoryTest(_DynamicFixture, _fixtures.FixtureTest):
         u1.addresses.remove(a1)
 
         self._assert_history(u1, ([], [], []), compare_passive=([], [], [a1]))
+
+
+class WriteOnlyTest(
+    _DynamicFixture, _fixtures.FixtureTest, AssertsCompiledSQL
+):
+    __dialect__ = "default"
+
+    lazy = "write_only"
+
+    def test_collection_type(self):
+        User, Address = self._user_address_fixture()
+        sess = fixture_session()
+        u1 = sess.get(User, 7)
+
+        assert isinstance(u1.addresses, WriteOnlyCollection)
+
+    def test_select(self):
+        User, Address = self._user_address_fixture(
+            addresses_args={"order_by": self.tables.addresses.c.id}
+        )
+        sess = fixture_session()
+        u1 = sess.get(User, 8)
+
+        self.assert_compile(
+            u1.addresses.select(),
+            "SELECT addresses.id, addresses.user_id, "
+            "addresses.email_address FROM addresses "
+            "WHERE :param_1 = addresses.user_id ORDER BY addresses.id",
+        )
+        eq_(
+            sess.scalars(u1.addresses.select()).all(),
+            [Address(id=2), Address(id=3), Address(id=4)],
+        )
+        eq_(
+            sess.scalars(
+                u1.addresses.select().where(
+                    Address.email_address == "ed@bettyboop.com"
+                )
+            ).all(),
+            [Address(id=3)],
+        )
+
+    def test_select_m2m(self):
+        Order, Item = self._order_item_fixture(
+            items_args={"order_by": self.tables.items.c.id}
+        )
+        sess = fixture_session()
+        o1 = sess.get(Order, 1)
+
+        eq_(
+            sess.scalars(o1.items.select()).all(),
+            [Item(id=1), Item(id=2), Item(id=3)],
+        )
+
+    def test_no_iteration(self):
+        User, Address = self._user_address_fixture()
+        sess = fixture_session()
+        u1 = sess.get(User, 8)
+
+        with expect_raises_message(
+            TypeError,
+            "WriteOnly collections don't support iteration in-place",
+        ):
+            list(u1.addresses)
+
+    def test_no_collection_replacement(self):
+        User, Address = self._user_address_fixture()
+        sess = fixture_session()
+        u1 = sess.get(User, 8)
+
+        with expect_raises_message(
+            exc.InvalidRequestError,
+            "Collection User.addresses does not support implicit iteration",
+        ):
+            u1.addresses = [Address(email_address="a1")]
+
+    def test_many_to_one_raises(self):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User,
+        )
+        self.mapper_registry.map_imperatively(User, users)
+        self.mapper_registry.map_imperatively(
+            Address,
+            addresses,
+            properties={"user": relationship(User, lazy="write_only")},
+        )
+
+        assert_raises_message(
+            exc.InvalidRequestError,
+            "On relationship Address.user, 'write_only' loaders cannot be "
+            "used with many-to-one/one-to-one relationships and/or "
+            "uselist=False.",
+            configure_mappers,
+        )
+
+    def test_transient_assignment(self):
+        User, Address = self._user_address_fixture()
+        sess = fixture_session()
+
+        u1 = User(
+            name="u1",
+            addresses=[
+                Address(email_address="a1"),
+                Address(email_address="a2"),
+            ],
+        )
+        sess.add(u1)
+        sess.flush()
+
+        eq_(
+            sess.scalar(select(func.count()).where(Address.user_id == u1.id)),
+            2,
+        )
+
+    def test_add_does_not_load(self):
+        User, Address = self._user_address_fixture()
+        sess = fixture_session()
+        u1 = sess.get(User, 8)
+
+        def go():
+            u1.addresses.add(Address(email_address="a1"))
+            u1.addresses.add_all(
+                [Address(email_address="a2"), Address(email_address="a3")]
+            )
+
+        self.assert_sql_count(testing.db, go, 0)
+
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL(
+                "INSERT INTO addresses (user_id, email_address) "
+                "VALUES (:user_id, :email_address)",
+                [
+                    {"user_id": 8, "email_address": "a1"},
+                    {"user_id": 8, "email_address": "a2"},
+                    {"user_id": 8, "email_address": "a3"},
+                ],
+            ),
+        )
+
+    def test_remove_does_not_load(self):
+        User, Address = self._user_address_fixture()
+        sess = fixture_session()
+        u1 = sess.get(User, 8)
+        a2, a3 = sess.get(Address, 2), sess.get(Address, 3)
+
+        def go():
+            u1.addresses.remove(a2)
+            u1.addresses.remove(a3)
+
+        self.assert_sql_count(testing.db, go, 0)
+
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL(
+                "UPDATE addresses SET user_id=:user_id "
+                "WHERE addresses.id = :addresses_id",
+                [
+                    {"user_id": None, "addresses_id": 2},
+                    {"user_id": None, "addresses_id": 3},
+                ],
+            ),
+        )
+
+    def test_backref_does_not_load(self):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User,
+        )
+        self.mapper_registry.map_imperatively(
+            User,
+            users,
+            properties={
+                "addresses": relationship(
+                    Address, lazy="write_only", back_populates="user"
+                )
+            },
+        )
+        self.mapper_registry.map_imperatively(
+            Address,
+            addresses,
+            properties={
+                "user": relationship(User, back_populates="addresses")
+            },
+        )
+        sess = fixture_session()
+        u1 = sess.get(User, 8)
+
+        def go():
+            sess.add(Address(email_address="a1", user=u1))
+
+        self.assert_sql_count(testing.db, go, 0)
+
+        sess.flush()
+        eq_(
+            sess.scalars(
+                u1.addresses.select().where(Address.email_address == "a1")
+            ).all(),
+            [Address(email_address="a1", user_id=8)],
+        )
+
+    def test_delete_parent_requires_passive_deletes(self):
+        User, Address = self._user_address_fixture()
+        sess = fixture_session()
+        u1 = sess.get(User, 8)
+        sess.delete(u1)
+
+        assert_raises_message(
+            exc.InvalidRequestError,
+            "Attribute User.addresses can't load the existing state from "
+            "the database for this operation; full iteration is not "
+            "permitted.",
+            sess.flush,
+        )
+
+    def test_delete_parent_passive_deletes(self):
+        User, Address = self._user_address_fixture(
+            addresses_args={"passive_deletes": True}
+        )
+        sess = fixture_session()
+        u1 = sess.get(User, 8)
+        sess.delete(u1)
+
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL("DELETE FROM users WHERE users.id = :id", [{"id": 8}]),
+        )
+
+    def test_insert(self):
+        User, Address = self._user_address_fixture()
+        sess = fixture_session()
+        u1 = sess.get(User, 7)
+
+        sess.execute(
+            u1.addresses.insert(),
+            [{"email_address": "e%d" % i} for i in range(3)],
+        )
+
+        eq_(
+            sess.scalars(u1.addresses.select().order_by(Address.id)).all(),
+            [
+                Address(id=1, email_address="jack@bean.com"),
+                Address(email_address="e0"),
+                Address(email_address="e1"),
+                Address(email_address="e2"),
+            ],
+        )
+
+    def test_insert_m2m_raises(self):
+        Order, Item = self._order_item_fixture()
+        sess = fixture_session()
+        o1 = sess.get(Order, 1)
+
+        assert_raises_message(
+            exc.InvalidRequestError,
+            "Write only bulk INSERT only supported for one-to-many "
+            "collections",
+            o1.items.insert,
+        )
+
+    def test_update_delete(self):
+        User, Address = self._user_address_fixture()
+        sess = fixture_session()
+        u1 = sess.get(User, 8)
+
+        sess.execute(
+            u1.addresses.update().values(email_address="updated"),
+            execution_options={"synchronize_session": False},
+        )
+        eq_(
+            sess.scalars(
+                select(Address.email_address).where(Address.user_id == 8)
+            ).all(),
+            ["updated", "updated", "updated"],
+        )
+
+        sess.execute(
+            u1.addresses.delete().where(Address.id == 2),
+            execution_options={"synchronize_session": False},
+        )
+        eq_(
+            sess.scalar(select(func.count()).where(Address.user_id == 8)),
+            2,
+        )
+
+    def test_history(self):
+        User, Address = self._user_address_fixture()
+        sess = fixture_session(autoflush=False)
+        u1 = sess.get(User, 8)
+        a2 = sess.get(Address, 2)
+        a5 = Address(email_address="a5")
+
+        u1.addresses.add(a5)
+        u1.addresses.remove(a2)
+
+        eq_(
+            attributes.get_history(
+                u1, "addresses", attributes.PASSIVE_NO_INITIALIZE
+            ),
+            ([a5], [], [a2]),
+        )
@@ -15,6 +15,7 @@ from sqlalchemy.orm import deferred
 from sqlalchemy.orm import exc as orm_exc
 from sqlalchemy.orm import joinedload
 from sqlalchemy.orm import lazyload
+from sqlalchemy.orm import loading
 from sqlalchemy.orm import make_transient_to_detached
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm import Session
@@ -25,6 +26,7 @@ from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import mock
 from sqlalchemy.testing.assertions import expect_raises_message
 from sqlalchemy.testing.assertsql import CountStatements
 from sqlalchemy.testing.fixtures import fixture_session
@@ -1567,6 +1569,184 @@ class ExpireTest(_fixtures.FixtureTest):
         assert "description" not in item.__dict__
 
 
+class BatchRefreshTest(_fixtures.FixtureTest):
+    def _fixture(self):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User,
+        )
+
+        self.mapper_registry.map_imperatively(
+            User,
+            users,
+            properties={
+                "addresses": relationship(Address, backref="user"),
+                "name": deferred(users.c.name),
+            },
+        )
+        self.mapper_registry.map_imperatively(Address, addresses)
+        return User, Address
+
+    def test_expired_after_commit(self):
+        User, Address = self._fixture()
+
+        sess = fixture_session(batch_refresh=True)
+        users = sess.query(User).options(undefer(User.name)).all()
+        addresses = sess.query(Address).all()
+        sess.commit()
+
+        def go():
+            eq_(
+                sorted(u.name for u in users),
+                ["chuck", "ed", "fred", "jack"],
+            )
+
+        # one load for the four users; the Address objects are not loaded
+        self.assert_sql_count(testing.db, go, 1)
+
+        for a in addresses:
+            assert "email_address" not in a.__dict__
+
+        def go():
+            eq_(len([a.email_address for a in addresses]), 5)
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_deferred(self):
+        User, Address = self._fixture()
+
+        sess = fixture_session(batch_refresh=True)
+        users = sess.query(User).order_by(User.id).all()
+
+        def go():
+            eq_([u.name for u in users], ["jack", "ed", "fred", "chuck"])
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_not_enabled(self):
+        User, Address = self._fixture()
+
+        sess = fixture_session()
+        users = sess.query(User).order_by(User.id).all()
+
+        def go():
+            eq_([u.name for u in users], ["jack", "ed", "fred", "chuck"])
+
+        self.assert_sql_count(testing.db, go, 4)
+
+    def test_modified_sibling_not_loaded(self):
+        User, Address = self._fixture()
+
+        sess = fixture_session(batch_refresh=True, autoflush=False)
+        users = sess.query(User).order_by(User.id).all()
+        sess.expire_all()
+        users[1].name = "ed modified"
+
+        def go():
+            eq_(users[0].name, "jack")
+
+        self.assert_sql_count(testing.db, go, 1)
+
+        eq_(users[1].name, "ed modified")
+        for u in users[2:]:
+            assert "name" in u.__dict__
+
+    def test_loaded_sibling_not_included(self):
+        User, Address = self._fixture()
+
+        sess = fixture_session(batch_refresh=True)
+        addresses = sess.query(Address).order_by(Address.id).all()
+        sess.expire_all()
+
+        sess.expire(addresses[2], ["email_address"])
+        sess.refresh(addresses[2])
+
+        def go():
+            eq_(addresses[0].email_address, "jack@bean.com")
+
+        # all the other Address objects are loaded
+        self.assert_sql_count(testing.db, go, 1)
+
+        for a in addresses:
+            assert "email_address" in a.__dict__
+            assert "user_id" in a.__dict__
+
+    def test_deleted_row(self):
+        users, addresses = self.tables.users, self.tables.addresses
+        User, Address = self._fixture()
+
+        sess = fixture_session(batch_refresh=True)
+        u1, u2 = sess.query(User).filter(User.id.in_([7, 8])).all()
+        sess.commit()
+
+        sess.execute(addresses.delete().where(addresses.c.user_id == 8))
+        sess.execute(users.delete().where(users.c.id == 8))
+
+        assert_raises(orm_exc.ObjectDeletedError, getattr, u2, "name")
+        eq_(u1.name, "jack")
+
+    def test_chunks(self):
+        User, Address = self._fixture()
+
+        sess = fixture_session(batch_refresh=True)
+        addresses = sess.query(Address).order_by(Address.id).all()
+        sess.expire_all()
+
+        with mock.patch.object(loading, "_SELECTIN_CHUNKSIZE", 2):
+
+            def go():
+                eq_(addresses[0].email_address, "jack@bean.com")
+
+            # each load is limited to one chunk of objects
+            self.assert_sql_count(testing.db, go, 1)
+
+            eq_(len([a.email_address for a in addresses]), 5)
+
+            for a in addresses:
+                assert "email_address" in a.__dict__
+
+            # the objects loaded together remain together
+            sess.expire_all()
+
+            def go():
+                eq_(len([a.email_address for a in addresses]), 5)
+
+            self.assert_sql_count(testing.db, go, 3)
+
+    def test_siblings_from_same_result(self):
+        User, Address = self._fixture()
+
+        sess = fixture_session(batch_refresh=True)
+        a1, a2 = sess.query(Address).filter(Address.id.in_([1, 2])).all()
+        a3, a4 = sess.query(Address).filter(Address.id.in_([3, 4])).all()
+        sess.commit()
+
+        def go():
+            eq_(a1.email_address, "jack@bean.com")
+
+        self.assert_sql_count(testing.db, go, 1)
+
+        assert "email_address" in a2.__dict__
+        assert "email_address" not in a3.__dict__
+        assert "email_address" not in a4.__dict__
+
+    def test_reloaded_after_commit(self):
+        User, Address = self._fixture()
+
+        sess = fixture_session(batch_refresh=True)
+        addresses = sess.query(Address).order_by(Address.id).all()
+
+        for i in range(2):
+            sess.commit()
+
+            def go():
+                eq_(len([a.email_address for a in addresses]), 5)
+
+            self.assert_sql_count(testing.db, go, 1)
+
+
 class PolymorphicExpireTest(fixtures.MappedTest):
     run_inserts = "once"
     run_deletes = None
@@ -1,11 +1,30 @@
+from sqlalchemy import Column
+from sqlalchemy import event
 from sqlalchemy import exc
+from sqlalchemy import ForeignKey
+from sqlalchemy import inspect
+from sqlalchemy import Integer
 from sqlalchemy import literal
 from sqlalchemy import literal_column
 from sqlalchemy import select
+from sqlalchemy import String
 from sqlalchemy import testing
 from sqlalchemy import text
+from sqlalchemy.orm import defer
+from sqlalchemy.orm import immediateload
+from sqlalchemy.orm import joinedload
 from sqlalchemy.orm import loading
+from sqlalchemy.orm import noload
 from sqlalchemy.orm import relationship
+from sqlalchemy.orm import selectin_polymorphic
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import subqueryload
+from sqlalchemy.orm import with_polymorphic
+from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_not
+from sqlalchemy.testing import is_true
 from sqlalchemy.testing import mock
 from sqlalchemy.testing.assertions import assert_raises
 from sqlalchemy.testing.assertions import assert_raises_message
@@ -180,6 +199,480 @@ class InstancesTest(_fixtures.FixtureTest):
         )
 
 
+class _InstanceFastPathTest(_fixtures.FixtureTest):
+    run_setup_mappers = "once"
+    run_inserts = "once"
+    run_deletes = None
+
+    @classmethod
+    def setup_mappers(cls):
+        cls._setup_stock_mapping()
+
+    @testing.fixture
+    def fast_path(self):
+        with mock.patch.object(
+            loading,
+            "_instance_fast_path",
+            mock.Mock(side_effect=self.module._instance_fast_path),
+        ) as fast_path:
+            yield fast_path
+
+    def test_new_instances(self, fast_path):
+        User, Address = self.classes("User", "Address")
+        s = fixture_session()
+
+        users = s.scalars(select(User).order_by(User.id)).all()
+        eq_(fast_path.call_count, 1)
+
+        eq_([u.name for u in users], ["jack", "ed", "fred", "chuck"])
+        for u in users:
+            state = inspect(u)
+            is_true(state.persistent)
+            is_(s.identity_map[state.key], u)
+            eq_(state.committed_state, {})
+
+        # lazy loader populated for new instances
+        eq_(
+            users[0].addresses,
+            [Address(id=1, email_address="jack@bean.com")],
+        )
+
+    def test_present_instances(self, fast_path):
+        User = self.classes.User
+        s = fixture_session()
+
+        u7 = s.get(User, 7)
+        u7.name = "modified"
+
+        users = s.scalars(select(User).order_by(User.id)).all()
+        is_(users[0], u7)
+        eq_(u7.name, "modified")
+        eq_([u.name for u in users[1:]], ["ed", "fred", "chuck"])
+
+    def test_deferred(self, fast_path):
+        User = self.classes.User
+        s = fixture_session()
+
+        u1 = s.scalars(
+            select(User).options(defer(User.name)).order_by(User.id)
+        ).first()
+        assert "name" not in u1.__dict__
+        eq_(u1.name, "jack")
+
+    def test_null_primary_key(self, fast_path):
+        User, Address = self.classes("User", "Address")
+        s = fixture_session()
+
+        rows = s.execute(
+            select(User, Address)
+            .outerjoin(User.addresses)
+            .where(User.id.in_([9, 10]))
+            .order_by(User.id, Address.id)
+        ).all()
+        eq_(
+            [(u.id, a.id if a is not None else None) for u, a in rows],
+            [(9, 5), (10, None)],
+        )
+
+    @testing.combinations(
+        "populate_existing", "load_event", "refresh", argnames="case"
+    )
+    def test_not_used(self, fast_path, case):
+        User = self.classes.User
+        s = fixture_session()
+
+        if case == "populate_existing":
+            s.scalars(
+                select(User).execution_options(populate_existing=True)
+            ).all()
+        elif case == "load_event":
+            canary = mock.Mock()
+            event.listen(User, "load", canary)
+            try:
+                users = s.scalars(select(User)).all()
+            finally:
+                event.remove(User, "load", canary)
+            eq_(canary.call_count, len(users))
+        elif case == "refresh":
+            u7 = s.get(User, 7)
+            fast_path.reset_mock()
+            s.refresh(u7)
+        else:
+            assert False
+
+        eq_(fast_path.mock_calls, [])
+
+
+class PyInstanceFastPathTest(_InstanceFastPathTest):
+    @classmethod
+    def setup_test_class(cls):
+        from sqlalchemy.orm import _py_loading
+
+        cls.module = _py_loading
+
+
+class CyInstanceFastPathTest(_InstanceFastPathTest):
+    __requires__ = ("cextensions",)
+
+    @classmethod
+    def setup_test_class(cls):
+        from sqlalchemy.cyextension import loading
+
+        cls.module = loading
+
+
+class ReadOnlyEntitiesTest(_fixtures.FixtureTest):
+    run_setup_mappers = "once"
+    run_inserts = "once"
+    run_deletes = None
+
+    @classmethod
+    def setup_mappers(cls):
+        cls._setup_stock_mapping()
+
+    def _assert_readonly(self, obj):
+        is_(
+            type(obj.__dict__["_sa_instance_state"]),
+            loading._ReadOnlyEntityState,
+        )
+
+    def test_load(self):
+        User = self.classes.User
+        s = fixture_session()
+
+        users = s.scalars(
+            select(User)
+            .order_by(User.id)
+            .execution_options(readonly_entities=True)
+        ).all()
+
+        eq_(
+            [(u.id, u.name) for u in users],
+            [(7, "jack"), (8, "ed"), (9, "fred"), (10, "chuck")],
+        )
+        for u in users:
+            is_(type(u), User)
+            self._assert_readonly(u)
+        eq_(len(s.identity_map), 0)
+
+    def test_distinct_from_session_instances(self):
+        User = self.classes.User
+        s = fixture_session()
+
+        u7 = s.get(User, 7)
+        u7.name = "modified"
+
+        ro_u7 = s.scalars(
+            select(User)
+            .where(User.id == 7)
+            .execution_options(readonly_entities=True)
+        ).one()
+        is_not(ro_u7, u7)
+
+        # autoflush proceeds as usual
+        eq_(ro_u7.name, "modified")
+        eq_(list(s.identity_map.values()), [u7])
+
+    def test_same_identity_same_instance(self):
+        User, Address = self.classes("User", "Address")
+        s = fixture_session()
+
+        rows = s.execute(
+            select(User, Address)
+            .join(User.addresses)
+            .where(User.id == 8)
+            .order_by(Address.id)
+            .execution_options(readonly_entities=True)
+        ).all()
+        eq_(len(rows), 3)
+        is_(rows[0][0], rows[1][0])
+        is_(rows[0][0], rows[2][0])
+        eq_([a.email_address for u, a in rows][0], "ed@wood.com")
+
+    def test_null_primary_key(self):
+        User, Address = self.classes("User", "Address")
+        s = fixture_session()
+
+        rows = s.execute(
+            select(User, Address)
+            .outerjoin(User.addresses)
+            .where(User.id.in_([9, 10]))
+            .order_by(User.id, Address.id)
+            .execution_options(readonly_entities=True)
+        ).all()
+        eq_(
+            [(u.id, a.id if a is not None else None) for u, a in rows],
+            [(9, 5), (10, None)],
+        )
+
+    @testing.combinations(
+        "set", "delete", "add", "merge", "delete_obj", argnames="operation"
+    )
+    def test_mutation_raises(self, operation):
+        User = self.classes.User
+        s = fixture_session()
+
+        u7 = s.scalars(
+            select(User)
+            .where(User.id == 7)
+            .execution_options(readonly_entities=True)
+        ).one()
+
+        with expect_raises_message(
+            exc.InvalidRequestError,
+            "Instance of User was loaded with the 'readonly_entities' "
+            "execution option; read-only entities can't be modified",
+        ):
+            if operation == "set":
+                u7.name = "modified"
+            elif operation == "delete":
+                del u7.name
+            elif operation == "add":
+                s.add(u7)
+            elif operation == "merge":
+                s.merge(u7)
+            elif operation == "delete_obj":
+                s.delete(u7)
+            else:
+                assert False
+
+        eq_(u7.name, "jack")
+        s.flush()
+        eq_(len(s.identity_map), 0)
+
+    @testing.combinations("lazy", "deferred", argnames="attrtype")
+    def test_unloaded_attribute_raises(self, attrtype):
+        User = self.classes.User
+        s = fixture_session()
+
+        stmt = select(User).where(User.id == 7)
+        if attrtype == "deferred":
+            stmt = stmt.options(defer(User.name))
+
+        u7 = s.scalars(stmt.execution_options(readonly_entities=True)).one()
+
+        with expect_raises_message(
+            exc.InvalidRequestError,
+            "Instance of User was loaded with the 'readonly_entities' "
+            "execution option",
+        ):
+            if attrtype == "lazy":
+                u7.addresses
+            else:
+                u7.name
+
+        self.assert_sql_count(testing.db, lambda: None, 0)
+
+    def test_joinedload_collection(self):
+        User = self.classes.User
+        s = fixture_session()
+
+        users = (
+            s.scalars(
+                select(User)
+                .options(joinedload(User.addresses))
+                .order_by(User.id)
+                .execution_options(readonly_entities=True)
+            )
+            .unique()
+            .all()
+        )
+        eq_(
+            [(u.id, [a.id for a in u.addresses]) for u in users],
+            [(7, [1]), (8, [2, 3, 4]), (9, [5]), (10, [])],
+        )
+        for u in users:
+            for a in u.addresses:
+                self._assert_readonly(a)
+
+        with expect_raises_message(
+            exc.InvalidRequestError,
+            "Collections of entities loaded with the 'readonly_entities' "
+            "execution option are read-only",
+        ):
+            users[0].addresses.append(users[1].addresses[0])
+        eq_(len(s.identity_map), 0)
+
+    def test_joinedload_scalar(self):
+        Address, User = self.classes("Address", "User")
+        s = fixture_session()
+
+        addresses = s.scalars(
+            select(Address)
+            .options(joinedload(Address.user))
+            .order_by(Address.id)
+            .execution_options(readonly_entities=True)
+        ).all()
+        eq_(
+            [(a.id, a.user.id) for a in addresses],
+            [(1, 7), (2, 8), (3, 8), (4, 8), (5, 9)],
+        )
+        is_(addresses[1].user, addresses[2].user)
+        self._assert_readonly(addresses[1].user)
+
+    def test_selectinload(self):
+        User, Address, Order = self.classes("User", "Address", "Order")
+        s = fixture_session()
+
+        def go():
+            users = s.scalars(
+                select(User)
+                .options(
+                    selectinload(User.addresses).selectinload(Address.user),
+                    selectinload(User.orders).selectinload(Order.items),
+                )
+                .order_by(User.id)
+                .execution_options(readonly_entities=True)
+            ).all()
+            eq_(
+                [
+                    (
+                        u.id,
+                        [(a.id, a.user.id) for a in u.addresses],
+                        [(o.id, [i.id for i in o.items]) for o in u.orders],
+                    )
+                    for u in users
+                ],
+                [
+                    (
+                        7,
+                        [(1, 7)],
+                        [(1, [1, 2, 3]), (3, [3, 4, 5]), (5, [5])],
+                    ),
+                    (8, [(2, 8), (3, 8), (4, 8)], []),
+                    (9, [(5, 9)], [(2, [1, 2, 3]), (4, [1, 5])]),
+                    (10, [], []),
+                ],
+            )
+            for u in users:
+                self._assert_readonly(u)
+                for o in u.orders:
+                    self._assert_readonly(o)
+                    is_(type(o.items), loading._ReadOnlyCollection)
+
+        self.assert_sql_count(testing.db, go, 5)
+        eq_(len(s.identity_map), 0)
+
+    def test_noload(self):
+        User, Address = self.classes("User", "Address")
+        s = fixture_session()
+
+        u7 = s.scalars(
+            select(User)
+            .options(noload(User.addresses))
+            .where(User.id == 7)
+            .execution_options(readonly_entities=True)
+        ).one()
+        eq_(u7.addresses, [])
+        is_(type(u7.addresses), loading._ReadOnlyCollection)
+
+        a1 = s.scalars(
+            select(Address)
+            .options(noload(Address.user))
+            .where(Address.id == 1)
+            .execution_options(readonly_entities=True)
+        ).one()
+        is_(a1.user, None)
+
+    @testing.combinations(subqueryload, immediateload, argnames="loader")
+    def test_unsupported_loader(self, loader):
+        User = self.classes.User
+        s = fixture_session()
+
+        with expect_raises_message(
+            exc.InvalidRequestError,
+            r"Loader strategy for User.addresses isn't supported with the "
+            r"'readonly_entities' execution option; use joinedload\(\), "
+            r"selectinload\(\) or noload\(\) for this relationship",
+        ):
+            s.scalars(
+                select(User)
+                .options(loader(User.addresses))
+                .execution_options(readonly_entities=True)
+            ).all()
+
+    def test_yield_per(self):
+        User = self.classes.User
+        s = fixture_session()
+
+        result = s.scalars(
+            select(User)
+            .options(selectinload(User.addresses))
+            .order_by(User.id)
+            .execution_options(readonly_entities=True, yield_per=2)
+        )
+        eq_(
+            [
+                [(u.id, len(u.addresses)) for u in partition]
+                for partition in result.partitions()
+            ],
+            [[(7, 1), (8, 3)], [(9, 1), (10, 0)]],
+        )
+        eq_(len(s.identity_map), 0)
+
+
+class ReadOnlyEntitiesPolymorphicTest(fixtures.DeclarativeMappedTest):
+    @classmethod
+    def setup_classes(cls):
+        Base = cls.DeclarativeBasic
+
+        class Person(fixtures.ComparableEntity, Base):
+            __tablename__ = "people"
+            id = Column(Integer, primary_key=True)
+            type = Column(String(20))
+            name = Column(String(30))
+            __mapper_args__ = {
+                "polymorphic_on": type,
+                "polymorphic_identity": "person",
+            }
+
+        class Engineer(Person):
+            __tablename__ = "engineers"
+            id = Column(ForeignKey("people.id"), primary_key=True)
+            language = Column(String(30))
+            __mapper_args__ = {"polymorphic_identity": "engineer"}
+
+    @classmethod
+    def insert_data(cls, connection):
+        Person, Engineer = cls.classes("Person", "Engineer")
+        with Session(connection) as s:
+            s.add_all(
+                [
+                    Person(id=1, name="p1"),
+                    Engineer(id=2, name="e1", language="python"),
+                ]
+            )
+            s.commit()
+
+    def test_with_polymorphic(self):
+        Person, Engineer = self.classes("Person", "Engineer")
+        s = fixture_session()
+
+        people = s.scalars(
+            select(with_polymorphic(Person, "*"))
+            .order_by(Person.id)
+            .execution_options(readonly_entities=True)
+        ).all()
+        eq_([type(p) for p in people], [Person, Engineer])
+        eq_(people[1].language, "python")
+        eq_(len(s.identity_map), 0)
+
+    def test_selectin_polymorphic_raises(self):
+        Person, Engineer = self.classes("Person", "Engineer")
+        s = fixture_session()
+
+        with expect_raises_message(
+            exc.InvalidRequestError,
+            "Polymorphic selectin loading for .*Engineer.* isn't supported "
+            "with the 'readonly_entities' execution option",
+        ):
+            s.scalars(
+                select(Person)
+                .options(selectin_polymorphic(Person, [Engineer]))
+                .execution_options(readonly_entities=True)
+            ).all()
+
+
 class MergeResultTest(_fixtures.FixtureTest):
     run_setup_mappers = "once"
     run_inserts = "once"
@@ -1688,6 +1688,181 @@ class MergeTest(_fixtures.FixtureTest):
         eq_(sess.query(Address).one(), Address(id=1, email_address="c"))
 
 
+class MergeAllTest(_fixtures.FixtureTest):
+    """Session.merge_all() functionality"""
+
+    run_inserts = "each"
+
+    def _fixture(self):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User,
+        )
+
+        self.mapper_registry.map_imperatively(
+            User,
+            users,
+            properties={
+                "addresses": relationship(
+                    Address, backref="user", order_by=addresses.c.id
+                )
+            },
+        )
+        self.mapper_registry.map_imperatively(Address, addresses)
+        return User, Address
+
+    def test_merge_all(self):
+        User, Address = self._fixture()
+
+        sess = fixture_session()
+
+        def go():
+            merged = sess.merge_all(
+                [
+                    User(id=9, name="fred modified"),
+                    User(id=7, name="jack modified"),
+                    User(id=15, name="new user"),
+                ]
+            )
+            eq_(
+                [(u.id, u.name) for u in merged],
+                [(9, "fred modified"), (7, "jack modified"), (15, "new user")],
+            )
+            in_(merged[2], sess.new)
+            not_in(merged[0], sess.new)
+
+        # one SELECT for all three users
+        self.assert_sql_count(testing.db, go, 1)
+
+        sess.flush()
+        sess.expunge_all()
+        eq_(
+            sess.query(User).order_by(User.id).all(),
+            [
+                User(id=7, name="jack modified"),
+                User(id=8, name="ed"),
+                User(id=9, name="fred modified"),
+                User(id=10, name="chuck"),
+                User(id=15, name="new user"),
+            ],
+        )
+
+    def test_cascade(self):
+        User, Address = self._fixture()
+
+        sess = fixture_session()
+
+        users = [
+            User(
+                id=8,
+                name="ed",
+                addresses=[
+                    Address(id=2, email_address="ed@wood.com"),
+                    Address(id=3, email_address="ed modified"),
+                    Address(id=15, email_address="ed new"),
+                ],
+            ),
+            User(
+                id=9,
+                name="fred",
+                addresses=[Address(id=5, email_address="fred modified")],
+            ),
+        ]
+
+        def go():
+            sess.merge_all(users)
+
+        # SELECT for the users, SELECT for their addresses collections,
+        # SELECT for the address that's not present in the collections
+        self.assert_sql_count(testing.db, go, 3)
+
+        sess.flush()
+        sess.expunge_all()
+        eq_(
+            sess.query(User)
+            .filter(User.id.in_([8, 9]))
+            .order_by(User.id)
+            .all(),
+            users,
+        )
+        eq_(sess.get(Address, 4).user, None)
+
+    def test_same_result_as_merge(self):
+        User, Address = self._fixture()
+
+        def payload():
+            return [
+                User(
+                    id=7,
+                    name="jack",
+                    addresses=[Address(id=1, email_address="jack new")],
+                ),
+                User(id=11, name="new", addresses=[Address(id=12)]),
+            ]
+
+        def state(sess, merged):
+            return [
+                (
+                    u.name,
+                    [(a.id, a.email_address) for a in u.addresses],
+                    sess.is_modified(u),
+                    u in sess.new,
+                    [sess.is_modified(a) for a in u.addresses],
+                )
+                for u in merged
+            ]
+
+        sess = fixture_session(autoflush=False)
+        merged = state(sess, sess.merge_all(payload()))
+        sess.close()
+
+        sess = fixture_session(autoflush=False)
+        merged_individually = state(sess, [sess.merge(u) for u in payload()])
+        sess.close()
+
+        eq_(merged, merged_individually)
+        eq_(
+            merged,
+            [
+                ("jack", [(1, "jack new")], False, False, [True]),
+                ("new", [(12, None)], True, True, [True]),
+            ],
+        )
+
+    def test_load_false(self):
+        User, Address = self._fixture()
+
+        sess = fixture_session()
+        u7, u8 = sess.query(User).filter(User.id.in_([7, 8])).all()
+        sess.expunge_all()
+
+        sess2 = fixture_session()
+
+        def go():
+            merged = sess2.merge_all([u7, u8], load=False)
+            eq_([u.name for u in merged], ["jack", "ed"])
+            eq_(len(sess2.dirty), 0)
+
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_identity_map_not_reloaded(self):
+        User, Address = self._fixture()
+
+        sess = fixture_session()
+        u7 = sess.get(User, 7)
+
+        def go():
+            eq_(
+                sess.merge_all([User(id=7, name="jack modified")]),
+                [u7],
+            )
+
+        self.assert_sql_count(testing.db, go, 0)
+        eq_(u7.name, "jack modified")
+
+
 class M2ONoUseGetLoadingTest(fixtures.MappedTest):
     """Merge a one-to-many.  The many-to-one on the other side is set up
     so that use_get is False.   See if skipping the "m2o" merge
@@ -53,6 +53,7 @@ from sqlalchemy.orm import deferred
 from sqlalchemy.orm import join
 from sqlalchemy.orm import joinedload
 from sqlalchemy.orm import lazyload
+from sqlalchemy.orm import loading
 from sqlalchemy.orm import Query
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm import selectinload
@@ -1410,6 +1411,149 @@ class GetTest(QueryTest):
             )
 
 
+class GetManyTest(QueryTest):
+    def test_get_many(self):
+        User = self.classes.User
+
+        s = fixture_session()
+
+        def go():
+            result = s.get_many(User, [9, 19, 7, 8])
+            eq_([u.id if u else None for u in result], [9, None, 7, 8])
+
+        self.assert_sql_count(testing.db, go, 1)
+
+        u7 = s.get(User, 7)
+
+        def go():
+            eq_(s.get_many(User, [7, 7]), [u7, u7])
+
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_identity_map_misses_only(self):
+        User = self.classes.User
+
+        s = fixture_session()
+        u7 = s.get(User, 7)
+
+        s.connection()
+        with self.sql_execution_asserter(testing.db) as asserter:
+            result = s.get_many(User, [7, 8, 9])
+        eq_(result[0], u7)
+        eq_([u.id for u in result], [7, 8, 9])
+
+        asserter.assert_(
+            CompiledSQL(
+                "SELECT users.id AS users_id, users.name AS users_name "
+                "FROM users WHERE users.id IN (__[POSTCOMPILE_primary_keys])",
+                [{"primary_keys": [8, 9]}],
+            )
+        )
+
+    def test_ident_of_other_type(self):
+        User = self.classes.User
+
+        s = fixture_session()
+
+        # the string is located by the database as is the case for get();
+        # its row doesn't match it by identity key, so it's loaded
+        # individually
+        def go():
+            result = s.get_many(User, ["8", 7, 19, "20"])
+            eq_([u.id if u else None for u in result], [8, 7, None, None])
+
+        self.assert_sql_count(testing.db, go, 3)
+
+        eq_(s.get_many(User, ["8", 8]), [s.get(User, 8)] * 2)
+
+    def test_composite_pk(self):
+        CompositePk = self.classes.CompositePk
+
+        s = fixture_session()
+
+        result = s.get_many(
+            CompositePk, [(2, 2), (100, 100), {"i": 1, "j": 2}]
+        )
+        eq_([c.k if c else None for c in result], [6, None, 3])
+
+    def test_wrong_number_of_params(self):
+        User = self.classes.User
+
+        s = fixture_session()
+        assert_raises(
+            sa_exc.InvalidRequestError, s.get_many, User, [7, (7, 10)]
+        )
+
+    def test_loader_options(self):
+        User = self.classes.User
+
+        s = fixture_session()
+
+        u8, u9 = s.get_many(User, [8, 9], options=[joinedload(User.addresses)])
+        eq_(len(u8.__dict__["addresses"]), 3)
+        eq_(len(u9.__dict__["addresses"]), 1)
+
+    def test_populate_existing(self):
+        User = self.classes.User
+
+        s = fixture_session(autoflush=False)
+        u7, u8 = s.get_many(User, [7, 8])
+        u7.name = "modified"
+
+        def go():
+            eq_(s.get_many(User, [7, 8], populate_existing=True), [u7, u8])
+
+        self.assert_sql_count(testing.db, go, 1)
+        eq_(u7.name, "jack")
+
+    def test_with_for_update(self):
+        User = self.classes.User
+
+        s = fixture_session()
+        u7, u8 = s.get_many(User, [7, 8])
+
+        def go():
+            eq_(s.get_many(User, [7, 8], with_for_update=True), [u7, u8])
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_expired(self):
+        User = self.classes.User
+
+        s = fixture_session()
+        u7, u8 = s.get_many(User, [7, 8])
+        s.expire(u7)
+        s.expire(u8)
+        s.execute(
+            self.tables.addresses.delete().where(
+                self.tables.addresses.c.user_id == 8
+            )
+        )
+        s.execute(
+            self.tables.users.delete().where(self.tables.users.c.id == 8)
+        )
+
+        def go():
+            eq_(s.get_many(User, [7, 8]), [u7, None])
+
+        self.assert_sql_count(testing.db, go, 1)
+        eq_(u7.__dict__["name"], "jack")
+        assert u8 not in s
+
+    def test_chunks(self):
+        User = self.classes.User
+
+        s = fixture_session()
+
+        with mock.patch.object(loading, "_SELECTIN_CHUNKSIZE", 3):
+
+            def go():
+                result = s.get_many(User, [10, 9, 8, 7, 19])
+                eq_([u.id if u else None for u in result], [10, 9, 8, 7, None])
+
+            self.assert_sql_count(testing.db, go, 2)
+
+
 class InvalidGenerationsTest(QueryTest, AssertsCompiledSQL):
     @testing.combinations(
         lambda s, User: s.query(User).limit(2),
@@ -5474,19 +5618,123 @@ class YieldTest(_fixtures.FixtureTest):
 
         eq_(len(result.all()), 4)
 
-    def test_no_joinedload_opt(self):
+    @testing.combinations(1, 2, 3, 10, argnames="yield_per")
+    def test_joinedload_opt(self, yield_per):
         self._eagerload_mappings()
 
+        User, Address = self.classes("User", "Address")
+        sess = fixture_session()
+        q = (
+            sess.query(User)
+            .options(joinedload(User.addresses))
+            .yield_per(yield_per)
+        )
+
+        def go():
+            eq_(
+                [(u.id, sorted(a.id for a in u.addresses)) for u in q],
+                [(7, [1]), (8, [2, 3, 4]), (9, [5]), (10, [])],
+            )
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    @testing.combinations(1, 2, 3, 10, argnames="yield_per")
+    def test_joinedload_mapping(self, yield_per):
+        self._eagerload_mappings(addresses_lazy="joined")
+
         User = self.classes.User
         sess = fixture_session()
-        q = sess.query(User).options(joinedload(User.addresses)).yield_per(1)
-        assert_raises_message(
-            sa_exc.InvalidRequestError,
-            "Can't use yield_per with eager loaders that require "
-            "uniquing or row buffering",
-            q.all,
+        stmt = select(User).execution_options(yield_per=yield_per)
+
+        def go():
+            # unique() is not needed, as rows are uniqued for each batch
+            eq_(
+                [
+                    (u.id, sorted(a.id for a in u.addresses))
+                    for u in sess.scalars(stmt).all()
+                ],
+                [(7, [1]), (8, [2, 3, 4]), (9, [5]), (10, [])],
+            )
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_joinedload_opt_batches(self):
+        self._eagerload_mappings()
+
+        User, Address = self.classes("User", "Address")
+        sess = fixture_session()
+        stmt = (
+            select(User)
+            .options(joinedload(User.addresses))
+            .execution_options(yield_per=2)
         )
 
+        # the three rows for user 8 span more than one batch of rows; they
+        # are buffered so that the collection is complete when the user
+        # is delivered
+        eq_(
+            [
+                (u.id, sorted(a.id for a in u.addresses))
+                for u in sess.scalars(stmt)
+            ],
+            [(7, [1]), (8, [2, 3, 4]), (9, [5]), (10, [])],
+        )
+
+    def test_joinedload_opt_order_by_primary_key(self):
+        self._eagerload_mappings()
+
+        User, Address = self.classes("User", "Address")
+        sess = fixture_session()
+        stmt = (
+            select(User)
+            .options(joinedload(User.addresses))
+            .order_by(User.name)
+            .execution_options(yield_per=1)
+        )
+
+        with self.sql_execution_asserter(testing.db) as asserter:
+            eq_(
+                [u.name for u in sess.scalars(stmt)],
+                ["chuck", "ed", "fred", "jack"],
+            )
+
+        asserter.assert_(
+            CompiledSQL(
+                "SELECT users.id, users.name, addresses_1.id AS id_1, "
+                "addresses_1.user_id, addresses_1.email_address "
+                "FROM users LEFT OUTER JOIN addresses AS addresses_1 "
+                "ON users.id = addresses_1.user_id "
+                "ORDER BY users.name, users.id"
+            )
+        )
+
+    def test_joinedload_opt_existing_objects(self):
+        self._eagerload_mappings()
+
+        User, Address = self.classes("User", "Address")
+        sess = fixture_session()
+
+        users = sess.scalars(select(User).order_by(User.id)).all()
+        for u in users:
+            assert "addresses" not in u.__dict__
+
+        stmt = (
+            select(User)
+            .options(joinedload(User.addresses))
+            .execution_options(yield_per=1)
+        )
+
+        def go():
+            eq_(
+                [
+                    (u.id, sorted(a.id for a in u.addresses))
+                    for u in sess.scalars(stmt)
+                ],
+                [(7, [1]), (8, [2, 3, 4]), (9, [5]), (10, [])],
+            )
+
+        self.assert_sql_count(testing.db, go, 1)
+
     def test_no_subqueryload_opt(self):
         self._eagerload_mappings()
 
@@ -5496,7 +5744,7 @@ class YieldTest(_fixtures.FixtureTest):
         assert_raises_message(
             sa_exc.InvalidRequestError,
             "Can't use yield_per with eager loaders that require "
-            "uniquing or row buffering",
+            "row buffering",
             q.all,
         )
 
@@ -5509,7 +5757,7 @@ class YieldTest(_fixtures.FixtureTest):
         assert_raises_message(
             sa_exc.InvalidRequestError,
             "Can't use yield_per with eager loaders that require "
-            "uniquing or row buffering",
+            "row buffering",
             q.all,
         )
 
@@ -5575,6 +5823,160 @@ class YieldTest(_fixtures.FixtureTest):
         ):
             next(result)
 
+    def test_auto_expunge(self):
+        self._eagerload_mappings()
+
+        User = self.classes.User
+
+        sess = fixture_session()
+        stmt = (
+            select(User)
+            .order_by(User.id)
+            .execution_options(yield_per=1, auto_expunge=True)
+        )
+
+        users = []
+        for user in sess.scalars(stmt):
+            users.append(user)
+            eq_(len(sess.identity_map), 1)
+            is_true(inspect(user).persistent)
+            for previous in users[0:-1]:
+                is_true(inspect(previous).detached)
+
+        eq_([user.id for user in users], [7, 8, 9, 10])
+        eq_(len(sess.identity_map), 0)
+
+    @testing.combinations(
+        (selectinload,), (joinedload,), argnames="loader_opt"
+    )
+    def test_auto_expunge_eager_loaders(self, loader_opt):
+        self._eagerload_mappings()
+
+        User = self.classes.User
+
+        sess = fixture_session()
+        stmt = (
+            select(User)
+            .options(loader_opt(User.addresses))
+            .order_by(User.id)
+            .execution_options(yield_per=2, auto_expunge=True)
+        )
+
+        results = []
+        for user in sess.scalars(stmt):
+            results.append(
+                (user.id, sorted(address.id for address in user.addresses))
+            )
+            for address in user.addresses:
+                is_true(inspect(address).persistent)
+
+            # only the users of the current batch remain in the Session
+            is_true(
+                len(
+                    [
+                        obj
+                        for obj in sess.identity_map.values()
+                        if isinstance(obj, User)
+                    ]
+                )
+                <= 2
+            )
+
+        eq_(results, [(7, [1]), (8, [2, 3, 4]), (9, [5]), (10, [])])
+        eq_(len(sess.identity_map), 0)
+
+    def test_auto_expunge_retains_existing_and_modified(self):
+        self._eagerload_mappings()
+
+        User = self.classes.User
+
+        sess = fixture_session(autoflush=False)
+        existing = sess.get(User, 8)
+
+        stmt = (
+            select(User)
+            .order_by(User.id)
+            .execution_options(yield_per=1, auto_expunge=True)
+        )
+
+        users = []
+        for user in sess.scalars(stmt):
+            users.append(user)
+            if user.id == 9:
+                user.name = "modified"
+
+        is_(users[1], existing)
+        eq_(
+            sorted(obj.id for obj in sess.identity_map.values()),
+            [8, 9],
+        )
+        is_true(inspect(users[0]).detached)
+        is_true(inspect(users[3]).detached)
+        assert users[2] in sess.dirty
+
+    def test_auto_expunge_lazy_loads(self):
+        self._eagerload_mappings()
+
+        User, Address = self.classes("User", "Address")
+
+        sess = fixture_session()
+        stmt = (
+            select(User)
+            .order_by(User.id)
+            .execution_options(yield_per=1, auto_expunge=True)
+        )
+
+        addresses = []
+        for user in sess.scalars(stmt):
+            for previous in addresses:
+                is_true(inspect(previous).detached)
+            addresses = list(user.addresses)
+            for address in addresses:
+                is_true(inspect(address).persistent)
+
+            # objects loaded by other means while the batch is processed
+            # are expunged along with it
+            address = sess.get(Address, 1)
+            is_true(inspect(address).persistent)
+
+        eq_(len(sess.identity_map), 0)
+
+    def test_auto_expunge_retains_existing_populate_existing(self):
+        self._eagerload_mappings()
+
+        User = self.classes.User
+
+        sess = fixture_session()
+        existing = sess.get(User, 8)
+
+        stmt = (
+            select(User)
+            .order_by(User.id)
+            .execution_options(
+                yield_per=1, auto_expunge=True, populate_existing=True
+            )
+        )
+
+        users = list(sess.scalars(stmt))
+
+        is_(users[1], existing)
+        eq_([obj.id for obj in sess.identity_map.values()], [8])
+
+    def test_auto_expunge_requires_yield_per(self):
+        self._eagerload_mappings()
+
+        User = self.classes.User
+
+        sess = fixture_session()
+        stmt = select(User).execution_options(auto_expunge=True)
+
+        with expect_raises_message(
+            sa_exc.InvalidRequestError,
+            "The 'auto_expunge' execution option may only be used in "
+            "conjunction with the 'yield_per' execution option",
+        ):
+            sess.execute(stmt)
+
 
 class YieldIterationTest(_fixtures.FixtureTest):
     run_inserts = "once"
@@ -2423,6 +2423,92 @@ class ChunkingTest(fixtures.DeclarativeMappedTest):
             ),
         )
 
+    @testing.combinations(
+        (47, None, [(1, 48), (48, 95), (95, 101)]),
+        (None, 47, [(1, 48), (48, 95), (95, 101)]),
+        (60, 47, [(1, 48), (48, 95), (95, 101)]),
+        (1000, None, [(1, 101)]),
+        argnames="chunksize, max_parameters, expected",
+    )
+    @testing.combinations("o2m", "m2o", argnames="direction")
+    def test_chunksize_option(
+        self, chunksize, max_parameters, expected, direction
+    ):
+        A, B = self.classes("A", "B")
+
+        session = fixture_session()
+
+        if direction == "o2m":
+            q = (
+                session.query(A)
+                .options(selectinload(A.bs, chunksize=chunksize))
+                .order_by(A.id)
+            )
+            first = CompiledSQL("SELECT a.id AS a_id FROM a ORDER BY a.id", {})
+            chunk_sql = (
+                "SELECT b.a_id AS b_a_id, b.id AS b_id "
+                "FROM b WHERE b.a_id IN "
+                "(__[POSTCOMPILE_primary_keys]) ORDER BY b.id"
+            )
+        else:
+            q = (
+                session.query(B)
+                .options(selectinload(B.a, chunksize=chunksize))
+                .order_by(B.id)
+            )
+            first = CompiledSQL(
+                "SELECT b.id AS b_id, b.a_id AS b_a_id FROM b ORDER BY b.id",
+                {},
+            )
+            chunk_sql = (
+                "SELECT a.id AS a_id FROM a WHERE a.id IN "
+                "(__[POSTCOMPILE_primary_keys])"
+            )
+
+        # the parameter limit of insertmanyvalues doesn't apply
+        with mock.patch.object(
+            testing.db.dialect,
+            "max_bind_parameters",
+            max_parameters
+            if max_parameters is not None
+            else testing.db.dialect.max_bind_parameters,
+        ), mock.patch.object(
+            testing.db.dialect, "insertmanyvalues_max_parameters", 5
+        ):
+            self.assert_sql_execution(
+                testing.db,
+                q.all,
+                first,
+                *[
+                    CompiledSQL(
+                        chunk_sql, {"primary_keys": list(range(start, end))}
+                    )
+                    for start, end in expected
+                ],
+            )
+
+    @testing.only_on(["sqlite", "postgresql"])
+    def test_chunksize_array_in_expansion(self):
+        """single column keys aren't limited by the parameter count when
+        IN is rendered using a single array parameter"""
+
+        A, B = self.classes("A", "B")
+
+        eng = testing.db.execution_options(compiled_cache=None)
+        session = fixture_session(bind=eng)
+
+        with mock.patch.object(
+            eng.dialect, "max_bind_parameters", 47
+        ), mock.patch.object(eng.dialect, "array_in_expansion", True):
+
+            def go():
+                for a in session.query(A).options(
+                    selectinload(A.bs, chunksize=1000)
+                ):
+                    eq_(len(a.bs), 5)
+
+            self.assert_sql_count(eng, go, 2)
+
     @testing.requires.independent_cursors
     def test_yield_per(self):
         # the docs make a lot of guarantees about yield_per
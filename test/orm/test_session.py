@@ -14,6 +14,7 @@ from sqlalchemy import String
 from sqlalchemy import testing
 from sqlalchemy import text
 from sqlalchemy import update
+from sqlalchemy.engine import CacheStats
 from sqlalchemy.orm import attributes
 from sqlalchemy.orm import backref
 from sqlalchemy.orm import close_all_sessions
@@ -1985,13 +1986,27 @@ class SessionInterface(fixtures.MappedTest):
     """Bogus args to Session methods produce actionable exceptions."""
 
     _class_methods = set(
-        ("connection", "execute", "get_bind", "scalar", "scalars")
+        (
+            "connection",
+            "execute",
+            "get_bind",
+            "scalar",
+            "scalars",
+            "warm_cache",
+        )
     )
 
     def _public_session_methods(self):
         Session = sa.orm.session.Session
 
-        blocklist = {"begin", "query", "bind_mapper", "get", "bind_table"}
+        blocklist = {
+            "begin",
+            "query",
+            "bind_mapper",
+            "get",
+            "get_many",
+            "bind_table",
+        }
         specials = {"__iter__", "__contains__"}
         ok = set()
         for name in dir(Session):
@@ -2053,6 +2068,7 @@ class SessionInterface(fixtures.MappedTest):
             raises_(name, user_arg)
 
         raises_("add_all", (user_arg,))
+        raises_("merge_all", (user_arg,))
 
         # flush will no-op without something in the unit of work
         def _():
@@ -2119,6 +2135,12 @@ class SessionInterface(fixtures.MappedTest):
             "scalars", text("SELECT 1"), bind_arguments=dict(mapper=user_arg)
         )
 
+        raises_(
+            "warm_cache",
+            [text("SELECT 1")],
+            bind_arguments=dict(mapper=user_arg),
+        )
+
         eq_(
             watchdog,
             self._class_methods,
@@ -2304,6 +2326,49 @@ class NewStyleExecutionTest(_fixtures.FixtureTest):
         is_true(inspect(u1).detached)
         is_(inspect(u1).session, None)
 
+    def test_warm_cache(self):
+        User, Address = self.classes("User", "Address")
+
+        stmts = [
+            select(User).options(joinedload(User.addresses)).order_by(User.id),
+            (
+                select(User).where(User.name == sa.bindparam("name")),
+                {"name": None},
+            ),
+            update(User).values(name="x").filter_by(id=15),
+        ]
+
+        eng = testing.db.execution_options(compiled_cache={})
+        cache_hits = []
+
+        @event.listens_for(eng, "after_cursor_execute")
+        def after_cursor_execute(conn, cursor, stmt, params, context, em):
+            cache_hits.append(context.cache_hit)
+
+        sess = Session(eng)
+        results = sess.warm_cache(stmts)
+        eq_(
+            [(r.cache_stats, r.error) for r in results],
+            [(CacheStats.CACHE_MISS, None)] * 3,
+        )
+        is_(results[0].statement, stmts[0])
+
+        result = sess.execute(
+            select(User).options(joinedload(User.addresses)).order_by(User.id)
+        )
+        eq_(
+            [len(u.addresses) for u in result.unique().scalars()],
+            [1, 3, 1, 0],
+        )
+
+        result = sess.execute(
+            select(User).where(User.name == sa.bindparam("name")),
+            {"name": "jack"},
+        )
+        eq_(result.scalar_one().id, 7)
+        eq_(cache_hits, [CacheStats.CACHE_HIT] * 2)
+        sess.close()
+
 
 class FlushWarningsTest(fixtures.MappedTest):
     run_setup_mappers = "each"
@@ -0,0 +1,112 @@
+"""Compare checkout throughput of AsyncAdaptedQueuePool and AsyncQueuePool.
+
+Many concurrent tasks repeatedly check out a connection, await a simulated
+round trip, and return the connection, against a pool which is much
+smaller than the number of tasks, so that most checkouts wait for a
+connection to be returned.   Connections are simulated, so that the
+results measure the overhead of the pool itself.   Along with the number of
+checkouts per second, the time each checkout waited for a connection is
+reported, showing how evenly connections are distributed among the tasks.
+
+    python test/perf/async_pool.py --tasks 1000 --checkouts 20
+
+"""
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import pool
+from sqlalchemy.util import await_only
+from sqlalchemy.util import greenlet_spawn
+
+
+class Connection:
+    def __init__(self, latency):
+        self.latency = latency
+
+    def rollback(self):
+        await_only(asyncio.sleep(0))
+
+    def commit(self):
+        await_only(asyncio.sleep(0))
+
+    def close(self):
+        pass
+
+    def execute(self):
+        await_only(asyncio.sleep(self.latency))
+
+
+async def run(poolclass, args):
+    def creator():
+        await_only(asyncio.sleep(args.connect_latency))
+        return Connection(args.latency)
+
+    p = poolclass(
+        creator,
+        pool_size=args.pool_size,
+        max_overflow=args.max_overflow,
+        timeout=args.timeout,
+    )
+
+    def checkout():
+        conn = p.connect()
+        try:
+            conn.dbapi_connection.execute()
+        finally:
+            conn.close()
+
+    async def worker(waits):
+        for i in range(args.checkouts):
+            start = time.perf_counter()
+            await greenlet_spawn(checkout)
+            waits.append(time.perf_counter() - start)
+
+    waits = []
+    start = time.perf_counter()
+    await asyncio.gather(*[worker(waits) for i in range(args.tasks)])
+    elapsed = time.perf_counter() - start
+
+    await greenlet_spawn(p.dispose)
+
+    waits.sort()
+    print(
+        "%-24s %8.0f checkouts/sec   p50 %7.2f ms   p99 %7.2f ms   "
+        "max %7.2f ms"
+        % (
+            poolclass.__name__,
+            len(waits) / elapsed,
+            waits[len(waits) // 2] * 1000,
+            waits[int(len(waits) * 0.99)] * 1000,
+            waits[-1] * 1000,
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--checkouts", type=int, default=20)
+    parser.add_argument("--pool-size", type=int, default=20)
+    parser.add_argument("--max-overflow", type=int, default=10)
+    parser.add_argument("--timeout", type=float, default=300)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0,
+        help="seconds awaited while each connection is checked out",
+    )
+    parser.add_argument(
+        "--connect-latency",
+        type=float,
+        default=0.001,
+        help="seconds awaited to establish each connection",
+    )
+    args = parser.parse_args()
+
+    for poolclass in (pool.AsyncAdaptedQueuePool, pool.AsyncQueuePool):
+        asyncio.run(run(poolclass, args))
+
+
+if __name__ == "__main__":
+    main()
@@ -443,13 +443,13 @@ def _print_query_stats(queries):
 
 
 def main(db, schema_name, table_number, min_cols, max_cols, args):
-    timing = timer()
     if args.pool_class:
         engine = sa.create_engine(
             db, echo=args.echo, poolclass=getattr(sa.pool, args.pool_class)
         )
     else:
         engine = sa.create_engine(db, echo=args.echo)
+    timing = timer(engine)
 
     if engine.name == "oracle":
         # clear out oracle caches so that we get the real-world time the
@@ -517,20 +517,35 @@ def main(db, schema_name, table_number, min_cols, max_cols, args):
                     drop_tables(engine, meta, schema_name, table_names)
         finally:
             pprint(timing.timing, sort_dicts=False)
+            print("Number of statements")
+            pprint(timing.statements, sort_dicts=False)
             if args.sqlstats:
                 _print_query_stats(stats)
 
 
-def timer():
+def timer(engine):
     timing = {}
+    statements = {}
+    count = 0
+
+    @sa.event.listens_for(engine, "before_cursor_execute")
+    def count_statements(*arg):
+        nonlocal count
+        count += 1
 
     @contextmanager
     def track_time(name):
         s = time.time()
+        start_count = count
         yield
         timing[name] = time.time() - s
+        # the number of round trips is tracked along with the time, since
+        # the multi methods are expected to use a number of statements
+        # that's independent of the number of tables
+        statements[name] = count - start_count
 
     track_time.timing = timing
+    track_time.statements = statements
     return track_time
 
 
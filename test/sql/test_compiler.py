@@ -4566,6 +4566,21 @@ class BindParameterTest(AssertsCompiledSQL, fixtures.TestBase):
             "mytable.myid IN (__[POSTCOMPILE_foo])",
         )
 
+    @testing.combinations(True, False, argnames="supports")
+    def test_expanding_parameter_array_in_unsupported(self, supports):
+        """the usual expanding parameter is rendered for a dialect that
+        can't render IN as an array parameter"""
+
+        dialect = default.DefaultDialect()
+        dialect.supports_array_in_expansion = supports
+        dialect.array_in_expansion = True
+        self.assert_compile(
+            table1.c.myid.in_([1, 2, 3]),
+            "mytable.myid IN (__[POSTCOMPILE_myid_1])",
+            checkparams={"myid_1": [1, 2, 3]},
+            dialect=dialect,
+        )
+
     def test_limit_offset_select_literal_binds(self):
         stmt = select(1).limit(5).offset(6)
         self.assert_compile(
@@ -30,6 +30,7 @@ from sqlalchemy.testing import eq_
 from sqlalchemy.testing import expect_raises_message
 from sqlalchemy.testing import expect_warnings
 from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
 
 
 class ORMExpr:
@@ -1805,3 +1806,140 @@ class MultirowTest(_InsertTestBase, fixtures.TablesTest, AssertsCompiledSQL):
             "SQL expression is required",
             table.insert().values(values).compile,
         )
+
+
+class InsertManyValuesCompileTest(fixtures.TestBase):
+    """test the statement rewriting used by the "insertmanyvalues"
+    execution style."""
+
+    @testing.fixture
+    def t(self):
+        return Table(
+            "t",
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+            Column("x", String(50)),
+            Column("y", Integer),
+        )
+
+    def _batches(self, stmt, dialect, parameters, page_size):
+        compiled = stmt.compile(
+            dialect=dialect, column_keys=["x", "y"], for_executemany=True
+        )
+        assert compiled._insertmanyvalues is not None
+        if compiled.positional:
+            parameters = [
+                tuple(param[key] for key in compiled.positiontup)
+                for param in parameters
+            ]
+        return list(
+            compiled._deliver_insertmanyvalues_batches(
+                compiled.string, parameters, page_size
+            )
+        )
+
+    def test_named(self, t):
+        dialect = postgresql.base.PGDialect()
+
+        eq_(
+            self._batches(
+                t.insert().returning(t.c.id),
+                dialect,
+                [{"x": "x%d" % i, "y": i} for i in range(5)],
+                3,
+            ),
+            [
+                (
+                    "INSERT INTO t (x, y) VALUES "
+                    "(%(x__0)s, %(y__0)s), (%(x__1)s, %(y__1)s), "
+                    "(%(x__2)s, %(y__2)s) RETURNING t.id",
+                    {
+                        "x__0": "x0",
+                        "y__0": 0,
+                        "x__1": "x1",
+                        "y__1": 1,
+                        "x__2": "x2",
+                        "y__2": 2,
+                    },
+                    1,
+                    2,
+                ),
+                (
+                    "INSERT INTO t (x, y) VALUES "
+                    "(%(x__0)s, %(y__0)s), (%(x__1)s, %(y__1)s) "
+                    "RETURNING t.id",
+                    {"x__0": "x3", "y__0": 3, "x__1": "x4", "y__1": 4},
+                    2,
+                    2,
+                ),
+            ],
+        )
+
+    def test_positional(self, t):
+        dialect = sqlite.dialect()
+        dialect.insert_returning = True
+
+        eq_(
+            self._batches(
+                t.insert()
+                .values(x=func.lower(bindparam("x")))
+                .returning(t.c.id),
+                dialect,
+                [{"x": "x%d" % i, "y": i} for i in range(3)],
+                2,
+            ),
+            [
+                (
+                    "INSERT INTO t (x, y) VALUES (lower(?), ?), (lower(?), ?) "
+                    "RETURNING id",
+                    ("x0", 0, "x1", 1),
+                    1,
+                    2,
+                ),
+                (
+                    "INSERT INTO t (x, y) VALUES (lower(?), ?) RETURNING id",
+                    ("x2", 2),
+                    2,
+                    2,
+                ),
+            ],
+        )
+
+    def test_on_conflict_runs_per_row(self, t):
+        dialect = postgresql.base.PGDialect()
+
+        stmt = postgresql.insert(t).on_conflict_do_nothing().returning(t.c.id)
+        params = [{"x": "x%d" % i, "y": i} for i in range(3)]
+        eq_(
+            self._batches(stmt, dialect, params, 10),
+            [
+                (
+                    "INSERT INTO t (x, y) VALUES (%(x)s, %(y)s) "
+                    "ON CONFLICT DO NOTHING RETURNING t.id",
+                    param,
+                    idx,
+                    3,
+                )
+                for idx, param in enumerate(params, 1)
+            ],
+        )
+
+    def test_not_used_wo_returning(self, t):
+        compiled = t.insert().compile(
+            dialect=postgresql.base.PGDialect(),
+            column_keys=["x", "y"],
+            for_executemany=True,
+        )
+        is_(compiled._insertmanyvalues, None)
+
+    def test_not_used_wo_dialect_support(self, t):
+        compiled = (
+            t.insert()
+            .returning(t.c.id)
+            .compile(
+                dialect=default.DefaultDialect(),
+                column_keys=["x", "y"],
+                for_executemany=True,
+            )
+        )
+        is_(compiled._insertmanyvalues, None)
@@ -5,6 +5,7 @@ from sqlalchemy import func
 from sqlalchemy import INT
 from sqlalchemy import Integer
 from sqlalchemy import literal
+from sqlalchemy import select
 from sqlalchemy import Sequence
 from sqlalchemy import sql
 from sqlalchemy import String
@@ -712,3 +713,117 @@ class TableInsertTest(fixtures.TablesTest):
             table=t,
             parameters=dict(id=None, data="data", x=5),
         )
+
+
+class InsertManyValuesTest(fixtures.RemovesEvents, fixtures.TablesTest):
+    __backend__ = True
+    __requires__ = ("insert_executemany_returning",)
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "data",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("x", String(50)),
+            Column("y", String(50)),
+            Column("z", Integer, server_default="5"),
+        )
+
+        Table(
+            "no_params",
+            metadata,
+            Column("id", Integer, primary_key=True),
+        )
+
+    def _count_cursor_executes(self, connection):
+        canary = mock.Mock()
+        self.event_listen(connection, "before_cursor_execute", canary)
+        return canary
+
+    def test_explicit_returning_pk(self, connection):
+        data = self.tables.data
+        canary = self._count_cursor_executes(connection)
+
+        result = connection.execute(
+            data.insert().returning(data.c.id, data.c.x, data.c.z),
+            [{"x": "x%d" % i, "y": "y%d" % i} for i in range(1, 11)],
+        )
+        eq_(
+            result.all(),
+            [(i, "x%d" % i, 5) for i in range(1, 11)],
+        )
+        eq_(canary.call_count, 1)
+
+    @testing.combinations(
+        (1, 10), (3, 4), (10, 1), (15, 1), argnames="page_size, num_batches"
+    )
+    def test_page_size(self, connection, page_size, num_batches):
+        data = self.tables.data
+        canary = self._count_cursor_executes(connection)
+
+        result = connection.execute(
+            data.insert().returning(data.c.x),
+            [{"x": "x%d" % i, "y": "y%d" % i} for i in range(1, 11)],
+            execution_options={"insertmanyvalues_page_size": page_size},
+        )
+        eq_(result.scalars().all(), ["x%d" % i for i in range(1, 11)])
+        eq_(canary.call_count, num_batches)
+
+        for call in canary.mock_calls:
+            # the "executemany" flag is False for each individual batch
+            eq_(call[1][5], False)
+
+        eq_(
+            connection.scalar(select(func.count()).select_from(data)),
+            10,
+        )
+
+    def test_max_parameters(self, connection):
+        data = self.tables.data
+        canary = self._count_cursor_executes(connection)
+
+        with mock.patch.object(
+            connection.dialect, "insertmanyvalues_max_parameters", 7
+        ):
+            result = connection.execute(
+                data.insert().returning(data.c.x),
+                [{"x": "x%d" % i, "y": "y%d" % i} for i in range(1, 11)],
+            )
+        eq_(result.scalars().all(), ["x%d" % i for i in range(1, 11)])
+
+        # 2 parameters per row, 3 rows per batch
+        eq_(canary.call_count, 4)
+
+    def test_return_defaults(self, connection):
+        data = self.tables.data
+
+        result = connection.execute(
+            data.insert().return_defaults(),
+            [{"x": "x%d" % i, "y": "y%d" % i} for i in range(1, 6)],
+        )
+        eq_(
+            result.inserted_primary_key_rows,
+            [(i,) for i in range(1, 6)],
+        )
+        eq_(
+            [row.z for row in result.returned_defaults_rows],
+            [5, 5, 5, 5, 5],
+        )
+
+    def test_no_parameters(self, connection):
+        no_params = self.tables.no_params
+
+        result = connection.execute(
+            no_params.insert().returning(no_params.c.id), [{}, {}, {}]
+        )
+        eq_(result.all(), [(1,), (2,), (3,)])
+
+    def test_return_defaults_result_soft_closed(self, connection):
+        data = self.tables.data
+
+        result = connection.execute(
+            data.insert().return_defaults(),
+            [{"x": "x1", "y": "y1"}, {"x": "x2", "y": "y2"}],
+        )
+        assert result._soft_closed
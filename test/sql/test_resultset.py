@@ -32,6 +32,7 @@ from sqlalchemy import TypeDecorator
 from sqlalchemy import VARCHAR
 from sqlalchemy.engine import cursor as _cursor
 from sqlalchemy.engine import default
+from sqlalchemy.engine import result as _result
 from sqlalchemy.engine import Row
 from sqlalchemy.engine.result import SimpleResultMetaData
 from sqlalchemy.engine.row import KEY_INTEGER_ONLY
@@ -3378,6 +3379,143 @@ class GenerativeResultTest(fixtures.TablesTest):
 
         assert type(all_[0]) is Row
 
+    @testing.combinations(None, 2, argnames="chunk_size")
+    @testing.combinations(True, False, argnames="use_columns")
+    def test_columns_as_arrays(self, connection, chunk_size, use_columns):
+        users = self.tables.users
+        connection.execute(
+            users.insert(),
+            [
+                {"user_id": 7, "user_name": "jack", "x": 1, "y": 2},
+                {"user_id": 8, "user_name": "ed", "x": 2, "y": None},
+                {"user_id": 9, "user_name": "fred", "x": 15, "y": 20},
+            ],
+        )
+
+        class Upper(TypeDecorator):
+            impl = String
+            cache_ok = True
+
+            def process_result_value(self, value, dialect):
+                return value.upper()
+
+        result = connection.execute(
+            select(
+                users.c.user_id,
+                type_coerce(users.c.user_name, Upper).label("user_name"),
+                users.c.x,
+                users.c.y,
+            ).order_by(users.c.user_id)
+        )
+        if use_columns:
+            result = result.columns("user_name", "x", "y")
+            expected_keys = ["user_name", "x", "y"]
+        else:
+            expected_keys = ["user_id", "user_name", "x", "y"]
+
+        cols = result.columns_as_arrays(chunk_size=chunk_size)
+        eq_(list(cols), expected_keys)
+
+        if not use_columns:
+            eq_(list(cols["user_id"]), [7, 8, 9])
+        eq_(cols["user_name"], ["JACK", "ED", "FRED"])
+        eq_(list(cols["x"]), [1, 2, 15])
+        eq_(cols["y"], [2, None, 20])
+
+        assert result._soft_closed
+
+    @testing.combinations(
+        ("all",),
+        ("iterate",),
+        ("fetchone",),
+        ("fetchmany",),
+        ("partitions",),
+        ("unique",),
+        ("columns",),
+        ("scalars",),
+        argnames="method",
+    )
+    @testing.combinations((True,), (False,), argnames="has_cyextension")
+    def test_fused_processors(self, connection, method, has_cyextension):
+        users = self.tables.users
+        connection.execute(
+            users.insert(),
+            [
+                {"user_id": 7, "user_name": "jack", "x": 1, "y": 2},
+                {"user_id": 8, "user_name": "ed", "x": 2, "y": None},
+                {"user_id": 9, "user_name": "fred", "x": 15, "y": 20},
+            ],
+        )
+
+        class Upper(TypeDecorator):
+            impl = String
+            cache_ok = True
+
+            def process_result_value(self, value, dialect):
+                return value.upper()
+
+        stmt = select(
+            type_coerce(users.c.user_name, Upper).label("user_name"),
+            users.c.user_id,
+            users.c.y,
+        ).order_by(users.c.user_id)
+
+        conn = connection.execution_options(compiled_cache={})
+        converters = None
+
+        # the C extension row applies processors itself, so that the fused
+        # converters are used only in place of a tuple filter
+        with mock.patch.object(
+            _cursor, "HAS_CYEXTENSION", has_cyextension
+        ), mock.patch.object(_result, "HAS_CYEXTENSION", has_cyextension):
+            for i in range(2):
+                result = conn.execute(stmt)
+                fused = (
+                    result.context.compiled._cached_metadata._fused_converters
+                )
+                if converters is None:
+                    converters = fused
+                else:
+                    is_(fused, converters)
+
+                if method == "all":
+                    rows = result.all()
+                elif method == "iterate":
+                    rows = list(result)
+                elif method == "fetchone":
+                    rows = [result.fetchone() for _ in range(3)]
+                elif method == "fetchmany":
+                    rows = result.fetchmany(2) + result.fetchmany(2)
+                elif method == "partitions":
+                    rows = [
+                        row for part in result.partitions(2) for row in part
+                    ]
+                elif method == "unique":
+                    rows = result.unique().all()
+                elif method == "columns":
+                    eq_(
+                        result.columns("y", "user_name").all(),
+                        [(2, "JACK"), (None, "ED"), (20, "FRED")],
+                    )
+                    continue
+                elif method == "scalars":
+                    eq_(result.scalars().all(), ["JACK", "ED", "FRED"])
+                    continue
+                else:
+                    assert False
+
+                eq_(rows, [("JACK", 7, 2), ("ED", 8, None), ("FRED", 9, 20)])
+                assert type(rows[0]) is Row
+
+        # converters are generated against the metadata that's cached
+        # on the compiled statement and shared by subsequent results
+        expected = set() if has_cyextension else {None}
+        if method == "columns":
+            expected.add((2, 0))
+        elif method == "scalars":
+            expected.add((0,))
+        eq_(set(fused), expected)
+
     def test_columns_twice(self, connection):
         users = self.tables.users
         connection.execute(